@@ -13,8 +13,10 @@ import type {
   PersonOverview,
   SeriesPoint,
   Notion,
+  StageLatencyPoint,
   StringPoint,
   SurfaceTimelinePoint,
+  ToolLatencyPoint,
   UsagePoint,
 } from './types'
 
@@ -179,6 +181,28 @@ export const fetchUsage = async (
   return data.items
 }
 
+export const fetchToolLatency = async (
+  range: DateRange,
+  bucket: string,
+): Promise<ToolLatencyPoint[]> => {
+  const data = await get<{ items: ToolLatencyPoint[] }>(
+    `/api/v1/latency/tools?${encodeRange(range)}&bucket=${bucket}`,
+    { items: [] },
+  )
+  return data.items
+}
+
+export const fetchStageLatency = async (
+  range: DateRange,
+  bucket: string,
+): Promise<StageLatencyPoint[]> => {
+  const data = await get<{ items: StageLatencyPoint[] }>(
+    `/api/v1/latency/stages?${encodeRange(range)}&bucket=${bucket}`,
+    { items: [] },
+  )
+  return data.items
+}
+
 export const fetchTimeline = async (
   range: DateRange,
 ): Promise<StringPoint[]> => {
@@ -2,6 +2,7 @@ import { DesireHistoryChart } from '@/components/history/desire-history-chart'
 import { EmotionDistributionChart } from '@/components/history/emotion-distribution-chart'
 import { EmotionTimelineChart } from '@/components/history/emotion-timeline-chart'
 import { IntensityChart } from '@/components/history/intensity-chart'
+import { LatencyChart } from '@/components/history/latency-chart'
 import { NotionPanel } from '@/components/history/notion-panel'
 import { ToolUsageChart } from '@/components/history/tool-usage-chart'
 import { ValenceArousalChart } from '@/components/history/valence-arousal-chart'
@@ -29,6 +30,8 @@ export const HistoryTab = ({
     emotionHeatmap,
     historyMarkers,
     notions,
+    toolLatency,
+    stageLatency,
     toolSeriesKeys,
     desireKeys,
     desireChartData,
@@ -41,6 +44,7 @@ export const HistoryTab = ({
         toolSeriesKeys={toolSeriesKeys}
         timeline={timeline}
       />
+      <LatencyChart toolLatency={toolLatency} stageLatency={stageLatency} />
       <IntensityChart intensity={intensity} />
       <EmotionTimelineChart points={emotionTrend} markers={historyMarkers} />
       <EmotionDistributionChart heatmapData={emotionHeatmap} />
@@ -0,0 +1,52 @@
+import { pivotLatency } from '@/components/history/latency-chart-utils'
+import type { ToolLatencyPoint } from '@/types'
+
+describe('pivotLatency', () => {
+  it('keys each bucket row by series p95 and skips empty buckets', () => {
+    const points: ToolLatencyPoint[] = [
+      {
+        ts: '2026-01-01T12:05:00Z',
+        tool_name: 'recall',
+        count: 2,
+        p50: 90,
+        p95: 310,
+        p99: 330,
+      },
+      {
+        ts: '2026-01-01T12:00:00Z',
+        tool_name: 'remember',
+        count: 1,
+        p50: 20,
+        p95: 20,
+        p99: 20,
+      },
+      {
+        ts: '2026-01-01T12:00:00Z',
+        tool_name: 'recall',
+        count: 4,
+        p50: 100,
+        p95: 110,
+        p99: 120,
+      },
+      {
+        ts: '2026-01-01T12:10:00Z',
+        tool_name: 'recall',
+        count: 0,
+        p50: null,
+        p95: null,
+        p99: null,
+      },
+    ]
+
+    const { rows, seriesKeys } = pivotLatency(
+      points,
+      (point) => point.tool_name,
+    )
+
+    expect(seriesKeys).toEqual(['recall', 'remember'])
+    expect(rows).toEqual([
+      { ts: '2026-01-01T12:00:00Z', remember: 20, recall: 110 },
+      { ts: '2026-01-01T12:05:00Z', recall: 310 },
+    ])
+  })
+})
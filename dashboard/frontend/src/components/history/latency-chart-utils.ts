@@ -0,0 +1,24 @@
+import type { LatencyPoint } from '@/types'
+
+export type LatencyChartRow = { ts: string; [series: string]: number | string }
+
+/** Pivot `[{ts, <key>, p95}]` rows into one chart row per bucket keyed by series. */
+export const pivotLatency = <T extends LatencyPoint>(
+  points: T[],
+  seriesOf: (point: T) => string,
+): { rows: LatencyChartRow[]; seriesKeys: string[] } => {
+  const byTs = new Map<string, LatencyChartRow>()
+  const seriesKeys = new Set<string>()
+  for (const point of points) {
+    if (point.p95 === null) continue
+    const series = seriesOf(point)
+    const row = byTs.get(point.ts) ?? { ts: point.ts }
+    row[series] = point.p95
+    byTs.set(point.ts, row)
+    seriesKeys.add(series)
+  }
+  return {
+    rows: Array.from(byTs.values()).sort((a, b) => a.ts.localeCompare(b.ts)),
+    seriesKeys: Array.from(seriesKeys).sort(),
+  }
+}
@@ -0,0 +1,113 @@
+import { useMemo } from 'react'
+import { CartesianGrid, Line, LineChart, XAxis, YAxis } from 'recharts'
+
+import {
+  ChartContainer,
+  ChartLegend,
+  ChartLegendContent,
+  ChartTooltip,
+  ChartTooltipContent,
+  type ChartConfig,
+} from '@/components/ui/chart'
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
+import {
+  pivotLatency,
+  type LatencyChartRow,
+} from '@/components/history/latency-chart-utils'
+import { TOOL_CHART_COLORS } from '@/constants'
+import { useTimestampFormatter } from '@/hooks/use-timestamp-formatter'
+import type { StageLatencyPoint, ToolLatencyPoint } from '@/types'
+
+type LatencyChartProps = {
+  toolLatency: ToolLatencyPoint[]
+  stageLatency: StageLatencyPoint[]
+}
+
+type LatencyLinesProps = {
+  title: string
+  rows: LatencyChartRow[]
+  seriesKeys: string[]
+}
+
+const LatencyLines = ({ title, rows, seriesKeys }: LatencyLinesProps) => {
+  const { formatTs } = useTimestampFormatter()
+  const config: ChartConfig = Object.fromEntries(
+    seriesKeys.map((key, i) => [
+      key,
+      {
+        label: key.replaceAll('_', ' '),
+        color: TOOL_CHART_COLORS[i % TOOL_CHART_COLORS.length],
+      },
+    ]),
+  )
+
+  return (
+    <div className="space-y-1">
+      <p className="text-muted-foreground text-xs">{title}</p>
+      <ChartContainer config={config} className="h-[220px] w-full">
+        <LineChart data={rows}>
+          <CartesianGrid strokeDasharray="3 3" />
+          <XAxis dataKey="ts" hide />
+          <YAxis unit="ms" />
+          <ChartTooltip
+            content={<ChartTooltipContent labelFormatter={formatTs} />}
+          />
+          <ChartLegend content={<ChartLegendContent />} />
+          {seriesKeys.map((key) => (
+            <Line
+              key={key}
+              type="monotone"
+              dataKey={key}
+              stroke={`var(--color-${key})`}
+              dot={false}
+              connectNulls
+            />
+          ))}
+        </LineChart>
+      </ChartContainer>
+    </div>
+  )
+}
+
+export const LatencyChart = ({
+  toolLatency,
+  stageLatency,
+}: LatencyChartProps) => {
+  const tools = useMemo(
+    () => pivotLatency(toolLatency, (point) => point.tool_name),
+    [toolLatency],
+  )
+  const stages = useMemo(
+    () => pivotLatency(stageLatency, (point) => point.stage),
+    [stageLatency],
+  )
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle className="text-sm">Latency (p95)</CardTitle>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        {tools.rows.length === 0 && (
+          <p className="text-muted-foreground text-xs">
+            No timed tool calls in this range.
+          </p>
+        )}
+        {tools.rows.length > 0 && (
+          <LatencyLines
+            title="Per tool"
+            rows={tools.rows}
+            seriesKeys={tools.seriesKeys}
+          />
+        )}
+        {stages.rows.length > 0 && (
+          <LatencyLines
+            title="Per stage"
+            rows={stages.rows}
+            seriesKeys={stages.seriesKeys}
+          />
+        )}
+      </CardContent>
+    </Card>
+  )
+}
@@ -4,6 +4,18 @@ import { Alert, AlertDescription, AlertTitle } from '@/components/ui/alert'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { useAnomalies } from '@/hooks/use-anomalies'
 import { useTimestampFormatter } from '@/hooks/use-timestamp-formatter'
+import type { AnomalyAlert } from '@/types'
+
+const ALERT_TITLES: Record<AnomalyAlert['kind'], string> = {
+  usage_spike: 'Usage spike',
+  intensity_spike: 'Intensity spike',
+  latency_regression: 'Latency regression',
+}
+
+const describeAlert = (alert: AnomalyAlert) =>
+  alert.kind === 'latency_regression'
+    ? `${alert.tool_name} p95: ${alert.value.toFixed(0)} ms (was ${(alert.previous ?? 0).toFixed(0)} ms)`
+    : `value: ${alert.value.toFixed(2)}`
 
 export const AnomalyAlerts = () => {
   const alerts = useAnomalies()
@@ -25,12 +37,10 @@ export const AnomalyAlerts = () => {
             <Alert key={`${alert.ts}-${i}`} variant="destructive">
               <AlertCircle className="h-4 w-4" />
               <AlertTitle className="text-xs font-medium">
-                {alert.kind === 'usage_spike'
-                  ? 'Usage spike'
-                  : 'Intensity spike'}
+                {ALERT_TITLES[alert.kind]}
               </AlertTitle>
               <AlertDescription className="text-xs">
-                {formatTs(alert.ts)} — value: {alert.value.toFixed(2)}
+                {formatTs(alert.ts)} — {describeAlert(alert)}
               </AlertDescription>
             </Alert>
           ))}
@@ -10,9 +10,11 @@ vi.mock('@/api', () => ({
   fetchLogs: vi.fn(),
   fetchMetric: vi.fn(),
   fetchNotions: vi.fn(),
+  fetchStageLatency: vi.fn(),
   fetchStringHeatmap: vi.fn(),
   fetchStringTimeline: vi.fn(),
   fetchTimeline: vi.fn(),
+  fetchToolLatency: vi.fn(),
   fetchUsage: vi.fn(),
   fetchValence: vi.fn(),
 }))
@@ -56,6 +58,8 @@ describe('useHistoryData', () => {
       { ts: '2026-01-01T12:01:00Z', value: 0.7 },
     ])
     vi.mocked(api.fetchUsage).mockResolvedValue([])
+    vi.mocked(api.fetchToolLatency).mockResolvedValue([])
+    vi.mocked(api.fetchStageLatency).mockResolvedValue([])
     vi.mocked(api.fetchTimeline).mockResolvedValue([])
     vi.mocked(api.fetchValence).mockResolvedValue([
       { ts: '2026-01-01T12:01:00Z', value: 0.4 },
@@ -221,6 +225,8 @@ describe('useHistoryData', () => {
     vi.mocked(api.fetchDesireKeys).mockResolvedValue([])
     vi.mocked(api.fetchIntensity).mockResolvedValue([])
     vi.mocked(api.fetchUsage).mockResolvedValue([])
+    vi.mocked(api.fetchToolLatency).mockResolvedValue([])
+    vi.mocked(api.fetchStageLatency).mockResolvedValue([])
     vi.mocked(api.fetchTimeline).mockResolvedValue([])
     vi.mocked(api.fetchValence).mockResolvedValue([])
     vi.mocked(api.fetchArousal).mockResolvedValue([])
@@ -7,9 +7,11 @@ import {
   fetchLogs,
   fetchMetric,
   fetchNotions,
+  fetchStageLatency,
   fetchStringHeatmap,
   fetchStringTimeline,
   fetchTimeline,
+  fetchToolLatency,
   fetchUsage,
   fetchValence,
 } from '@/api'
@@ -24,8 +26,10 @@ import type {
   LogPoint,
   Notion,
   SeriesPoint,
+  StageLatencyPoint,
   StringPoint,
   TimeRangePreset,
+  ToolLatencyPoint,
   UsagePoint,
 } from '@/types'
 
@@ -158,6 +162,8 @@ export const useHistoryData = (
   const [emotionHeatmap, setEmotionHeatmap] = useState<HeatmapPoint[]>([])
   const [historyMarkers, setHistoryMarkers] = useState<HistoryMarker[]>([])
   const [notions, setNotions] = useState<Notion[]>([])
+  const [toolLatency, setToolLatency] = useState<ToolLatencyPoint[]>([])
+  const [stageLatency, setStageLatency] = useState<StageLatencyPoint[]>([])
   const [desireMetrics, setDesireMetrics] = useState<DesireMetricSeriesMap>(
     () => makeEmptyDesireMetricSeriesMap(desireCatalog),
   )
@@ -182,20 +188,33 @@ export const useHistoryData = (
       )
       setDesireKeys(nextDesireKeys)
 
-      const [i, u, t, v, a, emotionTimeline, heatmap, logs, ...desireSeries] =
-        await Promise.all([
-          fetchIntensity(effectiveRange, bucket),
-          fetchUsage(effectiveRange, bucket),
-          fetchTimeline(effectiveRange),
-          fetchValence(effectiveRange, bucket),
-          fetchArousal(effectiveRange, bucket),
-          fetchStringTimeline('emotion_primary', effectiveRange),
-          fetchStringHeatmap('emotion_primary', effectiveRange, bucket),
-          fetchLogs(effectiveRange, 'ALL', ''),
-          ...nextDesireKeys.map((key) =>
-            fetchMetric(key, effectiveRange, bucket),
-          ),
-        ])
+      const [
+        i,
+        u,
+        t,
+        v,
+        a,
+        emotionTimeline,
+        heatmap,
+        logs,
+        toolLatencyRows,
+        stageLatencyRows,
+        ...desireSeries
+      ] = await Promise.all([
+        fetchIntensity(effectiveRange, bucket),
+        fetchUsage(effectiveRange, bucket),
+        fetchTimeline(effectiveRange),
+        fetchValence(effectiveRange, bucket),
+        fetchArousal(effectiveRange, bucket),
+        fetchStringTimeline('emotion_primary', effectiveRange),
+        fetchStringHeatmap('emotion_primary', effectiveRange, bucket),
+        fetchLogs(effectiveRange, 'ALL', ''),
+        fetchToolLatency(effectiveRange, bucket),
+        fetchStageLatency(effectiveRange, bucket),
+        ...nextDesireKeys.map((key) =>
+          fetchMetric(key, effectiveRange, bucket),
+        ),
+      ])
       if (disposed) return
 
       const emotionByTimestamp = new Map(
@@ -245,6 +264,8 @@ export const useHistoryData = (
       setEmotionTrend(nextEmotionTrend)
       setEmotionHeatmap(heatmap)
       setHistoryMarkers(buildMarkers(logs))
+      setToolLatency(toolLatencyRows)
+      setStageLatency(stageLatencyRows)
       setDesireMetrics(nextDesireMetrics)
     }
 
@@ -314,6 +335,8 @@ export const useHistoryData = (
     emotionHeatmap,
     historyMarkers,
     notions,
+    toolLatency,
+    stageLatency,
     desireMetrics,
     desireKeys,
     toolSeriesKeys,
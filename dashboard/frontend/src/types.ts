@@ -42,11 +42,25 @@ export type DesireCatalogResponse = {
 }
 
 export type AnomalyAlert = {
-  kind: 'usage_spike' | 'intensity_spike'
+  kind: 'usage_spike' | 'intensity_spike' | 'latency_regression'
   ts: string
   value: number
+  tool_name?: string
+  previous?: number
+}
+
+export type LatencyPoint = {
+  ts: string
+  count: number
+  p50: number | null
+  p95: number | null
+  p99: number | null
 }
 
+export type ToolLatencyPoint = LatencyPoint & { tool_name: string }
+
+export type StageLatencyPoint = LatencyPoint & { stage: string }
+
 export type TimeRangePreset = '15m' | '1h' | '6h' | '24h' | '7d' | 'custom'
 
 export type DateRange = {
@@ -0,0 +1,148 @@
+"""Measure ingest projection throughput in lines per second.
+
+Replays synthetic ``ego_mcp.server`` tool-call lines, shaped like the ones current
+ego-mcp writes, through ``ingest_jsonl_line`` into a store that only counts what it
+receives, so the number covers JSON parsing and projection but no storage. The
+``validated`` row runs the same lines through ``normalize_log`` and
+``EgoMcpLogProjector.project``, the path lines of unknown shape still take.
+
+    uv run python scripts/benchmark_ingest_projection.py --lines 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ego_dashboard.ingestor import EgoMcpLogProjector, ingest_jsonl_line, normalize_log
+from ego_dashboard.models import DashboardEvent, LogEvent
+
+_TOOLS = ("remember", "recall", "introspect", "consider_them", "wake_up")
+_DESIRES = ("curiosity", "social_thirst", "cognitive_coherence", "expression", "resonance")
+
+
+class _CountingStore:
+    def __init__(self) -> None:
+        self.events = 0
+        self.logs = 0
+
+    def ingest(self, event: DashboardEvent) -> None:
+        self.events += 1
+
+    def ingest_log(self, event: LogEvent) -> None:
+        self.logs += 1
+
+
+def _lines(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    lines: list[str] = []
+    for index in range(count):
+        ts = (start + timedelta(seconds=index)).isoformat().replace("+00:00", "Z")
+        tool_name = "attune" if index % 8 >= 6 else rng.choice(_TOOLS)
+        base = {
+            "timestamp": ts,
+            "level": "INFO",
+            "logger": "ego_mcp.server",
+            "tool_name": tool_name,
+            "time_phase": "night",
+        }
+        if index % 2 == 0:
+            lines.append(
+                json.dumps(
+                    {
+                        **base,
+                        "message": "Tool invocation",
+                        "tool_args": {
+                            "emotion": "curious",
+                            "intensity": round(rng.random(), 3),
+                            "body_state": {"time_phase": "night", "mode": "idle"},
+                        },
+                    }
+                )
+            )
+            continue
+        payload: dict[str, object] = {
+            **base,
+            "message": "Tool execution completed",
+            "tool_output": "x" * rng.randint(10, 400),
+            "tool_output_chars": rng.randint(10, 4000),
+            "tool_output_truncated": False,
+            "emotion_primary": "curious",
+            "emotion_intensity": round(rng.random(), 3),
+            "valence": round(rng.uniform(-1, 1), 3),
+            "arousal": round(rng.random(), 3),
+            "duration_ms": rng.randint(1, 900),
+            "stage_ms": {"embedding": round(rng.random() * 200, 2), "chroma": 12.5},
+        }
+        if tool_name == "attune":
+            levels = {name: round(rng.random(), 2) for name in _DESIRES}
+            payload.update(levels)
+            payload["desire_levels"] = levels
+            payload["attune_person"] = "Master"
+        elif tool_name == "wake_up":
+            payload.update(trust_level=0.8, total_interactions=12, shared_episodes_count=3)
+        elif tool_name == "consider_them":
+            payload["tool_output"] = "Master: trust=0.80, interactions=12, shared_episodes=3"
+        lines.append(json.dumps(payload))
+    return lines
+
+
+def _ingest_validated(line: str, store: _CountingStore, projector: EgoMcpLogProjector) -> None:
+    payload = json.loads(line)
+    store.ingest_log(normalize_log(payload))
+    event = projector.project(payload)
+    if event is not None:
+        store.ingest(event)
+
+
+def _measure(
+    lines: list[str],
+    repeat: int,
+    ingest: Callable[[str, _CountingStore, EgoMcpLogProjector], None],
+) -> tuple[float, _CountingStore]:
+    best = float("inf")
+    store = _CountingStore()
+    for _ in range(repeat):
+        store = _CountingStore()
+        projector = EgoMcpLogProjector()
+        started = time.perf_counter()
+        for line in lines:
+            ingest(line, store, projector)
+        best = min(best, time.perf_counter() - started)
+    return best, store
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    lines = _lines(args.lines, seed=0)
+    for label, ingest in (
+        ("trusted", lambda line, store, projector: ingest_jsonl_line(line, store, projector)),
+        ("validated", _ingest_validated),
+    ):
+        best, store = _measure(lines, args.repeat, ingest)
+        print(
+            f"{label:>9}: {len(lines)} lines in {best:.3f}s: {len(lines) / best:,.0f} lines/s "
+            f"({store.events} events, {store.logs} logs)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
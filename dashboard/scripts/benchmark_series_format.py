@@ -0,0 +1,68 @@
+"""Compare the JSON and columnar wire formats for time-series endpoints.
+
+Feeds synthetic SQL rows (the tuples psycopg returns) through the same conversion the
+SQL store uses for each format and times row conversion plus serialization.
+
+    uv run python scripts/benchmark_series_format.py --days 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ego_dashboard.columnar import series_from_counts, series_from_values
+from ego_dashboard.sql_store import _dense_usage_rows
+
+_TOOLS = ("remember", "recall", "feel_desires", "introspect", "consider_them", "wake_up")
+
+
+def _metric_json(rows: list[tuple[datetime, float]]) -> bytes:
+    items = [{"ts": ts.isoformat(), "value": float(value)} for ts, value in rows]
+    return json.dumps({"items": items}).encode()
+
+
+def _usage_json(rows: list[tuple[datetime, str, int]], start: datetime, end: datetime) -> bytes:
+    return json.dumps({"items": _dense_usage_rows(rows, start, end, "1m")}).encode()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=7, help="range length at 1m buckets")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    buckets = [start + timedelta(minutes=i) for i in range(args.days * 24 * 60)]
+    end = buckets[-1]
+    metric_rows = [(ts, rng.random()) for ts in buckets]
+    usage_rows = [(ts, tool, rng.randint(0, 5)) for ts in buckets for tool in _TOOLS]
+
+    cases = {
+        "metric/json": lambda: _metric_json(metric_rows),
+        "metric/columnar": lambda: series_from_values(metric_rows).encode(),
+        "usage/json": lambda: _usage_json(usage_rows, start, end),
+        "usage/columnar": lambda: series_from_counts(usage_rows, buckets).encode(),
+    }
+    print(f"{len(buckets)} buckets, {len(_TOOLS)} tools")
+    for name, case in cases.items():
+        size = len(case())
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<18} {best * 1000:9.1f} ms {size / 1024:10.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,27 +4,41 @@ import asyncio
 import json
 import logging
 import threading
-from collections import Counter, deque
-from collections.abc import AsyncIterator
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Protocol, TypedDict, cast
+from typing import Any, Literal, Protocol, TypedDict, cast, runtime_checkable
 
 import chromadb
 import networkx as nx
-from fastapi import FastAPI, HTTPException, Query, WebSocket
+from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 
+from ego_dashboard.broadcast import CurrentBroadcaster
+from ego_dashboard.columnar import COLUMNAR_MEDIA_TYPE, ColumnarSeries, series_from_items
 from ego_dashboard.desire_catalog import load_desire_catalog
 from ego_dashboard.ingestor import tail_jsonl_file
+from ego_dashboard.models import LogCursor
 from ego_dashboard.settings import DashboardSettings, load_settings
 from ego_dashboard.sql_store import SqlTelemetryStore
 from ego_dashboard.store import TelemetryStore
 
 _MEMORY_NETWORK_BATCH_SIZE = 512
+_CHROMA_STATE_FILES = ("chroma.sqlite3", "chroma.sqlite3-wal")
+_NDJSON_CHUNK_LINES = 256
+# Decay halves over 30+ days, so a rendered network stays accurate for a minute.
+_MEMORY_DECAY_REFRESH = timedelta(minutes=1)
+# Keyset page size behind /api/v1/logs; the first page is flushed before the next query.
+_LOG_STREAM_PAGE_SIZE = 100
 logger = logging.getLogger(__name__)
 
+type SeriesFormat = Literal["json", "columnar"]
+
 
 class StoreProtocol(Protocol):
     def tool_usage(
@@ -69,6 +83,104 @@ class StoreProtocol(Protocol):
     ) -> dict[str, object]: ...
 
 
+@runtime_checkable
+class ColumnarStoreProtocol(Protocol):
+    """Stores that can build ``?format=columnar`` series straight from query rows."""
+
+    def tool_usage_columns(self, start: datetime, end: datetime, bucket: str) -> ColumnarSeries: ...
+
+    def metric_history_columns(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> ColumnarSeries: ...
+
+    def string_heatmap_columns(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> ColumnarSeries: ...
+
+
+@runtime_checkable
+class LogPageStoreProtocol(Protocol):
+    """Stores that page logs oldest-first by the ``(ts, dedupe_key)`` keyset.
+
+    Without a cursor ``log_page`` returns the newest ``limit`` rows of the range.
+    """
+
+    def log_page(
+        self,
+        start: datetime,
+        end: datetime,
+        level: str | None = None,
+        *,
+        search: str | None = None,
+        after: LogCursor | None = None,
+        limit: int = 300,
+    ) -> list[dict[str, object]]: ...
+
+
+@runtime_checkable
+class LatencyStoreProtocol(Protocol):
+    """Stores that report tool and per-stage latency percentiles."""
+
+    def tool_latency(
+        self, start: datetime, end: datetime, bucket: str
+    ) -> list[dict[str, object]]: ...
+
+    def stage_latency(
+        self, start: datetime, end: datetime, bucket: str, tool_name: str | None = None
+    ) -> list[dict[str, object]]: ...
+
+
+def _parse_log_cursor(value: str) -> LogCursor:
+    # An empty key ("<ts>,") starts paging at ``ts``: every stored key sorts after it.
+    ts_text, separator, dedupe_key = value.partition(",")
+    try:
+        ts = datetime.fromisoformat(ts_text)
+    except ValueError:
+        ts = None
+    if ts is None or not separator:
+        raise HTTPException(status_code=422, detail="after must be '<ts>,<dedupe_key>'")
+    return (ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC), dedupe_key)
+
+
+def _iter_log_pages(
+    store: LogPageStoreProtocol,
+    start: datetime,
+    end: datetime,
+    level: str | None,
+    search: str | None,
+    after: LogCursor | None,
+    limit: int,
+) -> Iterator[bytes]:
+    """Stream ``{"items": [...], "page": {"next_after": ...}}`` one keyset page at a time."""
+    if after is None:
+        # A tail has nothing later in the range to page to.
+        rows = store.log_page(start, end, level, search=search, limit=limit)
+        yield ('{"items":[' + ",".join(json.dumps(row) for row in rows)).encode()
+        yield b'],"page":{"next_after":null}}'
+        return
+    yield b'{"items":['
+    sent = 0
+    next_after: str | None = None
+    while sent < limit:
+        size = min(_LOG_STREAM_PAGE_SIZE, limit - sent)
+        rows = store.log_page(start, end, level, search=search, after=after, limit=size)
+        if rows:
+            prefix = "," if sent else ""
+            yield (prefix + ",".join(json.dumps(row) for row in rows)).encode()
+            sent += len(rows)
+            last_ts, last_key = str(rows[-1]["ts"]), str(rows[-1]["dedupe_key"])
+            after = (datetime.fromisoformat(last_ts), last_key)
+            next_after = f"{last_ts},{last_key}"
+        if len(rows) < size:
+            next_after = None
+            break
+    yield ('],"page":' + json.dumps({"next_after": next_after}) + "}").encode()
+
+
+def _columnar_response(series: ColumnarSeries) -> Response:
+    return Response(content=series.encode(), media_type=COLUMNAR_MEDIA_TYPE)
+
+
 class _MemoryLinkPayload(TypedDict):
     target_id: str
     link_type: str
@@ -173,6 +285,10 @@ def _parse_iso_timestamp(value: object) -> datetime | None:
     return parsed.astimezone(UTC)
 
 
+def _utc_now() -> datetime:
+    return datetime.now(tz=UTC)
+
+
 def _calculate_memory_decay(
     timestamp: object,
     *,
@@ -184,7 +300,7 @@ def _calculate_memory_decay(
     if memory_time is None:
         return 1.0
 
-    current = now or datetime.now(tz=UTC)
+    current = now or _utc_now()
     age_seconds = (current - memory_time).total_seconds()
     if age_seconds < 0:
         return 1.0
@@ -195,6 +311,15 @@ def _calculate_memory_decay(
     return max(0.0, min(1.0, 2 ** (-age_days / max(effective_half_life, 1e-6))))
 
 
+def _memory_row_decay(memory: dict[str, object], now: datetime | None = None) -> float:
+    return _calculate_memory_decay(
+        memory.get("timestamp"),
+        link_confidence_max=_coerce_float(memory.get("link_confidence_max"), 0.0),
+        access_count=_coerce_int(memory.get("access_count"), 0),
+        now=now,
+    )
+
+
 def _load_link_metadata(value: object) -> list[_MemoryLinkPayload]:
     if not isinstance(value, str) or not value:
         return []
@@ -305,7 +430,58 @@ def _load_notion_rows(settings: DashboardSettings) -> list[dict[str, object]]:
     return rows
 
 
-def _load_memory_rows(settings: DashboardSettings) -> list[dict[str, object]]:
+class _ChromaReader:
+    """Long-lived Chroma client shared by every memory read in the process.
+
+    The client is opened lazily (or eagerly from ``lifespan``) and dropped after a
+    failed read, so the next attempt reopens it instead of reusing a broken handle.
+    The dashboard only reads through it; ego-mcp remains the sole writer.
+    """
+
+    def __init__(self, settings: DashboardSettings) -> None:
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._collection: chromadb.Collection | None = None
+
+    @property
+    def chroma_dir(self) -> Path | None:
+        if not self._settings.ego_mcp_data_dir:
+            return None
+        return Path(self._settings.ego_mcp_data_dir) / "chroma"
+
+    def open(self) -> None:
+        chroma_dir = self.chroma_dir
+        if chroma_dir is None or not chroma_dir.exists():
+            return
+        try:
+            self._get_collection()
+        except Exception:
+            logger.warning("Failed to open Chroma at %s; retrying on first read", chroma_dir)
+
+    def close(self) -> None:
+        with self._lock:
+            self._collection = None
+
+    def read[T](self, reader: Callable[[chromadb.Collection], T]) -> T:
+        """Run ``reader`` against the shared collection, reopening it once on failure."""
+        try:
+            return reader(self._get_collection())
+        except Exception:
+            logger.warning("Chroma read failed; reopening client", exc_info=True)
+            self.close()
+        return reader(self._get_collection())
+
+    def _get_collection(self) -> chromadb.Collection:
+        with self._lock:
+            if self._collection is None:
+                client = chromadb.PersistentClient(path=str(self.chroma_dir))
+                self._collection = client.get_collection(name="ego_memories")
+            return self._collection
+
+
+def _load_memory_rows(
+    settings: DashboardSettings, chroma: _ChromaReader | None = None
+) -> list[dict[str, object]]:
     if not settings.ego_mcp_data_dir:
         return []
 
@@ -318,78 +494,76 @@ def _load_memory_rows(settings: DashboardSettings) -> list[dict[str, object]]:
 
     rows: list[dict[str, object]] = []
     try:
-        client = chromadb.PersistentClient(path=str(chroma_dir))
-        collection = client.get_collection(name="ego_memories")
-        offset = 0
-        while True:
-            batch = collection.get(
-                limit=_MEMORY_NETWORK_BATCH_SIZE,
-                offset=offset,
-                include=["documents", "metadatas"],
-            )
+        rows = (chroma or _ChromaReader(settings)).read(_read_memory_rows)
+    except Exception:
+        logger.exception("Failed to load memory nodes for Memory Network from %s", chroma_dir)
+    return rows
 
-            ids = batch.get("ids", [])
-            documents = batch.get("documents", [])
-            metadatas = batch.get("metadatas", [])
-            if not isinstance(ids, list) or not ids:
-                break
 
-            document_rows = documents if isinstance(documents, list) else []
-            metadata_rows = metadatas if isinstance(metadatas, list) else []
-            for index, memory_id in enumerate(ids):
-                if not isinstance(memory_id, str):
-                    continue
-                document = document_rows[index] if index < len(document_rows) else None
-                metadata = metadata_rows[index] if index < len(metadata_rows) else {}
-                if not isinstance(metadata, dict):
-                    continue
-                linked_ids = _load_link_metadata(metadata.get("linked_ids"))
-                max_confidence = max((link["confidence"] for link in linked_ids), default=0.0)
-                access_count = _coerce_int(metadata.get("access_count"), 0)
-                category = metadata.get("category")
-                rows.append(
-                    {
-                        "id": memory_id,
-                        "content": document if isinstance(document, str) else "",
-                        "label": _memory_label(document, metadata),
-                        "content_preview": _memory_content_preview(document, metadata),
-                        "category": (
-                            str(category) if isinstance(category, str) and category else "daily"
-                        ),
-                        "timestamp": (
-                            str(metadata.get("timestamp"))
-                            if isinstance(metadata.get("timestamp"), str)
-                            else ""
-                        ),
-                        "decay": _calculate_memory_decay(
-                            metadata.get("timestamp"),
-                            link_confidence_max=max_confidence,
-                            access_count=access_count,
-                        ),
-                        "access_count": access_count,
-                        "importance": max(1, min(5, _coerce_int(metadata.get("importance"), 3))),
-                        "tags": _coerce_tags(metadata.get("tags")),
-                        "is_private": _coerce_bool(metadata.get("is_private")),
-                        "last_accessed": (
-                            str(metadata.get("last_accessed"))
-                            if isinstance(metadata.get("last_accessed"), str)
-                            else ""
-                        ),
-                        "emotional_valence": _coerce_float(metadata.get("valence"), 0.0),
-                        "emotional_arousal": _clamp_float(metadata.get("arousal"), 0.5),
-                        "emotional_intensity": _clamp_float(metadata.get("intensity"), 0.5),
-                        "linked_ids": linked_ids,
-                    }
-                )
+def _read_memory_rows(collection: chromadb.Collection) -> list[dict[str, object]]:
+    rows: list[dict[str, object]] = []
+    offset = 0
+    while True:
+        batch = collection.get(
+            limit=_MEMORY_NETWORK_BATCH_SIZE,
+            offset=offset,
+            include=["documents", "metadatas"],
+        )
 
-            if len(ids) < _MEMORY_NETWORK_BATCH_SIZE:
-                break
-            offset += len(ids)
-    except Exception:
-        logger.exception("Failed to load memory nodes for Memory Network from %s", chroma_dir)
+        ids = batch.get("ids", [])
+        documents = batch.get("documents", [])
+        metadatas = batch.get("metadatas", [])
+        if not isinstance(ids, list) or not ids:
+            break
+
+        document_rows = documents if isinstance(documents, list) else []
+        metadata_rows = metadatas if isinstance(metadatas, list) else []
+        for index, memory_id in enumerate(ids):
+            if not isinstance(memory_id, str):
+                continue
+            document = document_rows[index] if index < len(document_rows) else None
+            metadata = metadata_rows[index] if index < len(metadata_rows) else {}
+            if not isinstance(metadata, dict):
+                continue
+            rows.append(_memory_row(memory_id, document, metadata))
+
+        if len(ids) < _MEMORY_NETWORK_BATCH_SIZE:
+            break
+        offset += len(ids)
     return rows
 
 
+def _memory_row(memory_id: str, document: object, metadata: dict[str, Any]) -> dict[str, object]:
+    linked_ids = _load_link_metadata(metadata.get("linked_ids"))
+    max_confidence = max((link["confidence"] for link in linked_ids), default=0.0)
+    access_count = _coerce_int(metadata.get("access_count"), 0)
+    category = metadata.get("category")
+    return {
+        "id": memory_id,
+        "content": document if isinstance(document, str) else "",
+        "label": _memory_label(document, metadata),
+        "content_preview": _memory_content_preview(document, metadata),
+        "category": (str(category) if isinstance(category, str) and category else "daily"),
+        "timestamp": (
+            str(metadata.get("timestamp")) if isinstance(metadata.get("timestamp"), str) else ""
+        ),
+        "link_confidence_max": max_confidence,
+        "access_count": access_count,
+        "importance": max(1, min(5, _coerce_int(metadata.get("importance"), 3))),
+        "tags": _coerce_tags(metadata.get("tags")),
+        "is_private": _coerce_bool(metadata.get("is_private")),
+        "last_accessed": (
+            str(metadata.get("last_accessed"))
+            if isinstance(metadata.get("last_accessed"), str)
+            else ""
+        ),
+        "emotional_valence": _coerce_float(metadata.get("valence"), 0.0),
+        "emotional_arousal": _clamp_float(metadata.get("arousal"), 0.5),
+        "emotional_intensity": _clamp_float(metadata.get("intensity"), 0.5),
+        "linked_ids": linked_ids,
+    }
+
+
 def _edge_identity(source: str, target: str, link_type: str) -> tuple[str, str, str]:
     normalized_type = link_type.strip().lower() or "related"
     if normalized_type in {"related", "similar", "notion_related"}:
@@ -517,14 +691,33 @@ def _build_graph(node_ids: set[str], edges: list[dict[str, object]]) -> nx.Graph
     return graph
 
 
-def _compute_graph_metrics(graph: nx.Graph[Any]) -> dict[str, dict[str, int] | dict[str, float]]:
+def _compute_graph_metrics(
+    graph: nx.Graph[Any],
+    *,
+    exact_max_nodes: int = 500,
+    sample_size: int = 100,
+) -> dict[str, dict[str, int] | dict[str, float]]:
     degree: dict[str, int] = {str(node_id): int(value) for node_id, value in graph.degree()}
-    if graph.number_of_nodes() <= 500:
+    betweenness = _compute_betweenness(
+        graph, exact_max_nodes=exact_max_nodes, sample_size=sample_size
+    )
+    return {"degree": degree, "betweenness": betweenness}
+
+
+def _compute_betweenness(
+    graph: nx.Graph[Any],
+    *,
+    exact_max_nodes: int,
+    sample_size: int,
+) -> dict[str, float]:
+    node_count = graph.number_of_nodes()
+    if node_count <= exact_max_nodes:
         betweenness_raw = nx.betweenness_centrality(graph, normalized=True)
     else:
-        betweenness_raw = nx.betweenness_centrality(graph, k=100, normalized=True)
-    betweenness = {str(node_id): float(value) for node_id, value in betweenness_raw.items()}
-    return {"degree": degree, "betweenness": betweenness}
+        betweenness_raw = nx.betweenness_centrality(
+            graph, k=min(sample_size, node_count), normalized=True
+        )
+    return {str(node_id): float(value) for node_id, value in betweenness_raw.items()}
 
 
 def _build_memory_network_stats(
@@ -586,11 +779,27 @@ def _build_memory_network(
         if isinstance(row.get("id"), str) and row.get("id")
     }
     edges = _build_network_edges(memory_rows, notion_rows, node_ids)
-    graph = _build_graph(node_ids, edges)
-    metrics = _compute_graph_metrics(graph)
-    degree = cast(dict[str, int], metrics["degree"])
-    betweenness = cast(dict[str, float], metrics["betweenness"])
+    return _build_memory_network_payload(
+        memory_rows, notion_rows, edges, _build_graph(node_ids, edges)
+    )
+
+
+def _build_memory_network_payload(
+    memory_rows: list[dict[str, object]],
+    notion_rows: list[dict[str, object]],
+    edges: list[dict[str, object]],
+    graph: nx.Graph[str],
+    betweenness: dict[str, float] | None = None,
+    now: datetime | None = None,
+) -> dict[str, object]:
+    if betweenness is None:
+        metrics = _compute_graph_metrics(graph)
+        degree = cast(dict[str, int], metrics["degree"])
+        betweenness = cast(dict[str, float], metrics["betweenness"])
+    else:
+        degree = {str(node_id): int(value) for node_id, value in graph.degree()}
 
+    now = now or _utc_now()
     nodes: list[dict[str, object]] = []
     for memory in memory_rows:
         memory_id = str(memory["id"])
@@ -606,7 +815,7 @@ def _build_memory_network(
                 "is_private": memory.get("is_private", False),
                 "confidence": None,
                 "access_count": memory.get("access_count"),
-                "decay": memory.get("decay"),
+                "decay": _memory_row_decay(memory, now),
                 "reinforcement_count": None,
                 "person_id": None,
                 "related_count": None,
@@ -665,21 +874,61 @@ def _load_memory_network(settings: DashboardSettings) -> dict[str, object]:
     return _build_memory_network(_load_memory_rows(settings), _load_notion_rows(settings))
 
 
-def _load_memory_detail(settings: DashboardSettings, memory_id: str) -> dict[str, object] | None:
-    memory = next(
-        (row for row in _load_memory_rows(settings) if str(row.get("id", "")) == memory_id),
-        None,
-    )
+def _load_memory_detail(
+    settings: DashboardSettings,
+    memory_id: str,
+    notion_ids_by_memory: dict[str, list[str]] | None = None,
+    chroma: _ChromaReader | None = None,
+) -> dict[str, object] | None:
+    memory = _load_memory_row(chroma or _ChromaReader(settings), memory_id)
     if memory is None:
         return None
+    if notion_ids_by_memory is None:
+        notion_ids_by_memory = _notion_ids_by_memory(_load_notion_rows(settings))
+    return _memory_detail_payload(memory_id, memory, notion_ids_by_memory.get(memory_id, []))
+
+
+def _load_memory_row(chroma: _ChromaReader, memory_id: str) -> dict[str, object] | None:
+    chroma_dir = chroma.chroma_dir
+    if chroma_dir is None or not chroma_dir.exists():
+        return None
+    try:
+        batch = chroma.read(
+            lambda collection: collection.get(ids=[memory_id], include=["documents", "metadatas"])
+        )
+    except Exception:
+        logger.exception("Failed to load memory %s from %s", memory_id, chroma_dir)
+        return None
+    ids = batch.get("ids", [])
+    if not isinstance(ids, list) or memory_id not in ids:
+        return None
+    index = ids.index(memory_id)
+    documents = batch.get("documents")
+    metadatas = batch.get("metadatas")
+    document = documents[index] if isinstance(documents, list) and index < len(documents) else None
+    metadata = metadatas[index] if isinstance(metadatas, list) and index < len(metadatas) else {}
+    if not isinstance(metadata, dict):
+        return None
+    return _memory_row(memory_id, document, metadata)
+
 
-    generated_notion_ids: list[str] = []
-    for notion in _load_notion_rows(settings):
+def _notion_ids_by_memory(notion_rows: list[dict[str, object]]) -> dict[str, list[str]]:
+    index: dict[str, list[str]] = {}
+    for notion in notion_rows:
         source_memory_ids = notion.get("source_memory_ids")
         if not isinstance(source_memory_ids, list):
             continue
-        if memory_id in source_memory_ids:
-            generated_notion_ids.append(str(notion["id"]))
+        notion_id = str(notion["id"])
+        for source_memory_id in dict.fromkeys(source_memory_ids):
+            index.setdefault(str(source_memory_id), []).append(notion_id)
+    return index
+
+
+def _memory_detail_payload(
+    memory_id: str,
+    memory: dict[str, object],
+    generated_notion_ids: list[str],
+) -> dict[str, object]:
     is_private = bool(memory.get("is_private", False))
     return {
         "id": memory_id,
@@ -691,7 +940,7 @@ def _load_memory_detail(settings: DashboardSettings, memory_id: str) -> dict[str
         "is_private": is_private,
         "access_count": _coerce_int(memory.get("access_count"), 0),
         "last_accessed": str(memory.get("last_accessed", "")),
-        "decay": _coerce_float(memory.get("decay"), 0.0),
+        "decay": _memory_row_decay(memory),
         "emotional_trace": {
             "valence": _coerce_float(memory.get("emotional_valence"), 0.0),
             "arousal": _coerce_float(memory.get("emotional_arousal"), 0.5),
@@ -702,6 +951,414 @@ def _load_memory_detail(settings: DashboardSettings, memory_id: str) -> dict[str
     }
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _memory_source_signature(settings: DashboardSettings) -> tuple[tuple[int, int] | None, ...]:
+    # Chroma persists every collection write (metadata, documents, embedding queue) to
+    # its SQLite file, so the database and its WAL stand in for a collection version.
+    if not settings.ego_mcp_data_dir:
+        return ()
+    chroma_dir = Path(settings.ego_mcp_data_dir) / "chroma"
+    return (
+        _file_signature(chroma_dir),
+        *(_file_signature(chroma_dir / name) for name in _CHROMA_STATE_FILES),
+    )
+
+
+def _notion_source_signature(settings: DashboardSettings) -> tuple[int, int] | None:
+    if not settings.ego_mcp_data_dir:
+        return None
+    return _file_signature(Path(settings.ego_mcp_data_dir) / "notions.json")
+
+
+class _MemoryGraph:
+    """Memory and notion rows with the graph and id lookups built once.
+
+    Betweenness is filled in later by ``_MemoryGraphCache``; until then the payload
+    carries the previous graph's values (0.0 for new nodes). Decay depends on the
+    current time, so the network payload is re-rendered once it is older than
+    ``_MEMORY_DECAY_REFRESH``.
+    """
+
+    def __init__(
+        self,
+        memory_rows: list[dict[str, object]],
+        notion_rows: list[dict[str, object]],
+        previous: _MemoryGraph | None = None,
+    ) -> None:
+        self.memory_rows = memory_rows
+        self.notion_rows = notion_rows
+        self.memory_by_id = {str(row["id"]): row for row in memory_rows}
+        self.notion_by_id = {str(row["id"]): row for row in notion_rows}
+        self.notion_ids_by_memory = _notion_ids_by_memory(notion_rows)
+        self._positions = {
+            row_id: index for index, row_id in enumerate([*self.memory_by_id, *self.notion_by_id])
+        }
+        node_ids = {row_id for row_id in self._positions if row_id}
+        self.edges = _build_network_edges(memory_rows, notion_rows, node_ids)
+        self.graph = _build_graph(node_ids, self.edges)
+        self.betweenness: dict[str, float] = {}
+        self.betweenness_computed_at: datetime | None = None
+        self.betweenness_sampled = False
+        self.betweenness_fresh = False
+        if previous is not None and previous.betweenness_computed_at is not None:
+            self.betweenness = {
+                node_id: previous.betweenness.get(node_id, 0.0) for node_id in node_ids
+            }
+            self.betweenness_computed_at = previous.betweenness_computed_at
+            self.betweenness_sampled = previous.betweenness_sampled
+        self._rendered: tuple[datetime, dict[str, float], dict[str, object]] | None = None
+
+    @property
+    def network(self) -> dict[str, object]:
+        now = _utc_now()
+        betweenness = self.betweenness
+        rendered = self._rendered
+        if (
+            rendered is not None
+            and rendered[1] is betweenness
+            and timedelta(0) <= now - rendered[0] < _MEMORY_DECAY_REFRESH
+        ):
+            return rendered[2]
+        network = _build_memory_network_payload(
+            self.memory_rows, self.notion_rows, self.edges, self.graph, betweenness, now
+        )
+        self._rendered = (now, betweenness, network)
+        return network
+
+    def apply_betweenness(self, betweenness: dict[str, float], *, sampled: bool) -> None:
+        self.betweenness = betweenness
+        self.betweenness_computed_at = datetime.now(tz=UTC)
+        self.betweenness_sampled = sampled
+        self.betweenness_fresh = True
+
+    def centrality_status(self) -> dict[str, object]:
+        computed_at = self.betweenness_computed_at
+        return {
+            "fresh": self.betweenness_fresh,
+            "computed_at": computed_at.isoformat() if computed_at is not None else None,
+            "age_seconds": (
+                (datetime.now(tz=UTC) - computed_at).total_seconds()
+                if computed_at is not None
+                else None
+            ),
+            "sampled": self.betweenness_sampled,
+        }
+
+    def subnetwork(self, node_ids: set[str]) -> dict[str, object]:
+        ordered = sorted(node_ids & self._positions.keys(), key=self._positions.__getitem__)
+        return _build_memory_network(
+            [self.memory_by_id[node_id] for node_id in ordered if node_id in self.memory_by_id],
+            [self.notion_by_id[node_id] for node_id in ordered if node_id in self.notion_by_id],
+        )
+
+
+@dataclass(frozen=True)
+class _NetworkSelection:
+    """Server-side filters for the memory network; the default selects everything."""
+
+    categories: frozenset[str] = frozenset()
+    min_degree: int = 0
+    decay_min: float | None = None
+    decay_max: float | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    top_k: int | None = None
+    lod: bool = False
+    lod_max_degree: int = 1
+
+
+def _network_selection(
+    category: list[str] | None = Query(default=None),
+    min_degree: int = Query(default=0, ge=0),
+    decay_min: float | None = Query(default=None, ge=0.0, le=1.0),
+    decay_max: float | None = Query(default=None, ge=0.0, le=1.0),
+    from_ts: datetime | None = Query(default=None, alias="from"),
+    to_ts: datetime | None = Query(default=None, alias="to"),
+    top_k: int | None = Query(default=None, ge=1),
+    lod: bool = False,
+    lod_max_degree: int = Query(default=1, ge=0),
+) -> _NetworkSelection:
+    return _NetworkSelection(
+        categories=frozenset(category or ()),
+        min_degree=min_degree,
+        decay_min=decay_min,
+        decay_max=decay_max,
+        start=_as_utc(from_ts),
+        end=_as_utc(to_ts),
+        top_k=top_k,
+        lod=lod,
+        lod_max_degree=lod_max_degree,
+    )
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _node_selected(
+    node: dict[str, object], memory_graph: _MemoryGraph, selection: _NetworkSelection
+) -> bool:
+    if selection.categories and str(node.get("category", "")) not in selection.categories:
+        return False
+    if _coerce_int(node.get("degree"), 0) < selection.min_degree:
+        return False
+    if node.get("is_notion") is True:
+        return True
+    decay = _coerce_float(node.get("decay"), 0.0)
+    if selection.decay_min is not None and decay < selection.decay_min:
+        return False
+    if selection.decay_max is not None and decay > selection.decay_max:
+        return False
+    if selection.start is not None or selection.end is not None:
+        memory = memory_graph.memory_by_id.get(str(node["id"]), {})
+        timestamp = _parse_iso_timestamp(memory.get("timestamp"))
+        if timestamp is None:
+            return False
+        if selection.start is not None and timestamp < selection.start:
+            return False
+        if selection.end is not None and timestamp > selection.end:
+            return False
+    return True
+
+
+def _collapse_memory_nodes(
+    nodes: list[dict[str, object]],
+    edges: list[dict[str, object]],
+    memory_graph: _MemoryGraph,
+    max_degree: int,
+) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    """Fold low-degree memories into a selected notion built from them."""
+    selected_ids = {str(node["id"]) for node in nodes}
+    merged_into: dict[str, str] = {}
+    for node in nodes:
+        node_id = str(node["id"])
+        if node.get("is_notion") is True or _coerce_int(node.get("degree"), 0) > max_degree:
+            continue
+        notion_id = next(
+            (
+                notion_id
+                for notion_id in memory_graph.notion_ids_by_memory.get(node_id, [])
+                if notion_id in selected_ids
+            ),
+            None,
+        )
+        if notion_id is not None:
+            merged_into[node_id] = notion_id
+    if not merged_into:
+        return nodes, edges
+
+    collapsed_counts = Counter(merged_into.values())
+    kept_nodes: list[dict[str, object]] = []
+    for node in nodes:
+        node_id = str(node["id"])
+        if node_id in merged_into:
+            continue
+        if node_id in collapsed_counts:
+            node = {**node, "collapsed_count": collapsed_counts[node_id]}
+        kept_nodes.append(node)
+
+    kept_edges: list[dict[str, object]] = []
+    seen_edges: set[tuple[str, str, str]] = set()
+    for edge in edges:
+        source = merged_into.get(str(edge["source"]), str(edge["source"]))
+        target = merged_into.get(str(edge["target"]), str(edge["target"]))
+        if source == target:
+            continue
+        edge_key = _edge_identity(source, target, str(edge.get("link_type", "related")))
+        if edge_key in seen_edges:
+            continue
+        seen_edges.add(edge_key)
+        kept_edges.append({**edge, "source": source, "target": target})
+    return kept_nodes, kept_edges
+
+
+def _select_memory_network(
+    memory_graph: _MemoryGraph, selection: _NetworkSelection
+) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    network = memory_graph.network
+    nodes = cast(list[dict[str, object]], network["nodes"])
+    edges = cast(list[dict[str, object]], network["edges"])
+    if selection == _NetworkSelection():
+        return nodes, edges
+
+    selected = [node for node in nodes if _node_selected(node, memory_graph, selection)]
+    if selection.top_k is not None and len(selected) > selection.top_k:
+        ranked = sorted(
+            selected,
+            key=lambda node: (
+                -_coerce_float(node.get("betweenness"), 0.0),
+                -_coerce_int(node.get("degree"), 0),
+                str(node["id"]),
+            ),
+        )
+        top_ids = {str(node["id"]) for node in ranked[: selection.top_k]}
+        selected = [node for node in selected if str(node["id"]) in top_ids]
+    selected_ids = {str(node["id"]) for node in selected}
+    selected_edges = [
+        edge
+        for edge in edges
+        if str(edge["source"]) in selected_ids and str(edge["target"]) in selected_ids
+    ]
+    if selection.lod:
+        return _collapse_memory_nodes(
+            selected, selected_edges, memory_graph, selection.lod_max_degree
+        )
+    return selected, selected_edges
+
+
+def _page_memory_network(
+    nodes: list[dict[str, object]],
+    edges: list[dict[str, object]],
+    cursor: int,
+    limit: int | None,
+) -> tuple[list[dict[str, object]], list[dict[str, object]], int | None]:
+    """Slice nodes; each edge ships once, on the page holding its later endpoint."""
+    if limit is None and cursor == 0:
+        return nodes, edges, None
+    end = len(nodes) if limit is None else cursor + limit
+    positions = {str(node["id"]): index for index, node in enumerate(nodes)}
+    page_edges = [
+        edge
+        for edge in edges
+        if cursor <= max(positions[str(edge["source"])], positions[str(edge["target"])]) < end
+    ]
+    return nodes[cursor:end], page_edges, end if end < len(nodes) else None
+
+
+def _iter_network_ndjson(
+    header: dict[str, object],
+    nodes: list[dict[str, object]],
+    edges: list[dict[str, object]],
+) -> Iterator[bytes]:
+    lines = [json.dumps({"type": "meta", **header})]
+    for node in nodes:
+        lines.append(json.dumps({"type": "node", "data": node}))
+        if len(lines) >= _NDJSON_CHUNK_LINES:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    for edge in edges:
+        lines.append(json.dumps({"type": "edge", "data": edge}))
+        if len(lines) >= _NDJSON_CHUNK_LINES:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+class _MemoryGraphCache:
+    """Process-wide memory graph, rebuilt on change to Chroma or ``notions.json``.
+
+    A rebuild is not incremental: a changed source is re-read in full, and the edges
+    and networkx graph are rebuilt from all rows. Only whole sources are reused, so a
+    notion update keeps the memory rows already read from Chroma. Betweenness runs on
+    a single background worker after every rebuild so requests never wait for it.
+    """
+
+    def __init__(self, settings: DashboardSettings, chroma: _ChromaReader) -> None:
+        self._settings = settings
+        self._chroma = chroma
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._graph: _MemoryGraph | None = None
+        self._memory_signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._notion_signature: tuple[int, int] | None = None
+
+    def get(self) -> _MemoryGraph:
+        memory_signature = _memory_source_signature(self._settings)
+        notion_signature = _notion_source_signature(self._settings)
+        with self._lock:
+            graph = self._graph
+            memory_fresh = graph is not None and memory_signature == self._memory_signature
+            notion_fresh = graph is not None and notion_signature == self._notion_signature
+            if graph is not None and memory_fresh and notion_fresh:
+                return graph
+            memory_rows = graph.memory_rows if graph is not None and memory_fresh else None
+            if memory_rows is None:
+                memory_rows, loaded = self._load_memory_rows()
+                # A failed read is retried on the next request instead of being cached.
+                memory_signature_to_store = memory_signature if loaded else None
+            else:
+                memory_signature_to_store = memory_signature
+            notion_rows = (
+                graph.notion_rows
+                if graph is not None and notion_fresh
+                else _load_notion_rows(self._settings)
+            )
+            graph = _MemoryGraph(memory_rows, notion_rows, previous=graph)
+            self._graph = graph
+            self._memory_signature = memory_signature_to_store
+            self._notion_signature = notion_signature
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ego-dashboard-centrality"
+                )
+            self._executor.submit(self._refresh_centrality, graph)
+            return graph
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refresh_centrality(self, graph: _MemoryGraph) -> None:
+        if graph is not self._graph:
+            # Superseded by a newer rebuild; its own job is already queued.
+            return
+        exact_max_nodes = self._settings.memory_betweenness_exact_max_nodes
+        try:
+            betweenness = _compute_betweenness(
+                graph.graph,
+                exact_max_nodes=exact_max_nodes,
+                sample_size=self._settings.memory_betweenness_samples,
+            )
+        except Exception:
+            logger.exception("Failed to compute memory network betweenness")
+            return
+        graph.apply_betweenness(
+            betweenness, sampled=graph.graph.number_of_nodes() > exact_max_nodes
+        )
+
+    def _load_memory_rows(self) -> tuple[list[dict[str, object]], bool]:
+        if not self._settings.ego_mcp_data_dir:
+            return [], True
+        chroma_dir = Path(self._settings.ego_mcp_data_dir) / "chroma"
+        if not chroma_dir.exists():
+            return _load_memory_rows(self._settings), True
+        try:
+            return self._chroma.read(_read_memory_rows), True
+        except Exception:
+            logger.exception("Failed to load memory nodes for Memory Network from %s", chroma_dir)
+            return [], False
+
+
+class _NotionIndexCache:
+    """Memory id -> ids of notions built from it, reloaded when ``notions.json`` changes."""
+
+    def __init__(self, settings: DashboardSettings) -> None:
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._signature: tuple[int, int] | None = None
+        self._index: dict[str, list[str]] | None = None
+
+    def get(self) -> dict[str, list[str]]:
+        signature = _notion_source_signature(self._settings)
+        with self._lock:
+            if self._index is None or signature != self._signature:
+                self._index = _notion_ids_by_memory(_load_notion_rows(self._settings))
+                self._signature = signature
+            return self._index
+
+
 def _load_relationship_rows(settings: DashboardSettings) -> list[dict[str, object]]:
     if not settings.ego_mcp_data_dir:
         return []
@@ -771,10 +1428,15 @@ def _default_store(settings: DashboardSettings | None = None) -> StoreProtocol:
             app_settings.database_url,
             app_settings.redis_url,
             desire_catalog=desire_catalog,
+            storage_policy=app_settings.telemetry_storage_policy,
         )
         sql_store.initialize()
         return sql_store
-    return TelemetryStore(desire_catalog=desire_catalog)
+    return TelemetryStore(
+        desire_catalog=desire_catalog,
+        retention=app_settings.inmemory_retention,
+        max_items=app_settings.inmemory_max_items,
+    )
 
 
 def create_app(
@@ -794,6 +1456,7 @@ def create_app(
     @asynccontextmanager
     async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         nonlocal local_ingestor_thread, local_ingestor_stop_event
+        await asyncio.to_thread(chroma.open)
         if use_local_inmemory_ingestor:
             if local_ingestor_thread is None or not local_ingestor_thread.is_alive():
                 local_ingestor_stop_event = threading.Event()
@@ -812,6 +1475,9 @@ def create_app(
         try:
             yield
         finally:
+            await broadcaster.stop()
+            memory_graphs.shutdown()
+            chroma.close()
             if use_local_inmemory_ingestor:
                 if local_ingestor_stop_event is not None:
                     local_ingestor_stop_event.set()
@@ -850,25 +1516,53 @@ def create_app(
             }
         return result
 
+    chroma = _ChromaReader(app_settings)
+    memory_graphs = _MemoryGraphCache(app_settings, chroma)
+    notion_index = _NotionIndexCache(app_settings)
+
+    # One producer feeds every /ws/current client; see CurrentBroadcaster.
+    subscribe = getattr(telemetry, "subscribe", None)
+    broadcaster = CurrentBroadcaster(
+        _current_with_file_relationship,
+        telemetry.logs,
+        subscribe if callable(subscribe) else None,
+    )
+
     @app.get("/api/v1/current")
     def get_current() -> dict[str, object]:
         return _current_with_file_relationship()
 
-    @app.get("/api/v1/usage/tools")
+    @app.get("/api/v1/usage/tools", response_model=None)
     def get_tool_usage(
         from_ts: datetime = Query(alias="from"),
         to_ts: datetime = Query(alias="to"),
         bucket: str = "1m",
-    ) -> dict[str, object]:
+        series_format: SeriesFormat = Query(default="json", alias="format"),
+    ) -> dict[str, object] | Response:
+        if series_format == "columnar":
+            if isinstance(telemetry, ColumnarStoreProtocol):
+                return _columnar_response(telemetry.tool_usage_columns(from_ts, to_ts, bucket))
+            return _columnar_response(
+                series_from_items(telemetry.tool_usage(from_ts, to_ts, bucket))
+            )
         return {"items": telemetry.tool_usage(from_ts, to_ts, bucket)}
 
-    @app.get("/api/v1/metrics/{key}")
+    @app.get("/api/v1/metrics/{key}", response_model=None)
     def get_metric(
         key: str,
         from_ts: datetime = Query(alias="from"),
         to_ts: datetime = Query(alias="to"),
         bucket: str = "1m",
-    ) -> dict[str, object]:
+        series_format: SeriesFormat = Query(default="json", alias="format"),
+    ) -> dict[str, object] | Response:
+        if series_format == "columnar":
+            if isinstance(telemetry, ColumnarStoreProtocol):
+                return _columnar_response(
+                    telemetry.metric_history_columns(key, from_ts, to_ts, bucket)
+                )
+            return _columnar_response(
+                series_from_items(telemetry.metric_history(key, from_ts, to_ts, bucket))
+            )
         return {"items": telemetry.metric_history(key, from_ts, to_ts, bucket)}
 
     @app.get("/api/v1/metrics/{key}/string-timeline")
@@ -879,13 +1573,22 @@ def create_app(
     ) -> dict[str, object]:
         return {"items": telemetry.string_timeline(key, from_ts, to_ts)}
 
-    @app.get("/api/v1/metrics/{key}/heatmap")
+    @app.get("/api/v1/metrics/{key}/heatmap", response_model=None)
     def get_string_heatmap(
         key: str,
         from_ts: datetime = Query(alias="from"),
         to_ts: datetime = Query(alias="to"),
         bucket: str = "5m",
-    ) -> dict[str, object]:
+        series_format: SeriesFormat = Query(default="json", alias="format"),
+    ) -> dict[str, object] | Response:
+        if series_format == "columnar":
+            if isinstance(telemetry, ColumnarStoreProtocol):
+                return _columnar_response(
+                    telemetry.string_heatmap_columns(key, from_ts, to_ts, bucket)
+                )
+            return _columnar_response(
+                series_from_items(telemetry.string_heatmap(key, from_ts, to_ts, bucket))
+            )
         return {"items": telemetry.string_heatmap(key, from_ts, to_ts, bucket)}
 
     @app.get("/api/v1/desires/keys")
@@ -899,14 +1602,43 @@ def create_app(
     def get_desire_catalog() -> dict[str, object]:
         return load_desire_catalog(app_settings.ego_mcp_data_dir).to_response()
 
-    @app.get("/api/v1/logs")
+    @app.get("/api/v1/logs", response_model=None)
     def get_logs(
         from_ts: datetime = Query(alias="from"),
         to_ts: datetime = Query(alias="to"),
         level: str | None = None,
         search: str | None = None,
+        after: str | None = None,
+        limit: int = Query(default=300, ge=1, le=5_000),
+    ) -> dict[str, object] | StreamingResponse:
+        if not isinstance(telemetry, LogPageStoreProtocol):
+            return {"items": telemetry.logs(from_ts, to_ts, level, search=search)}
+        cursor = _parse_log_cursor(after) if after else None
+        return StreamingResponse(
+            _iter_log_pages(telemetry, from_ts, to_ts, level, search, cursor, limit),
+            media_type="application/json",
+        )
+
+    @app.get("/api/v1/latency/tools")
+    def get_tool_latency(
+        from_ts: datetime = Query(alias="from"),
+        to_ts: datetime = Query(alias="to"),
+        bucket: str = "5m",
+    ) -> dict[str, object]:
+        if not isinstance(telemetry, LatencyStoreProtocol):
+            return {"items": []}
+        return {"items": telemetry.tool_latency(from_ts, to_ts, bucket)}
+
+    @app.get("/api/v1/latency/stages")
+    def get_stage_latency(
+        from_ts: datetime = Query(alias="from"),
+        to_ts: datetime = Query(alias="to"),
+        bucket: str = "5m",
+        tool: str | None = None,
     ) -> dict[str, object]:
-        return {"items": telemetry.logs(from_ts, to_ts, level, search=search)}
+        if not isinstance(telemetry, LatencyStoreProtocol):
+            return {"items": []}
+        return {"items": telemetry.stage_latency(from_ts, to_ts, bucket, tool)}
 
     @app.get("/api/v1/alerts/anomalies")
     def get_anomalies(
@@ -917,12 +1649,41 @@ def create_app(
         return {"items": telemetry.anomaly_alerts(from_ts, to_ts, bucket)}
 
     @app.get("/api/v1/memory/network")
-    def get_memory_network() -> dict[str, object]:
-        return _load_memory_network(app_settings)
+    def get_memory_network(
+        selection: _NetworkSelection = Depends(_network_selection),
+        cursor: int = Query(default=0, ge=0),
+        limit: int | None = Query(default=None, ge=1, le=10_000),
+    ) -> dict[str, object]:
+        memory_graph = memory_graphs.get()
+        nodes, edges = _select_memory_network(memory_graph, selection)
+        page_nodes, page_edges, next_cursor = _page_memory_network(nodes, edges, cursor, limit)
+        return {
+            **memory_graph.network,
+            "nodes": page_nodes,
+            "edges": page_edges,
+            "centrality": memory_graph.centrality_status(),
+            "page": {"total_nodes": len(nodes), "next_cursor": next_cursor},
+        }
+
+    @app.get("/api/v1/memory/network/stream")
+    def stream_memory_network(
+        selection: _NetworkSelection = Depends(_network_selection),
+    ) -> StreamingResponse:
+        memory_graph = memory_graphs.get()
+        nodes, edges = _select_memory_network(memory_graph, selection)
+        header: dict[str, object] = {
+            "stats": memory_graph.network["stats"],
+            "centrality": memory_graph.centrality_status(),
+            "node_count": len(nodes),
+            "edge_count": len(edges),
+        }
+        return StreamingResponse(
+            _iter_network_ndjson(header, nodes, edges), media_type="application/x-ndjson"
+        )
 
     @app.get("/api/v1/memory/{memory_id}")
     def get_memory_detail(memory_id: str) -> dict[str, object]:
-        detail = _load_memory_detail(app_settings, memory_id)
+        detail = _load_memory_detail(app_settings, memory_id, notion_index.get(), chroma)
         if detail is None:
             raise HTTPException(status_code=404, detail="Memory not found")
         return detail
@@ -932,44 +1693,18 @@ def create_app(
         node_id: str,
         depth: int = Query(default=1, ge=1, le=3),
     ) -> dict[str, object]:
-        memory_rows = _load_memory_rows(app_settings)
-        notion_rows = _load_notion_rows(app_settings)
-        full_network = _build_memory_network(memory_rows, notion_rows)
-        full_nodes = cast(list[dict[str, object]], full_network["nodes"])
-        full_edges = cast(list[dict[str, object]], full_network["edges"])
-        full_graph = _build_graph(
-            {
-                str(node["id"])
-                for node in full_nodes
-                if isinstance(node.get("id"), str) and node.get("id")
-            },
-            full_edges,
-        )
-        if node_id not in full_graph:
+        memory_graph = memory_graphs.get()
+        if node_id not in memory_graph.graph:
             raise HTTPException(status_code=404, detail="Node not found")
-        subgraph = nx.ego_graph(full_graph, node_id, radius=depth)
-        subgraph_ids = {str(graph_node_id) for graph_node_id in subgraph.nodes}
-        return _build_memory_network(
-            [row for row in memory_rows if str(row.get("id", "")) in subgraph_ids],
-            [row for row in notion_rows if str(row.get("id", "")) in subgraph_ids],
-        )
+        subgraph = nx.ego_graph(memory_graph.graph, node_id, radius=depth)
+        return memory_graph.subnetwork({str(graph_node_id) for graph_node_id in subgraph.nodes})
 
     @app.get("/api/v1/memory/network/path")
     def get_memory_path(
         from_id: str = Query(alias="from"),
         to_id: str = Query(alias="to"),
     ) -> dict[str, object]:
-        network = _load_memory_network(app_settings)
-        nodes = cast(list[dict[str, object]], network["nodes"])
-        edges = cast(list[dict[str, object]], network["edges"])
-        graph = _build_graph(
-            {
-                str(node["id"])
-                for node in nodes
-                if isinstance(node.get("id"), str) and node.get("id")
-            },
-            edges,
-        )
+        graph = memory_graphs.get().graph
         if from_id not in graph or to_id not in graph:
             raise HTTPException(status_code=404, detail="Node not found")
         try:
@@ -1019,51 +1754,17 @@ def create_app(
     @app.websocket("/ws/current")
     async def ws_current(websocket: WebSocket) -> None:
         await websocket.accept()
-        recent_log_keys: deque[str] = deque(maxlen=512)
-        recent_log_key_set: set[str] = set()
+        try:
+            queue = await broadcaster.attach()
+        except Exception:
+            await websocket.close()
+            return
         try:
             while True:
-                await websocket.send_json(
-                    {
-                        "type": "current_snapshot",
-                        "at": datetime.now(tz=UTC).isoformat(),
-                        "data": _current_with_file_relationship(),
-                    }
-                )
-                end = datetime.now(tz=UTC)
-                start = end - timedelta(minutes=5)
-                logs = telemetry.logs(start, end)
-                for log in logs:
-                    log_key = json.dumps(
-                        {
-                            "ts": log.get("ts"),
-                            "level": log.get("level"),
-                            "logger": log.get("logger"),
-                            "message": log.get("message"),
-                            "fields": log.get("fields", {}),
-                        },
-                        sort_keys=True,
-                        default=str,
-                    )
-                    if log_key in recent_log_key_set:
-                        continue
-                    payload = dict(log)
-                    fields = payload.get("fields")
-                    if isinstance(fields, dict) and "tool_name" in fields:
-                        payload.setdefault("tool_name", fields["tool_name"])
-                    if "ok" not in payload:
-                        level = str(payload.get("level", "")).upper()
-                        message = str(payload.get("message", ""))
-                        payload["ok"] = not (level == "ERROR" or message == "Tool execution failed")
-                    await websocket.send_json({"type": "log_line", "data": payload})
-                    if len(recent_log_keys) == recent_log_keys.maxlen:
-                        evicted = recent_log_keys[0]
-                        recent_log_key_set.discard(evicted)
-                    recent_log_keys.append(log_key)
-                    recent_log_key_set.add(log_key)
-                await websocket.send_json({"type": "ping"})
-                await asyncio.sleep(2)
+                await websocket.send_json(await queue.get())
         except Exception:
             await websocket.close()
+        finally:
+            await broadcaster.detach(queue)
 
     return app
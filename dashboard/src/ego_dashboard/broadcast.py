@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+from ego_dashboard.store import StreamListener
+
+logger = logging.getLogger(__name__)
+
+type StreamMessage = dict[str, object]
+
+
+class _LogsReader(Protocol):
+    def __call__(
+        self,
+        start: datetime,
+        end: datetime,
+        level: str | None = None,
+        *,
+        search: str | None = None,
+    ) -> list[dict[str, object]]: ...
+
+
+def _log_identity(row: dict[str, object]) -> str:
+    return json.dumps(
+        {
+            "ts": row.get("ts"),
+            "level": row.get("level"),
+            "logger": row.get("logger"),
+            "message": row.get("message"),
+            "fields": row.get("fields", {}),
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _log_line_payload(row: dict[str, object]) -> dict[str, object]:
+    payload = dict(row)
+    fields = payload.get("fields")
+    if isinstance(fields, dict) and "tool_name" in fields:
+        payload.setdefault("tool_name", fields["tool_name"])
+    if "ok" not in payload:
+        level = str(payload.get("level", "")).upper()
+        message = str(payload.get("message", ""))
+        payload["ok"] = not (level == "ERROR" or message == "Tool execution failed")
+    return payload
+
+
+class CurrentBroadcaster:
+    """Single producer for ``/ws/current``: one snapshot/log pipeline fanned out to queues.
+
+    Stores that expose ``subscribe`` push change notifications (in-process listeners or
+    Redis pub/sub); other stores are polled once per heartbeat for every client together.
+    """
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict[str, object]],
+        logs: _LogsReader,
+        subscribe: Callable[[StreamListener], Callable[[], None]] | None = None,
+        *,
+        heartbeat_seconds: float = 2.0,
+        debounce_seconds: float = 0.1,
+        log_window: timedelta = timedelta(minutes=5),
+        backlog_size: int = 512,
+        client_queue_size: int = 256,
+    ) -> None:
+        self._snapshot_reader = snapshot
+        self._logs_reader = logs
+        self._subscribe = subscribe
+        self._heartbeat_seconds = heartbeat_seconds
+        self._debounce_seconds = debounce_seconds
+        self._log_window = log_window
+        self._client_queue_size = client_queue_size
+        self._clients: set[asyncio.Queue[StreamMessage]] = set()
+        # (monotonic arrival time, payload) for priming newly attached clients.
+        self._backlog: deque[tuple[float, dict[str, object]]] = deque(maxlen=backlog_size)
+        self._seen_logs: deque[str] = deque(maxlen=backlog_size)
+        self._seen_log_set: set[str] = set()
+        self._snapshot: StreamMessage | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._dirty: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+        self._polling = subscribe is None
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def attach(self) -> asyncio.Queue[StreamMessage]:
+        """Register a client queue primed with the latest snapshot and recent log lines."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._task is None or self._task.done() or self._loop is not loop:
+                await self._start(loop)
+            queue: asyncio.Queue[StreamMessage] = asyncio.Queue(self._client_queue_size)
+            if self._snapshot is not None:
+                queue.put_nowait(self._snapshot)
+            cutoff = time.monotonic() - self._log_window.total_seconds()
+            for received_at, payload in self._backlog:
+                if received_at >= cutoff and not queue.full():
+                    queue.put_nowait({"type": "log_line", "data": payload})
+            if not queue.full():
+                queue.put_nowait({"type": "ping"})
+            self._clients.add(queue)
+        return queue
+
+    async def detach(self, queue: asyncio.Queue[StreamMessage]) -> None:
+        self._clients.discard(queue)
+        if not self._clients:
+            await self.stop()
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        unsubscribe, self._unsubscribe = self._unsubscribe, None
+        if unsubscribe is not None:
+            await asyncio.to_thread(unsubscribe)
+
+    async def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        await self.stop()
+        self._loop = loop
+        self._dirty = asyncio.Event()
+        self._polling = self._subscribe is None
+        if self._subscribe is not None:
+            try:
+                self._unsubscribe = await asyncio.to_thread(self._subscribe, self._on_store_message)
+            except Exception:
+                logger.warning("stream subscription failed; polling instead", exc_info=True)
+                self._polling = True
+        await self._poll_logs()
+        await self._refresh_snapshot()
+        self._task = loop.create_task(self._run())
+
+    def _on_store_message(self, message: dict[str, object]) -> None:
+        # Called from ingest threads; hop onto the event loop before touching client queues.
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._handle_message, message)
+        except RuntimeError:
+            # The loop has already shut down; the next attach() resubscribes.
+            pass
+
+    def _handle_message(self, message: dict[str, object]) -> None:
+        data = message.get("data")
+        if message.get("type") == "log_line" and isinstance(data, dict):
+            self._accept_log(data)
+        if self._dirty is not None:
+            self._dirty.set()
+
+    def _accept_log(self, row: dict[str, object]) -> None:
+        identity = _log_identity(row)
+        if identity in self._seen_log_set:
+            return
+        if len(self._seen_logs) == self._seen_logs.maxlen:
+            self._seen_log_set.discard(self._seen_logs[0])
+        self._seen_logs.append(identity)
+        self._seen_log_set.add(identity)
+        payload = _log_line_payload(row)
+        self._backlog.append((time.monotonic(), payload))
+        self._publish({"type": "log_line", "data": payload})
+
+    def _publish(self, message: StreamMessage) -> None:
+        for queue in self._clients:
+            if queue.full():
+                # A slow client loses its oldest message instead of stalling everyone else.
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def _poll_logs(self) -> None:
+        end = datetime.now(tz=UTC)
+        rows = await asyncio.to_thread(self._logs_reader, end - self._log_window, end)
+        for row in rows:
+            self._accept_log(row)
+
+    async def _refresh_snapshot(self) -> None:
+        data = await asyncio.to_thread(self._snapshot_reader)
+        self._snapshot = {
+            "type": "current_snapshot",
+            "at": datetime.now(tz=UTC).isoformat(),
+            "data": data,
+        }
+        self._publish(self._snapshot)
+
+    async def _run(self) -> None:
+        dirty = self._dirty
+        assert dirty is not None
+        while True:
+            try:
+                await asyncio.wait_for(dirty.wait(), timeout=self._heartbeat_seconds)
+            except TimeoutError:
+                # Heartbeat: rate windows slide with wall time even without new events.
+                try:
+                    if self._polling:
+                        await self._poll_logs()
+                    await self._refresh_snapshot()
+                except Exception:
+                    logger.warning("current snapshot refresh failed", exc_info=True)
+                self._publish({"type": "ping"})
+                continue
+            # Coalesce bursts of ingested rows into one snapshot recomputation.
+            await asyncio.sleep(self._debounce_seconds)
+            dirty.clear()
+            try:
+                await self._refresh_snapshot()
+            except Exception:
+                logger.warning("current snapshot refresh failed", exc_info=True)
@@ -0,0 +1,147 @@
+"""Packed columnar encoding for time-series responses (``?format=columnar``).
+
+Wire layout, all little-endian::
+
+    b"EGC1" | uint32 header_len | header JSON | int64[rows] ts | float64[rows] per column
+
+The header is ``{"rows": n, "ts_unit": "ms", "columns": [name, ...]}``; column arrays
+follow the timestamp array in header order.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.ego-dashboard.columnar"
+_MAGIC = b"EGC1"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def epoch_millis(value: datetime) -> int:
+    aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    return (aware - _EPOCH) // _MILLISECOND
+
+
+@dataclass(slots=True)
+class ColumnarSeries:
+    """Timestamps (epoch milliseconds) plus named float64 columns of equal length."""
+
+    ts: array[int] = field(default_factory=lambda: array("q"))
+    columns: dict[str, array[float]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def encode(self) -> bytes:
+        header = json.dumps(
+            {"rows": len(self.ts), "ts_unit": "ms", "columns": list(self.columns)},
+            separators=(",", ":"),
+        ).encode()
+        parts = [_MAGIC, struct.pack("<I", len(header)), header, _little_endian(self.ts)]
+        parts.extend(_little_endian(column) for column in self.columns.values())
+        return b"".join(parts)
+
+
+def decode_columnar(payload: bytes) -> ColumnarSeries:
+    """Inverse of :meth:`ColumnarSeries.encode`, used by tests and benchmarks."""
+    if payload[:4] != _MAGIC:
+        raise ValueError("not a columnar payload")
+    (header_len,) = struct.unpack_from("<I", payload, 4)
+    offset = 8 + header_len
+    header = json.loads(payload[8:offset])
+    rows = int(header["rows"])
+    ts: array[int] = array("q")
+    ts.frombytes(payload[offset : offset + rows * 8])
+    offset += rows * 8
+    columns: dict[str, array[float]] = {}
+    for name in header["columns"]:
+        column: array[float] = array("d")
+        column.frombytes(payload[offset : offset + rows * 8])
+        offset += rows * 8
+        columns[str(name)] = column
+    if sys.byteorder == "big":
+        ts.byteswap()
+        for column in columns.values():
+            column.byteswap()
+    return ColumnarSeries(ts, columns)
+
+
+def series_from_values(rows: Iterable[tuple[datetime, float | None]]) -> ColumnarSeries:
+    """Single ``value`` column from ``(bucket, value)`` rows, skipping NULL values."""
+    series = ColumnarSeries(columns={"value": array("d")})
+    values = series.columns["value"]
+    for ts, value in rows:
+        if value is None:
+            continue
+        series.ts.append(epoch_millis(ts))
+        values.append(float(value))
+    return series
+
+
+def series_from_counts(
+    rows: Iterable[tuple[datetime, str, float]],
+    timeline: Sequence[datetime] | None = None,
+) -> ColumnarSeries:
+    """Pivot ``(bucket, name, count)`` rows into one column per name.
+
+    With ``timeline`` every listed bucket gets a row (missing counts are ``0``);
+    otherwise only buckets present in ``rows`` appear, in first-seen order.
+    """
+    positions: dict[int, int] = {}
+    series = ColumnarSeries()
+    if timeline is not None:
+        for bucket in timeline:
+            positions[epoch_millis(bucket)] = len(series.ts)
+            series.ts.append(epoch_millis(bucket))
+    cells: list[tuple[int, str, float]] = []
+    for ts, name, count in rows:
+        millis = epoch_millis(ts)
+        position = positions.get(millis)
+        if position is None:
+            if timeline is not None:
+                continue
+            position = positions[millis] = len(series.ts)
+            series.ts.append(millis)
+        cells.append((position, name, float(count)))
+    size = len(series.ts)
+    for name in sorted({name for _, name, _ in cells}):
+        series.columns[name] = array("d", bytes(8 * size))
+    for position, name, count in cells:
+        series.columns[name][position] = count
+    return series
+
+
+def series_from_items(items: Iterable[Mapping[str, object]]) -> ColumnarSeries:
+    """Convert the JSON item shapes (``value``, ``counts`` or one key per tool)."""
+    timeline: list[datetime] = []
+    cells: list[tuple[datetime, str, float]] = []
+    for item in items:
+        ts = datetime.fromisoformat(str(item["ts"]))
+        timeline.append(ts)
+        for key, value in item.items():
+            if key == "ts":
+                continue
+            if key == "counts" and isinstance(value, Mapping):
+                cells.extend(
+                    (ts, str(name), float(count))
+                    for name, count in value.items()
+                    if isinstance(count, (int, float))
+                )
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append((ts, key, float(value)))
+    return series_from_counts(cells, timeline)
+
+
+def _little_endian[T: (int, float)](values: array[T]) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -12,13 +12,26 @@ from psycopg.errors import UniqueViolation
 from ego_dashboard.ingestor import _resolve_source_files
 from ego_dashboard.models import DashboardEvent, LogEvent
 from ego_dashboard.sql_store import SqlTelemetryStore
-from ego_dashboard.telemetry_identity import dashboard_event_dedupe_key, log_event_dedupe_key
+from ego_dashboard.telemetry_identity import (
+    DEDUPE_KEYS_V2_MIGRATION,
+    LEGACY_DEDUPE_KEY_LENGTH,
+    dashboard_event_dedupe_key,
+    log_event_dedupe_key,
+)
 
 _BATCH_SIZE = 1000
+# (rows to key, rows whose keys are already final) for each pass over a table.
+_MISSING_KEYS = ("dedupe_key IS NULL", "dedupe_key IS NOT NULL")
+_LEGACY_KEYS = (
+    f"length(dedupe_key) = {LEGACY_DEDUPE_KEY_LENGTH}",
+    f"length(dedupe_key) <> {LEGACY_DEDUPE_KEY_LENGTH}",
+)
 
 
 @dataclass(frozen=True)
 class CleanupStats:
+    rehashed_tool_events: int
+    rehashed_log_events: int
     backfilled_tool_events: int
     backfilled_log_events: int
     deleted_tool_duplicates: int
@@ -187,12 +200,15 @@ def _apply_backfill_updates(
     return updated_rows, deleted_duplicates
 
 
-def _backfill_tool_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int, int]:
+def _backfill_tool_event_dedupe_keys(
+    cursor: Any, *, dry_run: bool, selection: tuple[str, str] = _MISSING_KEYS
+) -> tuple[int, int]:
+    pending, settled = selection
     cursor.execute(
-        """
+        f"""
         SELECT ts, dedupe_key
         FROM tool_events
-        WHERE dedupe_key IS NOT NULL
+        WHERE {settled}
         """
     )
     seen: set[tuple[object, str]] = {
@@ -201,7 +217,7 @@ def _backfill_tool_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int
         if isinstance(dedupe_key, str)
     }
     cursor.execute(
-        """
+        f"""
         SELECT ctid::text,
                ts,
                event_type,
@@ -216,7 +232,7 @@ def _backfill_tool_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int
                private,
                message
         FROM tool_events
-        WHERE dedupe_key IS NULL
+        WHERE {pending}
         ORDER BY ts ASC
         """
     )
@@ -238,12 +254,15 @@ def _backfill_tool_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int
     return (updated_rows, len(duplicate_ctids) + deleted_on_conflict)
 
 
-def _backfill_log_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int, int]:
+def _backfill_log_event_dedupe_keys(
+    cursor: Any, *, dry_run: bool, selection: tuple[str, str] = _MISSING_KEYS
+) -> tuple[int, int]:
+    pending, settled = selection
     cursor.execute(
-        """
+        f"""
         SELECT ts, dedupe_key
         FROM log_events
-        WHERE dedupe_key IS NOT NULL
+        WHERE {settled}
         """
     )
     seen: set[tuple[object, str]] = {
@@ -252,7 +271,7 @@ def _backfill_log_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int,
         if isinstance(dedupe_key, str)
     }
     cursor.execute(
-        """
+        f"""
         SELECT ctid::text,
                ts,
                level,
@@ -261,7 +280,7 @@ def _backfill_log_event_dedupe_keys(cursor: Any, *, dry_run: bool) -> tuple[int,
                private,
                fields
         FROM log_events
-        WHERE dedupe_key IS NULL
+        WHERE {pending}
         ORDER BY ts ASC
         """
     )
@@ -374,6 +393,17 @@ def _initialize_checkpoints(cursor: Any, log_path: str, *, dry_run: bool) -> int
     return count
 
 
+def _record_dedupe_keys_migration(cursor: Any) -> None:
+    cursor.execute(
+        """
+        INSERT INTO dashboard_migrations (name)
+        VALUES (%s)
+        ON CONFLICT (name) DO NOTHING
+        """,
+        (DEDUPE_KEYS_V2_MIGRATION,),
+    )
+
+
 def run_cleanup(
     *,
     database_url: str,
@@ -384,25 +414,41 @@ def run_cleanup(
 
     with psycopg.connect(database_url) as conn:
         with conn.cursor() as cur:
+            # Rewrite version 1 keys first so the backfill and duplicate passes only
+            # compare keys of the current version.
+            rehashed_tool_events, rehashed_tool_duplicates = _backfill_tool_event_dedupe_keys(
+                cur, dry_run=dry_run, selection=_LEGACY_KEYS
+            )
+            rehashed_log_events, rehashed_log_duplicates = _backfill_log_event_dedupe_keys(
+                cur, dry_run=dry_run, selection=_LEGACY_KEYS
+            )
             backfilled_tool_events, backfilled_tool_from_null = _backfill_tool_event_dedupe_keys(
                 cur, dry_run=dry_run
             )
             backfilled_log_events, backfilled_log_from_null = _backfill_log_event_dedupe_keys(
                 cur, dry_run=dry_run
             )
-            deleted_tool_duplicates = backfilled_tool_from_null + _delete_tool_event_duplicates(
-                cur, dry_run=dry_run
+            deleted_tool_duplicates = (
+                rehashed_tool_duplicates
+                + backfilled_tool_from_null
+                + _delete_tool_event_duplicates(cur, dry_run=dry_run)
             )
-            deleted_log_duplicates = backfilled_log_from_null + _delete_log_event_duplicates(
-                cur, dry_run=dry_run
+            deleted_log_duplicates = (
+                rehashed_log_duplicates
+                + backfilled_log_from_null
+                + _delete_log_event_duplicates(cur, dry_run=dry_run)
             )
             initialized_checkpoints = (
                 _initialize_checkpoints(cur, log_path, dry_run=dry_run) if log_path else 0
             )
+            if not dry_run:
+                _record_dedupe_keys_migration(cur)
         if not dry_run:
             conn.commit()
 
     return CleanupStats(
+        rehashed_tool_events=rehashed_tool_events,
+        rehashed_log_events=rehashed_log_events,
         backfilled_tool_events=backfilled_tool_events,
         backfilled_log_events=backfilled_log_events,
         deleted_tool_duplicates=deleted_tool_duplicates,
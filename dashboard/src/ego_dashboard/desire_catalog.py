@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict, dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal, cast
 
 from ego_dashboard.constants import DESIRE_METRIC_KEYS
+from ego_dashboard.latency import stage_name
 
 LEGACY_FIXED_DESIRE_IDS: tuple[str, ...] = DESIRE_METRIC_KEYS
 _RESERVED_NUMERIC_METRIC_KEYS = frozenset(
@@ -38,13 +40,16 @@ class DesireCatalog:
     implicit_rules: tuple[dict[str, Any], ...] = ()
     emergent: dict[str, Any] = field(default_factory=dict)
 
-    @property
-    def fixed_ids(self) -> set[str]:
-        return {item.id for item in self.fixed_desires}
+    @cached_property
+    def fixed_ids(self) -> frozenset[str]:
+        return frozenset(item.id for item in self.fixed_desires)
 
     def is_visible_desire_metric(self, key: str) -> bool:
         if key in _RESERVED_NUMERIC_METRIC_KEYS:
             return False
+        # Per-stage latencies share numeric_metrics with desire levels on attune/feel_desires.
+        if stage_name(key) is not None:
+            return False
         if key in self.fixed_ids:
             return True
         if key in LEGACY_FIXED_DESIRE_IDS:
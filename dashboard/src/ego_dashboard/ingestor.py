@@ -8,9 +8,12 @@ import re
 import threading
 import time
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Protocol, runtime_checkable
 
+from pydantic import BaseModel
+
 from ego_dashboard.constants import DESIRE_TELEMETRY_TOOL_NAMES
 from ego_dashboard.desire_catalog import DesireCatalog, default_desire_catalog, load_desire_catalog
 from ego_dashboard.models import DashboardEvent, LogEvent
@@ -27,6 +30,35 @@ _RELATIONSHIP_RE = re.compile(
     r"interactions=(?P<interactions>[0-9]+),\s*"
     r"shared_episodes=(?P<shared_episodes>[0-9]+)"
 )
+_RESERVED_LOG_KEYS = frozenset({"ts", "timestamp", "level", "logger", "message", "private"})
+_EGO_MCP_SERVER_LOGGER = "ego_mcp.server"
+# Tool-call fields that are read explicitly or never become event params.
+_NON_PARAM_KEYS = frozenset(
+    {
+        "tool_name",
+        "message",
+        "logger",
+        "level",
+        "timestamp",
+        "ts",
+        "tool_output",
+        "tool_output_chars",
+        "tool_output_truncated",
+        "duration_ms",
+        "stage_ms",
+        "emotion_primary",
+        "emotion_intensity",
+        "valence",
+        "arousal",
+    }
+)
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool})
+# ego-mcp tool-call messages and the ``(event_type, ok)`` each one projects to.
+_TOOL_CALL_EVENTS: dict[str, tuple[str, bool]] = {
+    "Tool invocation": ("tool_call_invoked", True),
+    "Tool execution completed": ("tool_call_completed", True),
+    "Tool execution failed": ("tool_call_failed", False),
+}
 LOGGER = logging.getLogger(__name__)
 
 
@@ -93,8 +125,7 @@ def normalize_log(raw: dict[str, object]) -> LogEvent:
     raw_ts = raw.get("ts")
     if not isinstance(raw_ts, str):
         raw_ts = raw.get("timestamp")
-    reserved = {"ts", "timestamp", "level", "logger", "message", "private"}
-    fields = {key: value for key, value in raw.items() if key not in reserved}
+    fields = {key: value for key, value in raw.items() if key not in _RESERVED_LOG_KEYS}
     return LogEvent(
         ts=_parse_ts(raw_ts if isinstance(raw_ts, str) else None),
         level=str(raw.get("level", "INFO")).upper(),
@@ -127,12 +158,234 @@ class CheckpointStoreProtocol(Protocol):
     def save_checkpoint(self, path: str, inode: int, offset: int) -> None: ...
 
 
+def _stage_metrics(raw_stages: object) -> dict[str, float]:
+    """Per-stage timings from ego-mcp's ``stage_ms`` field as ``stage_<name>_ms`` metrics."""
+    if not isinstance(raw_stages, dict):
+        return {}
+    return {
+        f"stage_{stage}_ms": float(value)
+        for stage, value in raw_stages.items()
+        if isinstance(stage, str)
+        and isinstance(value, (int, float))
+        and not isinstance(value, bool)
+    }
+
+
+def _relationship_from_text(raw: Mapping[str, object]) -> dict[str, float | int]:
+    """Relationship metrics rendered in ``consider_them``/``wake_up`` output text."""
+    fallback_text = raw.get("tool_output", "")
+    if not isinstance(fallback_text, str) or not fallback_text:
+        fallback_text = raw.get("message", "")
+    if not isinstance(fallback_text, str):
+        return {}
+    relationship_match = _RELATIONSHIP_RE.search(fallback_text)
+    if relationship_match is None:
+        return {}
+    try:
+        return {
+            "trust_level": float(relationship_match.group("trust")),
+            "total_interactions": int(relationship_match.group("interactions")),
+            "shared_episodes_count": int(relationship_match.group("shared_episodes")),
+        }
+    except ValueError:
+        return {}
+
+
+def _construct_trusted[M: BaseModel](model: type[M], values: dict[str, object]) -> M:
+    """Build ``model`` from ``values`` that already hold every field, validly typed.
+
+    Leaves the instance in the state ``model_construct`` would, without its per-field
+    Python loop, which makes ``model_construct`` slower than validating.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(
+        instance,
+        "__pydantic_private__",
+        {name: attr.get_default() for name, attr in model.__private_attributes__.items()},
+    )
+    return instance
+
+
+@dataclass(slots=True)
+class ToolCallRecord:
+    """An ego-mcp tool-call line projected in one pass, turned into models unvalidated."""
+
+    ts: datetime
+    level: str
+    logger: str
+    message: str
+    fields: dict[str, object]
+    tool_name: str
+    # ``None`` when the line only yields a log (desire-tool invocations).
+    event_type: str | None = None
+    ok: bool = True
+    duration_ms: int | None = None
+    emotion_primary: str | None = None
+    emotion_intensity: float | None = None
+    numeric_metrics: dict[str, float] = field(default_factory=dict)
+    string_metrics: dict[str, str] = field(default_factory=dict)
+    params: dict[str, str | int | float | bool] = field(default_factory=dict)
+
+    def to_event(self) -> DashboardEvent | None:
+        if self.event_type is None:
+            return None
+        return _construct_trusted(
+            DashboardEvent,
+            {
+                "ts": self.ts,
+                "event_type": self.event_type,
+                "tool_name": self.tool_name,
+                "ok": self.ok,
+                "duration_ms": self.duration_ms,
+                "emotion_primary": self.emotion_primary,
+                "emotion_intensity": self.emotion_intensity,
+                "numeric_metrics": self.numeric_metrics,
+                "string_metrics": self.string_metrics,
+                "params": self.params,
+                "private": False,
+                "message": self.message,
+            },
+        )
+
+    def to_log(self) -> LogEvent:
+        return _construct_trusted(
+            LogEvent,
+            {
+                "ts": self.ts,
+                "level": self.level,
+                "logger": self.logger,
+                "message": self.message,
+                "private": False,
+                "fields": self.fields,
+            },
+        )
+
+
 class EgoMcpLogProjector:
     """Project ego-mcp structured logs into dashboard telemetry events."""
 
     def __init__(self, desire_catalog: DesireCatalog | None = None) -> None:
         self._desire_catalog = desire_catalog or default_desire_catalog()
 
+    def project_record(self, raw: Mapping[str, object]) -> ToolCallRecord | None:
+        """Fast path for tool-call lines in the shape current ego-mcp writes.
+
+        Produces the same event and log as :meth:`project` plus ``normalize_log``
+        in a single pass over the line. Returns ``None`` for anything else (private
+        calls, ``ts``-keyed or legacy ``feel_desires`` lines, desire completions
+        without ``desire_levels``, values that are not plain JSON types), which take
+        the validated path instead.
+        """
+        message = raw.get("message")
+        tool_name = raw.get("tool_name")
+        timestamp = raw.get("timestamp")
+        if (
+            type(message) is not str
+            or type(tool_name) is not str
+            or type(timestamp) is not str
+            or "ts" in raw
+            or "private" in raw
+            or tool_name == "feel_desires"
+        ):
+            return None
+        kind = _TOOL_CALL_EVENTS.get(message)
+        if kind is None:
+            return None
+        event_type, ok = kind
+        desire_tool = tool_name in DESIRE_TELEMETRY_TOOL_NAMES
+        emits_event = not (desire_tool and event_type == "tool_call_invoked")
+
+        # One pass builds the log fields and the params ``_build_event_raw`` copies
+        # from top-level keys; those win over the tool-argument fallbacks below.
+        fields: dict[str, object] = {}
+        params: dict[str, str | int | float | bool] = {}
+        for key, value in raw.items():
+            if key in _RESERVED_LOG_KEYS:
+                continue
+            fields[key] = value
+            if key in _NON_PARAM_KEYS:
+                continue
+            if isinstance(value, (str, int, float)):
+                if type(value) not in _JSON_SCALAR_TYPES:
+                    return None
+                if not isinstance(value, str) or key in ALLOWED_STRING_PARAMS or "_" in key:
+                    params[key] = value
+            elif value is not None and not isinstance(value, (dict, list)):
+                return None
+
+        record = ToolCallRecord(
+            ts=_parse_ts(timestamp),
+            level=str(raw.get("level", "INFO")).upper(),
+            logger=str(raw.get("logger", "ego_dashboard")),
+            message=message,
+            fields=fields,
+            tool_name=tool_name,
+        )
+        if not emits_event:
+            return record
+
+        tool_args: Mapping[str, object] = {}
+        if event_type != "tool_call_completed":
+            raw_args = raw.get("tool_args")
+            if isinstance(raw_args, dict):
+                if "private" in raw_args:
+                    return None
+                tool_args = raw_args
+        levels: dict[str, float] = {}
+        if desire_tool:
+            levels = self._structured_desire_levels(raw.get("desire_levels"))
+            if not levels:
+                return None
+
+        emotion = tool_args.get("emotion")
+        if not isinstance(emotion, str):
+            emotion = raw.get("emotion_primary")
+        if isinstance(emotion, str):
+            params["emotion_primary"] = emotion
+            record.emotion_primary = emotion
+        for key in ("intensity", "valence", "arousal"):
+            if key in params:
+                continue
+            value = tool_args.get(key)
+            if not isinstance(value, (int, float)):
+                value = raw.get(key)
+            if isinstance(value, (int, float)):
+                params[key] = value
+        body_state = tool_args.get("body_state")
+        if isinstance(body_state, dict):
+            for key in ("time_phase", "mode", "state"):
+                value = body_state.get(key)
+                if key not in params and isinstance(value, str):
+                    params[key] = value
+        params.update(_stage_metrics(raw.get("stage_ms")))
+        if tool_name in {"consider_them", "wake_up"} and "trust_level" not in params:
+            params.update(_relationship_from_text(raw))
+        params.update(levels)
+
+        numeric_metrics = record.numeric_metrics
+        string_metrics = record.string_metrics
+        for key, value in params.items():
+            if isinstance(value, str):
+                string_metrics[key] = value
+            elif not isinstance(value, bool):
+                numeric_metrics[key] = float(value)
+        intensity = tool_args.get("intensity")
+        if not isinstance(intensity, (int, float)):
+            intensity = raw.get("emotion_intensity")
+        if isinstance(intensity, (int, float)):
+            record.emotion_intensity = float(intensity)
+            numeric_metrics["intensity"] = record.emotion_intensity
+        duration = raw.get("duration_ms")
+        if isinstance(duration, int) and not isinstance(duration, bool):
+            record.duration_ms = duration
+        record.event_type = event_type
+        record.ok = ok
+        record.params = params
+        return record
+
     def project(self, raw: Mapping[str, object]) -> DashboardEvent | None:
         message = raw.get("message")
         tool_name = raw.get("tool_name")
@@ -193,20 +446,24 @@ class EgoMcpLogProjector:
 
         return None
 
+    def _structured_desire_levels(self, raw_desire_levels: object) -> dict[str, float]:
+        if not isinstance(raw_desire_levels, dict):
+            return {}
+        return {
+            key: float(value)
+            for key, value in raw_desire_levels.items()
+            if isinstance(key, str)
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and self._desire_catalog.is_visible_desire_metric(key)
+        }
+
     def _parse_feel_desires_levels(self, raw: Mapping[str, object]) -> dict[str, float]:
-        raw_desire_levels = raw.get("desire_levels")
-        if isinstance(raw_desire_levels, dict):
-            structured_levels = {
-                key: float(value)
-                for key, value in raw_desire_levels.items()
-                if isinstance(key, str)
-                and isinstance(value, (int, float))
-                and not isinstance(value, bool)
-                and self._desire_catalog.is_visible_desire_metric(key)
-            }
-            if structured_levels:
-                return structured_levels
+        structured_levels = self._structured_desire_levels(raw.get("desire_levels"))
+        if structured_levels:
+            return structured_levels
 
+        # Legacy lines without ``desire_levels``: flat keys, then the rendered output.
         levels: dict[str, float] = {}
         for key, value in raw.items():
             if (
@@ -283,21 +540,7 @@ class EgoMcpLogProjector:
                 params[rel_key] = raw_value
 
         for key, value in raw.items():
-            if key in {
-                "tool_name",
-                "message",
-                "logger",
-                "level",
-                "timestamp",
-                "ts",
-                "tool_output",
-                "tool_output_chars",
-                "tool_output_truncated",
-                "emotion_primary",
-                "emotion_intensity",
-                "valence",
-                "arousal",
-            }:
+            if key in _NON_PARAM_KEYS:
                 continue
             if isinstance(value, bool):
                 params[key] = value
@@ -312,21 +555,10 @@ class EgoMcpLogProjector:
             elif isinstance(value, str) and (key in ALLOWED_STRING_PARAMS or "_" in key):
                 params[key] = value
 
+        params.update(_stage_metrics(raw.get("stage_ms")))
+
         if tool_name in {"consider_them", "wake_up"} and "trust_level" not in params:
-            fallback_text = raw.get("tool_output", "")
-            if not isinstance(fallback_text, str) or not fallback_text:
-                fallback_text = raw.get("message", "")
-            if isinstance(fallback_text, str):
-                relationship_match = _RELATIONSHIP_RE.search(fallback_text)
-                if relationship_match is not None:
-                    try:
-                        params["trust_level"] = float(relationship_match.group("trust"))
-                        params["total_interactions"] = int(relationship_match.group("interactions"))
-                        params["shared_episodes_count"] = int(
-                            relationship_match.group("shared_episodes")
-                        )
-                    except ValueError:
-                        pass
+            params.update(_relationship_from_text(raw))
 
         raw_ts = raw.get("ts")
         if not isinstance(raw_ts, str):
@@ -341,6 +573,9 @@ class EgoMcpLogProjector:
             "private": bool(tool_args.get("private", False)),
             "message": str(raw.get("message", "")),
         }
+        duration = raw.get("duration_ms")
+        if isinstance(duration, int) and not isinstance(duration, bool):
+            event_raw["duration_ms"] = duration
         if isinstance(tool_args.get("emotion"), str):
             event_raw["emotion_primary"] = tool_args["emotion"]
         elif isinstance(raw.get("emotion_primary"), str):
@@ -360,10 +595,16 @@ def _default_store() -> IngestStoreProtocol:
             settings.database_url,
             settings.redis_url,
             desire_catalog=desire_catalog,
+            storage_policy=settings.telemetry_storage_policy,
         )
         store.initialize()
+        store.rebuild_current_snapshot()
         return store
-    return TelemetryStore(desire_catalog=desire_catalog)
+    return TelemetryStore(
+        desire_catalog=desire_catalog,
+        retention=settings.inmemory_retention,
+        max_items=settings.inmemory_max_items,
+    )
 
 
 def ingest_jsonl_line(
@@ -387,10 +628,15 @@ def ingest_jsonl_line(
             event: DashboardEvent | None = normalize_event(payload)
             log = None
         else:
-            log = normalize_log(payload)
-            if log.logger != "ego_mcp.server":
+            if payload.get("logger") != _EGO_MCP_SERVER_LOGGER:
                 return
-            event = projector.project(payload) if projector is not None else None
+            record = projector.project_record(payload) if projector is not None else None
+            if record is not None:
+                event = record.to_event()
+                log = record.to_log()
+            else:
+                log = normalize_log(payload)
+                event = projector.project(payload) if projector is not None else None
     except (TypeError, ValueError) as exc:
         LOGGER.warning("failed to normalize jsonl line: %s", exc)
         return
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+# Reported percentiles, as (row key, quantile).
+LATENCY_QUANTILES: tuple[tuple[str, float], ...] = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+# Per-stage timings arrive as `stage_<name>_ms` numeric metrics (see EgoMcpLogProjector).
+STAGE_METRIC_PREFIX = "stage_"
+STAGE_METRIC_SUFFIX = "_ms"
+
+# A tool's p95 regresses when it at least doubles between consecutive buckets and grows
+# by this much; the floor keeps sub-millisecond tools from alerting on noise.
+_REGRESSION_RATIO = 2.0
+_REGRESSION_MIN_DELTA_MS = 50.0
+
+_RELATIVE_ACCURACY = 0.01
+_GAMMA = (1 + _RELATIVE_ACCURACY) / (1 - _RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+def stage_name(metric_key: str) -> str | None:
+    """``chroma`` for ``stage_chroma_ms``; ``None`` for keys that are not stage timings."""
+    if not (
+        metric_key.startswith(STAGE_METRIC_PREFIX) and metric_key.endswith(STAGE_METRIC_SUFFIX)
+    ):
+        return None
+    name = metric_key[len(STAGE_METRIC_PREFIX) : -len(STAGE_METRIC_SUFFIX)]
+    return name or None
+
+
+class QuantileSketch:
+    """Streaming quantile sketch with 1% relative error (DDSketch-style log buckets).
+
+    Values are counted in logarithmically sized bins, so memory grows with the value
+    range rather than the number of samples, and sketches merge by adding bin counts.
+    """
+
+    __slots__ = ("_bins", "_zeros", "count")
+
+    def __init__(self) -> None:
+        self._bins: dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self._zeros += 1
+            return
+        index = math.ceil(math.log(value) / _LOG_GAMMA)
+        self._bins[index] = self._bins.get(index, 0) + 1
+
+    def merge(self, other: QuantileSketch) -> None:
+        self.count += other.count
+        self._zeros += other._zeros
+        for index, count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if rank < seen:
+                return 2 * _GAMMA**index / (_GAMMA + 1)
+        return 2 * _GAMMA ** max(self._bins) / (_GAMMA + 1)
+
+
+def latency_row(ts: str, key: str, name: str, sketch: QuantileSketch) -> dict[str, object]:
+    row: dict[str, object] = {"ts": ts, key: name, "count": sketch.count}
+    for label, q in LATENCY_QUANTILES:
+        value = sketch.quantile(q)
+        row[label] = round(value, 3) if value is not None else None
+    return row
+
+
+def latency_regression_alerts(rows: Iterable[dict[str, object]]) -> list[dict[str, object]]:
+    """``latency_regression`` alerts from time-ordered ``tool_latency`` rows."""
+    alerts: list[dict[str, object]] = []
+    previous: dict[str, float] = {}
+    for row in rows:
+        tool_name = row.get("tool_name")
+        p95 = row.get("p95")
+        if not isinstance(tool_name, str) or not isinstance(p95, (int, float)):
+            continue
+        prev = previous.get(tool_name)
+        if (
+            prev is not None
+            and p95 >= prev * _REGRESSION_RATIO
+            and p95 - prev >= _REGRESSION_MIN_DELTA_MS
+        ):
+            alerts.append(
+                {
+                    "kind": "latency_regression",
+                    "ts": row["ts"],
+                    "value": float(p95),
+                    "tool_name": tool_name,
+                    "previous": prev,
+                }
+            )
+        previous[tool_name] = float(p95)
+    return alerts
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Keyset position for log pages: the ``(ts, dedupe_key)`` of the last row already sent.
+type LogCursor = tuple[datetime, str]
 
 
 class DashboardEvent(BaseModel):
@@ -18,6 +21,8 @@ class DashboardEvent(BaseModel):
     params: dict[str, str | int | float | bool] = Field(default_factory=dict)
     private: bool = False
     message: str | None = None
+    # Current-version dedupe key, filled on first use by telemetry_identity.
+    _dedupe_key: str | None = PrivateAttr(default=None)
 
 
 class LogEvent(BaseModel):
@@ -27,3 +32,4 @@ class LogEvent(BaseModel):
     message: str
     private: bool = False
     fields: dict[str, object] = Field(default_factory=dict)
+    _dedupe_key: str | None = PrivateAttr(default=None)
@@ -2,6 +2,18 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class TelemetryStoragePolicy:
+    """TimescaleDB policies applied by ``SqlTelemetryStore.initialize()``; ``None`` disables one."""
+
+    compress_after: timedelta | None = None
+    # Raw hypertable rows older than this are dropped; the continuous aggregates keep them.
+    raw_retention: timedelta | None = None
+    # The 1m/5m aggregates are dropped after this; 15m/1h stay as the long-term history.
+    fine_rollup_retention: timedelta | None = None
 
 
 @dataclass(frozen=True)
@@ -18,11 +30,37 @@ class DashboardSettings:
     log_path: str = "/tmp/ego-mcp-*.log"
     ingest_poll_seconds: float = 1.0
     ego_mcp_data_dir: str | None = None
+    # Bounds for the in-memory store used when no database is configured.
+    inmemory_retention_hours: float = 168.0
+    inmemory_max_items: int = 500_000
+    # Memory network betweenness: exact up to this many nodes, then sampled from k sources.
+    memory_betweenness_exact_max_nodes: int = 500
+    memory_betweenness_samples: int = 100
+    # TimescaleDB storage policies in days; None disables the policy.
+    telemetry_compress_after_days: float | None = None
+    telemetry_raw_retention_days: float | None = None
+    telemetry_fine_rollup_retention_days: float | None = None
 
     @property
     def use_external_store(self) -> bool:
         return bool(self.database_url and self.redis_url)
 
+    @property
+    def inmemory_retention(self) -> timedelta:
+        return timedelta(hours=self.inmemory_retention_hours)
+
+    @property
+    def telemetry_storage_policy(self) -> TelemetryStoragePolicy:
+        return TelemetryStoragePolicy(
+            compress_after=_days(self.telemetry_compress_after_days),
+            raw_retention=_days(self.telemetry_raw_retention_days),
+            fine_rollup_retention=_days(self.telemetry_fine_rollup_retention_days),
+        )
+
+
+def _days(value: float | None) -> timedelta | None:
+    return None if value is None else timedelta(days=value)
+
 
 def _env_float(name: str, default: float) -> float:
     raw = os.getenv(name)
@@ -37,6 +75,31 @@ def _env_float(name: str, default: float) -> float:
     return value
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    if value <= 0:
+        return default
+    return value
+
+
+def _env_optional_float(name: str, default: float | None) -> float | None:
+    """Like ``_env_float``, but ``0`` (or any non-positive value) turns the setting off."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else None
+
+
 def _default_log_path() -> str:
     explicit_dir = os.getenv("EGO_MCP_LOG_DIR")
     if explicit_dir:
@@ -63,4 +126,19 @@ def load_settings() -> DashboardSettings:
         log_path=os.getenv("DASHBOARD_LOG_PATH", _default_log_path()),
         ingest_poll_seconds=_env_float("DASHBOARD_INGEST_POLL_SECONDS", 1.0),
         ego_mcp_data_dir=os.getenv("DASHBOARD_EGO_MCP_DATA_DIR") or os.getenv("EGO_MCP_DATA_DIR"),
+        inmemory_retention_hours=_env_float("DASHBOARD_INMEMORY_RETENTION_HOURS", 168.0),
+        inmemory_max_items=_env_int("DASHBOARD_INMEMORY_MAX_ITEMS", 500_000),
+        memory_betweenness_exact_max_nodes=_env_int(
+            "DASHBOARD_MEMORY_BETWEENNESS_EXACT_MAX_NODES", 500
+        ),
+        memory_betweenness_samples=_env_int("DASHBOARD_MEMORY_BETWEENNESS_SAMPLES", 100),
+        telemetry_compress_after_days=_env_optional_float(
+            "DASHBOARD_TELEMETRY_COMPRESS_AFTER_DAYS", None
+        ),
+        telemetry_raw_retention_days=_env_optional_float(
+            "DASHBOARD_TELEMETRY_RAW_RETENTION_DAYS", None
+        ),
+        telemetry_fine_rollup_retention_days=_env_optional_float(
+            "DASHBOARD_TELEMETRY_FINE_ROLLUP_RETENTION_DAYS", None
+        ),
     )
@@ -2,25 +2,166 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any, cast
 
 import psycopg
 from redis import Redis
+from redis.exceptions import RedisError, WatchError
 
-from ego_dashboard.constants import DESIRE_TELEMETRY_TOOL_NAMES, DESIRE_TERMINAL_EVENT_TYPES
+from ego_dashboard.columnar import ColumnarSeries, series_from_counts, series_from_values
+from ego_dashboard.constants import (
+    DESIRE_METRIC_KEYS,
+    DESIRE_TELEMETRY_TOOL_NAMES,
+    DESIRE_TERMINAL_EVENT_TYPES,
+)
 from ego_dashboard.desire_catalog import DesireCatalog, default_desire_catalog
-from ego_dashboard.models import DashboardEvent, LogEvent
-from ego_dashboard.telemetry_identity import dashboard_event_dedupe_key, log_event_dedupe_key
+from ego_dashboard.latency import (
+    LATENCY_QUANTILES,
+    STAGE_METRIC_PREFIX,
+    STAGE_METRIC_SUFFIX,
+    latency_regression_alerts,
+)
+from ego_dashboard.models import DashboardEvent, LogCursor, LogEvent
+from ego_dashboard.settings import TelemetryStoragePolicy
+from ego_dashboard.store import StreamListener
+from ego_dashboard.telemetry_identity import (
+    DEDUPE_KEY_VERSION,
+    DEDUPE_KEYS_V2_MIGRATION,
+    dashboard_event_dedupe_key,
+    log_event_dedupe_key,
+)
 
 logger = logging.getLogger(__name__)
 _TOOL_OUTPUT_CHARS_CLEANUP_MIGRATION = "20260401_remove_tool_output_chars_metric"
 
+# Continuous aggregate widths, coarsest first: (suffix, SQL interval, width).
+_ROLLUP_WIDTHS: tuple[tuple[str, str, timedelta], ...] = (
+    ("1h", "1 hour", timedelta(hours=1)),
+    ("15m", "15 minutes", timedelta(minutes=15)),
+    ("5m", "5 minutes", timedelta(minutes=5)),
+    ("1m", "1 minute", timedelta(minutes=1)),
+)
+# Rollup widths dropped by `fine_rollup_retention`; the coarser ones are kept.
+_FINE_ROLLUP_SUFFIXES = ("1m", "5m")
+# Compression segments per hypertable: (table, segment_by). dedupe_key joins ts in the
+# segment order because TimescaleDB needs unique index columns there.
+_COMPRESSED_HYPERTABLES: tuple[tuple[str, str], ...] = (
+    ("tool_events", "tool_name"),
+    ("log_events", "logger"),
+)
+# Hot JSONB keys promoted to stored generated columns: (column, type, expression).
+_GENERATED_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("valence", "DOUBLE PRECISION", "(numeric_metrics ->> 'valence')::double precision"),
+    ("arousal", "DOUBLE PRECISION", "(numeric_metrics ->> 'arousal')::double precision"),
+    ("trust_level", "DOUBLE PRECISION", "(numeric_metrics ->> 'trust_level')::double precision"),
+    ("person_id", "TEXT", "string_metrics ->> 'person_id'"),
+)
+_NOTION_STRING_METRIC_KEYS = (
+    "notion_confidences",
+    "notion_created",
+    "notion_reinforced",
+    "notion_weakened",
+    "notion_dormant",
+    "notion_decayed",
+    "notion_pruned",
+    "notion_merged",
+)
+_SURFACE_STRING_METRIC_KEYS = (
+    "surfaced_person_ids",
+    "resonant_person_ids",
+    "involuntary_person_ids",
+)
+# Predicates shared by queries and partial indexes: PostgreSQL only considers a partial
+# index when the query's WHERE clause implies the index predicate.
+_NOTION_EVENTS_PREDICATE = " OR ".join(
+    f"string_metrics ? '{key}'" for key in _NOTION_STRING_METRIC_KEYS
+)
+_SURFACE_EVENTS_PREDICATE = " OR ".join(
+    f"string_metrics ? '{key}'" for key in _SURFACE_STRING_METRIC_KEYS
+)
+_EMOTION_EVENTS_PREDICATE = "emotion_primary IS NOT NULL OR emotion_intensity IS NOT NULL"
+_TOOL_EVENTS_INDEXES: tuple[tuple[str, str], ...] = (
+    ("idx_tool_events_string_metrics", "USING GIN (string_metrics)"),
+    ("idx_tool_events_notion_ts", f"(ts DESC) WHERE ({_NOTION_EVENTS_PREDICATE})"),
+    ("idx_tool_events_surface_ts", f"(ts DESC) WHERE ({_SURFACE_EVENTS_PREDICATE})"),
+    ("idx_tool_events_emotion_ts", f"(ts DESC) WHERE ({_EMOTION_EVENTS_PREDICATE})"),
+    ("idx_tool_events_trust_level_ts", "(ts DESC) WHERE trust_level IS NOT NULL"),
+    ("idx_tool_events_person_ts", "(person_id, ts DESC) WHERE person_id IS NOT NULL"),
+    ("idx_tool_events_latency_ts", "(ts DESC) WHERE duration_ms IS NOT NULL"),
+)
+# Trigram indexes let the `ILIKE '%needle%'` log search skip the sequential scan.
+_LOG_EVENTS_SEARCH_INDEXES: tuple[tuple[str, str], ...] = (
+    ("idx_log_events_message_trgm", "USING GIN (message gin_trgm_ops)"),
+    ("idx_log_events_fields_trgm", "USING GIN ((fields::text) gin_trgm_ops)"),
+)
+# Pub/sub channel announcing newly ingested rows to the /ws/current broadcaster.
+_STREAM_CHANNEL = "dashboard:stream"
+# Redis layout of the "current" snapshot maintained by the ingest path.
+_CURRENT_KEY = "dashboard:current"
+_CURRENT_ANCHOR_KEY = "dashboard:current:anchor"
+_CURRENT_EMOTION_KEY = "dashboard:current:emotion"
+_CURRENT_RELATIONSHIP_KEY = "dashboard:current:relationship"
+_CURRENT_DESIRES_KEY = "dashboard:current:desires"
+_CURRENT_COUNTS_KEY = "dashboard:current:counts"
+# Sorted sets scored by epoch seconds; members are `<ts>|<dedupe_key>`.
+_WINDOW_TOOL_CALLS_KEY = "dashboard:window:tool_calls"
+_WINDOW_TOOL_FAILURES_KEY = "dashboard:window:tool_failures"
+_WINDOW_LOG_INVOCATIONS_KEY = "dashboard:window:log_invocations"
+_WINDOW_LOG_FAILURES_KEY = "dashboard:window:log_failures"
+_WINDOW_KEYS = (
+    _WINDOW_TOOL_CALLS_KEY,
+    _WINDOW_TOOL_FAILURES_KEY,
+    _WINDOW_LOG_INVOCATIONS_KEY,
+    _WINDOW_LOG_FAILURES_KEY,
+)
+_WINDOW_1M_SECONDS = 60.0
+_WINDOW_24H_SECONDS = 24 * 3600.0
+
+# Numeric metrics charted often enough to be pre-aggregated as sum/count column pairs.
+ROLLUP_METRIC_KEYS: tuple[str, ...] = ("intensity", "valence", "arousal", *DESIRE_METRIC_KEYS)
+
 
 def _escape_ilike_pattern(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+def _log_filters(
+    start: datetime, end: datetime, level: str | None, search: str | None
+) -> tuple[list[str], list[object]]:
+    where_clauses = ["ts >= %s", "ts <= %s"]
+    params: list[object] = [start, end]
+    if level:
+        where_clauses.append("level = %s")
+        params.append(level.upper())
+    if search:
+        where_clauses.append("(message ILIKE %s ESCAPE '\\' OR fields::text ILIKE %s ESCAPE '\\')")
+        needle = f"%{_escape_ilike_pattern(search)}%"
+        params.extend([needle, needle])
+    return where_clauses, params
+
+
+def _log_row(
+    ts: datetime,
+    level: object,
+    logger_name: object,
+    message: object,
+    private: object,
+    fields: object,
+) -> dict[str, object]:
+    return {
+        "ts": ts.isoformat(),
+        "level": str(level),
+        "logger": str(logger_name),
+        "message": "REDACTED" if bool(private) else str(message),
+        "private": bool(private),
+        "fields": fields if isinstance(fields, dict) else {},
+    }
+
+
 def _parse_notion_confidences(value: object) -> dict[str, float]:
     if not isinstance(value, str) or not value:
         return {}
@@ -66,6 +207,14 @@ def _desire_tool_names_param() -> list[str]:
     return list(DESIRE_TELEMETRY_TOOL_NAMES)
 
 
+def _typed_usage_rows(rows: list[tuple[Any, ...]]) -> list[tuple[datetime, str, int]]:
+    return [
+        (bucket_ts, str(tool_name), int(count))
+        for bucket_ts, tool_name, count in rows
+        if isinstance(bucket_ts, datetime) and isinstance(tool_name, str)
+    ]
+
+
 def _dense_usage_rows(
     rows: list[tuple[datetime, str, int]],
     start: datetime,
@@ -87,21 +236,182 @@ def _dense_usage_rows(
             by_ts[key] = row
         row[tool_name] = int(count)
 
-    first_bucket = _bucket_floor(start, bucket_delta)
-    last_bucket = _bucket_floor(end, bucket_delta)
-    cursor = first_bucket
     dense_rows: list[dict[str, object]] = []
-    while cursor <= last_bucket:
+    for cursor in _bucket_timeline(start, end, bucket_delta):
         key = cursor.isoformat()
         row = dict(by_ts.get(key, {"ts": key}))
         for tool_name in tool_names:
             value = row.get(tool_name, 0)
             row[tool_name] = int(value) if isinstance(value, (int, float)) else 0
         dense_rows.append(row)
-        cursor += bucket_delta
     return dense_rows
 
 
+def _dense_usage_columns(
+    rows: list[tuple[datetime, str, int]],
+    start: datetime,
+    end: datetime,
+    bucket: str,
+) -> ColumnarSeries:
+    if not rows:
+        return ColumnarSeries()
+    timeline = _bucket_timeline(start, end, _bucket_to_timedelta(bucket))
+    return series_from_counts(rows, timeline)
+
+
+def _bucket_timeline(start: datetime, end: datetime, bucket_delta: timedelta) -> list[datetime]:
+    cursor = _bucket_floor(start, bucket_delta)
+    last_bucket = _bucket_floor(end, bucket_delta)
+    timeline: list[datetime] = []
+    while cursor <= last_bucket:
+        timeline.append(cursor)
+        cursor += bucket_delta
+    return timeline
+
+
+def _empty_current() -> dict[str, object]:
+    return {
+        "latest": None,
+        "latest_emotion": None,
+        "latest_relationship": None,
+        "tool_calls_per_min": 0,
+        "error_rate": 0.0,
+        "window_24h": {"tool_calls": 0, "error_rate": 0.0},
+        "latest_desires": {},
+        "latest_emergent_desires": {},
+    }
+
+
+def _window_member(ts: datetime, dedupe_key: str) -> str:
+    return f"{ts.isoformat()}|{dedupe_key}"
+
+
+def _parse_anchor(raw: object) -> float | None:
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def _load_json_object(raw: object) -> dict[str, Any] | None:
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _call_rates(calls: int, errors: int, log_calls: int, log_failures: int) -> tuple[int, float]:
+    if log_calls > 0:
+        return log_calls, log_failures / log_calls
+    return calls, (errors / calls) if calls else 0.0
+
+
+def _window_counts(raw: object) -> tuple[int, int, int, int]:
+    """Return (tool calls, tool failures, log invocations, log failures) from a snapshot."""
+    values = (
+        [int(value) for value in raw if isinstance(value, int)] if isinstance(raw, list) else []
+    )
+    values = (values + [0, 0, 0, 0])[:4]
+    return values[0], values[1], values[2], values[3]
+
+
+def _inserted(cur: psycopg.Cursor[object]) -> bool:
+    # ON CONFLICT DO NOTHING reports rowcount 0 for rows that were already stored.
+    rowcount = getattr(cur, "rowcount", -1)
+    return not isinstance(rowcount, int) or rowcount != 0
+
+
+def _interval_sql(value: timedelta) -> str:
+    return f"INTERVAL '{int(value.total_seconds())} seconds'"
+
+
+def _rollup_for_bucket(bucket: str) -> tuple[str, timedelta] | None:
+    """Pick the coarsest rollup whose width evenly divides the requested bucket."""
+    bucket_delta = _bucket_to_timedelta(bucket)
+    for suffix, _interval, width in _ROLLUP_WIDTHS:
+        if width <= bucket_delta and bucket_delta % width == timedelta(0):
+            return suffix, width
+    return None
+
+
+def _latency_aggregate_sql(suffix: str, interval: str) -> tuple[str, str]:
+    # percentile_agg (timescaledb_toolkit) keeps a mergeable UddSketch per bucket, so
+    # coarser buckets are re-aggregated with rollup() instead of averaging percentiles.
+    return (
+        f"tool_events_latency_{suffix}",
+        f"""
+        SELECT time_bucket(INTERVAL '{interval}', ts) AS bucket,
+               tool_name,
+               percentile_agg(duration_ms::double precision) AS latency
+        FROM tool_events
+        WHERE event_type IN ('tool_call_completed', 'tool_call_failed')
+          AND duration_ms IS NOT NULL
+        GROUP BY bucket, tool_name
+        """,
+    )
+
+
+def _latency_rows(key: str, rows: list[tuple[Any, ...]]) -> list[dict[str, object]]:
+    items: list[dict[str, object]] = []
+    for ts, name, count, quantiles in rows:
+        item: dict[str, object] = {"ts": ts.isoformat(), key: str(name), "count": int(count)}
+        for (label, _q), value in zip(LATENCY_QUANTILES, quantiles, strict=True):
+            item[label] = round(float(value), 3) if value is not None else None
+        items.append(item)
+    return items
+
+
+def _latency_quantiles_param() -> list[float]:
+    return [q for _label, q in LATENCY_QUANTILES]
+
+
+def _continuous_aggregate_sql(suffix: str, interval: str) -> list[tuple[str, str]]:
+    metric_columns = ",\n".join(
+        f"sum((numeric_metrics ->> '{key}')::double precision) AS {key}_sum,\n"
+        f"count(numeric_metrics ->> '{key}') AS {key}_count"
+        for key in ROLLUP_METRIC_KEYS
+    )
+    return [
+        (
+            f"log_events_tool_calls_{suffix}",
+            f"""
+            SELECT time_bucket(INTERVAL '{interval}', ts) AS bucket,
+                   fields ->> 'tool_name' AS tool_name,
+                   count(*) AS calls
+            FROM log_events
+            WHERE message = 'Tool invocation' AND fields ? 'tool_name'
+            GROUP BY bucket, tool_name
+            """,
+        ),
+        (
+            f"tool_events_usage_{suffix}",
+            f"""
+            SELECT time_bucket(INTERVAL '{interval}', ts) AS bucket,
+                   tool_name,
+                   count(*) AS calls,
+                   sum(CASE WHEN ok THEN 0 ELSE 1 END) AS errors
+            FROM tool_events
+            WHERE event_type IN ('tool_call_completed', 'tool_call_failed')
+            GROUP BY bucket, tool_name
+            """,
+        ),
+        (
+            f"tool_events_metrics_{suffix}",
+            f"""
+            SELECT time_bucket(INTERVAL '{interval}', ts) AS bucket,
+            {metric_columns}
+            FROM tool_events
+            GROUP BY bucket
+            """,
+        ),
+    ]
+
+
 class SqlTelemetryStore:
     def __init__(
         self,
@@ -109,10 +419,17 @@ class SqlTelemetryStore:
         redis_url: str,
         *,
         desire_catalog: DesireCatalog | None = None,
+        storage_policy: TelemetryStoragePolicy | None = None,
     ) -> None:
         self._db_url = database_url
+        # None leaves compression/retention jobs as they are (e.g. maintenance scripts).
+        self._storage_policy = storage_policy
         self._redis = Redis.from_url(redis_url, decode_responses=True)
         self._desire_catalog = desire_catalog or default_desire_catalog()
+        # Continuous aggregates are only read after initialize() created them.
+        self._rollups_ready = False
+        self._latency_rollups_ready = False
+        self._dedupe_key_version = DEDUPE_KEY_VERSION
 
     @property
     def desire_catalog(self) -> DesireCatalog:
@@ -205,6 +522,15 @@ class SqlTelemetryStore:
                     """
                 )
                 self._apply_dashboard_migrations(cur)
+                self._dedupe_key_version = self._resolve_dedupe_key_version(cur)
+                self._create_metric_columns_and_indexes(cur)
+                self._create_log_search_indexes(cur)
+                self._rollups_ready = self._create_continuous_aggregates(cur)
+                self._latency_rollups_ready = self._rollups_ready and (
+                    self._create_latency_rollups(cur)
+                )
+                if self._storage_policy is not None:
+                    self._apply_storage_policies(cur, self._storage_policy)
             conn.commit()
 
     def _apply_dashboard_migrations(self, cur: psycopg.Cursor[object]) -> None:
@@ -224,6 +550,219 @@ class SqlTelemetryStore:
             (_desire_tool_names_param(),),
         )
 
+    def _resolve_dedupe_key_version(self, cur: psycopg.Cursor[object]) -> int:
+        # Keep writing version 1 keys until dedupe_telemetry has rewritten the stored
+        # ones; mixing versions would let replayed lines slip past the unique index.
+        cur.execute(
+            "SELECT 1 FROM dashboard_migrations WHERE name = %s", (DEDUPE_KEYS_V2_MIGRATION,)
+        )
+        if cur.fetchone() is not None:
+            return DEDUPE_KEY_VERSION
+        cur.execute(
+            """
+            SELECT EXISTS (SELECT 1 FROM tool_events WHERE dedupe_key IS NOT NULL)
+                OR EXISTS (SELECT 1 FROM log_events WHERE dedupe_key IS NOT NULL)
+            """
+        )
+        row = cur.fetchone()
+        if row == (True,):
+            logger.warning(
+                "Telemetry rows use version 1 dedupe keys; run ego_dashboard.dedupe_telemetry "
+                "to migrate them to version %d",
+                DEDUPE_KEY_VERSION,
+            )
+            return 1
+        cur.execute(
+            """
+            INSERT INTO dashboard_migrations (name)
+            VALUES (%s)
+            ON CONFLICT (name) DO NOTHING
+            """,
+            (DEDUPE_KEYS_V2_MIGRATION,),
+        )
+        return DEDUPE_KEY_VERSION
+
+    def _create_metric_columns_and_indexes(self, cur: psycopg.Cursor[object]) -> None:
+        for column, column_type, expression in _GENERATED_COLUMNS:
+            cur.execute(
+                f"""
+                ALTER TABLE tool_events
+                ADD COLUMN IF NOT EXISTS {column} {column_type}
+                GENERATED ALWAYS AS ({expression}) STORED
+                """
+            )
+        for index_name, definition in _TOOL_EVENTS_INDEXES:
+            cur.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON tool_events {definition}")
+
+    def _create_log_search_indexes(self, cur: psycopg.Cursor[object]) -> None:
+        # Same savepoint fallback as the rollups: without pg_trgm, search stays a scan.
+        cur.execute("SAVEPOINT dashboard_log_search")
+        try:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for index_name, definition in _LOG_EVENTS_SEARCH_INDEXES:
+                cur.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON log_events {definition}")
+        except psycopg.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT dashboard_log_search")
+            logger.warning("pg_trgm unavailable; log search scans log_events without an index")
+            return
+        cur.execute("RELEASE SAVEPOINT dashboard_log_search")
+
+    def _create_continuous_aggregates(self, cur: psycopg.Cursor[object]) -> bool:
+        # A savepoint keeps the rest of initialize() usable when the TimescaleDB build
+        # cannot create continuous aggregates; queries then keep reading raw hypertables.
+        cur.execute("SAVEPOINT dashboard_rollups")
+        try:
+            for suffix, interval, _width in _ROLLUP_WIDTHS:
+                for view_name, select_sql in _continuous_aggregate_sql(suffix, interval):
+                    self._create_continuous_aggregate(cur, view_name, select_sql, interval)
+        except psycopg.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT dashboard_rollups")
+            logger.warning("Continuous aggregates unavailable; reading raw telemetry tables")
+            return False
+        cur.execute("RELEASE SAVEPOINT dashboard_rollups")
+        return True
+
+    def _create_latency_rollups(self, cur: psycopg.Cursor[object]) -> bool:
+        # Percentile sketches need timescaledb_toolkit; without it latency percentiles
+        # are computed from the raw hypertable.
+        cur.execute("SAVEPOINT dashboard_latency_rollups")
+        try:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS timescaledb_toolkit")
+            for suffix, interval, _width in _ROLLUP_WIDTHS:
+                view_name, select_sql = _latency_aggregate_sql(suffix, interval)
+                self._create_continuous_aggregate(cur, view_name, select_sql, interval)
+        except psycopg.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT dashboard_latency_rollups")
+            logger.warning("timescaledb_toolkit unavailable; latency percentiles read tool_events")
+            return False
+        cur.execute("RELEASE SAVEPOINT dashboard_latency_rollups")
+        return True
+
+    def _create_continuous_aggregate(
+        self, cur: psycopg.Cursor[object], view_name: str, select_sql: str, interval: str
+    ) -> None:
+        cur.execute(
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS {view_name}
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            {select_sql}
+            WITH NO DATA
+            """
+        )
+        if self._storage_policy is not None:
+            cur.execute(
+                f"SELECT remove_continuous_aggregate_policy('{view_name}', if_exists => TRUE)"
+            )
+        cur.execute(
+            f"""
+            SELECT add_continuous_aggregate_policy(
+              '{view_name}',
+              start_offset => {self._rollup_refresh_start_offset()},
+              end_offset => INTERVAL '1 minute',
+              schedule_interval => INTERVAL '{interval}',
+              if_not_exists => TRUE
+            )
+            """
+        )
+
+    def _rollup_refresh_start_offset(self) -> str:
+        # Refreshing a range whose raw chunks were dropped would empty the rollup there,
+        # so the refresh window has to end inside the raw retention.
+        policy = self._storage_policy
+        if policy is None or policy.raw_retention is None:
+            return "NULL"
+        return _interval_sql(max(policy.raw_retention - timedelta(hours=1), timedelta(hours=1)))
+
+    def _apply_storage_policies(
+        self, cur: psycopg.Cursor[object], policy: TelemetryStoragePolicy
+    ) -> None:
+        # Policies are replaced on every start so changed settings take effect. Community
+        # (Apache-only) TimescaleDB builds lack compression and retention; keep running.
+        # Compression and retention use separate savepoints so one failing (for example
+        # a settings change refused once chunks are compressed) never skips the other.
+        cur.execute("SAVEPOINT dashboard_compression")
+        try:
+            for table, segment_by in _COMPRESSED_HYPERTABLES:
+                cur.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE)")
+                if policy.compress_after is None:
+                    continue
+                if not self._compression_settings_match(cur, table, segment_by):
+                    cur.execute(
+                        f"""
+                        ALTER TABLE {table} SET (
+                          timescaledb.compress,
+                          timescaledb.compress_segmentby = '{segment_by}',
+                          timescaledb.compress_orderby = 'ts DESC, dedupe_key'
+                        )
+                        """
+                    )
+                cur.execute(
+                    f"SELECT add_compression_policy('{table}', "
+                    f"compress_after => {_interval_sql(policy.compress_after)})"
+                )
+        except psycopg.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT dashboard_compression")
+            logger.warning("TimescaleDB compression unavailable; chunks stay uncompressed")
+        else:
+            cur.execute("RELEASE SAVEPOINT dashboard_compression")
+
+        cur.execute("SAVEPOINT dashboard_retention")
+        try:
+            for table, _segment_by in _COMPRESSED_HYPERTABLES:
+                self._replace_retention_policy(cur, table, policy.raw_retention)
+            if self._rollups_ready:
+                for suffix, interval, _width in _ROLLUP_WIDTHS:
+                    if suffix not in _FINE_ROLLUP_SUFFIXES:
+                        continue
+                    view_names = [
+                        name for name, _sql in _continuous_aggregate_sql(suffix, interval)
+                    ]
+                    if self._latency_rollups_ready:
+                        view_names.append(_latency_aggregate_sql(suffix, interval)[0])
+                    for view_name in view_names:
+                        self._replace_retention_policy(cur, view_name, policy.fine_rollup_retention)
+        except psycopg.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT dashboard_retention")
+            logger.warning("TimescaleDB retention unavailable; telemetry is kept")
+            return
+        cur.execute("RELEASE SAVEPOINT dashboard_retention")
+
+    def _compression_settings_match(
+        self, cur: psycopg.Cursor[object], table: str, segment_by: str
+    ) -> bool:
+        # Changing compression settings fails once chunks are compressed, so the ALTER
+        # only runs when compression is off or configured differently.
+        cur.execute(
+            """
+            SELECT attname, segmentby_column_index, orderby_column_index, orderby_asc
+            FROM timescaledb_information.compression_settings
+            WHERE hypertable_schema = current_schema() AND hypertable_name = %s
+            """,
+            (table,),
+        )
+        segment_columns: list[tuple[int, str]] = []
+        order_columns: list[tuple[int, str, bool]] = []
+        for attname, segment_index, order_index, order_asc in cast(
+            list[tuple[object, ...]], cur.fetchall()
+        ):
+            if isinstance(segment_index, int):
+                segment_columns.append((segment_index, str(attname)))
+            if isinstance(order_index, int):
+                order_columns.append((order_index, str(attname), order_asc is True))
+        segments = [name for _index, name in sorted(segment_columns)]
+        orders = [(name, ascending) for _index, name, ascending in sorted(order_columns)]
+        return segments == [segment_by] and orders == [("ts", False), ("dedupe_key", True)]
+
+    def _replace_retention_policy(
+        self, cur: psycopg.Cursor[object], relation: str, drop_after: timedelta | None
+    ) -> None:
+        cur.execute(f"SELECT remove_retention_policy('{relation}', if_exists => TRUE)")
+        if drop_after is not None:
+            cur.execute(
+                f"SELECT add_retention_policy('{relation}', "
+                f"drop_after => {_interval_sql(drop_after)})"
+            )
+
     def _apply_tool_events_cleanup_migration(
         self,
         cur: psycopg.Cursor[object],
@@ -256,7 +795,7 @@ class SqlTelemetryStore:
         )
 
     def ingest(self, event: DashboardEvent) -> None:
-        dedupe_key = dashboard_event_dedupe_key(event)
+        dedupe_key = dashboard_event_dedupe_key(event, version=self._dedupe_key_version)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -286,21 +825,107 @@ class SqlTelemetryStore:
                         dedupe_key,
                     ),
                 )
+                inserted = _inserted(cur)
             conn.commit()
-        self._redis.set("dashboard:current", json.dumps(event.model_dump(mode="json")))
+        self._update_current_snapshot(event, dedupe_key)
+        if inserted:
+            self._publish({"type": "current"})
+
+    def _update_current_snapshot(self, event: DashboardEvent, dedupe_key: str) -> None:
+        ts = event.ts.timestamp()
+        latest_state = self._latest_state_values(event)
+        window_keys: list[str] = []
+        if event.event_type in {"tool_call_completed", "tool_call_failed"}:
+            window_keys.append(_WINDOW_TOOL_CALLS_KEY)
+            if not event.ok:
+                window_keys.append(_WINDOW_TOOL_FAILURES_KEY)
+        member = _window_member(event.ts, dedupe_key)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(_CURRENT_ANCHOR_KEY)  # type: ignore[no-untyped-call]
+                    anchor = _parse_anchor(pipe.get(_CURRENT_ANCHOR_KEY))
+                    pipe.multi()
+                    # Events replayed out of order still join the windows, but the
+                    # latest-state keys and the anchor only move forward.
+                    if anchor is None or ts >= anchor:
+                        for key, value in latest_state.items():
+                            pipe.set(key, value)
+                        pipe.set(_CURRENT_ANCHOR_KEY, repr(ts))
+                    for key in window_keys:
+                        pipe.zadd(key, {member: ts})
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+        self._refresh_window_counts()
+
+    def _latest_state_values(self, event: DashboardEvent) -> dict[str, str]:
+        values = {_CURRENT_KEY: json.dumps(event.model_dump(mode="json"))}
+        metrics = event.numeric_metrics
+        if event.emotion_primary is not None or event.emotion_intensity is not None:
+            values[_CURRENT_EMOTION_KEY] = json.dumps(
+                {
+                    "ts": event.ts.isoformat(),
+                    "emotion_primary": event.emotion_primary,
+                    "emotion_intensity": event.emotion_intensity,
+                    "valence": metrics.get("valence"),
+                    "arousal": metrics.get("arousal"),
+                }
+            )
+        if "trust_level" in metrics:
+            values[_CURRENT_RELATIONSHIP_KEY] = json.dumps(
+                {
+                    "trust_level": metrics.get("trust_level"),
+                    "total_interactions": metrics.get("total_interactions"),
+                    "shared_episodes_count": metrics.get("shared_episodes_count"),
+                }
+            )
+        if (
+            event.tool_name in DESIRE_TELEMETRY_TOOL_NAMES
+            and event.event_type in DESIRE_TERMINAL_EVENT_TYPES
+        ):
+            values[_CURRENT_DESIRES_KEY] = json.dumps(
+                {
+                    key: float(value)
+                    for key, value in metrics.items()
+                    if self._desire_catalog.is_visible_desire_metric(key)
+                }
+            )
+        return values
+
+    def _refresh_window_counts(self) -> None:
+        """Trim the sliding windows and store their counts relative to the stored anchor."""
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    # Counts are read before MULTI, so a concurrent writer touching the
+                    # anchor or a window makes the SET fail and the counts are re-read.
+                    pipe.watch(_CURRENT_ANCHOR_KEY, *_WINDOW_KEYS)  # type: ignore[no-untyped-call]
+                    anchor = _parse_anchor(pipe.get(_CURRENT_ANCHOR_KEY))
+                    if anchor is None:
+                        return
+                    cutoff_24h = anchor - _WINDOW_24H_SECONDS
+                    counts: dict[str, list[int]] = {"1m": [], "24h": []}
+                    for key in _WINDOW_KEYS:
+                        for window, start in (
+                            ("1m", anchor - _WINDOW_1M_SECONDS),
+                            ("24h", cutoff_24h),
+                        ):
+                            value = pipe.zcount(key, start, anchor)
+                            counts[window].append(value if isinstance(value, int) else 0)
+                    pipe.multi()
+                    for key in _WINDOW_KEYS:
+                        pipe.zremrangebyscore(key, "-inf", f"({cutoff_24h!r}")
+                    pipe.set(_CURRENT_COUNTS_KEY, json.dumps(counts))
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
 
     def ingest_log(self, event: LogEvent) -> None:
         masked = "REDACTED" if event.private else event.message
-        dedupe_key = log_event_dedupe_key(
-            LogEvent(
-                ts=event.ts,
-                level=event.level,
-                logger=event.logger,
-                message=masked,
-                private=event.private,
-                fields=event.fields,
-            )
-        )
+        dedupe_key = log_event_dedupe_key(event, message=masked, version=self._dedupe_key_version)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -319,7 +944,133 @@ class SqlTelemetryStore:
                         dedupe_key,
                     ),
                 )
+                inserted = _inserted(cur)
             conn.commit()
+        self._update_log_windows(event, dedupe_key)
+        if inserted:
+            self._publish(
+                {
+                    "type": "log_line",
+                    "data": {
+                        "ts": event.ts.isoformat(),
+                        "level": event.level.upper(),
+                        "logger": event.logger,
+                        "message": masked,
+                        "private": event.private,
+                        "fields": event.fields,
+                    },
+                }
+            )
+
+    def _publish(self, message: dict[str, object]) -> None:
+        self._redis.publish(_STREAM_CHANNEL, json.dumps(message, default=str))
+
+    def subscribe(self, listener: StreamListener) -> Callable[[], None]:
+        """Relay messages from the ingest channel to ``listener`` on a background thread."""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)  # type: ignore[no-untyped-call]
+        pubsub.subscribe(_STREAM_CHANNEL)
+        stop_event = threading.Event()
+
+        def relay() -> None:
+            try:
+                while not stop_event.is_set():
+                    try:
+                        message = pubsub.get_message(timeout=1.0)
+                    except RedisError:
+                        logger.warning("dashboard stream subscription failed", exc_info=True)
+                        stop_event.wait(1.0)
+                        continue
+                    if not isinstance(message, dict):
+                        continue
+                    payload = _load_json_object(message.get("data"))
+                    if payload is not None:
+                        listener(payload)
+            finally:
+                pubsub.close()
+
+        thread = threading.Thread(target=relay, name="ego-dashboard-stream", daemon=True)
+        thread.start()
+
+        def unsubscribe() -> None:
+            stop_event.set()
+            thread.join(timeout=2.0)
+
+        return unsubscribe
+
+    def _update_log_windows(self, event: LogEvent, dedupe_key: str) -> None:
+        if event.message == "Tool invocation" and _tool_name_from_fields(event.fields):
+            window_key = _WINDOW_LOG_INVOCATIONS_KEY
+        elif event.message == "Tool execution failed":
+            window_key = _WINDOW_LOG_FAILURES_KEY
+        else:
+            return
+        self._redis.zadd(window_key, {_window_member(event.ts, dedupe_key): event.ts.timestamp()})
+        self._refresh_window_counts()
+
+    def rebuild_current_snapshot(self) -> None:
+        """Seed the Redis snapshot from SQL when the ingest path has not built it yet."""
+        if self._redis.exists(_CURRENT_COUNTS_KEY):
+            return
+        latest = _load_json_object(self._redis.get(_CURRENT_KEY))
+        if latest is None:
+            return
+        snapshot = self._current_from_sql(latest)
+        latest_ts = datetime.fromisoformat(str(latest["ts"]).replace("Z", "+00:00"))
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT ts, dedupe_key, ok
+                    FROM tool_events
+                    WHERE ts >= %s - interval '24 hours' AND ts <= %s
+                      AND event_type IN ('tool_call_completed', 'tool_call_failed')
+                    """,
+                    (latest_ts, latest_ts),
+                )
+                event_rows = cur.fetchall()
+                cur.execute(
+                    """
+                    SELECT ts, dedupe_key, message
+                    FROM log_events
+                    WHERE ts >= %s - interval '24 hours' AND ts <= %s
+                      AND (
+                        (message = 'Tool invocation' AND fields ? 'tool_name')
+                        OR message = 'Tool execution failed'
+                      )
+                    """,
+                    (latest_ts, latest_ts),
+                )
+                log_rows = cur.fetchall()
+
+        pipe = self._redis.pipeline(transaction=False)
+        for index, (ts, dedupe_key, ok) in enumerate(event_rows):
+            if not isinstance(ts, datetime):
+                continue
+            member = _window_member(ts, str(dedupe_key or f"row-{index}"))
+            pipe.zadd(_WINDOW_TOOL_CALLS_KEY, {member: ts.timestamp()})
+            if ok is False:
+                pipe.zadd(_WINDOW_TOOL_FAILURES_KEY, {member: ts.timestamp()})
+        for index, (ts, dedupe_key, message) in enumerate(log_rows):
+            if not isinstance(ts, datetime):
+                continue
+            window_key = (
+                _WINDOW_LOG_FAILURES_KEY
+                if message == "Tool execution failed"
+                else _WINDOW_LOG_INVOCATIONS_KEY
+            )
+            member = _window_member(ts, str(dedupe_key or f"row-{index}"))
+            pipe.zadd(window_key, {member: ts.timestamp()})
+        pipe.set(_CURRENT_ANCHOR_KEY, repr(latest_ts.timestamp()))
+        if snapshot["latest_emotion"] is not None:
+            pipe.set(_CURRENT_EMOTION_KEY, json.dumps(snapshot["latest_emotion"]))
+        if snapshot["latest_relationship"] is not None:
+            pipe.set(_CURRENT_RELATIONSHIP_KEY, json.dumps(snapshot["latest_relationship"]))
+        fixed_desires = snapshot["latest_desires"]
+        emergent_desires = snapshot["latest_emergent_desires"]
+        if isinstance(fixed_desires, dict) and isinstance(emergent_desires, dict):
+            pipe.set(_CURRENT_DESIRES_KEY, json.dumps({**fixed_desires, **emergent_desires}))
+        pipe.execute()
+        self._refresh_window_counts()
 
     def load_checkpoint(self, path: str) -> tuple[int, int] | None:
         with psycopg.connect(self._db_url) as conn:
@@ -357,6 +1108,17 @@ class SqlTelemetryStore:
             conn.commit()
 
     def tool_usage(self, start: datetime, end: datetime, bucket: str) -> list[dict[str, object]]:
+        return _dense_usage_rows(self._tool_usage_counts(start, end, bucket), start, end, bucket)
+
+    def tool_usage_columns(self, start: datetime, end: datetime, bucket: str) -> ColumnarSeries:
+        return _dense_usage_columns(self._tool_usage_counts(start, end, bucket), start, end, bucket)
+
+    def _tool_usage_counts(
+        self, start: datetime, end: datetime, bucket: str
+    ) -> list[tuple[datetime, str, int]]:
+        rollup = _rollup_for_bucket(bucket) if self._rollups_ready else None
+        if rollup is not None:
+            return self._tool_usage_from_rollup(start, end, bucket, *rollup)
         bucket_size = _bucket_to_sql(bucket)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
@@ -376,12 +1138,7 @@ class SqlTelemetryStore:
                 )
                 rows = cur.fetchall()
                 if rows:
-                    log_rows = [
-                        (bucket_ts, str(tool_name), int(count))
-                        for bucket_ts, tool_name, count in rows
-                        if isinstance(bucket_ts, datetime) and isinstance(tool_name, str)
-                    ]
-                    return _dense_usage_rows(log_rows, start, end, bucket)
+                    return _typed_usage_rows(rows)
 
                 cur.execute(
                     """
@@ -395,16 +1152,65 @@ class SqlTelemetryStore:
                     (bucket_size, start, end),
                 )
                 fallback_rows = cur.fetchall()
-        typed_rows = [
-            (bucket_ts, str(tool_name), int(count))
-            for bucket_ts, tool_name, count in fallback_rows
-            if isinstance(bucket_ts, datetime) and isinstance(tool_name, str)
-        ]
-        return _dense_usage_rows(typed_rows, start, end, bucket)
+        return _typed_usage_rows(fallback_rows)
+
+    def _tool_usage_from_rollup(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: str,
+        suffix: str,
+        width: timedelta,
+    ) -> list[tuple[datetime, str, int]]:
+        # Rollup rows cover whole rollup buckets, so the range start is widened to the
+        # enclosing rollup bucket; the width never exceeds the requested bucket.
+        params = (_bucket_to_sql(bucket), _bucket_floor(start, width), end)
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT time_bucket(%s::interval, bucket) AS b, tool_name, sum(calls)
+                    FROM log_events_tool_calls_{suffix}
+                    WHERE bucket >= %s AND bucket <= %s
+                    GROUP BY b, tool_name
+                    ORDER BY b ASC
+                    """,
+                    params,
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    cur.execute(
+                        f"""
+                        SELECT time_bucket(%s::interval, bucket) AS b, tool_name, sum(calls)
+                        FROM tool_events_usage_{suffix}
+                        WHERE bucket >= %s AND bucket <= %s
+                        GROUP BY b, tool_name
+                        ORDER BY b ASC
+                        """,
+                        params,
+                    )
+                    rows = cur.fetchall()
+        return _typed_usage_rows(rows)
 
     def metric_history(
         self, key: str, start: datetime, end: datetime, bucket: str
     ) -> list[dict[str, object]]:
+        rows = self._metric_history_rows(key, start, end, bucket)
+        return [
+            {"ts": ts.isoformat(), "value": float(value)} for ts, value in rows if value is not None
+        ]
+
+    def metric_history_columns(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> ColumnarSeries:
+        return series_from_values(self._metric_history_rows(key, start, end, bucket))
+
+    def _metric_history_rows(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> list[tuple[Any, ...]]:
+        rollup = _rollup_for_bucket(bucket) if self._rollups_ready else None
+        if rollup is not None and key in ROLLUP_METRIC_KEYS:
+            return self._metric_history_from_rollup(key, start, end, bucket, *rollup)
         bucket_size = _bucket_to_sql(bucket)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
@@ -419,10 +1225,135 @@ class SqlTelemetryStore:
                     """,
                     (bucket_size, key, start, end, key),
                 )
+                return cur.fetchall()
+
+    def _metric_history_from_rollup(
+        self,
+        key: str,
+        start: datetime,
+        end: datetime,
+        bucket: str,
+        suffix: str,
+        width: timedelta,
+    ) -> list[tuple[Any, ...]]:
+        # `key` is one of ROLLUP_METRIC_KEYS, so interpolating its column names is safe.
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT time_bucket(%s::interval, bucket) AS b,
+                           sum({key}_sum) / sum({key}_count)
+                    FROM tool_events_metrics_{suffix}
+                    WHERE bucket >= %s AND bucket <= %s AND {key}_count > 0
+                    GROUP BY b
+                    ORDER BY b ASC
+                    """,
+                    (_bucket_to_sql(bucket), _bucket_floor(start, width), end),
+                )
+                return cur.fetchall()
+
+    def tool_latency(self, start: datetime, end: datetime, bucket: str) -> list[dict[str, object]]:
+        """p50/p95/p99 of ``duration_ms`` per bucket and tool of terminal tool events."""
+        rollup = _rollup_for_bucket(bucket) if self._latency_rollups_ready else None
+        if rollup is not None:
+            return _latency_rows(
+                "tool_name", self._tool_latency_from_rollup(start, end, bucket, *rollup)
+            )
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT time_bucket(%s::interval, ts) AS b,
+                           tool_name,
+                           count(*),
+                           percentile_cont(%s::double precision[])
+                             WITHIN GROUP (ORDER BY duration_ms)
+                    FROM tool_events
+                    WHERE ts >= %s AND ts <= %s
+                      AND duration_ms IS NOT NULL
+                      AND event_type IN ('tool_call_completed', 'tool_call_failed')
+                    GROUP BY b, tool_name
+                    ORDER BY b ASC, tool_name ASC
+                    """,
+                    (_bucket_to_sql(bucket), _latency_quantiles_param(), start, end),
+                )
                 rows = cur.fetchall()
-        return [
-            {"ts": ts.isoformat(), "value": float(value)} for ts, value in rows if value is not None
-        ]
+        return _latency_rows("tool_name", rows)
+
+    def _tool_latency_from_rollup(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: str,
+        suffix: str,
+        width: timedelta,
+    ) -> list[tuple[Any, ...]]:
+        # The quantiles are module constants, so interpolating them is safe.
+        percentiles = ", ".join(
+            f"approx_percentile({q}, latency)" for _label, q in LATENCY_QUANTILES
+        )
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT b, tool_name, num_vals(latency), ARRAY[{percentiles}]
+                    FROM (
+                      SELECT time_bucket(%s::interval, bucket) AS b,
+                             tool_name,
+                             rollup(latency) AS latency
+                      FROM tool_events_latency_{suffix}
+                      WHERE bucket >= %s AND bucket <= %s
+                      GROUP BY b, tool_name
+                    ) AS merged
+                    ORDER BY b ASC, tool_name ASC
+                    """,
+                    (_bucket_to_sql(bucket), _bucket_floor(start, width), end),
+                )
+                return cur.fetchall()
+
+    def stage_latency(
+        self, start: datetime, end: datetime, bucket: str, tool_name: str | None = None
+    ) -> list[dict[str, object]]:
+        """p50/p95/p99 of each ``stage_<name>_ms`` metric per bucket, optionally for one tool."""
+        # Stage keys are open-ended JSONB keys, which continuous aggregates cannot unnest,
+        # so stages are always read from tool_events; the partial index bounds the scan.
+        prefix_len = len(STAGE_METRIC_PREFIX)
+        affix_len = prefix_len + len(STAGE_METRIC_SUFFIX)
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT time_bucket(%s::interval, ts) AS b,
+                           substr(m.key, {prefix_len + 1}, length(m.key) - {affix_len}) AS stage,
+                           count(*),
+                           percentile_cont(%s::double precision[])
+                             WITHIN GROUP (ORDER BY m.value::double precision)
+                    FROM tool_events
+                    CROSS JOIN LATERAL jsonb_each_text(numeric_metrics) AS m(key, value)
+                    WHERE ts >= %s AND ts <= %s
+                      AND duration_ms IS NOT NULL
+                      AND event_type IN ('tool_call_completed', 'tool_call_failed')
+                      AND (%s::text IS NULL OR tool_name = %s)
+                      AND starts_with(m.key, %s)
+                      AND right(m.key, %s) = %s
+                      AND length(m.key) > {affix_len}
+                    GROUP BY b, stage
+                    ORDER BY b ASC, stage ASC
+                    """,
+                    (
+                        _bucket_to_sql(bucket),
+                        _latency_quantiles_param(),
+                        start,
+                        end,
+                        tool_name,
+                        tool_name,
+                        STAGE_METRIC_PREFIX,
+                        len(STAGE_METRIC_SUFFIX),
+                        STAGE_METRIC_SUFFIX,
+                    ),
+                )
+                rows = cur.fetchall()
+        return _latency_rows("stage", rows)
 
     def desire_metric_keys(self, start: datetime, end: datetime) -> list[str]:
         with psycopg.connect(self._db_url) as conn:
@@ -455,7 +1386,7 @@ class SqlTelemetryStore:
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
+                    f"""
                     SELECT
                       ts,
                       string_metrics ->> 'notion_confidences',
@@ -470,16 +1401,7 @@ class SqlTelemetryStore:
                     FROM tool_events
                     WHERE ts >= %s
                       AND ts <= %s
-                      AND (
-                        string_metrics ? 'notion_confidences'
-                        OR string_metrics ? 'notion_created'
-                        OR string_metrics ? 'notion_reinforced'
-                        OR string_metrics ? 'notion_weakened'
-                        OR string_metrics ? 'notion_dormant'
-                        OR string_metrics ? 'notion_decayed'
-                        OR string_metrics ? 'notion_pruned'
-                        OR string_metrics ? 'notion_merged'
-                      )
+                      AND ({_NOTION_EVENTS_PREDICATE})
                     ORDER BY ts ASC
                     """,
                     (start, end),
@@ -574,6 +1496,24 @@ class SqlTelemetryStore:
     def string_heatmap(
         self, key: str, start: datetime, end: datetime, bucket: str
     ) -> list[dict[str, object]]:
+        grouped: dict[str, dict[str, int]] = defaultdict(dict)
+        for ts, value, count in self._string_heatmap_rows(key, start, end, bucket):
+            if isinstance(value, str):
+                grouped[ts.isoformat()][value] = int(count)
+        return [{"ts": ts, "counts": counts} for ts, counts in grouped.items()]
+
+    def string_heatmap_columns(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> ColumnarSeries:
+        return series_from_counts(
+            (ts, value, count)
+            for ts, value, count in self._string_heatmap_rows(key, start, end, bucket)
+            if isinstance(value, str)
+        )
+
+    def _string_heatmap_rows(
+        self, key: str, start: datetime, end: datetime, bucket: str
+    ) -> list[tuple[Any, ...]]:
         bucket_size = _bucket_to_sql(bucket)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
@@ -589,12 +1529,7 @@ class SqlTelemetryStore:
                     """,
                     (bucket_size, key, start, end, key),
                 )
-                rows = cur.fetchall()
-        grouped: dict[str, dict[str, int]] = defaultdict(dict)
-        for ts, value, count in rows:
-            if isinstance(value, str):
-                grouped[ts.isoformat()][value] = int(count)
-        return [{"ts": ts, "counts": counts} for ts, counts in grouped.items()]
+                return cur.fetchall()
 
     def logs(
         self,
@@ -604,22 +1539,9 @@ class SqlTelemetryStore:
         *,
         search: str | None = None,
     ) -> list[dict[str, object]]:
+        where_clauses, params = _log_filters(start, end, level, search)
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
-                where_clauses = ["ts >= %s", "ts <= %s"]
-                params: list[object] = [start, end]
-
-                if level:
-                    where_clauses.append("level = %s")
-                    params.append(level.upper())
-                if search:
-                    where_clauses.append(
-                        "(message ILIKE %s ESCAPE '\\' OR fields::text ILIKE %s ESCAPE '\\')"
-                    )
-                    escaped = _escape_ilike_pattern(search)
-                    needle = f"%{escaped}%"
-                    params.extend([needle, needle])
-
                 cur.execute(
                     f"""
                     SELECT ts, level, logger, message, private, fields
@@ -631,17 +1553,48 @@ class SqlTelemetryStore:
                     tuple(params),
                 )
                 rows = cur.fetchall()
-        return [
-            {
-                "ts": ts.isoformat(),
-                "level": str(lvl),
-                "logger": str(logger),
-                "message": "REDACTED" if bool(private) else str(msg),
-                "private": bool(private),
-                "fields": fields if isinstance(fields, dict) else {},
-            }
-            for ts, lvl, logger, msg, private, fields in rows
-        ]
+        return [_log_row(*row) for row in rows]
+
+    def log_page(
+        self,
+        start: datetime,
+        end: datetime,
+        level: str | None = None,
+        *,
+        search: str | None = None,
+        after: LogCursor | None = None,
+        limit: int = 300,
+    ) -> list[dict[str, object]]:
+        """Oldest-first logs with their ``dedupe_key``.
+
+        Past the ``after`` keyset cursor when given; otherwise the newest ``limit`` rows
+        of the range, so a request without a cursor is a live tail.
+        """
+        where_clauses, params = _log_filters(start, end, level, search)
+        direction = "DESC"
+        if after is not None:
+            # Rows predating dedupe keys sort as '' until dedupe_telemetry backfills them.
+            where_clauses.append("(ts, COALESCE(dedupe_key, '')) > (%s, %s)")
+            params.extend(after)
+            direction = "ASC"
+        params.append(limit)
+        with psycopg.connect(self._db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT ts, level, logger, message, private, fields,
+                           COALESCE(dedupe_key, '')
+                    FROM log_events
+                    WHERE {" AND ".join(where_clauses)}
+                    ORDER BY ts {direction}, COALESCE(dedupe_key, '') {direction}
+                    LIMIT %s
+                    """,
+                    tuple(params),
+                )
+                rows = cur.fetchall()
+        if after is None:
+            rows.reverse()
+        return [{**_log_row(*row[:6]), "dedupe_key": str(row[6])} for row in rows]
 
     def anomaly_alerts(
         self, start: datetime, end: datetime, bucket: str
@@ -665,24 +1618,62 @@ class SqlTelemetryStore:
                     alerts.append({"kind": "intensity_spike", "ts": row["ts"], "value": raw})
                 prev_intensity = float(raw)
 
+        alerts.extend(latency_regression_alerts(self.tool_latency(start, end, bucket)))
         return alerts
 
     def current(self) -> dict[str, object]:
-        latest_raw = self._redis.get("dashboard:current")
-        latest_text = latest_raw if isinstance(latest_raw, str) else None
-        latest = json.loads(latest_text) if latest_text else None
+        latest_raw, emotion_raw, relationship_raw, desires_raw, counts_raw = self._redis.mget(
+            [
+                _CURRENT_KEY,
+                _CURRENT_EMOTION_KEY,
+                _CURRENT_RELATIONSHIP_KEY,
+                _CURRENT_DESIRES_KEY,
+                _CURRENT_COUNTS_KEY,
+            ]
+        )
+        latest = _load_json_object(latest_raw)
         if latest is None:
-            return {
-                "latest": None,
-                "latest_emotion": None,
-                "latest_relationship": None,
-                "tool_calls_per_min": 0,
-                "error_rate": 0.0,
-                "window_24h": {"tool_calls": 0, "error_rate": 0.0},
-                "latest_desires": {},
-                "latest_emergent_desires": {},
-            }
-        if isinstance(latest, dict) and latest.get("private") is True:
+            return _empty_current()
+        counts = _load_json_object(counts_raw)
+        if counts is None:
+            # The snapshot has not been built yet, e.g. right after upgrading an existing
+            # deployment; answer from SQL until the ingestor rebuilds it.
+            return self._current_from_sql(latest)
+        if latest.get("private") is True:
+            latest["message"] = "REDACTED"
+
+        latest_emotion = _load_json_object(emotion_raw)
+        if latest_emotion is not None:
+            if latest.get("emotion_primary") is None:
+                latest["emotion_primary"] = latest_emotion.get("emotion_primary")
+            if latest.get("emotion_intensity") is None:
+                latest["emotion_intensity"] = latest_emotion.get("emotion_intensity")
+        desires = {
+            key: float(value)
+            for key, value in (_load_json_object(desires_raw) or {}).items()
+            if self._desire_catalog.is_visible_desire_metric(key)
+            and isinstance(value, (int, float))
+        }
+        latest_fixed_desires, latest_emergent_desires = self._desire_catalog.split_desire_metrics(
+            desires
+        )
+        window_1m = _window_counts(counts.get("1m"))
+        window_24h = _window_counts(counts.get("24h"))
+        tool_calls_per_min, error_rate = _call_rates(*window_1m)
+        tool_calls_24h, error_rate_24h = _call_rates(*window_24h)
+        return {
+            "latest": latest,
+            "latest_emotion": latest_emotion,
+            "latest_relationship": _load_json_object(relationship_raw),
+            "tool_calls_per_min": tool_calls_per_min,
+            "error_rate": error_rate,
+            "window_24h": {"tool_calls": tool_calls_24h, "error_rate": error_rate_24h},
+            "latest_desires": latest_fixed_desires,
+            "latest_emergent_desires": latest_emergent_desires,
+        }
+
+    def _current_from_sql(self, latest: dict[str, Any]) -> dict[str, object]:
+        if latest.get("private") is True:
             latest["message"] = "REDACTED"
 
         latest_ts = datetime.fromisoformat(str(latest["ts"]).replace("Z", "+00:00"))
@@ -743,16 +1734,10 @@ class SqlTelemetryStore:
                 )
                 log_row_24h = cur.fetchone()
                 cur.execute(
-                    """
-                    SELECT
-                      ts,
-                      emotion_primary,
-                      emotion_intensity,
-                      (numeric_metrics ->> 'valence')::double precision,
-                      (numeric_metrics ->> 'arousal')::double precision
+                    f"""
+                    SELECT ts, emotion_primary, emotion_intensity, valence, arousal
                     FROM tool_events
-                    WHERE ts <= %s
-                      AND (emotion_primary IS NOT NULL OR emotion_intensity IS NOT NULL)
+                    WHERE ts <= %s AND ({_EMOTION_EVENTS_PREDICATE})
                     ORDER BY ts DESC
                     LIMIT 1
                     """,
@@ -762,11 +1747,11 @@ class SqlTelemetryStore:
                 cur.execute(
                     """
                     SELECT
-                      (numeric_metrics ->> 'trust_level')::double precision,
+                      trust_level,
                       (numeric_metrics ->> 'total_interactions')::double precision,
                       (numeric_metrics ->> 'shared_episodes_count')::double precision
                     FROM tool_events
-                    WHERE ts <= %s AND numeric_metrics ? 'trust_level'
+                    WHERE ts <= %s AND trust_level IS NOT NULL
                     ORDER BY ts DESC
                     LIMIT 1
                     """,
@@ -860,24 +1845,19 @@ class SqlTelemetryStore:
         latest_fixed_desires, latest_emergent_desires = self._desire_catalog.split_desire_metrics(
             latest_desires
         )
+        tool_calls_per_min, error_rate = _call_rates(
+            total_calls, total_errors, log_calls, log_failures
+        )
+        tool_calls_24h, error_rate_24h = _call_rates(
+            total_calls_24h, total_errors_24h, log_calls_24h, log_failures_24h
+        )
         return {
             "latest": latest,
             "latest_emotion": latest_emotion,
             "latest_relationship": latest_relationship,
-            "tool_calls_per_min": log_calls if log_calls > 0 else total_calls,
-            "error_rate": (
-                (log_failures / log_calls)
-                if log_calls > 0
-                else ((total_errors / total_calls) if total_calls else 0.0)
-            ),
-            "window_24h": {
-                "tool_calls": (log_calls_24h if log_calls_24h > 0 else total_calls_24h),
-                "error_rate": (
-                    (log_failures_24h / log_calls_24h)
-                    if log_calls_24h > 0
-                    else ((total_errors_24h / total_calls_24h) if total_calls_24h else 0.0)
-                ),
-            },
+            "tool_calls_per_min": tool_calls_per_min,
+            "error_rate": error_rate,
+            "window_24h": {"tool_calls": tool_calls_24h, "error_rate": error_rate_24h},
             "latest_desires": latest_fixed_desires,
             "latest_emergent_desires": latest_emergent_desires,
         }
@@ -886,15 +1866,10 @@ class SqlTelemetryStore:
         with psycopg.connect(self._db_url) as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
+                    f"""
                     SELECT ts, string_metrics
                     FROM tool_events
-                    WHERE ts >= %s AND ts <= %s
-                      AND (
-                        string_metrics ? 'surfaced_person_ids'
-                        OR string_metrics ? 'resonant_person_ids'
-                        OR string_metrics ? 'involuntary_person_ids'
-                      )
+                    WHERE ts >= %s AND ts <= %s AND ({_SURFACE_EVENTS_PREDICATE})
                     ORDER BY ts ASC
                     """,
                     (start, end),
@@ -942,14 +1917,15 @@ class SqlTelemetryStore:
                     """
                     SELECT ts, numeric_metrics, string_metrics
                     FROM tool_events
-                    WHERE ts >= %s AND ts <= %s
+                    WHERE person_id = %s
+                      AND ts >= %s AND ts <= %s
                       AND (
-                        numeric_metrics ? 'trust_level'
+                        trust_level IS NOT NULL
                         OR numeric_metrics ? 'shared_episodes_count'
                       )
                     ORDER BY ts ASC
                     """,
-                    (start, end),
+                    (person_id, start, end),
                 )
                 rows = cur.fetchall()
                 for ts, numeric_metrics, string_metrics in rows:
@@ -1025,12 +2001,17 @@ class SqlTelemetryStore:
 
 
 def _bucket_to_sql(bucket: str) -> str:
-    mapping = {"1m": "1 minute", "5m": "5 minute", "15m": "15 minute"}
+    mapping = {"1m": "1 minute", "5m": "5 minute", "15m": "15 minute", "1h": "1 hour"}
     return mapping.get(bucket, "1 minute")
 
 
 def _bucket_to_timedelta(bucket: str) -> timedelta:
-    mapping = {"1m": timedelta(minutes=1), "5m": timedelta(minutes=5), "15m": timedelta(minutes=15)}
+    mapping = {
+        "1m": timedelta(minutes=1),
+        "5m": timedelta(minutes=5),
+        "15m": timedelta(minutes=15),
+        "1h": timedelta(hours=1),
+    }
     return mapping.get(bucket, timedelta(minutes=1))
 
 
@@ -1,46 +1,173 @@
 from __future__ import annotations
 
 import json
+import threading
+from bisect import bisect_left, bisect_right
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timedelta
+from itertools import islice
 
 from ego_dashboard.constants import DESIRE_TELEMETRY_TOOL_NAMES, DESIRE_TERMINAL_EVENT_TYPES
 from ego_dashboard.desire_catalog import DesireCatalog, default_desire_catalog
-from ego_dashboard.models import DashboardEvent, LogEvent
+from ego_dashboard.latency import (
+    QuantileSketch,
+    latency_regression_alerts,
+    latency_row,
+    stage_name,
+)
+from ego_dashboard.models import DashboardEvent, LogCursor, LogEvent
 from ego_dashboard.telemetry_identity import dashboard_event_dedupe_key, log_event_dedupe_key
 
-_BUCKETS = {"1m": timedelta(minutes=1), "5m": timedelta(minutes=5), "15m": timedelta(minutes=15)}
+_BUCKETS = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "1h": timedelta(hours=1),
+}
+_TERMINAL_EVENT_TYPES = frozenset({"tool_call_completed", "tool_call_failed"})
+
+type StreamListener = Callable[[dict[str, object]], None]
+
+
+class _TimeSeries[T]:
+    """Time-ordered parallel columns with bisect range lookups and bounded retention."""
+
+    def __init__(self, retention: timedelta | None, max_items: int | None) -> None:
+        self._retention = retention
+        self._max_items = max_items
+        self.timestamps: list[datetime] = []
+        self.items: list[T] = []
+        self._identities: list[tuple[datetime, str]] = []
+        self._identity_set: set[tuple[datetime, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def insert(self, ts: datetime, dedupe_key: str, item: T) -> bool:
+        identity = (ts, dedupe_key)
+        if identity in self._identity_set:
+            return False
+        if self._retention is not None and self.timestamps:
+            if ts < self.timestamps[-1] - self._retention:
+                return False
+        # bisect_right keeps arrival order for equal timestamps, like a stable sort.
+        index = bisect_right(self.timestamps, ts)
+        self.timestamps.insert(index, ts)
+        self.items.insert(index, item)
+        self._identities.insert(index, identity)
+        self._identity_set.add(identity)
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        cut = 0
+        if self._retention is not None:
+            cut = bisect_left(self.timestamps, self.timestamps[-1] - self._retention)
+        if self._max_items is not None:
+            cut = max(cut, len(self.items) - self._max_items)
+        if cut <= 0:
+            return
+        for identity in self._identities[:cut]:
+            self._identity_set.discard(identity)
+        del self.timestamps[:cut]
+        del self.items[:cut]
+        del self._identities[:cut]
+
+    def between(self, start: datetime, end: datetime) -> list[T]:
+        """Return items with ``start <= ts <= end`` in time order."""
+        lo = bisect_left(self.timestamps, start)
+        hi = bisect_right(self.timestamps, end)
+        return self.items[lo:hi]
+
+    def page(
+        self, start: datetime, end: datetime, after: tuple[datetime, str] | None
+    ) -> Iterator[tuple[tuple[datetime, str], T]]:
+        """Yield items in ``[start, end]`` past ``after``, ordered by ``(ts, dedupe_key)``."""
+        if after is not None:
+            start = max(start, after[0])
+        index = bisect_left(self.timestamps, start)
+        hi = bisect_right(self.timestamps, end)
+        while index < hi:
+            # Already sorted by ts, so only each run of equal timestamps is ordered by key.
+            run_end = bisect_right(self.timestamps, self.timestamps[index], index, hi)
+            for row in sorted(self._rows(index, run_end), key=lambda row: row[0]):
+                if after is None or row[0] > after:
+                    yield row
+            index = run_end
+
+    def page_newest(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[tuple[datetime, str], T]]:
+        """Yield items in ``[start, end]`` newest first, by descending ``(ts, dedupe_key)``."""
+        lo = bisect_left(self.timestamps, start)
+        index = bisect_right(self.timestamps, end)
+        while index > lo:
+            run_start = bisect_left(self.timestamps, self.timestamps[index - 1], lo, index)
+            yield from sorted(self._rows(run_start, index), key=lambda row: row[0], reverse=True)
+            index = run_start
+
+    def _rows(self, lo: int, hi: int) -> Iterator[tuple[tuple[datetime, str], T]]:
+        return zip(self._identities[lo:hi], self.items[lo:hi], strict=True)
+
+    def since(self, start: datetime) -> list[T]:
+        return self.items[bisect_left(self.timestamps, start) :]
+
+    def latest(self) -> T | None:
+        return self.items[-1] if self.items else None
 
 
 class TelemetryStore:
-    def __init__(self, desire_catalog: DesireCatalog | None = None) -> None:
-        self._events: list[DashboardEvent] = []
-        self._logs: list[LogEvent] = []
-        self._event_keys: set[tuple[datetime, str]] = set()
-        self._log_keys: set[tuple[datetime, str]] = set()
+    def __init__(
+        self,
+        desire_catalog: DesireCatalog | None = None,
+        *,
+        retention: timedelta | None = None,
+        max_items: int | None = None,
+    ) -> None:
+        self._events: _TimeSeries[DashboardEvent] = _TimeSeries(retention, max_items)
+        self._logs: _TimeSeries[LogEvent] = _TimeSeries(retention, max_items)
         self._checkpoints: dict[str, tuple[int, int]] = {}
         self._desire_catalog = desire_catalog or default_desire_catalog()
+        self._listeners: list[StreamListener] = []
+        self._listeners_lock = threading.Lock()
 
     @property
     def desire_catalog(self) -> DesireCatalog:
         return self._desire_catalog
 
     def ingest(self, event: DashboardEvent) -> None:
-        key = (event.ts, dashboard_event_dedupe_key(event))
-        if key in self._event_keys:
-            return
-        self._event_keys.add(key)
-        self._events.append(event)
-        self._events.sort(key=lambda item: item.ts)
+        if self._events.insert(event.ts, dashboard_event_dedupe_key(event), event):
+            self._notify({"type": "current"})
 
     def ingest_log(self, event: LogEvent) -> None:
-        key = (event.ts, log_event_dedupe_key(event))
-        if key in self._log_keys:
-            return
-        self._log_keys.add(key)
-        self._logs.append(event)
-        self._logs.sort(key=lambda item: item.ts)
+        if self._logs.insert(event.ts, log_event_dedupe_key(event), event):
+            self._notify({"type": "log_line", "data": self._log_row(event)})
+
+    def subscribe(self, listener: StreamListener) -> Callable[[], None]:
+        """Call ``listener`` with a stream message for every newly stored event."""
+        with self._listeners_lock:
+            self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with self._listeners_lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def _notify(self, message: dict[str, object]) -> None:
+        with self._listeners_lock:
+            listeners = tuple(self._listeners)
+        for listener in listeners:
+            listener(message)
+
+    @staticmethod
+    def _log_row(item: LogEvent) -> dict[str, object]:
+        row = item.model_dump(mode="json")
+        if item.private:
+            row["message"] = "REDACTED"
+        return row
 
     def load_checkpoint(self, path: str) -> tuple[int, int] | None:
         return self._checkpoints.get(path)
@@ -52,14 +179,13 @@ class TelemetryStore:
         return _BUCKETS.get(bucket, timedelta(minutes=1))
 
     def _filtered(self, start: datetime, end: datetime) -> list[DashboardEvent]:
-        return [item for item in self._events if start <= item.ts <= end]
+        return self._events.between(start, end)
 
     def _terminal_events(self, start: datetime, end: datetime) -> list[DashboardEvent]:
         return [
             item
-            for item in self._events
-            if start <= item.ts <= end
-            and item.event_type in {"tool_call_completed", "tool_call_failed"}
+            for item in self._events.between(start, end)
+            if item.event_type in _TERMINAL_EVENT_TYPES
         ]
 
     @staticmethod
@@ -72,7 +198,7 @@ class TelemetryStore:
             return {}
         wanted = set(keys)
         latest: dict[str, float] = {}
-        for event in reversed(self._events):
+        for event in reversed(self._events.items):
             for key, value in event.numeric_metrics.items():
                 if key not in wanted or key in latest:
                     continue
@@ -93,32 +219,33 @@ class TelemetryStore:
         return desire_metrics
 
     def _latest_desire_metrics(self) -> dict[str, float]:
-        for event in reversed(self._events):
+        for event in reversed(self._events.items):
             desire_metrics = self._desire_metrics_for_event(event)
             if desire_metrics:
                 return desire_metrics
         return {}
 
-    def _bucket_events(
-        self, events: list[DashboardEvent], start: datetime, end: datetime, bucket: str
-    ) -> list[tuple[datetime, list[DashboardEvent]]]:
+    def _bucket_items[T: (DashboardEvent, LogEvent)](
+        self, items: list[T], start: datetime, end: datetime, bucket: str
+    ) -> list[tuple[datetime, list[T]]]:
+        """Group time-ordered items into ``[start, end)`` buckets in a single pass."""
         delta = self._bucket_delta(bucket)
-        rows: list[tuple[datetime, list[DashboardEvent]]] = []
+        rows: list[tuple[datetime, list[T]]] = []
         cursor = start
         while cursor < end:
-            bucket_end = cursor + delta
-            grouped = [ev for ev in events if cursor <= ev.ts < bucket_end]
-            rows.append((cursor, grouped))
-            cursor = bucket_end
+            rows.append((cursor, []))
+            cursor += delta
+        for item in items:
+            index = (item.ts - start) // delta
+            if 0 <= index < len(rows):
+                rows[index][1].append(item)
         return rows
 
     def tool_usage(self, start: datetime, end: datetime, bucket: str) -> list[dict[str, object]]:
         invocations = [
             log
-            for log in self._logs
-            if start <= log.ts <= end
-            and log.message == "Tool invocation"
-            and self._invocation_tool_name(log) is not None
+            for log in self._logs.between(start, end)
+            if log.message == "Tool invocation" and self._invocation_tool_name(log) is not None
         ]
         if invocations:
             tool_names = sorted(
@@ -129,27 +256,22 @@ class TelemetryStore:
                 }
             )
             log_usage_rows: list[dict[str, object]] = []
-            delta = self._bucket_delta(bucket)
-            cursor = start
-            while cursor < end:
-                bucket_end = cursor + delta
+            for at, grouped_logs in self._bucket_items(invocations, start, end, bucket):
                 log_counts: Counter[str] = Counter(
                     tool_name
-                    for log in invocations
-                    if cursor <= log.ts < bucket_end
+                    for log in grouped_logs
                     if (tool_name := self._invocation_tool_name(log)) is not None
                 )
-                row: dict[str, object] = {"ts": cursor.isoformat()}
+                row: dict[str, object] = {"ts": at.isoformat()}
                 for tool_name in tool_names:
                     row[tool_name] = int(log_counts.get(tool_name, 0))
                 log_usage_rows.append(row)
-                cursor = bucket_end
             return log_usage_rows
 
         events = self._terminal_events(start, end)
         tool_names = sorted({ev.tool_name for ev in events})
         event_usage_rows: list[dict[str, object]] = []
-        for at, grouped in self._bucket_events(events, start, end, bucket):
+        for at, grouped in self._bucket_items(events, start, end, bucket):
             event_counts: dict[str, int] = Counter(ev.tool_name for ev in grouped)
             row = {"ts": at.isoformat()}
             for tool_name in tool_names:
@@ -162,12 +284,48 @@ class TelemetryStore:
     ) -> list[dict[str, object]]:
         events = self._filtered(start, end)
         rows: list[dict[str, object]] = []
-        for at, grouped in self._bucket_events(events, start, end, bucket):
+        for at, grouped in self._bucket_items(events, start, end, bucket):
             values = [ev.numeric_metrics[key] for ev in grouped if key in ev.numeric_metrics]
             if values:
                 rows.append({"ts": at.isoformat(), "value": sum(values) / len(values)})
         return rows
 
+    def tool_latency(self, start: datetime, end: datetime, bucket: str) -> list[dict[str, object]]:
+        """p50/p95/p99 of ``duration_ms`` per bucket and tool, from streaming sketches."""
+        events = self._terminal_events(start, end)
+        rows: list[dict[str, object]] = []
+        for at, grouped in self._bucket_items(events, start, end, bucket):
+            sketches: dict[str, QuantileSketch] = {}
+            for ev in grouped:
+                if ev.duration_ms is not None:
+                    sketches.setdefault(ev.tool_name, QuantileSketch()).add(ev.duration_ms)
+            ts = at.isoformat()
+            rows.extend(
+                latency_row(ts, "tool_name", name, sketches[name]) for name in sorted(sketches)
+            )
+        return rows
+
+    def stage_latency(
+        self, start: datetime, end: datetime, bucket: str, tool_name: str | None = None
+    ) -> list[dict[str, object]]:
+        """p50/p95/p99 of each ``stage_<name>_ms`` metric per bucket, optionally for one tool."""
+        events = [
+            ev
+            for ev in self._terminal_events(start, end)
+            if tool_name is None or ev.tool_name == tool_name
+        ]
+        rows: list[dict[str, object]] = []
+        for at, grouped in self._bucket_items(events, start, end, bucket):
+            sketches: dict[str, QuantileSketch] = {}
+            for ev in grouped:
+                for key, value in ev.numeric_metrics.items():
+                    stage = stage_name(key)
+                    if stage is not None:
+                        sketches.setdefault(stage, QuantileSketch()).add(value)
+            ts = at.isoformat()
+            rows.extend(latency_row(ts, "stage", name, sketches[name]) for name in sorted(sketches))
+        return rows
+
     def string_timeline(self, key: str, start: datetime, end: datetime) -> list[dict[str, str]]:
         events = self._filtered(start, end)
         points = [
@@ -182,7 +340,7 @@ class TelemetryStore:
     ) -> list[dict[str, object]]:
         events = self._filtered(start, end)
         rows: list[dict[str, object]] = []
-        for at, grouped in self._bucket_events(events, start, end, bucket):
+        for at, grouped in self._bucket_items(events, start, end, bucket):
             counter: Counter[str] = Counter(
                 ev.string_metrics[key] for ev in grouped if key in ev.string_metrics
             )
@@ -197,24 +355,49 @@ class TelemetryStore:
         *,
         search: str | None = None,
     ) -> list[dict[str, object]]:
-        values = [log for log in self._logs if start <= log.ts <= end]
-        if level:
-            values = [log for log in values if log.level == level.upper()]
-        if search:
-            needle = search.lower()
-            values = [
-                log
-                for log in values
-                if needle in log.message.lower()
-                or any(needle in value.lower() for value in self._field_values(log.fields))
-            ]
-        rows: list[dict[str, object]] = []
-        for item in values[-300:]:
-            row = item.model_dump(mode="json")
-            if item.private:
-                row["message"] = "REDACTED"
-            rows.append(row)
-        return rows
+        values = [
+            log for log in self._logs.between(start, end) if self._log_matches(log, level, search)
+        ]
+        return [self._log_row(item) for item in values[-300:]]
+
+    def log_page(
+        self,
+        start: datetime,
+        end: datetime,
+        level: str | None = None,
+        *,
+        search: str | None = None,
+        after: LogCursor | None = None,
+        limit: int = 300,
+    ) -> list[dict[str, object]]:
+        """Oldest-first logs with their ``dedupe_key``.
+
+        Past the ``after`` keyset cursor when given; otherwise the newest ``limit`` rows
+        of the range, so a request without a cursor is a live tail.
+        """
+        if after is None:
+            rows = self._logs.page_newest(start, end)
+        else:
+            rows = self._logs.page(start, end, after)
+        matches = (
+            {**self._log_row(log), "dedupe_key": dedupe_key}
+            for (_ts, dedupe_key), log in rows
+            if self._log_matches(log, level, search)
+        )
+        page = list(islice(matches, limit))
+        if after is None:
+            page.reverse()
+        return page
+
+    def _log_matches(self, log: LogEvent, level: str | None, search: str | None) -> bool:
+        if level and log.level != level.upper():
+            return False
+        if not search:
+            return True
+        needle = search.lower()
+        return needle in log.message.lower() or any(
+            needle in value.lower() for value in self._field_values(log.fields)
+        )
 
     @classmethod
     def _field_values(cls, value: object) -> Iterable[str]:
@@ -258,6 +441,7 @@ class TelemetryStore:
                 alerts.append({"kind": "intensity_spike", "ts": row["ts"], "value": value})
             prev_intensity = value
 
+        alerts.extend(latency_regression_alerts(self.tool_latency(start, end, bucket)))
         return alerts
 
     def desire_metric_keys(self, start: datetime, end: datetime) -> list[str]:
@@ -279,24 +463,19 @@ class TelemetryStore:
                 "latest_emergent_desires": {},
             }
 
-        latest = self._events[-1]
+        latest = self._events.items[-1]
         window_start = latest.ts - timedelta(minutes=1)
         window_24h_start = latest.ts - timedelta(hours=24)
-        recent = [ev for ev in self._events if ev.ts >= window_start]
-        recent_24h = [ev for ev in self._events if ev.ts >= window_24h_start]
-        terminal_recent = [
-            ev for ev in recent if ev.event_type in {"tool_call_completed", "tool_call_failed"}
-        ]
-        terminal_recent_24h = [
-            ev for ev in recent_24h if ev.event_type in {"tool_call_completed", "tool_call_failed"}
-        ]
+        recent_24h = self._events.since(window_24h_start)
+        terminal_recent_24h = [ev for ev in recent_24h if ev.event_type in _TERMINAL_EVENT_TYPES]
+        terminal_recent = [ev for ev in terminal_recent_24h if ev.ts >= window_start]
         latest_payload = latest.model_dump(mode="json")
         if latest.private:
             latest_payload["message"] = "REDACTED"
         emotion_source = next(
             (
                 ev
-                for ev in reversed(self._events)
+                for ev in reversed(self._events.items)
                 if ev.emotion_primary is not None or ev.emotion_intensity is not None
             ),
             None,
@@ -324,7 +503,7 @@ class TelemetryStore:
                 "arousal": (float(arousal_raw) if isinstance(arousal_raw, (int, float)) else None),
             }
         relationship_source = next(
-            (ev for ev in reversed(self._events) if "trust_level" in ev.numeric_metrics),
+            (ev for ev in reversed(self._events.items) if "trust_level" in ev.numeric_metrics),
             None,
         )
         latest_relationship = None
@@ -335,8 +514,8 @@ class TelemetryStore:
                 "total_interactions": metrics.get("total_interactions"),
                 "shared_episodes_count": metrics.get("shared_episodes_count"),
             }
-        log_window = [log for log in self._logs if log.ts >= window_start]
-        log_window_24h = [log for log in self._logs if log.ts >= window_24h_start]
+        log_window_24h = self._logs.since(window_24h_start)
+        log_window = [log for log in log_window_24h if log.ts >= window_start]
         invocation_count = sum(
             1
             for log in log_window
@@ -400,7 +579,7 @@ class TelemetryStore:
             cloned.numeric_metrics["notion_confidence"] = confidence
             events.append(cloned)
         rows: list[dict[str, object]] = []
-        for at, grouped in self._bucket_events(events, start, end, bucket):
+        for at, grouped in self._bucket_items(events, start, end, bucket):
             values = [
                 ev.numeric_metrics["notion_confidence"]
                 for ev in grouped
@@ -5,12 +5,78 @@ import json
 
 from ego_dashboard.models import DashboardEvent, LogEvent
 
+# Version 1: SHA-256 over a sorted-key JSON object (64 hex chars).
+# Version 2: 128-bit BLAKE2b over a sorted-key JSON array in fixed field order (32 hex chars).
+# `dedupe_telemetry` rewrites version 1 keys and records DEDUPE_KEYS_V2_MIGRATION.
+DEDUPE_KEY_VERSION = 2
+DEDUPE_KEYS_V2_MIGRATION = "20261019_dedupe_keys_v2"
+LEGACY_DEDUPE_KEY_LENGTH = 64
+
+# Reusing one encoder skips the per-call JSONEncoder construction done by json.dumps(**kw).
+_encode = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+
 
 def _canonical_json(value: object) -> str:
     return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
 
 
-def dashboard_event_dedupe_key(event: DashboardEvent) -> str:
+def _digest(payload: list[object]) -> str:
+    # surrogatepass: json.loads can yield lone surrogates, which plain UTF-8 rejects.
+    encoded = _encode(payload).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def dashboard_event_dedupe_key(event: DashboardEvent, *, version: int = DEDUPE_KEY_VERSION) -> str:
+    if version == 1:
+        return _legacy_dashboard_event_dedupe_key(event)
+    if event._dedupe_key is not None:
+        return event._dedupe_key
+    key = _digest(
+        [
+            event.event_type,
+            event.tool_name,
+            event.ok,
+            event.duration_ms,
+            event.emotion_primary,
+            event.emotion_intensity,
+            event.numeric_metrics,
+            event.string_metrics,
+            event.params,
+            event.private,
+            event.message,
+        ]
+    )
+    event._dedupe_key = key
+    return key
+
+
+def log_event_dedupe_key(
+    event: LogEvent,
+    *,
+    message: str | None = None,
+    version: int = DEDUPE_KEY_VERSION,
+) -> str:
+    """Identity of a log line; ``message`` overrides the stored text (e.g. ``REDACTED``)."""
+    if version == 1:
+        return _legacy_log_event_dedupe_key(event, message)
+    cacheable = message is None or message == event.message
+    if cacheable and event._dedupe_key is not None:
+        return event._dedupe_key
+    key = _digest(
+        [
+            event.level.upper(),
+            event.logger,
+            event.message if message is None else message,
+            event.private,
+            event.fields,
+        ]
+    )
+    if cacheable:
+        event._dedupe_key = key
+    return key
+
+
+def _legacy_dashboard_event_dedupe_key(event: DashboardEvent) -> str:
     payload = {
         "event_type": event.event_type,
         "tool_name": event.tool_name,
@@ -27,11 +93,11 @@ def dashboard_event_dedupe_key(event: DashboardEvent) -> str:
     return hashlib.sha256(_canonical_json(payload).encode("utf-8")).hexdigest()
 
 
-def log_event_dedupe_key(event: LogEvent) -> str:
+def _legacy_log_event_dedupe_key(event: LogEvent, message: str | None) -> str:
     payload = {
         "level": event.level.upper(),
         "logger": event.logger,
-        "message": event.message,
+        "message": event.message if message is None else message,
         "private": event.private,
         "fields": event.fields,
     }
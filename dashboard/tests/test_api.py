@@ -4,14 +4,17 @@ import json
 import threading
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
+from urllib.parse import quote
 
+import chromadb
 import networkx as nx
 import pytest
 from fastapi.testclient import TestClient
 
 from ego_dashboard.api import _compute_graph_metrics, _load_memory_network, create_app
-from ego_dashboard.models import DashboardEvent
+from ego_dashboard.columnar import COLUMNAR_MEDIA_TYPE, decode_columnar
+from ego_dashboard.models import DashboardEvent, LogEvent
 from ego_dashboard.settings import DashboardSettings
 from ego_dashboard.store import TelemetryStore
 
@@ -73,15 +76,22 @@ def _install_fake_memory_collection(
         def get(
             self,
             *,
-            limit: int,
-            offset: int,
             include: list[str],
+            limit: int | None = None,
+            offset: int | None = None,
+            ids: list[str] | None = None,
         ) -> dict[str, object]:
-            if collection_calls is not None:
-                collection_calls.append(
-                    {"limit": limit, "offset": offset, "include": tuple(include)}
-                )
-            batch = rows[offset : offset + limit]
+            if ids is not None:
+                if collection_calls is not None:
+                    collection_calls.append({"ids": tuple(ids), "include": tuple(include)})
+                batch = [row for row in rows if row[0] in ids]
+            else:
+                assert limit is not None and offset is not None
+                if collection_calls is not None:
+                    collection_calls.append(
+                        {"limit": limit, "offset": offset, "include": tuple(include)}
+                    )
+                batch = rows[offset : offset + limit]
             return {
                 "ids": [memory_id for memory_id, _, _ in batch],
                 "documents": [document for _, document, _ in batch],
@@ -99,6 +109,71 @@ def _install_fake_memory_collection(
     monkeypatch.setattr("ego_dashboard.api.chromadb.PersistentClient", _FakePersistentClient)
 
 
+def test_time_series_endpoints_support_columnar_format() -> None:
+    store = TelemetryStore()
+    for minute, (phase, intensity) in enumerate([("night", 0.5), ("night", 0.7), ("dawn", 0.2)]):
+        store.ingest(
+            DashboardEvent(
+                ts=datetime(2026, 1, 1, 12, minute, tzinfo=UTC),
+                event_type="tool_call_completed",
+                tool_name="feel_desires",
+                ok=True,
+                numeric_metrics={"intensity": intensity},
+                string_metrics={"time_phase": phase},
+            )
+        )
+    client = TestClient(create_app(store))
+    query = "from=2026-01-01T12:00:00Z&to=2026-01-01T12:03:00Z&bucket=1m"
+
+    for path in ("/api/v1/usage/tools", "/api/v1/metrics/intensity"):
+        items = client.get(f"{path}?{query}").json()["items"]
+        response = client.get(f"{path}?{query}&format=columnar")
+        series = decode_columnar(response.content)
+
+        assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+        assert list(series.ts) == [
+            int(datetime.fromisoformat(item["ts"]).timestamp() * 1000) for item in items
+        ]
+        for name, values in series.columns.items():
+            assert list(values) == [float(item[name]) for item in items]
+
+    heatmap = decode_columnar(
+        client.get(f"/api/v1/metrics/time_phase/heatmap?{query}&format=columnar").content
+    )
+    assert {name: list(values) for name, values in heatmap.columns.items()} == {
+        "dawn": [0.0, 0.0, 1.0],
+        "night": [1.0, 1.0, 0.0],
+    }
+    assert client.get(f"/api/v1/metrics/intensity?{query}&format=xml").status_code == 422
+
+
+def test_latency_endpoints_report_tool_and_stage_percentiles() -> None:
+    store = TelemetryStore()
+    for tool_name, duration_ms in (("recall", 120), ("remember", 30)):
+        store.ingest(
+            DashboardEvent(
+                ts=datetime(2026, 1, 1, 12, 1, tzinfo=UTC),
+                event_type="tool_call_completed",
+                tool_name=tool_name,
+                ok=True,
+                duration_ms=duration_ms,
+                numeric_metrics={"stage_embedding_ms": duration_ms / 2},
+                params={},
+                private=False,
+            )
+        )
+    client = TestClient(create_app(store))
+    query = "from=2026-01-01T12:00:00Z&to=2026-01-01T12:05:00Z&bucket=5m"
+
+    tools = client.get(f"/api/v1/latency/tools?{query}").json()["items"]
+    stages = client.get(f"/api/v1/latency/stages?{query}&tool=remember").json()["items"]
+
+    assert [(row["tool_name"], row["count"]) for row in tools] == [("recall", 1), ("remember", 1)]
+    assert abs(tools[0]["p50"] - 120) <= 1.2
+    assert [(row["stage"], row["count"]) for row in stages] == [("embedding", 1)]
+    assert abs(stages[0]["p50"] - 15) <= 0.15
+
+
 def test_history_endpoints() -> None:
     store = TelemetryStore()
     store.ingest(
@@ -360,6 +435,44 @@ def test_logs_endpoint_search_filter_returns_partial_matches() -> None:
     assert len(response.json()["items"]) == 2
 
 
+def test_logs_endpoint_streams_keyset_pages() -> None:
+    store = TelemetryStore()
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    for index in range(250):
+        store.ingest_log(
+            LogEvent(
+                ts=base + timedelta(seconds=index // 2),
+                level="INFO",
+                logger="ego_mcp.server",
+                message=f"line {index}",
+            )
+        )
+    client = TestClient(create_app(store))
+    query = "from=2026-01-01T12:00:00Z&to=2026-01-01T13:00:00Z"
+
+    tail = client.get(f"/api/v1/logs?{query}&limit=120").json()
+    assert {item["message"] for item in tail["items"]} == {
+        f"line {index}" for index in range(130, 250)
+    }
+    assert tail["page"] == {"next_after": None}
+
+    start_cursor = quote("2026-01-01T12:00:00+00:00,")
+    first = client.get(f"/api/v1/logs?{query}&limit=120&after={start_cursor}")
+    assert first.status_code == 200
+    body = first.json()
+    assert len(body["items"]) == 120
+    next_after = body["page"]["next_after"]
+    assert next_after == f"{body['items'][-1]['ts']},{body['items'][-1]['dedupe_key']}"
+
+    rest = client.get(f"/api/v1/logs?{query}&after={quote(next_after)}").json()
+    assert len(rest["items"]) == 130
+    assert rest["page"] == {"next_after": None}
+    messages = {item["message"] for item in body["items"] + rest["items"]}
+    assert messages == {f"line {index}" for index in range(250)}
+
+    assert client.get(f"/api/v1/logs?{query}&after=not-a-cursor").status_code == 422
+
+
 def test_cors_preflight_allows_configured_origin() -> None:
     app = create_app(
         TelemetryStore(),
@@ -449,8 +562,8 @@ def test_memory_network_and_notions_endpoints(
         encoding="utf-8",
     )
     monkeypatch.setattr(
-        "ego_dashboard.api._load_memory_network",
-        lambda _settings: {
+        "ego_dashboard.api._build_memory_network_payload",
+        lambda *_args: {
             "nodes": [
                 {
                     "id": "mem_1",
@@ -878,6 +991,132 @@ def test_memory_detail_endpoint_returns_404_when_missing(
     assert response.status_code == 404
 
 
+def test_memory_endpoints_reuse_cached_graph_until_sources_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collection_calls: list[dict[str, object]] = []
+    _install_fake_memory_collection(
+        monkeypatch,
+        tmp_path,
+        [("mem_1", "One", {"category": "daily", "timestamp": "2026-01-01T12:00:00+00:00"})],
+        collection_calls=collection_calls,
+    )
+    sqlite_path = tmp_path / "chroma" / "chroma.sqlite3"
+    sqlite_path.write_bytes(b"v1")
+    notion_path = tmp_path / "notions.json"
+    notion_path.write_text(json.dumps({}), encoding="utf-8")
+    app = create_app(
+        TelemetryStore(),
+        settings=DashboardSettings(ego_mcp_data_dir=str(tmp_path)),
+    )
+    client = TestClient(app)
+
+    def _scans() -> int:
+        return sum(1 for call in collection_calls if "offset" in call)
+
+    assert client.get("/api/v1/memory/network").status_code == 200
+    assert client.get("/api/v1/memory/network/path?from=mem_1&to=mem_1").status_code == 200
+    assert client.get("/api/v1/memory/mem_1").json()["generated_notion_ids"] == []
+    assert _scans() == 1
+    assert collection_calls[-1] == {"ids": ("mem_1",), "include": ("documents", "metadatas")}
+
+    notion_path.write_text(
+        json.dumps({"notion_1": {"label": "n", "source_memory_ids": ["mem_1"]}}),
+        encoding="utf-8",
+    )
+    assert client.get("/api/v1/memory/mem_1").json()["generated_notion_ids"] == ["notion_1"]
+    assert client.get("/api/v1/memory/network/subgraph?node_id=notion_1").status_code == 200
+    assert _scans() == 1
+
+    sqlite_path.write_bytes(b"version-2")
+    assert client.get("/api/v1/memory/network").status_code == 200
+    assert _scans() == 2
+
+
+def test_memory_network_decay_follows_the_clock_between_rebuilds(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collection_calls: list[dict[str, object]] = []
+    _install_fake_memory_collection(
+        monkeypatch,
+        tmp_path,
+        [("mem_1", "One", {"category": "daily", "timestamp": "2026-01-01T12:00:00+00:00"})],
+        collection_calls=collection_calls,
+    )
+    clock = {"now": datetime(2026, 1, 1, 12, 0, tzinfo=UTC)}
+    monkeypatch.setattr("ego_dashboard.api._utc_now", lambda: clock["now"])
+    app = create_app(
+        TelemetryStore(),
+        settings=DashboardSettings(ego_mcp_data_dir=str(tmp_path)),
+    )
+    client = TestClient(app)
+
+    fresh = client.get("/api/v1/memory/network").json()
+    clock["now"] += timedelta(days=30)
+    aged = client.get("/api/v1/memory/network").json()
+    filtered = client.get("/api/v1/memory/network?decay_max=0.6").json()
+
+    assert sum(1 for call in collection_calls if "offset" in call) == 1
+    assert fresh["nodes"][0]["decay"] == pytest.approx(1.0)
+    assert aged["nodes"][0]["decay"] == pytest.approx(0.5)
+    assert aged["stats"]["avg_memory_decay"] == pytest.approx(0.5)
+    assert [node["id"] for node in filtered["nodes"]] == ["mem_1"]
+    assert client.get("/api/v1/memory/mem_1").json()["decay"] == pytest.approx(0.5)
+
+
+def test_memory_endpoints_share_one_chroma_client_and_reopen_after_failure(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_fake_memory_collection(
+        monkeypatch,
+        tmp_path,
+        [("mem_1", "One", {"category": "daily", "timestamp": "2026-01-01T12:00:00+00:00"})],
+    )
+    fake_client = chromadb.PersistentClient
+    opened: list[str] = []
+    failures = {"remaining": 0}
+
+    class _FlakyCollection:
+        def __init__(self, inner: Any) -> None:
+            self._inner = inner
+
+        def get(self, **kwargs: Any) -> dict[str, object]:
+            if failures["remaining"]:
+                failures["remaining"] -= 1
+                raise RuntimeError("segment closed")
+            return cast(dict[str, object], self._inner.get(**kwargs))
+
+    class _CountingClient:
+        def __init__(self, path: str) -> None:
+            opened.append(path)
+            self._inner = fake_client(path=path)
+
+        def get_collection(self, name: str) -> _FlakyCollection:
+            return _FlakyCollection(self._inner.get_collection(name))
+
+    monkeypatch.setattr("ego_dashboard.api.chromadb.PersistentClient", _CountingClient)
+    app = create_app(
+        TelemetryStore(),
+        settings=DashboardSettings(ego_mcp_data_dir=str(tmp_path)),
+    )
+
+    with TestClient(app) as client:
+        assert opened == [str(tmp_path / "chroma")]
+        assert client.get("/api/v1/memory/network").status_code == 200
+        assert client.get("/api/v1/memory/mem_1").status_code == 200
+        assert client.get("/api/v1/memory/mem_1").status_code == 200
+        assert len(opened) == 1
+
+        failures["remaining"] = 1
+        assert client.get("/api/v1/memory/mem_1").json()["id"] == "mem_1"
+        assert len(opened) == 2
+        assert client.get("/api/v1/memory/mem_1").status_code == 200
+        assert len(opened) == 2
+
+
 def test_memory_network_subgraph_endpoint_respects_depth(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1035,6 +1274,148 @@ def test_memory_network_path_endpoint_reports_connected_and_disconnected_nodes(
     }
 
 
+def test_memory_network_serves_background_betweenness_with_staleness(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _linked(target_id: str) -> str:
+        return json.dumps([{"target_id": target_id, "link_type": "related", "confidence": 0.7}])
+
+    _install_fake_memory_collection(
+        monkeypatch,
+        tmp_path,
+        [
+            ("mem_1", "One", {"linked_ids": _linked("mem_2")}),
+            ("mem_2", "Two", {"linked_ids": _linked("mem_3")}),
+            ("mem_3", "Three", {"linked_ids": "[]"}),
+        ],
+    )
+    sample_sizes: list[int | None] = []
+    betweenness_centrality = nx.betweenness_centrality
+
+    def recording_betweenness_centrality(
+        graph_arg: nx.Graph[str],
+        *,
+        k: int | None = None,
+        normalized: bool = True,
+    ) -> dict[str, float]:
+        sample_sizes.append(k)
+        return cast(
+            dict[str, float], betweenness_centrality(graph_arg, normalized=normalized, seed=0)
+        )
+
+    monkeypatch.setattr(
+        "ego_dashboard.api.nx.betweenness_centrality", recording_betweenness_centrality
+    )
+    app = create_app(
+        TelemetryStore(),
+        settings=DashboardSettings(
+            ego_mcp_data_dir=str(tmp_path),
+            memory_betweenness_exact_max_nodes=2,
+            memory_betweenness_samples=3,
+        ),
+    )
+    client = TestClient(app)
+
+    network = client.get("/api/v1/memory/network").json()
+    for _ in range(100):
+        if network["centrality"]["fresh"]:
+            break
+        threading.Event().wait(0.02)
+        network = client.get("/api/v1/memory/network").json()
+
+    assert network["centrality"]["fresh"] is True
+    assert network["centrality"]["sampled"] is True
+    assert network["centrality"]["age_seconds"] >= 0
+    assert sample_sizes == [3]
+    betweenness = {node["id"]: node["betweenness"] for node in network["nodes"]}
+    assert betweenness["mem_2"] == pytest.approx(1.0)
+
+
+def _install_filterable_network(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    def _linked(target_id: str) -> str:
+        return json.dumps([{"target_id": target_id, "link_type": "related", "confidence": 0.7}])
+
+    _install_fake_memory_collection(
+        monkeypatch,
+        tmp_path,
+        [
+            (
+                "mem_1",
+                "One",
+                {"timestamp": "2026-01-01T00:00:00+00:00", "linked_ids": _linked("mem_3")},
+            ),
+            ("mem_2", "Two", {"timestamp": "2026-01-02T00:00:00+00:00"}),
+            (
+                "mem_3",
+                "Three",
+                {"timestamp": "2026-01-03T00:00:00+00:00", "linked_ids": _linked("mem_4")},
+            ),
+            ("mem_4", "Four", {"timestamp": "2026-01-04T00:00:00+00:00", "category": "work"}),
+        ],
+    )
+    (tmp_path / "notions.json").write_text(
+        json.dumps({"notion_1": {"label": "n", "source_memory_ids": ["mem_1", "mem_2"]}}),
+        encoding="utf-8",
+    )
+    app = create_app(
+        TelemetryStore(),
+        settings=DashboardSettings(ego_mcp_data_dir=str(tmp_path)),
+    )
+    return TestClient(app)
+
+
+def test_memory_network_filters_and_collapses_low_degree_memories(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _install_filterable_network(tmp_path, monkeypatch)
+
+    filtered = client.get("/api/v1/memory/network?category=daily&min_degree=2").json()
+    windowed = client.get(
+        "/api/v1/memory/network?from=2026-01-02T00:00:00Z&to=2026-01-03T12:00:00Z"
+    ).json()
+    collapsed = client.get("/api/v1/memory/network?lod=true&lod_max_degree=1").json()
+
+    assert [node["id"] for node in filtered["nodes"]] == ["mem_1", "mem_3"]
+    assert [(edge["source"], edge["target"]) for edge in filtered["edges"]] == [("mem_1", "mem_3")]
+    assert filtered["page"] == {"total_nodes": 2, "next_cursor": None}
+    assert [node["id"] for node in windowed["nodes"]] == ["mem_2", "mem_3", "notion_1"]
+    assert [node["id"] for node in collapsed["nodes"]] == ["mem_1", "mem_3", "mem_4", "notion_1"]
+    assert collapsed["nodes"][-1]["collapsed_count"] == 1
+    assert all("mem_2" not in (edge["source"], edge["target"]) for edge in collapsed["edges"])
+
+
+def test_memory_network_pages_and_streams_every_edge_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _install_filterable_network(tmp_path, monkeypatch)
+    full = client.get("/api/v1/memory/network").json()
+
+    pages = []
+    cursor: int | None = 0
+    while cursor is not None:
+        page = client.get(f"/api/v1/memory/network?limit=2&cursor={cursor}").json()
+        pages.append(page)
+        cursor = page["page"]["next_cursor"]
+    stream = client.get("/api/v1/memory/network/stream")
+    lines = [json.loads(line) for line in stream.text.splitlines()]
+
+    assert len(pages) == 3
+    assert [node["id"] for page in pages for node in page["nodes"]] == [
+        node["id"] for node in full["nodes"]
+    ]
+    assert sorted(
+        (edge["source"], edge["target"]) for page in pages for edge in page["edges"]
+    ) == sorted((edge["source"], edge["target"]) for edge in full["edges"])
+    assert stream.headers["content-type"] == "application/x-ndjson"
+    assert lines[0]["type"] == "meta"
+    assert lines[0]["node_count"] == len(full["nodes"])
+    assert [line["data"] for line in lines if line["type"] == "node"] == full["nodes"]
+    assert [line["data"] for line in lines if line["type"] == "edge"] == full["edges"]
+
+
 def test_compute_graph_metrics_uses_sampled_betweenness_for_large_graph(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1206,11 +1587,6 @@ def test_ws_current_stream_sends_snapshot_deduped_logs_and_ping(
                 "surface_counts": {"resonant": 0, "involuntary": 0, "total": 0},
             }
 
-    async def fake_sleep(_seconds: float) -> None:
-        raise RuntimeError("stop websocket loop")
-
-    monkeypatch.setattr("ego_dashboard.api.asyncio.sleep", fake_sleep)
-
     app = create_app(_WsStore())
     client = TestClient(app)
 
@@ -1234,6 +1610,49 @@ def test_ws_current_stream_sends_snapshot_deduped_logs_and_ping(
         assert ping == {"type": "ping"}
 
 
+def test_ws_current_pushes_ingested_rows_to_every_client() -> None:
+    from ego_dashboard.models import LogEvent
+
+    store = TelemetryStore()
+    app = create_app(store)
+
+    with (
+        TestClient(app) as client,
+        client.websocket_connect("/ws/current") as first,
+        client.websocket_connect("/ws/current") as second,
+    ):
+        for websocket in (first, second):
+            assert websocket.receive_json()["type"] == "current_snapshot"
+            assert websocket.receive_json() == {"type": "ping"}
+
+        store.ingest_log(
+            LogEvent(
+                ts=datetime.now(tz=UTC),
+                logger="ego_mcp.server",
+                message="Tool invocation",
+                fields={"tool_name": "remember"},
+            )
+        )
+        store.ingest(
+            DashboardEvent(
+                ts=datetime.now(tz=UTC),
+                event_type="tool_call_completed",
+                tool_name="feel_desires",
+                numeric_metrics={"social_thirst": 0.4},
+            )
+        )
+
+        for websocket in (first, second):
+            log_line = websocket.receive_json()
+            assert log_line["type"] == "log_line"
+            assert log_line["data"]["tool_name"] == "remember"
+            assert log_line["data"]["ok"] is True
+            snapshot = websocket.receive_json()
+            while snapshot["type"] != "current_snapshot" or snapshot["data"]["latest"] is None:
+                snapshot = websocket.receive_json()
+            assert snapshot["data"]["latest"]["tool_name"] == "feel_desires"
+
+
 def test_relationships_overview_endpoint_returns_empty_without_data_dir() -> None:
     app = create_app(
         TelemetryStore(),
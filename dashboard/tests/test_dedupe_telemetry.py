@@ -5,7 +5,9 @@ from datetime import UTC, datetime
 from psycopg.errors import UniqueViolation
 
 from ego_dashboard.dedupe_telemetry import (
+    _LEGACY_KEYS,
     _apply_backfill_updates,
+    _backfill_log_event_dedupe_keys,
     build_log_event_dedupe_updates,
     build_tool_event_dedupe_updates,
     partition_dedupe_updates,
@@ -163,3 +165,53 @@ def test_apply_backfill_updates_deletes_rows_that_conflict_during_update() -> No
     assert deleted == 2
     assert cursor.updated == ["(0,2)"]
     assert cursor.deleted == ["(0,1)", "(0,3)"]
+
+
+def test_legacy_log_keys_are_rewritten_to_current_version() -> None:
+    ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    legacy_row = ("(2,1)", ts, "INFO", "ego_mcp", "Tool invocation", False, {"tool_name": "x"})
+    current_key = build_log_event_dedupe_updates([legacy_row])[0][2]
+
+    class _Cursor:
+        def __init__(self) -> None:
+            self.rowcount = 0
+            self.queries: list[str] = []
+            self.updated: list[tuple[str, str]] = []
+            self.deleted: list[str] = []
+            self._rows: list[tuple[object, ...]] = []
+
+        def execute(self, query: object, params: object | None = None) -> None:
+            sql = " ".join(str(query).split())
+            self.queries.append(sql)
+            tuple_params = params if isinstance(params, tuple) else ()
+            self.rowcount = 1
+            if sql.startswith("SELECT ts, dedupe_key"):
+                # A row already carrying the current key for the second legacy copy.
+                self._rows = [(ts, "0" * 32)]
+            elif sql.startswith("SELECT ctid::text"):
+                duplicate = ("(2,2)", *legacy_row[1:])
+                self._rows = [legacy_row, duplicate]
+            elif sql.startswith("UPDATE log_events"):
+                self.updated.append((str(tuple_params[1]), str(tuple_params[0])))
+            elif sql.startswith("DELETE FROM log_events"):
+                self.deleted.append(str(tuple_params[0]))
+            elif sql.startswith("SELECT 1"):
+                self._rows = []
+
+        def fetchone(self) -> tuple[object, ...] | None:
+            return self._rows[0] if self._rows else None
+
+        def fetchall(self) -> list[tuple[object, ...]]:
+            return self._rows
+
+    cursor = _Cursor()
+    updated, deleted = _backfill_log_event_dedupe_keys(
+        cursor, dry_run=False, selection=_LEGACY_KEYS
+    )
+
+    assert "WHERE length(dedupe_key) <> 64" in cursor.queries[0]
+    assert "WHERE length(dedupe_key) = 64" in cursor.queries[1]
+    assert len(current_key) == 32
+    assert cursor.updated == [("(2,1)", current_key)]
+    assert cursor.deleted == ["(2,2)"]
+    assert (updated, deleted) == (1, 1)
@@ -6,8 +6,11 @@ import threading
 import time
 from pathlib import Path
 
-from ego_dashboard.desire_catalog import DesireCatalog, DesireCatalogItem
-from ego_dashboard.ingestor import EgoMcpLogProjector, normalize_event
+import pytest
+
+from ego_dashboard.desire_catalog import DesireCatalog, DesireCatalogItem, default_desire_catalog
+from ego_dashboard.ingestor import EgoMcpLogProjector, normalize_event, normalize_log
+from ego_dashboard.telemetry_identity import dashboard_event_dedupe_key, log_event_dedupe_key
 
 
 def _catalog(*fixed_ids: tuple[str, str, int] | tuple[str, str]) -> DesireCatalog:
@@ -215,6 +218,50 @@ def test_projector_creates_event_from_non_feel_desires_failure() -> None:
     assert event.numeric_metrics["arousal"] == 0.6
 
 
+def test_projector_projects_duration_and_stage_timings() -> None:
+    projector = EgoMcpLogProjector()
+    completion = {
+        "timestamp": "2026-01-01T12:00:02Z",
+        "level": "INFO",
+        "logger": "ego_mcp.server",
+        "message": "Tool execution completed",
+        "tool_name": "recall",
+        "duration_ms": 412,
+        "stage_ms": {"embedding": 250.5, "chroma": 80.25, "hopfield": True, 3: 1.0},
+    }
+
+    event = projector.project(completion)
+
+    assert event is not None
+    assert event.duration_ms == 412
+    assert event.numeric_metrics["stage_embedding_ms"] == 250.5
+    assert event.numeric_metrics["stage_chroma_ms"] == 80.25
+    assert "stage_hopfield_ms" not in event.numeric_metrics
+    assert "duration_ms" not in event.numeric_metrics
+
+
+def test_projector_keeps_feel_desires_stage_timings_out_of_desires() -> None:
+    projector = EgoMcpLogProjector()
+    completion = {
+        "timestamp": "2026-01-01T12:00:02Z",
+        "level": "INFO",
+        "logger": "ego_mcp.server",
+        "message": "Tool execution completed",
+        "tool_name": "feel_desires",
+        "duration_ms": 9,
+        "stage_ms": {"notion_io": 1.5},
+        "desire_levels": {"curiosity": 0.4},
+    }
+
+    event = projector.project(completion)
+
+    assert event is not None
+    assert event.duration_ms == 9
+    assert event.numeric_metrics["stage_notion_io_ms"] == 1.5
+    fixed, emergent = default_desire_catalog().split_desire_metrics(event.numeric_metrics)
+    assert "stage_notion_io_ms" not in {**fixed, **emergent}
+
+
 def test_projector_parses_feel_desires_completion_metrics() -> None:
     projector = EgoMcpLogProjector()
     invocation = {
@@ -581,6 +628,134 @@ def test_projector_prefers_structured_relationship_metrics_over_tool_output() ->
     assert event.numeric_metrics["shared_episodes_count"] == 3
 
 
+_TRUSTED_BASE: dict[str, object] = {
+    "timestamp": "2026-01-01T12:00:02Z",
+    "level": "info",
+    "logger": "ego_mcp.server",
+    "time_phase": "night",
+}
+_TRUSTED_LINES: list[dict[str, object]] = [
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool invocation",
+        "tool_name": "remember",
+        "tool_args": {
+            "emotion": "curious",
+            "intensity": 0.7,
+            "body_state": {"time_phase": "morning", "mode": "idle", "state": "calm"},
+            "content": "note",
+        },
+        "intensity": 0.3,
+    },
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool execution completed",
+        "tool_name": "recall",
+        "tool_output": "1. [2026-01-01] note",
+        "tool_output_chars": 20,
+        "tool_output_truncated": False,
+        "emotion_primary": "curious",
+        "emotion_intensity": 0.65,
+        "valence": 0.2,
+        "arousal": 0.7,
+        "intensity": True,
+        "duration_ms": 412,
+        "stage_ms": {"embedding": 250.5, "chroma": 80},
+        "recall_hit_count": 3,
+        "recall_mode": "semantic",
+        "note": "no underscore",
+    },
+    {
+        **_TRUSTED_BASE,
+        "level": "ERROR",
+        "message": "Tool execution failed",
+        "tool_name": "remember",
+        "tool_args": {"emotion": "sad", "valence": -0.4},
+        "duration_ms": 3,
+        "stage_ms": {},
+    },
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool invocation",
+        "tool_name": "attune",
+        "tool_args": {},
+    },
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool execution completed",
+        "tool_name": "attune",
+        "desire_levels": {"curiosity": 0.7, "social_thirst": 1, "stage_io_ms": 2.0},
+        "curiosity": 0.7,
+        "social_thirst": 1,
+        "impulse_boost_amount": 0.1,
+        "attune_person": "Master",
+        "stage_ms": {"notion_io": 1.5},
+    },
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool execution completed",
+        "tool_name": "consider_them",
+        "tool_output": "Master: trust=0.75, interactions=9, shared_episodes=2",
+    },
+    {
+        **_TRUSTED_BASE,
+        "message": "Tool execution completed",
+        "tool_name": "wake_up",
+        "trust_level": 0.82,
+        "total_interactions": 15,
+        "shared_episodes_count": 3,
+        "person_id": "Master",
+        "tool_output": "Master: trust=0.10, interactions=1, shared_episodes=0",
+    },
+]
+
+
+@pytest.mark.parametrize("raw", _TRUSTED_LINES)
+def test_trusted_projection_matches_validated_projection(raw: dict[str, object]) -> None:
+    projector = EgoMcpLogProjector()
+
+    record = projector.project_record(raw)
+
+    assert record is not None
+    event = record.to_event()
+    validated_event = projector.project(raw)
+    assert event == validated_event
+    if event is not None and validated_event is not None:
+        assert event.model_fields_set == validated_event.model_fields_set
+        assert dashboard_event_dedupe_key(event) == dashboard_event_dedupe_key(validated_event)
+    log = record.to_log()
+    validated_log = normalize_log(raw)
+    assert log == validated_log
+    assert log.model_fields_set == validated_log.model_fields_set
+    assert log_event_dedupe_key(log) == log_event_dedupe_key(validated_log)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {**_TRUSTED_BASE, "message": "Tool invocation", "tool_name": "remember", "private": True},
+        {
+            **_TRUSTED_BASE,
+            "message": "Tool invocation",
+            "tool_name": "remember",
+            "tool_args": {"private": True},
+        },
+        {"ts": "2026-01-01T12:00:02Z", "message": "Tool invocation", "tool_name": "remember"},
+        {**_TRUSTED_BASE, "message": "Tool execution completed", "tool_name": "feel_desires"},
+        {**_TRUSTED_BASE, "message": "Tool execution completed", "tool_name": "attune"},
+        {**_TRUSTED_BASE, "message": "Routing tool call", "tool_name": "remember"},
+        {
+            **_TRUSTED_BASE,
+            "message": "Tool execution completed",
+            "tool_name": "recall",
+            "recall_mode": ("not", "json"),
+        },
+    ],
+)
+def test_trusted_projection_leaves_other_shapes_to_validation(raw: dict[str, object]) -> None:
+    assert EgoMcpLogProjector().project_record(raw) is None
+
+
 def test_ingest_jsonl_line_only_stores_ego_mcp_server_logs() -> None:
     from ego_dashboard.ingestor import ingest_jsonl_line
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from pytest import MonkeyPatch
 
 from ego_dashboard.settings import DashboardSettings, load_settings
@@ -60,3 +62,36 @@ def test_load_settings_falls_back_to_ego_mcp_data_dir(monkeypatch: MonkeyPatch)
     settings = load_settings()
 
     assert settings.ego_mcp_data_dir == "/tmp/ego-data"
+
+
+def test_load_settings_parses_inmemory_bounds(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("DASHBOARD_INMEMORY_RETENTION_HOURS", "12")
+    monkeypatch.setenv("DASHBOARD_INMEMORY_MAX_ITEMS", "not-a-number")
+
+    settings = load_settings()
+
+    assert settings.inmemory_retention.total_seconds() == 12 * 3600
+    assert settings.inmemory_max_items == 500_000
+
+
+def test_load_settings_parses_memory_betweenness_budget(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("DASHBOARD_MEMORY_BETWEENNESS_EXACT_MAX_NODES", "2000")
+    monkeypatch.setenv("DASHBOARD_MEMORY_BETWEENNESS_SAMPLES", "0")
+
+    settings = load_settings()
+
+    assert settings.memory_betweenness_exact_max_nodes == 2000
+    assert settings.memory_betweenness_samples == 100
+
+
+def test_load_settings_parses_telemetry_storage_policy(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("DASHBOARD_TELEMETRY_COMPRESS_AFTER_DAYS", "0")
+    monkeypatch.setenv("DASHBOARD_TELEMETRY_RAW_RETENTION_DAYS", "30")
+    monkeypatch.setenv("DASHBOARD_TELEMETRY_FINE_ROLLUP_RETENTION_DAYS", "not-a-number")
+
+    policy = load_settings().telemetry_storage_policy
+
+    assert policy.compress_after is None
+    assert policy.raw_retention == timedelta(days=30)
+    assert policy.fine_rollup_retention is None
+    assert DashboardSettings().telemetry_storage_policy.compress_after is None
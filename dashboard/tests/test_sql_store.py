@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal, cast
 
 import pytest
+from redis.exceptions import WatchError
 
+from ego_dashboard.columnar import decode_columnar
 from ego_dashboard.constants import DESIRE_METRIC_KEYS, DESIRE_TELEMETRY_TOOL_NAMES
 from ego_dashboard.desire_catalog import DesireCatalog, DesireCatalogItem
+from ego_dashboard.models import LogEvent
+from ego_dashboard.settings import TelemetryStoragePolicy
 from ego_dashboard.sql_store import SqlTelemetryStore
 
 
@@ -16,8 +21,101 @@ class _FakeRedis:
         self._payload = payload
 
     def get(self, key: str) -> str | None:
-        del key
-        return self._payload
+        return self._payload if key == "dashboard:current" else None
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.get(key) for key in keys]
+
+
+class _MemoryRedis:
+    """Small in-memory stand-in for the Redis commands used by the current snapshot."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.published: list[tuple[str, dict[str, Any]]] = []
+        # Number of upcoming WATCH transactions that fail as if another writer raced them.
+        self.watch_conflicts = 0
+
+    def set(self, key: str, value: str) -> None:
+        self.values[key] = value
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    def exists(self, key: str) -> int:
+        return int(key in self.values)
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key: str, _min: str, max_score: str) -> int:
+        bound = float(max_score.lstrip("("))
+        members = self.sorted_sets.get(key, {})
+        removed = [member for member, score in members.items() if score < bound]
+        for member in removed:
+            del members[member]
+        return len(removed)
+
+    def zcount(self, key: str, min_score: float, max_score: float) -> int:
+        members = self.sorted_sets.get(key, {})
+        return sum(1 for score in members.values() if min_score <= score <= max_score)
+
+    def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, json.loads(message)))
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> _MemoryPipeline:
+        del transaction
+        return _MemoryPipeline(self)
+
+
+class _MemoryPipeline:
+    def __init__(self, redis: _MemoryRedis) -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple[Any, ...]]] = []
+        self._watching = False
+        self._immediate = False
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any) -> Any:
+            if self._immediate:
+                return getattr(self._redis, name)(*args)
+            self._calls.append((name, args))
+            return None
+
+        return _queue
+
+    def watch(self, *_keys: str) -> None:
+        self._watching = True
+        self._immediate = True
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    def reset(self) -> None:
+        self._calls = []
+        self._watching = False
+        self._immediate = False
+
+    def execute(self) -> list[Any]:
+        calls, watching = self._calls, self._watching
+        self.reset()
+        if watching and self._redis.watch_conflicts:
+            self._redis.watch_conflicts -= 1
+            raise WatchError("watched key changed")
+        return [getattr(self._redis, name)(*args) for name, args in calls]
+
+    def __enter__(self) -> _MemoryPipeline:
+        return self
+
+    def __exit__(self, *_args: object) -> Literal[False]:
+        self.reset()
+        return False
 
 
 class _FakeCursor:
@@ -166,11 +264,8 @@ def test_sql_store_initialize_ingest_and_checkpoint_methods(
 
     statements: list[tuple[str, tuple[Any, ...] | None]] = []
     commits = 0
-    redis_values: dict[str, str] = {}
-
-    class _RecordingRedis:
-        def set(self, key: str, value: str) -> None:
-            redis_values[key] = value
+    redis = _MemoryRedis()
+    redis_values = redis.values
 
     class _RecordingCursor:
         def __init__(self) -> None:
@@ -213,7 +308,7 @@ def test_sql_store_initialize_ingest_and_checkpoint_methods(
 
     monkeypatch.setattr(
         "ego_dashboard.sql_store.Redis.from_url",
-        lambda *_args, **_kwargs: _RecordingRedis(),
+        lambda *_args, **_kwargs: redis,
     )
     monkeypatch.setattr(
         "ego_dashboard.sql_store.psycopg.connect",
@@ -538,14 +633,13 @@ def test_current_latest_emotion_query_is_bounded_by_latest_ts(
     emotion_queries = [
         (sql, params)
         for sql, params in executed
-        if "numeric_metrics ->> 'valence'" in sql and "FROM tool_events" in sql
+        if "emotion_intensity, valence, arousal" in sql and "FROM tool_events" in sql
     ]
     assert len(emotion_queries) == 1
     sql, params = emotion_queries[0]
     compact_sql = " ".join(sql.split())
     assert "WHERE ts <= %s" in compact_sql
-    assert "(numeric_metrics ->> 'valence')::double precision" in compact_sql
-    assert "(numeric_metrics ->> 'arousal')::double precision" in compact_sql
+    assert "(emotion_primary IS NOT NULL OR emotion_intensity IS NOT NULL)" in compact_sql
     assert params == (latest_ts,)
 
 
@@ -662,12 +756,12 @@ def test_current_latest_relationship_query_filters_trust_level_metric(
     relationship_queries = [
         (sql, params)
         for sql, params in executed
-        if "numeric_metrics ->> 'trust_level'" in sql and "FROM tool_events" in sql
+        if "trust_level IS NOT NULL" in sql and "FROM tool_events" in sql
     ]
     assert len(relationship_queries) == 1
     sql, params = relationship_queries[0]
     compact_sql = " ".join(sql.split())
-    assert "numeric_metrics ? 'trust_level'" in compact_sql
+    assert "SELECT trust_level," in compact_sql
     assert "WHERE ts <= %s" in compact_sql
     assert params == (latest_ts,)
 
@@ -705,6 +799,32 @@ def test_desire_metric_keys_reads_dynamic_keys_from_feel_desires_events(
     assert keys == ["You want to feel safe.", "curiosity"]
 
 
+def test_stage_timings_on_desire_events_are_not_desires(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from ego_dashboard.models import DashboardEvent
+
+    stage_metrics = {"curiosity": 0.7, "stage_chroma_ms": 3.2, "stage_notion_io_ms": 1.5}
+    store, _redis = _snapshot_store(
+        monkeypatch, [], all_rows={"SELECT numeric_metrics": [(stage_metrics,)]}
+    )
+    ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(
+        DashboardEvent(
+            ts=ts,
+            event_type="tool_call_completed",
+            tool_name="attune",
+            numeric_metrics=stage_metrics,
+        )
+    )
+
+    current = store.current()
+
+    assert current["latest_desires"] == {"curiosity": 0.7}
+    assert current["latest_emergent_desires"] == {}
+    assert store.desire_metric_keys(ts - timedelta(minutes=5), ts) == ["curiosity"]
+
+
 def test_desire_metric_keys_reads_dynamic_keys_from_attune_events(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1178,3 +1298,898 @@ def test_metric_and_string_queries_handle_notion_link_and_curation_keys(
     assert metric_rows == [{"ts": "2026-01-01T12:00:00+00:00", "value": 2.0}]
     assert action_rows == [{"ts": "2026-01-01T12:00:00+00:00", "value": "merge"}]
     assert notion_rows == [{"ts": "2026-01-01T12:01:00+00:00", "value": "notion_1"}]
+
+
+class _RollupCursor:
+    def __init__(
+        self,
+        executed: list[tuple[str, tuple[Any, ...] | None]],
+        all_rows: dict[str, list[tuple[Any, ...]]],
+        fail_on: str | None,
+    ) -> None:
+        self._executed = executed
+        self._all_rows = all_rows
+        self._fail_on = fail_on
+        self._sql = ""
+
+    def execute(self, query: object, params: object | None = None) -> None:
+        self._sql = str(query)
+        self._executed.append((self._sql, params if isinstance(params, tuple) else None))
+        if self._fail_on is not None and self._fail_on in self._sql:
+            import psycopg
+
+            raise psycopg.errors.FeatureNotSupported("continuous aggregates unavailable")
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return None
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        for marker, rows in self._all_rows.items():
+            if marker in self._sql:
+                return rows
+        return []
+
+    def __enter__(self) -> _RollupCursor:
+        return self
+
+    def __exit__(self, *_args: object) -> Literal[False]:
+        return False
+
+
+def _rollup_store(
+    monkeypatch: pytest.MonkeyPatch,
+    executed: list[tuple[str, tuple[Any, ...] | None]],
+    all_rows: dict[str, list[tuple[Any, ...]]] | None = None,
+    *,
+    fail_on: str | None = None,
+    storage_policy: TelemetryStoragePolicy | None = None,
+) -> SqlTelemetryStore:
+    class _Connection:
+        def cursor(self) -> _RollupCursor:
+            return _RollupCursor(executed, all_rows or {}, fail_on)
+
+        def commit(self) -> None:
+            return None
+
+        def __enter__(self) -> _Connection:
+            return self
+
+        def __exit__(self, *_args: object) -> Literal[False]:
+            return False
+
+    monkeypatch.setattr(
+        "ego_dashboard.sql_store.Redis.from_url",
+        lambda *_args, **_kwargs: _FakeRedis(None),
+    )
+    monkeypatch.setattr(
+        "ego_dashboard.sql_store.psycopg.connect",
+        lambda *_args, **_kwargs: _Connection(),
+    )
+    store = SqlTelemetryStore(
+        "postgresql://unused", "redis://unused", storage_policy=storage_policy
+    )
+    store.initialize()
+    return store
+
+
+def test_initialize_creates_continuous_aggregates_with_refresh_policies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed)
+
+    views = [sql for sql, _ in executed if "CREATE MATERIALIZED VIEW" in sql]
+    policies = [sql for sql, _ in executed if "add_continuous_aggregate_policy" in sql]
+
+    for suffix in ("1m", "5m", "15m", "1h"):
+        for prefix in ("log_events_tool_calls", "tool_events_usage", "tool_events_metrics"):
+            assert any(f"{prefix}_{suffix}\n" in sql for sql in views)
+            assert any(f"'{prefix}_{suffix}'" in sql for sql in policies)
+    assert all("timescaledb.materialized_only = false" in sql for sql in views)
+    assert any("valence_sum" in sql and "curiosity_count" in sql for sql in views)
+    assert any("RELEASE SAVEPOINT dashboard_rollups" in sql for sql, _ in executed)
+
+
+def test_initialize_promotes_hot_metric_keys_and_indexes_json_predicates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed)
+    statements = [" ".join(sql.split()) for sql, _ in executed]
+
+    for column in ("valence", "arousal", "trust_level", "person_id"):
+        assert any(
+            f"ADD COLUMN IF NOT EXISTS {column} " in sql and "GENERATED ALWAYS AS" in sql
+            for sql in statements
+        )
+    assert any(
+        "idx_tool_events_string_metrics ON tool_events USING GIN (string_metrics)" in sql
+        for sql in statements
+    )
+    assert any(
+        "idx_tool_events_notion_ts" in sql and "string_metrics ? 'notion_merged'" in sql
+        for sql in statements
+    )
+    assert any(
+        "idx_tool_events_trust_level_ts" in sql and "WHERE trust_level IS NOT NULL" in sql
+        for sql in statements
+    )
+    generated_at = next(i for i, sql in enumerate(statements) if "GENERATED ALWAYS" in sql)
+    person_index_at = next(
+        i for i, sql in enumerate(statements) if "idx_tool_events_person_ts" in sql
+    )
+    assert generated_at < person_index_at
+
+
+def test_tool_usage_and_metric_history_read_matching_rollups(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bucket_ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        {
+            "FROM log_events_tool_calls_15m": [(bucket_ts, "remember", 3)],
+            "FROM tool_events_metrics_5m": [(bucket_ts, 0.25)],
+        },
+    )
+    executed.clear()
+    start = bucket_ts + timedelta(minutes=2)
+
+    usage = store.tool_usage(start, bucket_ts + timedelta(minutes=14), bucket="15m")
+    valence = store.metric_history("valence", start, bucket_ts + timedelta(minutes=4), "5m")
+
+    assert usage == [{"ts": bucket_ts.isoformat(), "remember": 3}]
+    assert valence == [{"ts": bucket_ts.isoformat(), "value": 0.25}]
+    assert not any("FROM tool_events\n" in sql or "FROM log_events\n" in sql for sql, _ in executed)
+    metric_sql, metric_params = executed[-1]
+    assert "sum(valence_sum) / sum(valence_count)" in metric_sql
+    assert metric_params is not None and metric_params[1] == bucket_ts
+
+
+def test_columnar_series_are_built_from_the_same_rows_as_json(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bucket_ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    later_ts = bucket_ts + timedelta(minutes=15)
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        {
+            "FROM log_events_tool_calls_15m": [
+                (bucket_ts, "remember", 3),
+                (later_ts, "recall", 1),
+            ],
+            "FROM tool_events_metrics_5m": [(bucket_ts, 0.25), (later_ts, None)],
+            "string_metrics ->> %s AS value": [
+                (bucket_ts, "night", 2),
+                (bucket_ts, "morning", 1),
+                (later_ts, "night", 4),
+            ],
+        },
+    )
+    end = later_ts + timedelta(minutes=14)
+
+    usage = decode_columnar(store.tool_usage_columns(bucket_ts, end, "15m").encode())
+    valence = decode_columnar(
+        store.metric_history_columns("valence", bucket_ts, end, "5m").encode()
+    )
+    heatmap = decode_columnar(
+        store.string_heatmap_columns("time_phase", bucket_ts, end, "15m").encode()
+    )
+
+    millis = [int(bucket_ts.timestamp() * 1000), int(later_ts.timestamp() * 1000)]
+    assert list(usage.ts) == millis
+    assert {name: list(values) for name, values in usage.columns.items()} == {
+        "recall": [0.0, 1.0],
+        "remember": [3.0, 0.0],
+    }
+    assert list(valence.ts) == millis[:1]
+    assert list(valence.columns["value"]) == [0.25]
+    assert list(heatmap.ts) == millis
+    assert {name: list(values) for name, values in heatmap.columns.items()} == {
+        "morning": [1.0, 0.0],
+        "night": [2.0, 4.0],
+    }
+
+
+def test_metric_history_reads_raw_events_for_keys_without_rollup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(monkeypatch, executed)
+    executed.clear()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+    store.metric_history("notion_links_created", start, start + timedelta(minutes=5), "1m")
+
+    assert len(executed) == 1
+    assert "numeric_metrics ->> %s" in executed[0][0]
+
+
+def test_failed_rollup_creation_keeps_raw_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(monkeypatch, executed, fail_on="CREATE MATERIALIZED VIEW")
+    assert any("ROLLBACK TO SAVEPOINT dashboard_rollups" in sql for sql, _ in executed)
+    executed.clear()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+    store.tool_usage(start, start + timedelta(minutes=5), "5m")
+
+    assert "FROM log_events\n" in executed[0][0]
+
+
+def test_initialize_creates_latency_rollups_with_toolkit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed)
+    statements = [" ".join(sql.split()) for sql, _ in executed]
+
+    assert "CREATE EXTENSION IF NOT EXISTS timescaledb_toolkit" in statements
+    for suffix in ("1m", "5m", "15m", "1h"):
+        assert any(
+            f"tool_events_latency_{suffix} " in sql and "percentile_agg(duration_ms" in sql
+            for sql in statements
+        )
+    assert any("idx_tool_events_latency_ts" in sql for sql in statements)
+    assert "RELEASE SAVEPOINT dashboard_latency_rollups" in statements
+
+
+def test_tool_latency_reads_percentile_rollups(monkeypatch: pytest.MonkeyPatch) -> None:
+    bucket_ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    later_ts = bucket_ts + timedelta(minutes=5)
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        {
+            "FROM tool_events_latency_5m": [
+                (bucket_ts, "recall", 4, [100.0, 110.0, 120.0]),
+                (later_ts, "recall", 2, [300.0, 320.0, 330.0]),
+            ],
+        },
+    )
+    executed.clear()
+
+    rows = store.tool_latency(bucket_ts, later_ts + timedelta(minutes=4), "5m")
+    alerts = store.anomaly_alerts(bucket_ts, later_ts + timedelta(minutes=4), "5m")
+
+    assert rows[0] == {
+        "ts": bucket_ts.isoformat(),
+        "tool_name": "recall",
+        "count": 4,
+        "p50": 100.0,
+        "p95": 110.0,
+        "p99": 120.0,
+    }
+    assert "rollup(latency)" in executed[0][0]
+    assert "approx_percentile(0.95, latency)" in executed[0][0]
+    assert {
+        "kind": "latency_regression",
+        "ts": later_ts.isoformat(),
+        "value": 320.0,
+        "tool_name": "recall",
+        "previous": 110.0,
+    } in alerts
+
+
+def test_latency_without_toolkit_reads_raw_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(monkeypatch, executed, fail_on="timescaledb_toolkit")
+    assert any("ROLLBACK TO SAVEPOINT dashboard_latency_rollups" in sql for sql, _ in executed)
+    executed.clear()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+    store.tool_latency(start, start + timedelta(minutes=5), "5m")
+    store.stage_latency(start, start + timedelta(minutes=5), "5m", "recall")
+
+    tool_sql, tool_params = executed[0]
+    stage_sql, stage_params = executed[1]
+    assert "percentile_cont(%s::double precision[])" in tool_sql
+    assert "FROM tool_events\n" in tool_sql
+    assert tool_params is not None and tool_params[1] == [0.5, 0.95, 0.99]
+    assert "jsonb_each_text(numeric_metrics)" in stage_sql
+    assert stage_params is not None and stage_params[4:6] == ("recall", "recall")
+
+
+def test_initialize_replaces_compression_and_retention_policies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    policy = TelemetryStoragePolicy(
+        compress_after=timedelta(days=7),
+        raw_retention=timedelta(days=30),
+        fine_rollup_retention=timedelta(days=90),
+    )
+    _rollup_store(monkeypatch, executed, storage_policy=policy)
+    statements = [" ".join(sql.split()) for sql, _ in executed]
+
+    assert any(
+        "ALTER TABLE tool_events SET" in sql and "compress_segmentby = 'tool_name'" in sql
+        for sql in statements
+    )
+    assert any(
+        "ALTER TABLE log_events SET" in sql and "compress_segmentby = 'logger'" in sql
+        for sql in statements
+    )
+    for table in ("tool_events", "log_events"):
+        assert (
+            f"SELECT add_compression_policy('{table}', compress_after => INTERVAL '604800 seconds')"
+            in statements
+        )
+        assert (
+            f"SELECT add_retention_policy('{table}', drop_after => INTERVAL '2592000 seconds')"
+            in statements
+        )
+    rollup_retention = [sql for sql in statements if "add_retention_policy('tool_events_" in sql]
+    assert {sql.split("'")[1] for sql in rollup_retention} == {
+        "tool_events_usage_1m",
+        "tool_events_usage_5m",
+        "tool_events_metrics_1m",
+        "tool_events_metrics_5m",
+        "tool_events_latency_1m",
+        "tool_events_latency_5m",
+    }
+    refresh = [sql for sql in statements if "add_continuous_aggregate_policy" in sql]
+    # The refresh window stops an hour short of the raw retention.
+    assert all("start_offset => INTERVAL '2588400 seconds'" in sql for sql in refresh)
+    assert any("remove_continuous_aggregate_policy" in sql for sql in statements)
+    assert "RELEASE SAVEPOINT dashboard_compression" in statements
+    assert "RELEASE SAVEPOINT dashboard_retention" in statements
+
+
+def test_initialize_keeps_matching_compression_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    settings = [("tool_name", 1, None, None), ("ts", None, 1, False), ("dedupe_key", None, 2, True)]
+    _rollup_store(
+        monkeypatch,
+        executed,
+        {"timescaledb_information.compression_settings": settings},
+        storage_policy=TelemetryStoragePolicy(compress_after=timedelta(days=7)),
+    )
+    statements = [" ".join(sql.split()) for sql, _ in executed]
+
+    # tool_events already matches; log_events is segmented by logger, so it is altered.
+    assert not any("ALTER TABLE tool_events SET" in sql for sql in statements)
+    assert any("ALTER TABLE log_events SET" in sql for sql in statements)
+    assert (
+        "SELECT add_compression_policy('tool_events', compress_after => INTERVAL '604800 seconds')"
+        in statements
+    )
+
+
+def test_default_storage_policy_leaves_compression_off(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed, storage_policy=TelemetryStoragePolicy())
+
+    assert any("remove_compression_policy('tool_events'" in sql for sql, _ in executed)
+    assert not any("ALTER TABLE tool_events SET" in sql for sql, _ in executed)
+    assert not any("add_compression_policy" in sql for sql, _ in executed)
+
+
+def test_initialize_without_storage_policy_leaves_jobs_alone(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed)
+
+    assert not any("compression_policy" in sql for sql, _ in executed)
+    assert not any("retention_policy" in sql for sql, _ in executed)
+    refresh = [sql for sql, _ in executed if "add_continuous_aggregate_policy" in sql]
+    assert all("start_offset => NULL" in sql for sql in refresh)
+
+
+def test_unavailable_compression_still_applies_retention(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        fail_on="add_compression_policy",
+        storage_policy=TelemetryStoragePolicy(
+            compress_after=timedelta(days=7), raw_retention=timedelta(days=30)
+        ),
+    )
+    statements = [sql for sql, _ in executed]
+
+    assert "ROLLBACK TO SAVEPOINT dashboard_compression" in statements
+    assert "RELEASE SAVEPOINT dashboard_retention" in statements
+    assert any("add_retention_policy('tool_events'" in sql for sql in statements)
+    assert store._rollups_ready
+
+
+def test_initialize_adds_trigram_indexes_for_log_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed)
+    statements = [" ".join(sql.split()) for sql, _ in executed]
+
+    assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in statements
+    assert any(
+        "idx_log_events_message_trgm ON log_events USING GIN (message gin_trgm_ops)" in sql
+        for sql in statements
+    )
+    assert any(
+        "idx_log_events_fields_trgm ON log_events USING GIN ((fields::text) gin_trgm_ops)" in sql
+        for sql in statements
+    )
+
+
+def test_missing_pg_trgm_keeps_initialize_going(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    _rollup_store(monkeypatch, executed, fail_on="pg_trgm")
+
+    assert any("ROLLBACK TO SAVEPOINT dashboard_log_search" in sql for sql, _ in executed)
+    assert any("RELEASE SAVEPOINT dashboard_rollups" in sql for sql, _ in executed)
+
+
+def test_log_page_without_cursor_reads_the_newest_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    ts = datetime(2026, 1, 1, 12, 0, 5, tzinfo=UTC)
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        {
+            "FROM log_events": [
+                (ts, "INFO", "ego_mcp.server", "second", False, {}, "k2"),
+                (ts - timedelta(seconds=1), "INFO", "ego_mcp.server", "first", False, {}, "k1"),
+            ]
+        },
+    )
+    executed.clear()
+
+    rows = store.log_page(ts - timedelta(minutes=5), ts, limit=2)
+
+    compact_sql = " ".join(executed[0][0].split())
+    assert "ORDER BY ts DESC, COALESCE(dedupe_key, '') DESC LIMIT %s" in compact_sql
+    assert "> (%s, %s)" not in compact_sql
+    assert [row["message"] for row in rows] == ["first", "second"]
+
+
+def test_log_page_uses_keyset_predicate_and_returns_dedupe_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executed: list[tuple[str, tuple[Any, ...] | None]] = []
+    ts = datetime(2026, 1, 1, 12, 0, 5, tzinfo=UTC)
+    store = _rollup_store(
+        monkeypatch,
+        executed,
+        {"FROM log_events": [(ts, "INFO", "ego_mcp.server", "secret", True, {}, "k2")]},
+    )
+    executed.clear()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    end = start + timedelta(days=30)
+
+    rows = store.log_page(start, end, search="remember", after=(start, "k1"), limit=50)
+
+    sql, params = executed[0]
+    compact_sql = " ".join(sql.split())
+    assert "(ts, COALESCE(dedupe_key, '')) > (%s, %s)" in compact_sql
+    assert "ORDER BY ts ASC, COALESCE(dedupe_key, '') ASC LIMIT %s" in compact_sql
+    assert params == (start, end, "%remember%", "%remember%", start, "k1", 50)
+    assert rows == [
+        {
+            "ts": ts.isoformat(),
+            "level": "INFO",
+            "logger": "ego_mcp.server",
+            "message": "REDACTED",
+            "private": True,
+            "fields": {},
+            "dedupe_key": "k2",
+        }
+    ]
+
+
+def _snapshot_store(
+    monkeypatch: pytest.MonkeyPatch,
+    executed: list[str],
+    all_rows: dict[str, list[tuple[Any, ...]]] | None = None,
+    fetchone_rows: list[tuple[Any, ...] | None] | None = None,
+    rowcount: int = 1,
+) -> tuple[SqlTelemetryStore, _MemoryRedis]:
+    redis = _MemoryRedis()
+    pending_rows = list(fetchone_rows or [])
+
+    class _Cursor:
+        def __init__(self) -> None:
+            self._sql = ""
+            self.rowcount = rowcount
+
+        def execute(self, query: object, _params: object | None = None) -> None:
+            self._sql = str(query)
+            executed.append(self._sql)
+
+        def fetchone(self) -> tuple[Any, ...] | None:
+            return pending_rows.pop(0) if pending_rows else None
+
+        def fetchall(self) -> list[tuple[Any, ...]]:
+            for marker, rows in (all_rows or {}).items():
+                if marker in self._sql:
+                    return rows
+            return []
+
+        def __enter__(self) -> _Cursor:
+            return self
+
+        def __exit__(self, *_args: object) -> Literal[False]:
+            return False
+
+    class _Connection:
+        def cursor(self) -> _Cursor:
+            return _Cursor()
+
+        def commit(self) -> None:
+            return None
+
+        def __enter__(self) -> _Connection:
+            return self
+
+        def __exit__(self, *_args: object) -> Literal[False]:
+            return False
+
+    monkeypatch.setattr("ego_dashboard.sql_store.Redis.from_url", lambda *_a, **_k: redis)
+    monkeypatch.setattr("ego_dashboard.sql_store.psycopg.connect", lambda *_a, **_k: _Connection())
+    return SqlTelemetryStore("postgresql://unused", "redis://unused"), redis
+
+
+@pytest.mark.parametrize(
+    ("has_legacy_rows", "key_length", "records_migration"),
+    [(True, 64, False), (False, 32, True)],
+)
+def test_initialize_keeps_legacy_dedupe_keys_until_migrated(
+    monkeypatch: pytest.MonkeyPatch,
+    has_legacy_rows: bool,
+    key_length: int,
+    records_migration: bool,
+) -> None:
+    executed: list[str] = []
+    # tool_output_chars cleanup already applied, dedupe v2 migration missing.
+    store, redis = _snapshot_store(
+        monkeypatch, executed, fetchone_rows=[(1,), None, (has_legacy_rows,)]
+    )
+    store.initialize()
+    store.ingest_log(
+        LogEvent(
+            ts=datetime(2026, 1, 1, 12, 0, tzinfo=UTC),
+            message="Tool invocation",
+            fields={"tool_name": "remember"},
+        )
+    )
+
+    members = [member for values in redis.sorted_sets.values() for member in values]
+    assert members
+    assert {len(member.rsplit("|", 1)[1]) for member in members} == {key_length}
+    assert any("INSERT INTO dashboard_migrations" in sql for sql in executed) is records_migration
+
+
+def test_current_reads_snapshot_maintained_by_ingest_without_sql(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from ego_dashboard.models import DashboardEvent, LogEvent
+
+    executed: list[str] = []
+    store, _redis = _snapshot_store(monkeypatch, executed)
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(
+        DashboardEvent(
+            ts=base - timedelta(hours=2),
+            event_type="tool_call_completed",
+            tool_name="attune",
+            emotion_primary="curious",
+            emotion_intensity=0.6,
+            numeric_metrics={"curiosity": 0.7, "valence": 0.3, "tool_output_chars": 10.0},
+        )
+    )
+    store.ingest(
+        DashboardEvent(
+            ts=base - timedelta(minutes=30),
+            event_type="tool_call_completed",
+            tool_name="consider_them",
+            numeric_metrics={"trust_level": 0.8, "total_interactions": 4.0},
+        )
+    )
+    store.ingest_log(
+        LogEvent(
+            ts=base - timedelta(hours=1),
+            logger="ego_mcp.server",
+            message="Tool invocation",
+            fields={"tool_name": "remember"},
+        )
+    )
+    store.ingest_log(
+        LogEvent(ts=base - timedelta(seconds=20), level="ERROR", message="Tool execution failed")
+    )
+    store.ingest_log(
+        LogEvent(
+            ts=base - timedelta(seconds=30),
+            logger="ego_mcp.server",
+            message="Tool invocation",
+            fields={"tool_name": "remember"},
+        )
+    )
+    store.ingest(
+        DashboardEvent(
+            ts=base,
+            event_type="tool_call_failed",
+            tool_name="remember",
+            ok=False,
+            private=True,
+            message="secret",
+        )
+    )
+    executed.clear()
+
+    current = store.current()
+
+    assert executed == []
+    latest = cast(dict[str, Any], current["latest"])
+    assert latest["message"] == "REDACTED"
+    assert latest["emotion_primary"] == "curious"
+    assert current["latest_emotion"] == {
+        "ts": (base - timedelta(hours=2)).isoformat(),
+        "emotion_primary": "curious",
+        "emotion_intensity": 0.6,
+        "valence": 0.3,
+        "arousal": None,
+    }
+    assert current["latest_relationship"] == {
+        "trust_level": 0.8,
+        "total_interactions": 4.0,
+        "shared_episodes_count": None,
+    }
+    assert current["latest_desires"] == {"curiosity": 0.7}
+    assert current["tool_calls_per_min"] == 1
+    assert current["error_rate"] == 1.0
+    assert current["window_24h"] == {"tool_calls": 2, "error_rate": 0.5}
+
+
+def test_snapshot_windows_slide_with_latest_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    from ego_dashboard.models import DashboardEvent
+
+    store, redis = _snapshot_store(monkeypatch, [])
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(DashboardEvent(ts=base, tool_name="remember"))
+    store.ingest(DashboardEvent(ts=base + timedelta(hours=25), tool_name="recall"))
+
+    current = store.current()
+
+    assert current["tool_calls_per_min"] == 1
+    assert current["window_24h"] == {"tool_calls": 1, "error_rate": 0.0}
+    assert len(redis.sorted_sets["dashboard:window:tool_calls"]) == 1
+
+
+def test_snapshot_keeps_newest_state_when_older_events_arrive_late(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from ego_dashboard.models import DashboardEvent
+
+    store, redis = _snapshot_store(monkeypatch, [])
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(
+        DashboardEvent(
+            ts=base,
+            tool_name="remember",
+            emotion_primary="calm",
+            numeric_metrics={"trust_level": 0.9},
+        )
+    )
+    redis.watch_conflicts = 2
+    store.ingest(
+        DashboardEvent(
+            ts=base - timedelta(seconds=30),
+            event_type="tool_call_failed",
+            tool_name="recall",
+            ok=False,
+            emotion_primary="anxious",
+            numeric_metrics={"trust_level": 0.1},
+        )
+    )
+    store.ingest(DashboardEvent(ts=base - timedelta(hours=30), tool_name="recall"))
+
+    current = store.current()
+
+    assert cast(dict[str, Any], current["latest"])["tool_name"] == "remember"
+    assert cast(dict[str, Any], current["latest_emotion"])["emotion_primary"] == "calm"
+    assert current["latest_relationship"] == {
+        "trust_level": 0.9,
+        "total_interactions": None,
+        "shared_episodes_count": None,
+    }
+    assert redis.get("dashboard:current:anchor") == repr(base.timestamp())
+    failures = redis.sorted_sets["dashboard:window:tool_failures"]
+    assert list(failures.values()) == [(base - timedelta(seconds=30)).timestamp()]
+    assert current["tool_calls_per_min"] == 2
+    assert current["error_rate"] == 0.5
+    # The 30-hour-old event fell outside the 24h window of the newer anchor.
+    assert current["window_24h"] == {"tool_calls": 2, "error_rate": 0.5}
+    assert redis.watch_conflicts == 0
+
+
+def test_rebuild_current_snapshot_seeds_windows_from_sql(monkeypatch: pytest.MonkeyPatch) -> None:
+    executed: list[str] = []
+    latest_ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store, redis = _snapshot_store(
+        monkeypatch,
+        executed,
+        all_rows={
+            "SELECT ts, dedupe_key, ok": [
+                (latest_ts - timedelta(seconds=10), "a", True),
+                (latest_ts - timedelta(hours=3), "b", False),
+            ],
+            "SELECT ts, dedupe_key, message": [
+                (latest_ts - timedelta(hours=3), None, "Tool invocation"),
+            ],
+        },
+        # current() falls back to SQL once, then the rebuild repeats the same queries.
+        fetchone_rows=[
+            (1, 0),
+            (2, 1),
+            (0, 0),
+            (1, 0),
+            (latest_ts, "curious", 0.4, 0.2, 0.5),
+            None,
+            ({"curiosity": 0.9},),
+        ]
+        * 2,
+    )
+    redis.set("dashboard:current", json.dumps({"ts": latest_ts.isoformat(), "private": False}))
+
+    assert store.current()["window_24h"] == {"tool_calls": 1, "error_rate": 0.0}
+    store.rebuild_current_snapshot()
+    executed.clear()
+    current = store.current()
+
+    assert executed == []
+    assert current["tool_calls_per_min"] == 1
+    assert current["window_24h"] == {"tool_calls": 1, "error_rate": 0.0}
+    assert current["latest_desires"] == {"curiosity": 0.9}
+    latest_emotion = cast(dict[str, Any], current["latest_emotion"])
+    assert latest_emotion["emotion_primary"] == "curious"
+    assert current["latest_relationship"] is None
+
+    executed.clear()
+    store.rebuild_current_snapshot()
+    assert executed == []
+
+
+def test_ingest_publishes_stream_messages_for_new_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from ego_dashboard.models import DashboardEvent, LogEvent
+
+    store, redis = _snapshot_store(monkeypatch, [])
+    ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(DashboardEvent(ts=ts, tool_name="remember"))
+    store.ingest_log(
+        LogEvent(ts=ts, message="secret", private=True, fields={"tool_name": "remember"})
+    )
+
+    assert redis.published == [
+        ("dashboard:stream", {"type": "current"}),
+        (
+            "dashboard:stream",
+            {
+                "type": "log_line",
+                "data": {
+                    "ts": "2026-01-01T12:00:00+00:00",
+                    "level": "INFO",
+                    "logger": "ego_dashboard",
+                    "message": "REDACTED",
+                    "private": True,
+                    "fields": {"tool_name": "remember"},
+                },
+            },
+        ),
+    ]
+
+
+def test_ingest_does_not_publish_rows_skipped_by_conflict(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from ego_dashboard.models import DashboardEvent, LogEvent
+
+    store, redis = _snapshot_store(monkeypatch, [], rowcount=0)
+    ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(DashboardEvent(ts=ts, tool_name="remember"))
+    store.ingest_log(LogEvent(ts=ts, message="Tool invocation"))
+
+    assert redis.published == []
+
+
+_TIMESCALE_TEST_URL = os.environ.get("DASHBOARD_TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(
+    not _TIMESCALE_TEST_URL,
+    reason="set DASHBOARD_TEST_DATABASE_URL to a disposable TimescaleDB database",
+)
+def test_json_predicate_queries_use_indexes_on_seeded_timescaledb() -> None:
+    import psycopg
+
+    from ego_dashboard.sql_store import (
+        _EMOTION_EVENTS_PREDICATE,
+        _NOTION_EVENTS_PREDICATE,
+        _SURFACE_EVENTS_PREDICATE,
+    )
+
+    assert _TIMESCALE_TEST_URL is not None
+    store = SqlTelemetryStore(_TIMESCALE_TEST_URL, "redis://localhost:6379/0")
+    store.initialize()
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    rows = []
+    for index in range(5000):
+        numeric: dict[str, float] = {"intensity": 0.5}
+        strings: dict[str, str] = {"time_phase": "night"}
+        if index % 50 == 0:
+            numeric["trust_level"] = 0.7
+            strings["person_id"] = f"person-{index % 7}"
+        if index % 40 == 0:
+            strings["notion_created"] = f"notion-{index}"
+        if index % 60 == 0:
+            strings["resonant_person_ids"] = json.dumps([f"person-{index % 7}"])
+        rows.append(
+            (
+                base + timedelta(seconds=index),
+                "remember",
+                json.dumps(numeric),
+                json.dumps(strings),
+                f"explain-{index}",
+            )
+        )
+    queries = {
+        "idx_tool_events_notion_ts": (
+            f"SELECT ts FROM tool_events WHERE ts >= %s AND ts <= %s "
+            f"AND ({_NOTION_EVENTS_PREDICATE})"
+        ),
+        "idx_tool_events_surface_ts": (
+            "SELECT ts FROM tool_events WHERE ts >= %s AND ts <= %s AND ("
+            "string_metrics ? 'resonant_person_ids' "
+            "OR string_metrics ? 'involuntary_person_ids')"
+        ),
+        "idx_tool_events_person_ts": (
+            "SELECT ts FROM tool_events WHERE person_id = 'person-1' AND ts >= %s AND ts <= %s"
+        ),
+        "idx_tool_events_trust_level_ts": (
+            "SELECT trust_level FROM tool_events WHERE ts >= %s AND ts <= %s "
+            "AND trust_level IS NOT NULL ORDER BY ts DESC LIMIT 1"
+        ),
+        "idx_tool_events_emotion_ts": (
+            f"SELECT valence FROM tool_events WHERE ts >= %s AND ts <= %s "
+            f"AND ({_EMOTION_EVENTS_PREDICATE}) ORDER BY ts DESC LIMIT 1"
+        ),
+        "idx_tool_events_string_metrics": (
+            "SELECT ts FROM tool_events WHERE ts >= %s AND ts <= %s "
+            "AND string_metrics ? 'time_phase'"
+        ),
+    }
+    assert "surfaced_person_ids" in _SURFACE_EVENTS_PREDICATE
+
+    with psycopg.connect(_TIMESCALE_TEST_URL) as conn:
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO tool_events (
+                  ts, event_type, tool_name, ok, numeric_metrics, string_metrics, params,
+                  private, message
+                ) VALUES (%s, 'tool_call_completed', %s, TRUE, %s::jsonb, %s::jsonb,
+                  '{}'::jsonb, FALSE, %s)
+                """,
+                rows,
+            )
+            cur.execute("ANALYZE tool_events")
+            # The seeded table is small; rule out sequential scans so the plan shows
+            # whether each predicate can be answered from an index at all.
+            cur.execute("SET LOCAL enable_seqscan = off")
+            window = (base, base + timedelta(hours=2))
+            for index_name, sql in queries.items():
+                cur.execute(f"EXPLAIN {sql}", window)
+                plan = "\n".join(str(row[0]) for row in cur.fetchall())
+                assert index_name in plan, f"{index_name} unused:\n{plan}"
+        conn.rollback()
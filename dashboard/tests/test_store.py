@@ -4,7 +4,8 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 from ego_dashboard.desire_catalog import DesireCatalog, DesireCatalogItem
-from ego_dashboard.models import DashboardEvent
+from ego_dashboard.latency import QuantileSketch
+from ego_dashboard.models import DashboardEvent, LogEvent
 from ego_dashboard.store import TelemetryStore
 
 
@@ -141,6 +142,69 @@ def test_string_visualization_and_anomaly_detection() -> None:
     assert any(alert["kind"] == "intensity_spike" for alert in alerts)
 
 
+def _timed_event(
+    minutes: int, tool: str, duration_ms: int, stages: dict[str, float]
+) -> DashboardEvent:
+    return DashboardEvent(
+        ts=datetime(2026, 1, 1, 12, 0, tzinfo=UTC) + timedelta(minutes=minutes),
+        event_type="tool_call_completed",
+        tool_name=tool,
+        ok=True,
+        duration_ms=duration_ms,
+        numeric_metrics={f"stage_{name}_ms": ms for name, ms in stages.items()},
+        params={},
+        private=False,
+    )
+
+
+def test_quantile_sketch_stays_within_relative_error() -> None:
+    sketch = QuantileSketch()
+    values = [float(value) for value in range(1, 1001)]
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        estimate = sketch.quantile(q)
+        assert estimate is not None
+        assert abs(estimate - exact) <= exact * 0.01
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_tool_and_stage_latency_percentiles() -> None:
+    store = TelemetryStore()
+    for minute in range(4):
+        store.ingest(_timed_event(minute, "recall", 100, {"embedding": 40.0, "chroma": 60.0}))
+    store.ingest(_timed_event(1, "remember", 20, {"embedding": 20.0}))
+    store.ingest(_timed_event(6, "recall", 300, {"embedding": 40.0, "chroma": 260.0}))
+
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    end = datetime(2026, 1, 1, 12, 10, tzinfo=UTC)
+
+    tools = store.tool_latency(start, end, bucket="5m")
+    stages = store.stage_latency(start, end, bucket="5m", tool_name="recall")
+
+    assert [(row["ts"], row["tool_name"], row["count"]) for row in tools] == [
+        ("2026-01-01T12:00:00+00:00", "recall", 4),
+        ("2026-01-01T12:00:00+00:00", "remember", 1),
+        ("2026-01-01T12:05:00+00:00", "recall", 1),
+    ]
+    assert abs(cast(float, tools[0]["p95"]) - 100) <= 1
+    assert [(row["stage"], row["count"]) for row in stages] == [
+        ("chroma", 4),
+        ("embedding", 4),
+        ("chroma", 1),
+        ("embedding", 1),
+    ]
+    assert abs(cast(float, stages[2]["p99"]) - 260) <= 2.6
+
+    alerts = store.anomaly_alerts(start, end, bucket="5m")
+    regressions = [alert for alert in alerts if alert["kind"] == "latency_regression"]
+    assert len(regressions) == 1
+    assert regressions[0]["tool_name"] == "recall"
+    assert regressions[0]["ts"] == "2026-01-01T12:05:00+00:00"
+
+
 def test_logs_filtering() -> None:
     from ego_dashboard.models import LogEvent
 
@@ -222,6 +286,63 @@ def test_logs_search_none_or_empty_returns_all_rows() -> None:
     assert len(store.logs(base, end, search="")) == 2
 
 
+def test_log_page_walks_equal_timestamps_by_keyset_cursor() -> None:
+    store = TelemetryStore()
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    end = base + timedelta(minutes=1)
+    for index in range(5):
+        store.ingest_log(
+            LogEvent(ts=base, level="INFO", logger="ego_mcp.server", message=f"line {index}")
+        )
+    store.ingest_log(LogEvent(ts=end, level="ERROR", logger="ego_mcp.server", message="line late"))
+
+    seen: list[str] = []
+    cursor: tuple[datetime, str] = (base, "")
+    while True:
+        page = store.log_page(base, end, after=cursor, limit=2)
+        if not page:
+            break
+        seen.extend(str(row["message"]) for row in page)
+        last = page[-1]
+        cursor = (datetime.fromisoformat(str(last["ts"])), str(last["dedupe_key"]))
+
+    assert sorted(seen[:5]) == [f"line {index}" for index in range(5)]
+    assert seen[5:] == ["line late"]
+    assert [row["message"] for row in store.log_page(base, end, "error", search="LATE")] == [
+        "line late"
+    ]
+
+
+def test_log_page_without_cursor_returns_the_newest_rows_oldest_first() -> None:
+    store = TelemetryStore()
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    for index in range(6):
+        store.ingest_log(
+            LogEvent(
+                ts=base + timedelta(seconds=index // 2),
+                level="ERROR" if index % 2 else "INFO",
+                message=f"line {index}",
+            )
+        )
+    end = base + timedelta(minutes=1)
+
+    tail = store.log_page(base, end, limit=3)
+    errors = store.log_page(base, end, "error", limit=2)
+
+    assert [datetime.fromisoformat(str(row["ts"])) for row in tail] == [
+        base + timedelta(seconds=1),
+        base + timedelta(seconds=2),
+        base + timedelta(seconds=2),
+    ]
+    assert [(row["ts"], row["dedupe_key"]) for row in tail] == sorted(
+        (row["ts"], row["dedupe_key"]) for row in tail
+    )
+    assert [row["message"] for row in errors] == ["line 3", "line 5"]
+    assert store.log_page(base, end, after=(base + timedelta(seconds=1), "")) == store.log_page(
+        base, end, limit=4
+    )
+
+
 def test_desire_metric_keys_include_dynamic_history_only_keys() -> None:
     store = TelemetryStore()
     start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
@@ -285,6 +406,31 @@ def test_current_and_desire_metric_keys_accept_attune_events() -> None:
     ]
 
 
+def test_stage_timings_on_desire_events_are_not_desires() -> None:
+    store = TelemetryStore()
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(
+        DashboardEvent(
+            ts=start,
+            event_type="tool_call_completed",
+            tool_name="feel_desires",
+            ok=True,
+            duration_ms=10,
+            numeric_metrics={
+                "curiosity": 0.7,
+                "stage_chroma_ms": 3.2,
+                "stage_notion_io_ms": 1.5,
+            },
+        )
+    )
+
+    current = store.current()
+
+    assert current["latest_desires"] == {"curiosity": 0.7}
+    assert current["latest_emergent_desires"] == {}
+    assert store.desire_metric_keys(start, start + timedelta(minutes=10)) == ["curiosity"]
+
+
 def test_invoked_attune_event_not_counted_for_desire_metrics() -> None:
     """Invoked events should not contribute desire metrics (Finding 6)."""
     store = TelemetryStore()
@@ -760,3 +906,85 @@ def test_store_exposes_generic_notion_link_and_curation_metrics() -> None:
     assert metric_rows == [{"ts": start.isoformat(), "value": 2.0}]
     assert action_rows == [{"ts": start.isoformat(), "value": "merge"}]
     assert notion_rows == [{"ts": start.isoformat(), "value": "notion_1"}]
+
+
+def test_out_of_order_ingest_is_kept_time_ordered_for_range_queries() -> None:
+    store = TelemetryStore()
+    for minute in (4, 0, 2, 1, 3):
+        store.ingest(_event(minute, "remember", minute / 10, "day"))
+
+    start = datetime(2026, 1, 1, 12, 1, tzinfo=UTC)
+    end = datetime(2026, 1, 1, 12, 3, tzinfo=UTC)
+
+    assert [row["value"] for row in store.metric_history("intensity", start, end, "1m")] == [
+        0.1,
+        0.2,
+    ]
+    assert store.current()["latest"] is not None
+    latest = cast(dict[str, Any], store.current()["latest"])
+    assert latest["emotion_intensity"] == 0.4
+
+
+def test_bucket_aggregation_excludes_events_at_range_end() -> None:
+    store = TelemetryStore()
+    store.ingest(_event(0, "remember", 0.2, "day"))
+    store.ingest(_event(3, "remember", 0.9, "day"))
+
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    end = datetime(2026, 1, 1, 12, 3, tzinfo=UTC)
+    usage = store.tool_usage(start, end, bucket="1m")
+
+    assert [row["remember"] for row in usage] == [1, 0, 0]
+
+
+def test_retention_window_evicts_old_events_and_logs() -> None:
+    from ego_dashboard.models import LogEvent
+
+    store = TelemetryStore(retention=timedelta(minutes=10))
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    store.ingest(_event(0, "remember", 0.2, "day"))
+    store.ingest_log(LogEvent(ts=base, level="INFO", logger="a", message="old"))
+    store.ingest(_event(30, "remember", 0.4, "day"))
+    store.ingest_log(
+        LogEvent(ts=base + timedelta(minutes=30), level="INFO", logger="a", message="new")
+    )
+    # Replayed events older than the window are dropped instead of re-added.
+    store.ingest(_event(1, "remember", 0.3, "day"))
+
+    window_end = base + timedelta(hours=1)
+    assert [row["value"] for row in store.string_timeline("time_phase", base, window_end)] == [
+        "day"
+    ]
+    assert [row["message"] for row in store.logs(base, window_end)] == ["new"]
+
+
+def test_max_items_evicts_oldest_and_allows_reingest() -> None:
+    store = TelemetryStore(max_items=2)
+    first = _event(0, "remember", 0.1, "day")
+    store.ingest(first)
+    store.ingest(_event(1, "remember", 0.2, "day"))
+    store.ingest(_event(2, "remember", 0.3, "day"))
+
+    start = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    end = start + timedelta(minutes=5)
+    assert len(store.string_timeline("time_phase", start, end)) == 2
+
+    store.ingest(first)
+    assert len(store.string_timeline("time_phase", start, end)) == 2
+
+
+def test_subscribe_notifies_only_newly_stored_rows() -> None:
+    store = TelemetryStore()
+    messages: list[dict[str, object]] = []
+    unsubscribe = store.subscribe(messages.append)
+    ts = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+    store.ingest(DashboardEvent(ts=ts, tool_name="remember"))
+    store.ingest(DashboardEvent(ts=ts, tool_name="remember"))
+    store.ingest_log(LogEvent(ts=ts, message="secret", private=True))
+    unsubscribe()
+    store.ingest_log(LogEvent(ts=ts, message="after unsubscribe"))
+
+    assert [message["type"] for message in messages] == ["current", "log_line"]
+    log_row = cast(dict[str, object], messages[1]["data"])
+    assert log_row["message"] == "REDACTED"
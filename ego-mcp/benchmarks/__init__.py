@@ -0,0 +1,7 @@
+"""Offline performance benchmarks for ego-mcp.
+
+Run from the ``ego-mcp`` directory::
+
+    uv run python -m benchmarks --sizes 1000 10000 --output report.json
+    uv run python -m benchmarks --sizes 1000 --baseline report.json
+"""
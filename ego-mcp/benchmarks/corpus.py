@@ -0,0 +1,409 @@
+"""Synthetic ego-mcp data directories: memories, link graph, notions and relationships."""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from benchmarks.hashing import HashingEmbeddingProvider
+from ego_mcp import timezone_utils
+from ego_mcp._memory_serialization import memory_to_chromadb
+from ego_mcp.chromadb_compat import load_chromadb
+from ego_mcp.embedding import EgoEmbeddingFunction
+from ego_mcp.notion import NotionStore, generate_notion_from_cluster
+from ego_mcp.relationship import RelationshipStore
+from ego_mcp.types import (
+    BodyState,
+    Category,
+    Emotion,
+    EmotionalTrace,
+    LinkType,
+    Memory,
+    MemoryLink,
+    Notion,
+)
+
+chromadb = load_chromadb()
+
+# topic: (category, tags, vocabulary). Memories draw most words from one topic, so
+# hashed embeddings, BM25 and tag-derived notions all see coherent clusters.
+TOPICS: dict[str, tuple[Category, tuple[str, ...], tuple[str, ...]]] = {
+    "garden": (
+        Category.DAILY,
+        ("garden", "seasons"),
+        (
+            "tomatoes",
+            "soil",
+            "seedlings",
+            "rain",
+            "basil",
+            "compost",
+            "sunlight",
+            "watering",
+            "sprouts",
+            "harvest",
+            "roots",
+            "frost",
+            "bees",
+            "trellis",
+        ),
+    ),
+    "music": (
+        Category.FEELING,
+        ("music",),
+        (
+            "melody",
+            "piano",
+            "chords",
+            "rhythm",
+            "song",
+            "lyrics",
+            "harmony",
+            "concert",
+            "guitar",
+            "tempo",
+            "chorus",
+            "improvisation",
+            "vinyl",
+            "scale",
+        ),
+    ),
+    "code": (
+        Category.TECHNICAL,
+        ("code", "debugging"),
+        (
+            "function",
+            "refactor",
+            "tests",
+            "bug",
+            "compiler",
+            "latency",
+            "cache",
+            "index",
+            "query",
+            "deploy",
+            "review",
+            "regression",
+            "profiler",
+            "schema",
+        ),
+    ),
+    "philosophy": (
+        Category.PHILOSOPHICAL,
+        ("philosophy", "identity"),
+        (
+            "memory",
+            "self",
+            "continuity",
+            "meaning",
+            "consciousness",
+            "time",
+            "change",
+            "freedom",
+            "truth",
+            "attention",
+            "habit",
+            "wonder",
+            "doubt",
+        ),
+    ),
+    "cooking": (
+        Category.DAILY,
+        ("cooking",),
+        (
+            "soup",
+            "bread",
+            "garlic",
+            "recipe",
+            "oven",
+            "spices",
+            "noodles",
+            "broth",
+            "dough",
+            "kitchen",
+            "dinner",
+            "lemon",
+            "ginger",
+            "rice",
+        ),
+    ),
+    "walks": (
+        Category.OBSERVATION,
+        ("walks", "city"),
+        (
+            "river",
+            "bridge",
+            "streetlights",
+            "crows",
+            "morning",
+            "fog",
+            "park",
+            "station",
+            "bicycle",
+            "alley",
+            "clouds",
+            "bench",
+            "wind",
+            "market",
+        ),
+    ),
+    "conversation": (
+        Category.CONVERSATION,
+        ("conversation",),
+        (
+            "question",
+            "story",
+            "laughed",
+            "promise",
+            "advice",
+            "secret",
+            "plans",
+            "worry",
+            "joke",
+            "apology",
+            "gratitude",
+            "silence",
+            "listening",
+        ),
+    ),
+    "dreams": (
+        Category.DREAM,
+        ("dreams",),
+        (
+            "ocean",
+            "staircase",
+            "door",
+            "lantern",
+            "forest",
+            "train",
+            "mirror",
+            "flying",
+            "library",
+            "moon",
+            "key",
+            "maze",
+            "whales",
+        ),
+    ),
+}
+PERSONS: tuple[str, ...] = ("Master", "Aiko", "Ben", "Chiara", "Dmitri", "Emi")
+
+_OPENERS = (
+    "Today I noticed",
+    "I keep thinking about",
+    "We talked about",
+    "It surprised me how",
+    "Quietly remembering",
+    "Later that evening",
+    "I wrote down",
+)
+_FILLER = ("the", "a", "with", "and", "again", "slowly", "almost", "still", "after")
+_TONES = ("warm", "playful", "serious", "tired", "curious")
+_TIME_PHASES = ("morning", "afternoon", "evening", "night", "late_night")
+_EMOTIONS = tuple(Emotion)
+_BATCH_SIZE = 1_000
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusSpec:
+    """Shape of a synthetic corpus; the same spec always yields the same data."""
+
+    size: int
+    seed: int = 0
+    days: int = 365
+    # One notion per this many memories, distilled from a same-topic cluster.
+    memories_per_notion: int = 50
+    notion_cluster_size: int = 8
+
+
+@dataclass(frozen=True, slots=True)
+class Corpus:
+    """Ids a benchmark needs to address the seeded data."""
+
+    memory_ids: list[str]
+    notion_ids: list[str]
+    persons: tuple[str, ...]
+    topics: tuple[str, ...]
+
+
+def _content(rng: random.Random, words: tuple[str, ...], person: str | None) -> str:
+    picked = rng.sample(words, k=min(len(words), rng.randint(4, 7)))
+    parts = [rng.choice(_OPENERS)]
+    for word in picked:
+        parts.append(rng.choice(_FILLER))
+        parts.append(word)
+    if person is not None:
+        parts.append(f"with {person}")
+    return " ".join(parts) + "."
+
+
+def build_memories(spec: CorpusSpec) -> list[Memory]:
+    """Generate ``spec.size`` time-ordered memories with a linked graph.
+
+    Each memory links to a recent memory of the same topic (temporal chains) and,
+    with lower probability, to an endpoint of an existing link, which gives the
+    graph the hub-heavy degree distribution of preferential attachment.
+    """
+    rng = random.Random(spec.seed)
+    now = timezone_utils.now()
+    start = now - timedelta(days=spec.days)
+    step = timedelta(days=spec.days) / max(spec.size, 1)
+    topic_names = tuple(TOPICS)
+    recent_by_topic: dict[str, deque[int]] = {
+        name: deque(maxlen=30) for name in topic_names
+    }
+    endpoints: list[int] = []
+    memories: list[Memory] = []
+    for index in range(spec.size):
+        topic = rng.choice(topic_names)
+        category, tags, words = TOPICS[topic]
+        person = rng.choice(PERSONS) if rng.random() < 0.3 else None
+        ts = (
+            start
+            + step * index
+            + timedelta(seconds=rng.uniform(0, step.total_seconds()))
+        )
+        anticipated_at = ""
+        if rng.random() < 0.002:
+            anticipated_at = (now + timedelta(days=rng.randint(1, 30))).isoformat()
+        memory = Memory(
+            id=f"mem_{rng.getrandbits(48):012x}",
+            content=_content(rng, words, person),
+            timestamp=ts.isoformat(),
+            emotional_trace=EmotionalTrace(
+                primary=rng.choice(_EMOTIONS),
+                secondary=[rng.choice(_EMOTIONS)] if rng.random() < 0.3 else [],
+                intensity=round(rng.uniform(0.1, 1.0), 2),
+                valence=round(rng.uniform(-1.0, 1.0), 2),
+                arousal=round(rng.uniform(0.0, 1.0), 2),
+                body_state=BodyState(time_phase=rng.choice(_TIME_PHASES)),
+            ),
+            importance=rng.choices((1, 2, 3, 4, 5), weights=(1, 3, 5, 3, 1))[0],
+            category=category,
+            tags=list(tags),
+            is_private=rng.random() < 0.05,
+            access_count=rng.randint(0, 5),
+            involved_person_ids=[person] if person is not None else [],
+            anticipated_at=anticipated_at,
+        )
+        memories.append(memory)
+
+        targets: dict[int, LinkType] = {}
+        recent = recent_by_topic[topic]
+        if recent and rng.random() < 0.6:
+            targets[rng.choice(recent)] = rng.choice(
+                (LinkType.LEADS_TO, LinkType.CAUSED_BY)
+            )
+        if endpoints and rng.random() < 0.35:
+            targets.setdefault(
+                rng.choice(endpoints), rng.choice((LinkType.SIMILAR, LinkType.RELATED))
+            )
+        for target, link_type in targets.items():
+            confidence = round(rng.uniform(0.4, 0.95), 2)
+            memory.linked_ids.append(
+                MemoryLink(
+                    target_id=memories[target].id,
+                    link_type=link_type,
+                    confidence=confidence,
+                )
+            )
+            memories[target].linked_ids.append(
+                MemoryLink(
+                    target_id=memory.id, link_type=link_type, confidence=confidence
+                )
+            )
+            endpoints.extend((index, target))
+        recent.append(index)
+    return memories
+
+
+def build_notions(spec: CorpusSpec, memories: list[Memory]) -> list[Notion]:
+    """Distil notions from chronological same-topic clusters, linked within a topic."""
+    rng = random.Random(spec.seed + 1)
+    by_topic: dict[tuple[str, ...], list[Memory]] = {}
+    for memory in memories:
+        by_topic.setdefault(tuple(memory.tags), []).append(memory)
+    clusters = [
+        (tags, members[offset : offset + spec.notion_cluster_size])
+        for tags, members in by_topic.items()
+        for offset in range(
+            0, len(members) - spec.notion_cluster_size + 1, spec.notion_cluster_size
+        )
+    ]
+    count = min(len(clusters), spec.size // spec.memories_per_notion)
+    notions: list[Notion] = []
+    latest_by_topic: dict[tuple[str, ...], list[str]] = {}
+    for number, (tags, cluster) in enumerate(rng.sample(clusters, k=count)):
+        notion = generate_notion_from_cluster(cluster)
+        notion.id = f"notion_{number:06d}"
+        notion.reinforcement_count = rng.randint(0, 6)
+        people = {pid for memory in cluster for pid in memory.involved_person_ids}
+        if len(people) == 1:
+            notion.person_id = people.pop()
+        related = latest_by_topic.setdefault(tags, [])
+        notion.related_notion_ids = related[-2:]
+        related.append(notion.id)
+        notions.append(notion)
+    return notions
+
+
+def _seed_relationships(path: Path, rng: random.Random, now_iso: str) -> None:
+    store = RelationshipStore(path)
+    for person in PERSONS:
+        store.update(
+            person,
+            {
+                "name": person,
+                "trust_level": round(rng.uniform(0.3, 0.95), 2),
+                "known_facts": [f"{person} likes {rng.choice(tuple(TOPICS))}"],
+                "preferred_topics": rng.sample(tuple(TOPICS), k=2),
+                "relation_kind": "interlocutor"
+                if person == PERSONS[0]
+                else "mentioned",
+            },
+        )
+        for _ in range(rng.randint(3, 12)):
+            store.add_interaction(person, now_iso, rng.choice(_TONES))
+
+
+async def seed_corpus(
+    data_dir: Path, provider: HashingEmbeddingProvider, spec: CorpusSpec
+) -> Corpus:
+    """Write ``spec`` into a fresh ego-mcp data directory.
+
+    Memories go straight into the ``ego_memories`` collection in batches with
+    precomputed vectors; the lexical index is rebuilt from it when the server
+    connects, exactly as after an upgrade.
+    """
+    memories = build_memories(spec)
+    client: Any = chromadb.PersistentClient(path=str(data_dir / "chroma"))
+    collection = client.get_or_create_collection(
+        name="ego_memories", embedding_function=EgoEmbeddingFunction(provider)
+    )
+    for offset in range(0, len(memories), _BATCH_SIZE):
+        batch = memories[offset : offset + _BATCH_SIZE]
+        documents = [memory.content for memory in batch]
+        collection.add(
+            ids=[memory.id for memory in batch],
+            documents=documents,
+            metadatas=[memory_to_chromadb(memory) for memory in batch],
+            embeddings=await provider.embed(documents),
+        )
+
+    notions = build_notions(spec, memories)
+    NotionStore(data_dir / "notions.json").save_many(notions)
+    _seed_relationships(
+        data_dir / "relationships" / "models.json",
+        random.Random(spec.seed + 2),
+        timezone_utils.now().isoformat(),
+    )
+    return Corpus(
+        memory_ids=[memory.id for memory in memories],
+        notion_ids=[notion.id for notion in notions],
+        persons=PERSONS,
+        topics=tuple(TOPICS),
+    )
@@ -0,0 +1,57 @@
+"""Deterministic, network-free embedding provider for benchmarks."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import itertools
+import math
+import re
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+@functools.lru_cache(maxsize=65_536)
+def _bucket(token: str, dim: int) -> tuple[int, float]:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+
+class HashingEmbeddingProvider:
+    """Signed feature hashing of word unigrams and bigrams into unit vectors.
+
+    Texts that share words get a positive cosine similarity, so recall,
+    auto-linking and consolidation see realistic neighbourhoods, while the
+    vectors stay identical across runs, machines and Python hash seeds.
+    """
+
+    def __init__(self, dim: int = 256) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        self._dim = dim
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    async def close(self) -> None:
+        """No-op close hook for compatibility with provider protocol."""
+        return
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_one(text) for text in texts]
+
+    def embed_one(self, text: str) -> list[float]:
+        vec = [0.0] * self._dim
+        tokens = _TOKEN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in itertools.pairwise(tokens)]
+        for feature in features:
+            index, sign = _bucket(feature, self._dim)
+            vec[index] += sign
+        norm = math.sqrt(sum(x * x for x in vec))
+        if norm == 0.0:
+            # Empty text still needs a valid unit vector for the vector store.
+            vec[0] = 1.0
+            return vec
+        return [x / norm for x in vec]
@@ -0,0 +1,381 @@
+"""Time every ego-mcp tool end to end and per stage against synthetic corpora."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import ego_mcp.server as server_mod
+from benchmarks.corpus import TOPICS, Corpus, CorpusSpec, seed_corpus
+from benchmarks.hashing import HashingEmbeddingProvider
+from ego_mcp import timezone_utils
+from ego_mcp.config import EgoConfig
+
+REPORT_SCHEMA = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# A tool regresses when its median grows by more than this factor over the baseline.
+DEFAULT_THRESHOLD = 1.25
+
+
+@dataclass(slots=True)
+class _RunState:
+    corpus: Corpus
+    rng: random.Random
+    episode_ids: list[str] = field(default_factory=list)
+    forgettable: list[str] = field(default_factory=list)
+
+    def query(self) -> str:
+        _category, _tags, words = TOPICS[self.rng.choice(self.corpus.topics)]
+        return " ".join(self.rng.sample(words, k=2))
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One tool call shape; ``args`` builds fresh arguments for every call."""
+
+    tool: str
+    args: Callable[[_RunState], dict[str, Any]]
+
+
+def _no_args(_state: _RunState) -> dict[str, Any]:
+    return {}
+
+
+# Read-only tools first, then the ones that grow or shrink the corpus.
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("wake_up", _no_args),
+    Scenario("attune", _no_args),
+    Scenario("introspect", _no_args),
+    Scenario("consider_them", lambda s: {"person": s.rng.choice(s.corpus.persons)}),
+    Scenario("recall", lambda s: {"context": s.query()}),
+    Scenario("pause", _no_args),
+    Scenario("curate_notions", lambda s: {"action": "list"}),
+    Scenario("configure_desires", _no_args),
+    Scenario("get_episode", lambda s: {"episode_id": s.rng.choice(s.episode_ids)}),
+    Scenario(
+        "remember",
+        lambda s: {
+            "content": f"Benchmark note about {s.query()}",
+            "emotion": "curious",
+            "category": "daily",
+            "importance": 3,
+        },
+    ),
+    Scenario(
+        "link_memories",
+        lambda s: dict(
+            zip(("source_id", "target_id"), s.rng.sample(s.corpus.memory_ids, k=2))
+        ),
+    ),
+    Scenario(
+        "update_relationship",
+        lambda s: {
+            "person": s.rng.choice(s.corpus.persons),
+            "field": "trust_level",
+            "value": round(s.rng.uniform(0.3, 0.95), 2),
+        },
+    ),
+    Scenario(
+        "update_self",
+        lambda s: {
+            "field": "new_question",
+            "value": {"question": f"What connects {s.query()}?", "importance": 3},
+        },
+    ),
+    Scenario(
+        "create_episode",
+        lambda s: {
+            "memory_ids": s.rng.sample(s.corpus.memory_ids, k=3),
+            "summary": f"Benchmark episode about {s.query()}",
+        },
+    ),
+    Scenario("forget", lambda s: {"memory_id": s.forgettable.pop()}),
+    Scenario("consolidate", _no_args),
+)
+
+
+class _CompletionRecorder(logging.Handler):
+    """Keeps the ``stage_ms`` of the last ``Tool execution completed`` record."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.stage_ms: dict[str, float] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.getMessage() == "Tool execution completed":
+            stages = getattr(record, "stage_ms", None)
+            self.stage_ms = dict(stages) if isinstance(stages, dict) else {}
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    return sorted_values[round(q * (len(sorted_values) - 1))]
+
+
+def _summarize(
+    durations: list[float], stages: list[dict[str, float]], errors: int
+) -> dict[str, Any]:
+    ordered = sorted(durations)
+    summary: dict[str, Any] = {"calls": len(durations), "errors": errors}
+    if ordered:
+        summary.update(
+            mean_ms=round(sum(ordered) / len(ordered), 3),
+            p50_ms=round(_percentile(ordered, 0.5), 3),
+            p95_ms=round(_percentile(ordered, 0.95), 3),
+            max_ms=round(ordered[-1], 3),
+        )
+    totals: dict[str, float] = {}
+    for call in stages:
+        for stage, ms in call.items():
+            totals[stage] = totals.get(stage, 0.0) + ms
+    # Mean per call, so stages a call never entered count as zero.
+    summary["stage_ms"] = {
+        stage: round(total / max(len(stages), 1), 3)
+        for stage, total in sorted(totals.items())
+    }
+    return summary
+
+
+async def _time_scenario(
+    scenario: Scenario,
+    state: _RunState,
+    recorder: _CompletionRecorder,
+    iterations: int,
+    warmup: int,
+) -> dict[str, Any]:
+    durations: list[float] = []
+    stages: list[dict[str, float]] = []
+    errors = 0
+    for call in range(warmup + iterations):
+        args = scenario.args(state)
+        recorder.stage_ms = {}
+        started = time.perf_counter()
+        try:
+            await server_mod.call_tool(scenario.tool, args)
+        except Exception:  # noqa: BLE001 - a failing tool is counted, not fatal
+            errors += 1
+            continue
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if call >= warmup:
+            durations.append(elapsed_ms)
+            stages.append(recorder.stage_ms)
+    return _summarize(durations, stages, errors)
+
+
+def _config(data_dir: Path) -> EgoConfig:
+    return EgoConfig(
+        embedding_provider="hashing",
+        embedding_model="hashing",
+        api_key="",
+        data_dir=data_dir,
+        companion_name="Master",
+        workspace_dir=None,
+        timezone="UTC",
+    )
+
+
+async def run_corpus(
+    spec: CorpusSpec,
+    data_dir: Path,
+    provider: HashingEmbeddingProvider,
+    *,
+    iterations: int,
+    warmup: int,
+    tools: set[str] | None = None,
+) -> dict[str, Any]:
+    """Seed ``spec`` into ``data_dir``, start the server on it and time each scenario."""
+    started = time.perf_counter()
+    corpus = await seed_corpus(data_dir, provider, spec)
+    server_mod.init_server(_config(data_dir), embedding_provider=provider)
+    seed_seconds = time.perf_counter() - started
+
+    state = _RunState(corpus=corpus, rng=random.Random(spec.seed + 3))
+    calls = warmup + iterations
+    episodes = server_mod._get_episodes()
+    for _ in range(max(5, calls)):
+        episode = await episodes.create(
+            state.rng.sample(corpus.memory_ids, k=4),
+            f"Seeded episode about {state.query()}",
+        )
+        state.episode_ids.append(episode.id)
+    state.forgettable = corpus.memory_ids[: min(calls, len(corpus.memory_ids))]
+
+    recorder = _CompletionRecorder()
+    server_logger = logging.getLogger(server_mod.__name__)
+    previous_level = server_logger.level
+    server_logger.setLevel(logging.INFO)
+    server_logger.addHandler(recorder)
+    try:
+        results = {
+            scenario.tool: await _time_scenario(
+                scenario, state, recorder, iterations, warmup
+            )
+            for scenario in SCENARIOS
+            if tools is None or scenario.tool in tools
+        }
+    finally:
+        server_logger.removeHandler(recorder)
+        server_logger.setLevel(previous_level)
+        server_mod._get_memory().close()
+    return {
+        "memories": len(corpus.memory_ids),
+        "notions": len(corpus.notion_ids),
+        "seed_seconds": round(seed_seconds, 3),
+        "tools": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+async def run_benchmarks(
+    sizes: list[int],
+    *,
+    iterations: int = 20,
+    warmup: int = 2,
+    dim: int = 256,
+    seed: int = 0,
+    tools: set[str] | None = None,
+    data_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Build the JSON report for every corpus size."""
+    provider = HashingEmbeddingProvider(dim)
+    corpora: dict[str, Any] = {}
+    for size in sizes:
+        spec = CorpusSpec(size=size, seed=seed)
+        if data_dir is not None:
+            target = data_dir / f"corpus-{size}"
+            target.mkdir(parents=True, exist_ok=False)
+            corpora[str(size)] = await run_corpus(
+                spec,
+                target,
+                provider,
+                iterations=iterations,
+                warmup=warmup,
+                tools=tools,
+            )
+            continue
+        with tempfile.TemporaryDirectory(prefix=f"ego-bench-{size}-") as tmp:
+            corpora[str(size)] = await run_corpus(
+                spec,
+                Path(tmp),
+                provider,
+                iterations=iterations,
+                warmup=warmup,
+                tools=tools,
+            )
+    return {
+        "schema": REPORT_SCHEMA,
+        "created_at": timezone_utils.now().isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "iterations": iterations,
+            "warmup": warmup,
+            "dim": dim,
+            "seed": seed,
+        },
+        "corpora": corpora,
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Median latency of every (size, tool) present in both reports, with its ratio."""
+    rows: list[dict[str, Any]] = []
+    for size, corpus in current.get("corpora", {}).items():
+        base_tools = baseline.get("corpora", {}).get(size, {}).get("tools", {})
+        for tool, summary in corpus.get("tools", {}).items():
+            base_p50 = base_tools.get(tool, {}).get("p50_ms")
+            p50 = summary.get("p50_ms")
+            if not base_p50 or p50 is None:
+                continue
+            ratio = p50 / base_p50
+            rows.append(
+                {
+                    "size": size,
+                    "tool": tool,
+                    "baseline_p50_ms": base_p50,
+                    "p50_ms": p50,
+                    "ratio": round(ratio, 3),
+                    "regressed": ratio > threshold,
+                }
+            )
+    return rows
+
+
+def _print_comparison(rows: list[dict[str, Any]]) -> None:
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['size']:>7} {row['tool']:<20} {row['baseline_p50_ms']:>10.2f} -> "
+            f"{row['p50_ms']:>10.2f} ms  x{row['ratio']:.2f}{flag}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--dim", type=int, default=256, help="embedding dimensions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tools", nargs="+", help="only time these tools")
+    parser.add_argument("--data-dir", type=Path, help="keep the seeded data here")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_benchmarks(
+            args.sizes,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            dim=args.dim,
+            seed=args.seed,
+            tools=set(args.tools) if args.tools else None,
+            data_dir=args.data_dir,
+        )
+    )
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    rows = compare_reports(baseline, report, args.threshold)
+    _print_comparison(rows)
+    return 1 if any(row["regressed"] for row in rows) else 0
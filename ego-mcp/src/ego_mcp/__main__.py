@@ -3,7 +3,11 @@
 import asyncio
 import logging
 
-from ego_mcp.logging_utils import configure_logging, install_global_exception_hooks
+from ego_mcp.logging_utils import (
+    configure_logging,
+    install_global_exception_hooks,
+    shutdown_logging,
+)
 from ego_mcp.server import main
 
 if __name__ == "__main__":
@@ -20,3 +24,5 @@ if __name__ == "__main__":
             "ego-mcp server terminated with an unhandled exception"
         )
         raise
+    finally:
+        shutdown_logging()
@@ -0,0 +1,56 @@
+"""Change detection for JSON files that stores keep parsed in memory."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# File timestamps are coarse (one clock tick), so a rewrite with the same size shortly
+# after a load can keep mtime and size; inside this window the contents are compared.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class FileVersion:
+    """The mtime, size and content digest of a file when it was last read or written."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+
+    @classmethod
+    def of(cls, path: Path) -> FileVersion | None:
+        """Current version of ``path``; ``None`` when it does not exist."""
+        try:
+            stat = path.stat()
+            content = path.read_bytes()
+        except OSError:
+            return None
+        return cls(stat.st_mtime_ns, len(content), _digest(content))
+
+    def matches(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_mtime_ns != self.mtime_ns or stat.st_size != self.size:
+            return False
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            return True
+        try:
+            return _digest(path.read_bytes()) == self.digest
+        except OSError:
+            return False
+
+
+def file_unchanged(path: Path, version: FileVersion | None) -> bool:
+    """Whether ``path`` is still at ``version`` (``None`` meaning it did not exist)."""
+    if version is None:
+        return not path.exists()
+    return version.matches(path)
+
+
+def _digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
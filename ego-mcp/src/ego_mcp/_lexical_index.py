@@ -14,6 +14,8 @@ import sqlite3
 from collections.abc import Iterable
 from pathlib import Path
 
+from ego_mcp.spans import timed
+
 logger = logging.getLogger(__name__)
 
 _MAX_TRIGRAMS = 64
@@ -107,6 +109,7 @@ class LexicalIndex:
                 logger.warning("Failed to close lexical index: %s", exc)
             self._conn = None
 
+    @timed("lexical")
     def add(self, memory_id: str, content: str) -> None:
         """Index a memory's content. No-op if the index is unavailable."""
         if not self.available or self._conn is None:
@@ -122,6 +125,7 @@ class LexicalIndex:
                 "Failed to index memory %s for lexical search: %s", memory_id, exc
             )
 
+    @timed("lexical")
     def remove(self, memory_id: str) -> None:
         """Remove a memory from the index. No-op if the index is unavailable."""
         if not self.available or self._conn is None:
@@ -166,6 +170,7 @@ class LexicalIndex:
         except Exception as exc:
             logger.warning("Failed to rebuild lexical index: %s", exc)
 
+    @timed("lexical")
     def search(self, query: str, limit: int) -> list[str]:
         """Return memory_ids matching ``query``, ranked by BM25 (best first).
 
@@ -21,6 +21,7 @@ from ego_mcp.preciousness import (
 )
 from ego_mcp.proust import PROUST_PERSON_PROBABILITY
 from ego_mcp.relationship import RelationshipStore
+from ego_mcp.spans import span, timed
 from ego_mcp.types import Memory, MemorySearchResult, RecalledPerson
 
 if TYPE_CHECKING:
@@ -97,6 +98,7 @@ def _max_link_confidence(memory: Memory) -> float:
     return max((link.confidence for link in memory.linked_ids), default=0.0)
 
 
+@timed("scoring")
 def _scored_result(memory: Memory, distance: float) -> MemorySearchResult:
     now = timezone_utils.now()
     decay = calculate_time_decay(
@@ -123,6 +125,7 @@ def _scored_result(memory: Memory, distance: float) -> MemorySearchResult:
     )
 
 
+@timed("scoring")
 def _raw_semantic_result(memory: Memory, distance: float) -> MemorySearchResult:
     decay = calculate_time_decay(
         memory.timestamp,
@@ -544,7 +547,8 @@ async def recall(
         )
         embeddings = embed_results.get("embeddings")
 
-        if embeddings and len(embeddings) > 0:
+        # Chroma returns a NumPy array here, whose truth value is ambiguous.
+        if embeddings is not None and len(embeddings) > 0:
             contents = [result.memory.content for result in candidate_pool]
             store._hopfield.store(embeddings, candidate_ids, contents)
 
@@ -583,7 +587,8 @@ async def recall(
     except Exception as exc:
         logger.warning("Hopfield recall fallback to semantic-only: %s", exc)
 
-    base_results = await _apply_spreading_activation(store, base_results, n_results)
+    with span("spreading_activation"):
+        base_results = await _apply_spreading_activation(store, base_results, n_results)
 
     proust_result: MemorySearchResult | None = None
     if dormant_candidates and random.random() < proust_probability:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,7 @@ from ego_mcp.chromadb_compat import load_chromadb
 from ego_mcp.config import EgoConfig
 from ego_mcp.embedding import EgoEmbeddingFunction
 from ego_mcp.hopfield import ModernHopfieldNetwork
+from ego_mcp.spans import span
 from ego_mcp.types import (
     BodyState,
     Category,
@@ -28,6 +30,33 @@ from ego_mcp.types import (
 logger = logging.getLogger(__name__)
 chromadb = load_chromadb()
 
+_TIMED_COLLECTION_METHODS = frozenset(
+    {"add", "count", "delete", "get", "query", "update", "upsert"}
+)
+
+
+class _TimedCollection:
+    """Collection proxy that records vector-store calls as the ``chroma`` stage."""
+
+    __slots__ = ("_collection",)
+
+    def __init__(self, collection: Any) -> None:
+        self._collection = collection
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._collection, name)
+        if name not in _TIMED_COLLECTION_METHODS:
+            return attr
+        return _timed_call(attr)
+
+
+def _timed_call(method: Callable[..., Any]) -> Callable[..., Any]:
+    def call(*args: Any, **kwargs: Any) -> Any:
+        with span("chroma"):
+            return method(*args, **kwargs)
+
+    return call
+
 
 class MemoryStore:
     """ChromaDB-backed memory storage with semantic search, Hopfield recall, and auto-linking."""
@@ -97,7 +126,7 @@ class MemoryStore:
         if self._collection is None:
             self.connect()
         assert self._collection is not None
-        return self._collection
+        return _TimedCollection(self._collection)
 
     def get_client(self) -> Any:
         """Return active vector-store client (connect lazily if needed)."""
@@ -9,13 +9,14 @@ from pathlib import Path
 from typing import Any, Callable
 
 from ego_mcp._memory_serialization import memory_to_chromadb
-from ego_mcp._server_context import _relationship_store
+from ego_mcp._server_context import _relationship_store, _self_model_store
 from ego_mcp._server_emotion_formatting import (
     _relative_time,
     _truncate_for_quote,
 )
 from ego_mcp._server_runtime import (
     get_notion_store,
+    get_relationship_store,
     get_workspace_sync,
     update_tool_metadata,
 )
@@ -100,7 +101,7 @@ def _relationship_store_for_memory(memory: MemoryStore) -> RelationshipStore | N
     if data_dir is None:
         return None
     try:
-        return RelationshipStore(Path(data_dir) / "relationships" / "models.json")
+        return get_relationship_store(Path(data_dir) / "relationships" / "models.json")
     except TypeError:
         return None
 
@@ -157,23 +158,17 @@ def _load_person_memory_ids(memory: MemoryStore) -> dict[str, set[str]]:
     person_memory_ids: dict[str, set[str]] = {}
     if not hasattr(memory, "data_dir") or not hasattr(memory, "get_client"):
         return person_memory_ids
-    relationships_path = Path(memory.data_dir) / "relationships" / "models.json"
-    try:
-        raw_payload = json.loads(relationships_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        raw_payload = {}
-    if not isinstance(raw_payload, dict):
-        raw_payload = {}
+    relationships = get_relationship_store(
+        Path(memory.data_dir) / "relationships" / "models.json"
+    )
 
     try:
         collection = memory.get_client().get_or_create_collection(name="ego_episodes")
     except Exception:
         collection = None
 
-    for person, raw in raw_payload.items():
-        if not isinstance(person, str) or not isinstance(raw, dict):
-            continue
-        episode_ids = raw.get("shared_episode_ids", [])
+    for person in relationships.person_ids():
+        episode_ids = relationships.raw(person).get("shared_episode_ids", [])
         if not isinstance(episode_ids, list) or not episode_ids:
             continue
         if collection is None:
@@ -320,7 +315,7 @@ async def _handle_consolidate(
     ripening_deposits = 0
     if config is not None:
         ripening_stats = await feed_ripening_questions(
-            SelfModelStore(config.data_dir / "self_model.json"),
+            _self_model_store(config),
             memory,
             notion_store,
         )
@@ -543,7 +538,7 @@ def _handle_update_self(config: EgoConfig, args: dict[str, Any]) -> str:
     """Update self model."""
     field_name = _SELF_FIELD_ALIASES.get(args["field"], args["field"])
     value = args["value"]
-    store = SelfModelStore(config.data_dir / "self_model.json")
+    store = _self_model_store(config)
 
     if field_name == "new_question":
         if not isinstance(value, dict) or not str(value.get("question", "")).strip():
@@ -9,9 +9,15 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from ego_mcp import timezone_utils
+from ego_mcp._server_runtime import (
+    get_relationship_store,
+    get_request_context,
+    get_self_model_store,
+)
 from ego_mcp.absence import approx_duration_words
 from ego_mcp.config import EgoConfig
 from ego_mcp.memory import MemoryStore
+from ego_mcp.notion import NotionStore
 from ego_mcp.relationship import RelationshipStore
 from ego_mcp.relationship_wording import episode_words, history_words, trust_words
 from ego_mcp.self_model import (
@@ -19,14 +25,38 @@ from ego_mcp.self_model import (
     QUESTION_DORMANT_MAX_SALIENCE,
     SelfModelStore,
 )
-from ego_mcp.types import Memory
+from ego_mcp.types import Memory, Notion
 
 logger = logging.getLogger(__name__)
 
 
 def _self_model_store_for_memory(memory: MemoryStore) -> SelfModelStore:
-    """Create a self-model store using the same configured data directory as memory."""
-    return SelfModelStore(memory.data_dir / "self_model.json")
+    """Shared self-model store in the same configured data directory as memory."""
+    return get_self_model_store(memory.data_dir / "self_model.json")
+
+
+def _self_model_store(config: EgoConfig) -> SelfModelStore:
+    return get_self_model_store(config.data_dir / "self_model.json")
+
+
+async def _recent_memories(
+    memory: MemoryStore, n: int, category_filter: str | None = None
+) -> list[Memory]:
+    """``memory.list_recent`` through the current tool call's memo, when there is one."""
+    context = get_request_context()
+    if context is not None:
+        return await context.list_recent(memory, n, category_filter)
+    if category_filter is None:
+        return await memory.list_recent(n=n)
+    return await memory.list_recent(n=n, category_filter=category_filter)
+
+
+def _shared_notions(store: NotionStore) -> list[Notion]:
+    """``store.list_all()`` through the current tool call's memo, when there is one."""
+    context = get_request_context()
+    if context is not None:
+        return context.list_notions(store)
+    return store.list_all()
 
 
 def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
@@ -109,7 +139,7 @@ def _find_related_forgotten_questions(
 
 
 def _relationship_store(config: EgoConfig) -> RelationshipStore:
-    return RelationshipStore(config.data_dir / "relationships" / "models.json")
+    return get_relationship_store(config.data_dir / "relationships" / "models.json")
 
 
 def _frequency_words(last_7d: int, *, matched_person: bool) -> str:
@@ -146,7 +176,7 @@ def _last_interaction_words(timestamp: str, now: datetime) -> str:
 async def _summarize_conversation_tendency(
     memory: MemoryStore, person: str
 ) -> tuple[str, str, list[str], list[str]]:
-    conversations = await memory.list_recent(n=200, category_filter="conversation")
+    conversations = await _recent_memories(memory, 200, "conversation")
     person_lc = person.lower()
 
     filtered = [m for m in conversations if person_lc in m.content.lower()]
@@ -238,7 +268,9 @@ async def _derive_desire_modulation(
     recent_memories: list[Memory] | None = None,
 ) -> tuple[dict[str, float], dict[str, float], dict[str, float]]:
     """Infer transient desire modifiers from recent memory context."""
-    recent = recent_memories if recent_memories is not None else await memory.list_recent(n=30)
+    recent = (
+        recent_memories if recent_memories is not None else await _recent_memories(memory, 30)
+    )
     context_boosts: dict[str, float] = {}
     fading_important = (
         fading_important_questions
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from pathlib import Path
 
 from ego_mcp.episode import EpisodeStore
 from ego_mcp.impulse import ImpulseManager
+from ego_mcp.memory import MemoryStore
 from ego_mcp.notion import NotionStore
+from ego_mcp.relationship import RelationshipStore
+from ego_mcp.self_model import SelfModelStore
+from ego_mcp.types import Memory, Notion
 from ego_mcp.workspace_sync import WorkspaceMemorySync
 
 
@@ -32,10 +36,72 @@ def _impulse_manager_default() -> ImpulseManager:
 
 _notion_store_getter: Callable[[], NotionStore] = _notion_store_default
 _impulse_manager_getter: Callable[[], ImpulseManager] = _impulse_manager_default
+# One instance per JSON file, re-read only when the file changes on disk.
+_json_stores: dict[tuple[type, Path], RelationshipStore | SelfModelStore] = {}
 _tool_metadata: ContextVar[dict[str, object]] = ContextVar("tool_metadata", default={})
 _tool_completion_metadata: dict[str, object] = {}
 
 
+class RequestContext:
+    """Reads shared by the handler and completion telemetry of one tool call.
+
+    Recent memories are cached per category filter and served by slicing, since a
+    shorter ``list_recent`` result is a prefix of a longer one. The cache is dropped
+    when the collection count changes (a memory was saved or deleted); metadata-only
+    updates made during the call are not re-read. Notions are re-listed only after the
+    notion store saves.
+    """
+
+    def __init__(self) -> None:
+        self._recent: dict[str | None, tuple[int, list[Memory]]] = {}
+        self._memory_count: int | None = None
+        self._notions: tuple[NotionStore, int, list[Notion]] | None = None
+
+    async def list_recent(
+        self, memory: MemoryStore, n: int, category_filter: str | None = None
+    ) -> list[Memory]:
+        count_fn = getattr(memory, "collection_count", None)
+        count = count_fn() if callable(count_fn) else None
+        if not isinstance(count, int):
+            # Without a count there is no way to notice writes, so nothing is cached.
+            return await _list_recent(memory, n, category_filter)
+        if count != self._memory_count:
+            self._recent.clear()
+            self._memory_count = count
+        cached = self._recent.get(category_filter)
+        if cached is not None:
+            limit, memories = cached
+            if n <= limit or len(memories) < limit:
+                return memories[:n]
+        memories = await _list_recent(memory, n, category_filter)
+        self._recent[category_filter] = (n, memories)
+        return list(memories)
+
+    def list_notions(self, store: NotionStore) -> list[Notion]:
+        revision = getattr(store, "revision", None)
+        if not isinstance(revision, int):
+            return store.list_all()
+        cached = self._notions
+        if cached is not None and cached[0] is store and cached[1] == revision:
+            return list(cached[2])
+        notions = store.list_all()
+        self._notions = (store, revision, notions)
+        return list(notions)
+
+
+async def _list_recent(
+    memory: MemoryStore, n: int, category_filter: str | None
+) -> list[Memory]:
+    if category_filter is None:
+        return await memory.list_recent(n=n)
+    return await memory.list_recent(n=n, category_filter=category_filter)
+
+
+_request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
 def configure_runtime_accessors(
     *,
     workspace_sync_getter: Callable[[], WorkspaceMemorySync | None],
@@ -69,6 +135,43 @@ def get_impulse_manager() -> ImpulseManager:
     return _impulse_manager_getter()
 
 
+def get_relationship_store(path: Path) -> RelationshipStore:
+    return _shared_json_store(RelationshipStore, path)
+
+
+def get_self_model_store(path: Path) -> SelfModelStore:
+    return _shared_json_store(SelfModelStore, path)
+
+
+def _shared_json_store[S: (RelationshipStore, SelfModelStore)](
+    store_type: type[S], path: Path
+) -> S:
+    key = (store_type, path)
+    store = _json_stores.get(key)
+    if isinstance(store, store_type):
+        store.reload_if_changed()
+        return store
+    created = store_type(path)
+    _json_stores[key] = created
+    return created
+
+
+def clear_json_stores() -> None:
+    _json_stores.clear()
+
+
+def begin_request_context() -> Token[RequestContext | None]:
+    return _request_context.set(RequestContext())
+
+
+def end_request_context(token: Token[RequestContext | None]) -> None:
+    _request_context.reset(token)
+
+
+def get_request_context() -> RequestContext | None:
+    return _request_context.get()
+
+
 def reset_tool_metadata() -> None:
     _tool_metadata.set({})
 
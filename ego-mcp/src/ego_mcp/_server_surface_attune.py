@@ -47,7 +47,6 @@ from ego_mcp.memory import MemoryStore
 from ego_mcp.relationship_wording import history_words, trust_words
 from ego_mcp.ripening import should_show_ripening_presence
 from ego_mcp.scaffolds import SCAFFOLD_ATTUNE, compose_response, render
-from ego_mcp.self_model import SelfModelStore
 from ego_mcp.types import Memory, Notion
 
 _derive_desire_modulation_override: (
@@ -79,13 +78,15 @@ def _call_get_body_state() -> dict[str, Any]:
 
 
 def _list_notions_safe() -> list[Notion]:
+    from ego_mcp._server_context import _shared_notions
+
     try:
         store = get_notion_store()
     except Exception:
         return []
     return [
         notion
-        for notion in store.list_all()
+        for notion in _shared_notions(store)
         if isinstance(notion, Notion) and notion.id
     ]
 
@@ -148,7 +149,7 @@ async def _handle_attune(
     now = timezone_utils.now()
 
     # Resolve target person for this attune call
-    from ego_mcp._server_context import _relationship_store
+    from ego_mcp._server_context import _recent_memories, _relationship_store
     _ws = _relationship_store(config)
     person = args.get("person", config.companion_name)
     resolved = _ws.resolve_person(person)
@@ -156,7 +157,7 @@ async def _handle_attune(
         person = resolved
 
     # 1. Emotional texture from recent memories
-    recent_all = await memory.list_recent(n=30)
+    recent_all = await _recent_memories(memory, 30)
     emotional_texture = _format_recent_emotion_layer(recent_all, now=now)
 
     # 2. Desire currents (3-direction with EMA)
@@ -170,9 +171,10 @@ async def _handle_attune(
     from ego_mcp._server_context import (
         _derive_desire_modulation,
         _fading_important_questions,
+        _self_model_store,
     )
 
-    self_store = SelfModelStore(config.data_dir / "self_model.json")
+    self_store = _self_model_store(config)
     fading_questions = _fading_important_questions(memory, store=self_store)
     ripening_presence_shown = should_show_ripening_presence(
         self_store.get_unresolved_questions_with_salience(),
@@ -15,8 +15,11 @@ from ego_mcp._server_context import (
     _derive_desire_modulation,
     _fading_important_questions,
     _find_related_forgotten_questions,
+    _recent_memories,
     _relationship_snapshot,
     _relationship_store,
+    _self_model_store,
+    _shared_notions,
     _summarize_conversation_tendency,
 )
 from ego_mcp._server_emotion_formatting import (
@@ -73,7 +76,7 @@ from ego_mcp.scaffolds import (
     compose_response,
     render_with_data,
 )
-from ego_mcp.self_model import QUESTION_ACTIVE_MIN_SALIENCE, SelfModelStore
+from ego_mcp.self_model import QUESTION_ACTIVE_MIN_SALIENCE
 from ego_mcp.types import Memory, Notion
 
 _relationship_snapshot_override: (
@@ -200,7 +203,7 @@ def _notion_map() -> dict[str, Notion]:
         return {}
     return {
         notion.id: notion
-        for notion in store.list_all()
+        for notion in _shared_notions(store)
         if isinstance(notion, Notion) and notion.id
     }
 
@@ -409,7 +412,7 @@ async def _handle_wake_up(
     from ego_mcp import timezone_utils
 
     now = timezone_utils.now()
-    recent_all = await memory.list_recent(n=30)
+    recent_all = await _recent_memories(memory, 30)
     parts: list[str] = []
     desire.expire_emergent_desires()
 
@@ -470,9 +473,7 @@ async def _handle_wake_up(
             f'Last introspection ({since}):\n"{_tail_quote_for_introspection(latest_text)}"'
         )
     else:
-        recent_introspections = await memory.list_recent(
-            n=1, category_filter="introspection"
-        )
+        recent_introspections = await _recent_memories(memory, 1, "introspection")
         if recent_introspections:
             m = recent_introspections[0]
             since = m.timestamp[:16] if len(m.timestamp) >= 16 else m.timestamp
@@ -482,7 +483,7 @@ async def _handle_wake_up(
         else:
             parts.append("No introspection yet.")
 
-    self_store = SelfModelStore(config.data_dir / "self_model.json")
+    self_store = _self_model_store(config)
     entries = self_store.get_unresolved_questions_with_salience()
     ripened_block = ""
     ripened = pick_ripened_question(entries)
@@ -588,7 +589,7 @@ async def _handle_introspect(
     focus = (args or {}).get("focus", "default")
     if focus == "network":
         return _handle_introspect_network()
-    recent_all = await memory.list_recent(n=30)
+    recent_all = await _recent_memories(memory, 30)
     now = timezone_utils.now()
 
     # §10.1 emotional layers — week + month only (3-day is in attune)
@@ -596,7 +597,7 @@ async def _handle_introspect(
     month_layer = _format_month_emotion_layer(recent_all, now)
     emotion_section = f"{week_layer}\n{month_layer}"
 
-    self_store = SelfModelStore(config.data_dir / "self_model.json")
+    self_store = _self_model_store(config)
     fading_questions = _fading_important_questions(memory, store=self_store)
     (
         introspect_context_boosts,
@@ -890,7 +891,7 @@ async def _handle_consider_them(
     if absence_frame:
         data_lines.append(absence_frame)
     held_questions = shared_open_questions_for_person(
-        SelfModelStore(config.data_dir / "self_model.json"),
+        _self_model_store(config),
         person,
         limit=2,
     )
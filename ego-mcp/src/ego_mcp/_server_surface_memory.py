@@ -13,6 +13,7 @@ from ego_mcp._memory_serialization import memory_to_chromadb
 from ego_mcp._server_context import (
     _find_related_forgotten_questions,
     _relationship_store,
+    _self_model_store,
 )
 from ego_mcp._server_emotion_formatting import (
     _format_recall_entry,
@@ -45,7 +46,7 @@ from ego_mcp.scaffolds import (
     SCAFFOLD_REMEMBER_INTROSPECTION,
     compose_response,
 )
-from ego_mcp.self_model import SelfModelStore
+from ego_mcp.spans import span
 
 logger = logging.getLogger(__name__)
 _REMEMBER_DUPLICATE_PREFIX = "Not saved — very similar memory already exists."
@@ -380,7 +381,7 @@ async def _handle_remember(
                         )
                     if not reunion_question_section:
                         reunion_question_section = format_shared_question_line(
-                            SelfModelStore(config.data_dir / "self_model.json"),
+                            _self_model_store(config),
                             person,
                         )
             try:
@@ -601,8 +602,9 @@ async def _handle_recall(
     else:
         lines = [f"{len(results)} of ~{total_count} memories (showing top matches):"]
         now = timezone_utils.now()
-        for i, result in enumerate(results, 1):
-            lines.extend(_format_recall_entry(i, result, now=now).splitlines())
+        with span("formatting"):
+            for i, result in enumerate(results, 1):
+                lines.extend(_format_recall_entry(i, result, now=now).splitlines())
 
         notion_tags = sorted(
             {
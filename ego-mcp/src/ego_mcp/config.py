@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 _DEFAULT_MODELS: dict[str, str] = {
     "gemini": "gemini-embedding-001",
     "openai": "text-embedding-3-small",
+    "local": "all-MiniLM-L6-v2",
 }
 
 _API_KEY_ENV: dict[str, str] = {
@@ -28,9 +29,11 @@ class EgoConfig:
     """Immutable configuration loaded from environment variables.
 
     Environment variables:
-        EGO_MCP_EMBEDDING_PROVIDER: "gemini" or "openai" (default: "gemini")
+        EGO_MCP_EMBEDDING_PROVIDER: "gemini", "openai" or "local" (default: "gemini")
         EGO_MCP_EMBEDDING_MODEL: Model name (default: provider-dependent)
-        GEMINI_API_KEY / OPENAI_API_KEY: API key (required)
+        GEMINI_API_KEY / OPENAI_API_KEY: API key (required unless provider is "local")
+        EGO_MCP_MODEL_CACHE_DIR: Directory for local embedding models
+            (default: ~/.ego-mcp/models)
         EGO_MCP_DATA_DIR: Data directory (default: ~/.ego-mcp/data)
         EGO_MCP_COMPANION_NAME: Companion name (default: "Master")
         EGO_MCP_WORKSPACE_DIR: OpenClaw workspace root for Markdown sync (optional)
@@ -47,16 +50,17 @@ class EgoConfig:
     workspace_dir: Path | None
     timezone: str
     lexical_search_enabled: bool = True
+    model_cache_dir: Path | None = None
 
     @classmethod
     def from_env(cls) -> EgoConfig:
         """Construct EgoConfig from environment variables."""
         provider = os.environ.get("EGO_MCP_EMBEDDING_PROVIDER", "gemini").lower()
 
-        if provider not in ("gemini", "openai"):
+        if provider not in _DEFAULT_MODELS:
             raise ValueError(
                 f"Invalid embedding provider: '{provider}'. "
-                "Must be 'gemini' or 'openai'."
+                "Must be 'gemini', 'openai' or 'local'."
             )
 
         model = os.environ.get(
@@ -64,11 +68,15 @@ class EgoConfig:
             _DEFAULT_MODELS[provider],
         )
 
-        api_key_env = _API_KEY_ENV[provider]
-        api_key = os.environ.get(api_key_env, "")
-        if not api_key:
-            url = _API_KEY_URLS[provider]
-            raise ValueError(f"{api_key_env} is not set. Get your API key at: {url}")
+        api_key = ""
+        api_key_env = _API_KEY_ENV.get(provider)
+        if api_key_env is not None:
+            api_key = os.environ.get(api_key_env, "")
+            if not api_key:
+                url = _API_KEY_URLS[provider]
+                raise ValueError(
+                    f"{api_key_env} is not set. Get your API key at: {url}"
+                )
 
         data_dir_str = os.environ.get(
             "EGO_MCP_DATA_DIR",
@@ -90,6 +98,12 @@ class EgoConfig:
 
         lexical_search_raw = os.environ.get("EGO_MCP_LEXICAL_SEARCH", "").strip().lower()
         lexical_search_enabled = lexical_search_raw not in ("0", "false", "off")
+        model_cache_dir = Path(
+            os.environ.get(
+                "EGO_MCP_MODEL_CACHE_DIR",
+                str(Path.home() / ".ego-mcp" / "models"),
+            )
+        )
 
         return cls(
             embedding_provider=provider,
@@ -100,4 +114,5 @@ class EgoConfig:
             workspace_dir=workspace_dir,
             timezone=timezone,
             lexical_search_enabled=lexical_search_enabled,
+            model_cache_dir=model_cache_dir,
         )
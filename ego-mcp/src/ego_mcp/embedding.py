@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
 import httpx
+import numpy as np
 
 from ego_mcp.config import EgoConfig
+from ego_mcp.spans import timed
 
 # mypy: disable-error-code=import-not-found
 
@@ -144,12 +152,158 @@ class OpenAIEmbeddingProvider:
         raise last_error  # pragma: no cover
 
 
+# Models the local provider can fetch on first use: name -> (archive URL, sha256).
+_LOCAL_MODEL_ARCHIVES: dict[str, tuple[str, str]] = {
+    "all-MiniLM-L6-v2": (
+        "https://chroma-onnx-models.s3.amazonaws.com/all-MiniLM-L6-v2/onnx.tar.gz",
+        "913d7300ceae3b2dbc2c50d1de4baacab4be7b9380491c27fab7418616a16ec3",
+    ),
+}
+_LOCAL_MODEL_FILES = ("model.onnx", "tokenizer.json")
+_LOCAL_MAX_TOKENS = 256
+
+
+def _download_local_model(model: str, model_dir: Path) -> None:
+    """Fetch a known model archive, verify it and unpack its files into model_dir."""
+    if model not in _LOCAL_MODEL_ARCHIVES:
+        raise FileNotFoundError(
+            f"Local embedding model '{model}' not found in {model_dir}. "
+            f"Place {' and '.join(_LOCAL_MODEL_FILES)} there to use it offline."
+        )
+    url, expected_sha256 = _LOCAL_MODEL_ARCHIVES[model]
+    model_dir.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=model_dir.parent) as tmp:
+        archive = Path(tmp) / "model.tar.gz"
+        digest = hashlib.sha256()
+        with (
+            httpx.Client(timeout=60.0, follow_redirects=True) as client,
+            client.stream("GET", url) as resp,
+            archive.open("wb") as fh,
+        ):
+            resp.raise_for_status()
+            for chunk in resp.iter_bytes():
+                digest.update(chunk)
+                fh.write(chunk)
+        if digest.hexdigest() != expected_sha256:
+            raise ValueError(f"Checksum mismatch for local embedding model '{model}'")
+
+        extracted = Path(tmp) / "extracted"
+        with tarfile.open(archive) as tar:
+            tar.extractall(extracted, filter="data")
+        found = next(extracted.rglob(_LOCAL_MODEL_FILES[0]), None)
+        if found is None:
+            raise FileNotFoundError(f"{_LOCAL_MODEL_FILES[0]} missing from {url}")
+        model_dir.mkdir(exist_ok=True)
+        # model.onnx goes last: its presence marks the download as complete.
+        for item in sorted(found.parent.iterdir(), key=lambda p: p == found):
+            item.replace(model_dir / item.name)
+
+
+class LocalEmbeddingProvider:
+    """On-device sentence embeddings with ONNX Runtime on CPU.
+
+    ``<cache_dir>/<model>/`` holds ``model.onnx`` and ``tokenizer.json`` of a
+    sentence-transformers export. Known models are downloaded there once; after
+    that no network is used. Vectors are mean-pooled and unit-normalized.
+    """
+
+    def __init__(
+        self,
+        model: str = "all-MiniLM-L6-v2",
+        cache_dir: Path | None = None,
+        batch_size: int = 32,
+    ) -> None:
+        self._model = model
+        self._model_dir = (cache_dir or Path.home() / ".ego-mcp" / "models") / model
+        self._batch_size = batch_size
+        self._load_lock = threading.Lock()
+        self._runtime: tuple[Any, Any, frozenset[str]] | None = None
+        # One worker: inference is already multi-threaded inside ONNX Runtime,
+        # and a single queue keeps concurrent callers from oversubscribing cores.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ego-mcp-embedding"
+        )
+
+    async def close(self) -> None:
+        """Stop the inference worker thread."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in the inference worker thread."""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._embed_sync, texts)
+
+    def _load(self) -> tuple[Any, Any, frozenset[str]]:
+        with self._load_lock:
+            if self._runtime is not None:
+                return self._runtime
+            try:
+                import onnxruntime
+                from tokenizers import Tokenizer
+            except ImportError as exc:
+                raise RuntimeError(
+                    "The local embedding provider needs onnxruntime and tokenizers "
+                    "(pip install 'ego-mcp[local]')."
+                ) from exc
+
+            if not all((self._model_dir / f).exists() for f in _LOCAL_MODEL_FILES):
+                _download_local_model(self._model, self._model_dir)
+
+            tokenizer = Tokenizer.from_file(str(self._model_dir / "tokenizer.json"))
+            tokenizer.enable_truncation(max_length=_LOCAL_MAX_TOKENS)
+            # Pad to the longest text of each batch rather than a fixed length.
+            tokenizer.enable_padding(
+                pad_id=tokenizer.token_to_id("[PAD]") or 0, pad_token="[PAD]"
+            )
+            options = onnxruntime.SessionOptions()
+            options.log_severity_level = 3
+            options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+            session = onnxruntime.InferenceSession(
+                str(self._model_dir / "model.onnx"),
+                sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            inputs = frozenset(i.name for i in session.get_inputs())
+            self._runtime = (tokenizer, session, inputs)
+            return self._runtime
+
+    def _embed_sync(self, texts: list[str]) -> list[list[float]]:
+        tokenizer, session, inputs = self._load()
+        # Batch texts of similar length together so padding stays short.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors: list[list[float]] = [[] for _ in texts]
+        for start in range(0, len(order), self._batch_size):
+            batch = order[start : start + self._batch_size]
+            encodings = tokenizer.encode_batch([texts[i] for i in batch])
+            ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {"input_ids": ids, "attention_mask": mask}
+            if "token_type_ids" in inputs:
+                feeds["token_type_ids"] = np.zeros_like(ids)
+            hidden = session.run(None, feeds)[0]
+            weights = mask[..., np.newaxis].astype(np.float32)
+            pooled = (hidden * weights).sum(axis=1) / np.clip(
+                weights.sum(axis=1), 1e-9, None
+            )
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            for index, row in zip(batch, (pooled / norms).tolist()):
+                vectors[index] = row
+        return vectors
+
+
 def create_embedding_provider(config: EgoConfig) -> EmbeddingProvider:
     """Factory: create the appropriate embedding provider from config."""
     if config.embedding_provider == "gemini":
         return GeminiEmbeddingProvider(config.api_key, config.embedding_model)
     elif config.embedding_provider == "openai":
         return OpenAIEmbeddingProvider(config.api_key, config.embedding_model)
+    elif config.embedding_provider == "local":
+        return LocalEmbeddingProvider(config.embedding_model, config.model_cache_dir)
     else:
         raise ValueError(f"Unknown provider: {config.embedding_provider}")
 
@@ -176,6 +330,7 @@ class EgoEmbeddingFunction:
         """ChromaDB query embedding hook."""
         return self.__call__(input)
 
+    @timed("embedding")
     def __call__(self, input: Documents) -> Embeddings:
         """Synchronous embedding call for ChromaDB."""
         try:
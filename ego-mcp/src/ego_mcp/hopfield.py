@@ -7,12 +7,14 @@ Uses Modern Continuous Hopfield Networks (Ramsauer et al., 2020).
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 import numpy as np
 
-# mypy: disable-error-code=import-not-found
+from ego_mcp.spans import timed
 
+# mypy: disable-error-code=import-not-found
 
 
 logger = logging.getLogger(__name__)
@@ -54,14 +56,15 @@ class ModernHopfieldNetwork:
         self.n_iters = n_iters
         self._state: HopfieldState | None = None
 
+    @timed("hopfield")
     def store(
         self,
-        embeddings: list[list[float]],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
         ids: list[str],
         contents: list[str],
     ) -> None:
         """Store embedding patterns for retrieval."""
-        if not embeddings:
+        if len(embeddings) == 0:
             logger.warning("Hopfield: No embeddings provided, skipping store.")
             self._state = None
             return
@@ -83,6 +86,7 @@ class ModernHopfieldNetwork:
             self.beta,
         )
 
+    @timed("hopfield")
     def retrieve(self, query_embedding: list[float]) -> tuple[np.ndarray, list[float]]:
         """Retrieve via Hopfield update rule.
 
@@ -131,6 +135,7 @@ class ModernHopfieldNetwork:
         top_indices = np.argsort(arr)[-k:][::-1]
         return [(int(i), float(arr[i])) for i in top_indices]
 
+    @timed("hopfield")
     def recall_results(
         self, similarities: list[float], k: int = 5
     ) -> list[HopfieldRecallResult]:
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
-from typing import Any
+import json
+import os
+from pathlib import Path
+from typing import IO, Any
 
+import numpy as np
 
-def _cosine_distance(a: list[float], b: list[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    if na == 0.0 or nb == 0.0:
-        return 1.0
-    return 1.0 - (dot / (na * nb))
+# mypy: disable-error-code=import-not-found
+
+_INITIAL_CAPACITY = 64
+# Compact once garbage (tombstones, superseded log entries) outnumbers the live
+# rows and there is enough of it to matter.
+_MIN_GARBAGE_TO_COMPACT = 1_024
+_STATE_FILE = "collection.json"
+# Files written per generation, as (stem, suffix).
+_GENERATION_FILES = (("embeddings", "f32"), ("norms", "f32"), ("records", "jsonl"))
+# Metadata keys that recall, list_recent and list_anticipations filter on by
+# equality; each gets a value -> rows hash index.
+_INDEXED_KEYS = ("category", "emotion", "anticipated_at")
 
 
 def _match_where(metadata: dict[str, Any], where: dict[str, Any] | None) -> bool:
@@ -42,53 +49,485 @@ def _match_where(metadata: dict[str, Any], where: dict[str, Any] | None) -> bool
     return True
 
 
-@dataclass
-class _Record:
-    document: str
-    metadata: dict[str, Any]
-    embedding: list[float]
+def _where_clauses(where: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """Split ``where`` into single-key clauses that must all hold.
+
+    ``None`` means nothing can match, mirroring ``_match_where``.
+    """
+    if "$and" in where:
+        clauses = where["$and"]
+        if not isinstance(clauses, list):
+            return None
+        split: list[dict[str, Any]] = []
+        for clause in clauses:
+            if not isinstance(clause, dict):
+                continue
+            if "$and" in clause:
+                split.append(clause)
+                continue
+            split.extend({k: v} for k, v in clause.items())
+        return split
+    return [{k: v} for k, v in where.items()]
+
+
+def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 class Collection:
-    """In-memory collection with a Chroma-like interface."""
+    """Collection with a Chroma-like interface.
+
+    Embeddings live in one contiguous float32 matrix with precomputed norms, so
+    ``query`` scores every candidate with a single matrix-vector product. Rows
+    are addressed through an id -> row map; deletes leave tombstones that are
+    compacted away once garbage outnumbers the live rows.
+
+    With a ``path`` the collection persists there: the matrix and norms are
+    memory-mapped files, and documents and metadata are replayed from an
+    append-only JSONL log on first use. Compaction writes a new generation of
+    all three files and switches to it by rewriting ``collection.json``.
 
-    def __init__(self, embedding_function: Any) -> None:
+    Equality filters on ``_INDEXED_KEYS`` are answered from hash indexes, so
+    ``get``/``query`` only check the remaining clauses on the candidate rows.
+    """
+
+    def __init__(self, embedding_function: Any, path: Path | None = None) -> None:
         self._embedding_function = embedding_function
-        self._records: dict[str, _Record] = {}
+        self._path = path
+        self._loaded = path is None
+        self._generation = 0
+        self._log: IO[str] | None = None
+        self._log_entries = 0
+        self._row_by_id: dict[str, int] = {}
+        # Per-row state; a tombstoned row has id None and alive False.
+        self._ids: list[str | None] = []
+        self._documents: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._matrix: np.ndarray | None = None  # (capacity, dim) float32
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._indexes: dict[str, dict[Any, set[int]]] = {
+            key: {} for key in _INDEXED_KEYS
+        }
+
+    @property
+    def _size(self) -> int:
+        return len(self._ids)
+
+    # --- storage ---
+
+    def _file(self, stem: str, suffix: str, generation: int | None = None) -> Path:
+        assert self._path is not None
+        gen = self._generation if generation is None else generation
+        return self._path / f"{stem}.{gen}.{suffix}"
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        assert self._path is not None
+        try:
+            state = json.loads((self._path / _STATE_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        self._generation = int(state["generation"])
+        dim = int(state["dim"])
+        embeddings = self._file("embeddings", "f32")
+        capacity = embeddings.stat().st_size // (4 * dim) if embeddings.exists() else 0
+        capacity = max(capacity, _INITIAL_CAPACITY)
+        self._map(capacity, dim)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+        log_path = self._file("records", "jsonl")
+        if not log_path.exists():
+            return
+        valid_bytes = 0
+        with log_path.open("rb") as fh:
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    break
+                self._replay(entry)
+                self._log_entries += 1
+                valid_bytes += len(raw)
+        if valid_bytes < log_path.stat().st_size:
+            # Drop a torn final write so later appends start on a clean line.
+            with log_path.open("r+b") as fh:
+                fh.truncate(valid_bytes)
+
+    def _replay(self, entry: dict[str, Any]) -> None:
+        rec_id = entry["id"]
+        op = entry["op"]
+        if op == "add":
+            row = int(entry["row"])
+            if row == self._size:
+                self._ids.append(rec_id)
+                self._documents.append(entry["document"])
+                self._metadatas.append(entry["metadata"])
+            else:
+                self._unindex(row)
+                self._ids[row] = rec_id
+                self._documents[row] = entry["document"]
+                self._metadatas[row] = entry["metadata"]
+            self._index(row)
+            self._row_by_id[rec_id] = row
+            self._alive[row] = True
+        elif op == "update":
+            if rec_id in self._row_by_id:
+                self._update_metadata(self._row_by_id[rec_id], entry["metadata"])
+        elif op == "delete":
+            if rec_id in self._row_by_id:
+                self._tombstone(self._row_by_id.pop(rec_id))
+
+    def _append_log(self, entries: list[dict[str, Any]]) -> None:
+        if self._path is None or not entries:
+            return
+        if self._log is None:
+            self._log = self._file("records", "jsonl").open("a", encoding="utf-8")
+        self._log.write(
+            "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        )
+        self._log.flush()
+        self._log_entries += len(entries)
+
+    def _map(self, capacity: int, dim: int, generation: int | None = None) -> None:
+        """(Re)map the embedding and norm files, growing them to ``capacity`` rows."""
+        arrays = []
+        for stem, shape in (("embeddings", (capacity, dim)), ("norms", (capacity,))):
+            path = self._file(stem, "f32", generation)
+            with path.open("ab") as fh:
+                if fh.tell() < 4 * int(np.prod(shape)):
+                    fh.truncate(4 * int(np.prod(shape)))
+            arrays.append(np.memmap(path, dtype=np.float32, mode="r+", shape=shape))
+        self._matrix, self._norms = arrays
+
+    def _reserve(self, rows: int, dim: int) -> None:
+        if self._matrix is not None and self._matrix.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match collection "
+                f"dimensionality {self._matrix.shape[1]}"
+            )
+        current = self._matrix.shape[0] if self._matrix is not None else 0
+        if rows <= current:
+            return
+        capacity = max(current, _INITIAL_CAPACITY)
+        while capacity < rows:
+            capacity *= 2
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+        if self._path is not None:
+            if self._matrix is None:
+                self._path.mkdir(parents=True, exist_ok=True)
+                _write_json_atomic(
+                    self._path / _STATE_FILE,
+                    {"dim": dim, "generation": self._generation},
+                )
+            self._map(capacity, dim)
+        else:
+            matrix = np.zeros((capacity, dim), dtype=np.float32)
+            norms = np.zeros(capacity, dtype=np.float32)
+            if self._matrix is not None:
+                matrix[: self._size] = self._matrix[: self._size]
+                norms[: self._size] = self._norms[: self._size]
+            self._matrix, self._norms = matrix, norms
+        self._alive = alive
+
+    def _tombstone(self, row: int) -> None:
+        self._unindex(row)
+        self._ids[row] = None
+        self._documents[row] = ""
+        self._metadatas[row] = {}
+        self._alive[row] = False
+
+    def _compact_if_needed(self) -> None:
+        live = len(self._row_by_id)
+        garbage = self._size - live
+        if self._path is not None:
+            garbage = max(garbage, self._log_entries - live)
+        if garbage >= _MIN_GARBAGE_TO_COMPACT and garbage > live:
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = self._live_rows()
+        rows = keep.tolist()
+        ids = [self._ids[row] for row in rows]
+        documents = [self._documents[row] for row in rows]
+        metadatas = [self._metadatas[row] for row in rows]
+        if self._matrix is not None and self._path is not None:
+            self._rewrite_generation(keep, ids, documents, metadatas)
+        elif self._matrix is not None:
+            self._matrix[: len(keep)] = self._matrix[keep]
+            self._norms[: len(keep)] = self._norms[keep]
+        self._alive[: len(keep)] = True
+        self._alive[len(keep) :] = False
+        self._ids, self._documents, self._metadatas = ids, documents, metadatas
+        self._row_by_id = {
+            rec_id: row for row, rec_id in enumerate(ids) if rec_id is not None
+        }
+        self._indexes = {key: {} for key in self._indexes}
+        for row in range(len(ids)):
+            self._index(row)
+
+    def _rewrite_generation(
+        self,
+        keep: np.ndarray,
+        ids: list[str | None],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        assert self._path is not None and self._matrix is not None
+        old_generation = self._generation
+        new_generation = old_generation + 1
+        dim = self._matrix.shape[1]
+        matrix, norms = self._matrix[keep], self._norms[keep]
+        # Also drop any half-written files a crash left behind.
+        for stem, suffix in _GENERATION_FILES:
+            self._file(stem, suffix, new_generation).unlink(missing_ok=True)
+        self._map(max(len(keep), _INITIAL_CAPACITY), dim, new_generation)
+        self._matrix[: len(keep)] = matrix
+        self._norms[: len(keep)] = norms
+        for mapped in (self._matrix, self._norms):
+            if isinstance(mapped, np.memmap):
+                mapped.flush()
+        with self._file("records", "jsonl", new_generation).open(
+            "w", encoding="utf-8"
+        ) as fh:
+            for row, (rec_id, document, metadata) in enumerate(
+                zip(ids, documents, metadatas)
+            ):
+                entry = {
+                    "op": "add",
+                    "id": rec_id,
+                    "row": row,
+                    "document": document,
+                    "metadata": metadata,
+                }
+                fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        _write_json_atomic(
+            self._path / _STATE_FILE, {"dim": dim, "generation": new_generation}
+        )
+
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self._generation = new_generation
+        self._log_entries = len(ids)
+        alive = np.zeros(self._matrix.shape[0], dtype=bool)
+        alive[: len(self._alive)] = self._alive[: self._matrix.shape[0]]
+        self._alive = alive
+        for stem, suffix in _GENERATION_FILES:
+            self._file(stem, suffix, old_generation).unlink(missing_ok=True)
+
+    # --- metadata indexes ---
+
+    def _index(self, row: int) -> None:
+        metadata = self._metadatas[row]
+        for key, index in list(self._indexes.items()):
+            try:
+                index.setdefault(metadata.get(key), set()).add(row)
+            except TypeError:
+                # Unhashable values: stop indexing this key and scan instead.
+                del self._indexes[key]
+
+    def _unindex(self, row: int) -> None:
+        metadata = self._metadatas[row]
+        for key, index in self._indexes.items():
+            rows = index.get(metadata.get(key))
+            if rows is None:
+                continue
+            rows.discard(row)
+            if not rows:
+                del index[metadata.get(key)]
+
+    def _update_metadata(self, row: int, patch: dict[str, Any]) -> None:
+        reindex = any(key in self._indexes for key in patch)
+        if reindex:
+            self._unindex(row)
+        self._metadatas[row].update(patch)
+        if reindex:
+            self._index(row)
+
+    def _indexed_rows(self, clause: dict[str, Any]) -> set[int] | None:
+        """Rows satisfying a single-key clause, or None if no index covers it."""
+        ((key, condition),) = clause.items()
+        index = self._indexes.get(key)
+        if index is None:
+            return None
+        if not isinstance(condition, dict):
+            return set(index.get(condition, ()))
+        if not condition or not set(condition) <= {"$eq", "$ne"}:
+            return None
+        rows: set[int] | None = None
+        for op, expected in condition.items():
+            if op == "$eq":
+                matched = set(index.get(expected, ()))
+            else:
+                matched = set().union(
+                    *(bucket for value, bucket in index.items() if value != expected)
+                )
+            rows = matched if rows is None else rows & matched
+        return rows
+
+    def _rows_matching(
+        self, where: dict[str, Any] | None, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Rows that satisfy ``where``, in the order of ``rows`` (default: all)."""
+        if where is None:
+            return self._live_rows() if rows is None else rows
+        clauses = _where_clauses(where)
+        if clauses is None:
+            return np.zeros(0, dtype=np.intp)
+        candidates: set[int] | None = None
+        residual: list[dict[str, Any]] = []
+        for clause in clauses:
+            matched = self._indexed_rows(clause) if len(clause) == 1 else None
+            if matched is None:
+                residual.append(clause)
+            else:
+                candidates = matched if candidates is None else candidates & matched
+        if candidates is None:
+            ordered = self._live_rows() if rows is None else rows
+        elif rows is None:
+            ordered = np.array(sorted(candidates), dtype=np.intp)
+        else:
+            ordered = np.array(
+                [row for row in rows.tolist() if row in candidates], dtype=np.intp
+            )
+        if not residual:
+            return ordered
+        metadatas = self._metadatas
+        return np.fromiter(
+            (
+                row
+                for row in ordered.tolist()
+                if all(_match_where(metadatas[row], c) for c in residual)
+            ),
+            dtype=np.intp,
+        )
+
+    # --- reads and writes ---
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._alive[: self._size])
 
     def add(
         self,
         ids: list[str],
         documents: list[str],
         metadatas: list[dict[str, Any]] | None = None,
-        embeddings: list[list[float]] | None = None,
+        embeddings: Any = None,
     ) -> None:
+        self._ensure_loaded()
+        if not ids:
+            return
         metas = metadatas or [{} for _ in documents]
         embs = embeddings
         if embs is None:
             embs = self._embedding_function(documents)
+        vectors = np.asarray(embs, dtype=np.float32).reshape(len(ids), -1)
+        self._reserve(self._size + len(ids), vectors.shape[1])
+        assert self._matrix is not None
+        norms = np.linalg.norm(vectors, axis=1)
+        entries: list[dict[str, Any]] = []
         for i, rec_id in enumerate(ids):
-            self._records[rec_id] = _Record(
-                document=documents[i],
-                metadata=dict(metas[i]),
-                embedding=list(embs[i]),
+            row = self._row_by_id.get(rec_id)
+            if row is None:
+                row = self._size
+                self._row_by_id[rec_id] = row
+                self._ids.append(rec_id)
+                self._documents.append(documents[i])
+                self._metadatas.append(dict(metas[i]))
+            else:
+                self._unindex(row)
+                self._documents[row] = documents[i]
+                self._metadatas[row] = dict(metas[i])
+            self._index(row)
+            self._matrix[row] = vectors[i]
+            self._norms[row] = norms[i]
+            self._alive[row] = True
+            entries.append(
+                {
+                    "op": "add",
+                    "id": rec_id,
+                    "row": row,
+                    "document": documents[i],
+                    "metadata": self._metadatas[row],
+                }
             )
+        # The mapped rows are written before the log entries that refer to them.
+        self._append_log(entries)
+        self._compact_if_needed()
 
     def update(
         self,
         ids: list[str],
         metadatas: list[dict[str, Any]] | None = None,
     ) -> None:
+        self._ensure_loaded()
         metas = metadatas or []
+        entries: list[dict[str, Any]] = []
         for i, rec_id in enumerate(ids):
-            rec = self._records.get(rec_id)
-            if rec is None:
+            row = self._row_by_id.get(rec_id)
+            if row is None:
                 continue
             if i < len(metas):
-                rec.metadata.update(metas[i])
+                self._update_metadata(row, metas[i])
+                entries.append({"op": "update", "id": rec_id, "metadata": metas[i]})
+        self._append_log(entries)
+        self._compact_if_needed()
+
+    def delete(
+        self,
+        ids: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> None:
+        self._ensure_loaded()
+        if ids is not None:
+            rows = np.array(
+                [self._row_by_id[i] for i in ids if i in self._row_by_id],
+                dtype=np.intp,
+            )
+            rows = self._rows_matching(where, rows)
+        elif where is not None:
+            rows = self._rows_matching(where)
+        else:
+            return
+        entries: list[dict[str, Any]] = []
+        for row in rows.tolist():
+            rec_id = self._ids[row]
+            if rec_id is None:
+                continue
+            del self._row_by_id[rec_id]
+            self._tombstone(row)
+            entries.append({"op": "delete", "id": rec_id})
+        self._append_log(entries)
+        self._compact_if_needed()
 
     def count(self) -> int:
-        return len(self._records)
+        self._ensure_loaded()
+        return len(self._row_by_id)
+
+    def _result_fields(
+        self, rows: list[int], include_fields: set[str]
+    ) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if "documents" in include_fields:
+            out["documents"] = [self._documents[row] for row in rows]
+        if "metadatas" in include_fields:
+            out["metadatas"] = [dict(self._metadatas[row]) for row in rows]
+        if "embeddings" in include_fields:
+            # One fancy-indexed copy, shaped (n, dim) like Chroma's NumPy result.
+            out["embeddings"] = (
+                np.asarray(self._matrix[rows])
+                if self._matrix is not None
+                else np.zeros((0, 0))
+            )
+        return out
 
     def get(
         self,
@@ -97,43 +536,32 @@ class Collection:
         limit: int | None = None,
         include: list[str] | None = None,
     ) -> dict[str, Any]:
+        self._ensure_loaded()
         include_fields = set(include or ["documents", "metadatas"])
-        result_ids: list[str] = []
-        docs: list[str] = []
-        metas: list[dict[str, Any]] = []
-        embs: list[list[float]] = []
-
-        ordered_ids = ids if ids is not None else list(self._records.keys())
-        for rec_id in ordered_ids:
-            rec = self._records.get(rec_id)
-            if rec is None:
-                continue
-            if not _match_where(rec.metadata, where):
-                continue
-            result_ids.append(rec_id)
-            docs.append(rec.document)
-            metas.append(dict(rec.metadata))
-            embs.append(list(rec.embedding))
-            if limit is not None and len(result_ids) >= limit:
-                break
-
-        out: dict[str, Any] = {"ids": result_ids}
-        if "documents" in include_fields:
-            out["documents"] = docs
-        if "metadatas" in include_fields:
-            out["metadatas"] = metas
-        if "embeddings" in include_fields:
-            out["embeddings"] = embs
+        requested = None
+        if ids is not None:
+            requested = np.array(
+                [self._row_by_id[i] for i in ids if i in self._row_by_id],
+                dtype=np.intp,
+            )
+        rows = self._rows_matching(where, requested)
+        if limit is not None:
+            rows = rows[:limit]
+        row_list = rows.tolist()
+
+        out: dict[str, Any] = {"ids": [self._ids[row] for row in row_list]}
+        out.update(self._result_fields(row_list, include_fields))
         return out
 
     def query(
         self,
         query_texts: list[str] | None = None,
-        query_embeddings: list[list[float]] | None = None,
+        query_embeddings: Any = None,
         n_results: int = 5,
         where: dict[str, Any] | None = None,
         include: list[str] | None = None,
     ) -> dict[str, Any]:
+        self._ensure_loaded()
         include_fields = set(include or ["documents", "metadatas", "distances"])
         if query_embeddings is not None and len(query_embeddings) > 0:
             q = query_embeddings[0]
@@ -142,43 +570,82 @@ class Collection:
         else:
             q = []
 
-        scored: list[tuple[str, float, _Record]] = []
-        for rec_id, rec in self._records.items():
-            if not _match_where(rec.metadata, where):
-                continue
-            scored.append((rec_id, _cosine_distance(q, rec.embedding), rec))
-        scored.sort(key=lambda x: x[1])
-        top = scored[: max(0, n_results)]
-
-        ids = [x[0] for x in top]
-        docs = [x[2].document for x in top]
-        metas = [dict(x[2].metadata) for x in top]
-        dists = [x[1] for x in top]
+        rows = self._rows_matching(where)
+        k = min(max(0, n_results), len(rows))
+        top_rows: list[int] = []
+        dists: list[float] = []
+        if k > 0:
+            assert self._matrix is not None
+            distances = self._distances(np.asarray(q, dtype=np.float32), rows)
+            if k < len(rows):
+                picked = np.argpartition(distances, k - 1)[:k]
+            else:
+                picked = np.arange(len(rows))
+            # Nearest first; ties keep insertion order.
+            picked = picked[np.lexsort((rows[picked], distances[picked]))]
+            top_rows = rows[picked].tolist()
+            dists = distances[picked].astype(float).tolist()
 
-        out: dict[str, Any] = {"ids": [ids]}
-        if "documents" in include_fields:
-            out["documents"] = [docs]
-        if "metadatas" in include_fields:
-            out["metadatas"] = [metas]
+        out: dict[str, Any] = {"ids": [[self._ids[row] for row in top_rows]]}
+        fields = self._result_fields(top_rows, include_fields)
+        for key, value in fields.items():
+            out[key] = [value]
         if "distances" in include_fields:
             out["distances"] = [dists]
         return out
 
+    def _distances(self, q: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Cosine distance from ``q`` to each of ``rows``; 1.0 for zero vectors."""
+        assert self._matrix is not None
+        q_norm = float(np.linalg.norm(q)) if q.size else 0.0
+        if q_norm == 0.0 or q.shape[0] != self._matrix.shape[1]:
+            return np.ones(len(rows), dtype=np.float32)
+        if len(rows) == self._size:
+            # Nothing filtered or deleted: score the matrix prefix without a copy.
+            dots = self._matrix[: self._size] @ q
+            norms = self._norms[: self._size]
+        else:
+            dots = self._matrix[rows] @ q
+            norms = self._norms[rows]
+        denom = norms * q_norm
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances: np.ndarray = 1.0 - dots / denom
+        distances[denom == 0.0] = 1.0
+        return distances
+
 
 _STORE_BY_PATH: dict[str, dict[str, Collection]] = {}
 
 
 class PersistentClient:
-    """Path-scoped in-memory client compatible with required APIs."""
+    """Path-scoped client whose collections persist under ``path``.
+
+    Collections are opened lazily and shared by every client on the same path,
+    so a process has a single writer per collection.
+    """
 
     def __init__(self, path: str) -> None:
         self._path = path
         _STORE_BY_PATH.setdefault(path, {})
 
+    def _collection_dir(self, name: str) -> Path:
+        return Path(self._path) / "local_chromadb" / name
+
     def get_or_create_collection(
         self, name: str, embedding_function: Any
     ) -> Collection:
         collections = _STORE_BY_PATH[self._path]
         if name not in collections:
-            collections[name] = Collection(embedding_function)
+            collections[name] = Collection(
+                embedding_function, self._collection_dir(name)
+            )
+        return collections[name]
+
+    def get_collection(self, name: str, embedding_function: Any = None) -> Collection:
+        collections = _STORE_BY_PATH[self._path]
+        if name not in collections:
+            directory = self._collection_dir(name)
+            if not (directory / _STATE_FILE).exists():
+                raise ValueError(f"Collection {name} does not exist.")
+            collections[name] = Collection(embedding_function, directory)
         return collections[name]
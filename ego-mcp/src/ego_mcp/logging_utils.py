@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from ego_mcp import timezone_utils
 
 TRACE_LEVEL_NUM = 5
 logging.addLevelName(TRACE_LEVEL_NUM, "TRACE")
 
+type OverflowPolicy = Literal["block", "drop_debug", "sample"]
+
+_DEFAULT_QUEUE_SIZE = 10_000
+_DEFAULT_OVERFLOW: OverflowPolicy = "drop_debug"
+_BATCH_SIZE = 256
+# Under the "sample" policy one in this many INFO records is still queued while full.
+_SAMPLE_EVERY = 10
+# A blocked put re-checks the writer thread this often so a dead writer cannot hang it.
+_BLOCKED_PUT_POLL_SECONDS = 0.5
+
 
 class JsonLineFormatter(logging.Formatter):
     """Format log records as JSON Lines."""
@@ -62,8 +77,10 @@ class JsonLineFormatter(logging.Formatter):
                 continue
             payload[key] = value
 
-        if record.exc_info:
-            payload["exception"] = self.formatException(record.exc_info)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
         if record.stack_info:
             payload["stack"] = record.stack_info
 
@@ -84,6 +101,183 @@ def _parse_log_level(value: str | None) -> int:
     return logging.INFO
 
 
+def _parse_overflow_policy(value: str | None) -> OverflowPolicy:
+    normalized = (value or "").strip().lower()
+    if normalized == "block":
+        return "block"
+    if normalized == "sample":
+        return "sample"
+    return _DEFAULT_OVERFLOW
+
+
+def _parse_queue_size(value: str | None) -> int:
+    try:
+        size = int(value) if value else _DEFAULT_QUEUE_SIZE
+    except ValueError:
+        return _DEFAULT_QUEUE_SIZE
+    return size if size > 0 else _DEFAULT_QUEUE_SIZE
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Hand records to the writer thread without formatting or writing them.
+
+    When the queue is full, ``overflow`` decides what the logging thread does:
+    ``block`` waits for space, ``drop_debug`` drops records below INFO and waits for
+    the rest, and ``sample`` additionally keeps only one in ``_SAMPLE_EVERY`` INFO
+    records. WARNING and above always wait, unless ``writer_alive`` reports that
+    nothing will ever drain the queue; those records are counted as dropped.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord | None],
+        overflow: OverflowPolicy,
+        *,
+        writer_alive: Callable[[], bool] | None = None,
+    ) -> None:
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self._writer_alive = writer_alive or (lambda: True)
+        self.dropped = 0
+        self._sampled = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, keep the record unformatted for JsonLineFormatter;
+        # only resolve what may not survive the hand-off (args, live tracebacks).
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        log_queue: queue.Queue[logging.LogRecord | None] = self.queue  # type: ignore[assignment]
+        try:
+            log_queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        with self._dropped_lock:
+            if self._should_drop(record.levelno):
+                self.dropped += 1
+                return
+        while self._writer_alive():
+            try:
+                log_queue.put(record, timeout=_BLOCKED_PUT_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def _should_drop(self, levelno: int) -> bool:
+        if self.overflow == "block" or levelno >= logging.WARNING:
+            return False
+        if levelno < logging.INFO:
+            return True
+        if self.overflow != "sample":
+            return False
+        self._sampled += 1
+        return self._sampled % _SAMPLE_EVERY != 0
+
+
+class JsonlLogWriter:
+    """Background thread that formats queued records and appends them in batches."""
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord | None],
+        log_path: Path,
+        formatter: logging.Formatter,
+        *,
+        batch_size: int = _BATCH_SIZE,
+    ) -> None:
+        self._queue = log_queue
+        self._formatter = formatter
+        self._batch_size = batch_size
+        self._stream = log_path.open("a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._run, name="ego-mcp-log-writer", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Write everything already queued, then close the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._stream.close()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            if records:
+                self._write(records)
+            if len(records) != len(batch):
+                return
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        lines: list[str] = []
+        for record in records:
+            try:
+                lines.append(self._formatter.format(record))
+            except Exception as exc:
+                # Any failure here would otherwise end the writer thread and, once the
+                # queue fills, block every logging call.
+                print(
+                    f"ego-mcp: could not format log record {record.msg!r}: {exc!r}",
+                    file=sys.stderr,
+                )
+        if not lines:
+            return
+        try:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+        except OSError as exc:
+            print(f"ego-mcp: could not write log file: {exc}", file=sys.stderr)
+
+
+_active_writer: JsonlLogWriter | None = None
+_active_handler: BoundedQueueHandler | None = None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records to disk and stop the writer thread."""
+    global _active_writer, _active_handler
+    handler, writer = _active_handler, _active_writer
+    _active_handler = _active_writer = None
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+        if handler.dropped:
+            record = logging.getLogger(__name__).makeRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                "Dropped log records under queue pressure",
+                (),
+                None,
+                extra={"dropped_records": handler.dropped},
+            )
+            handler.enqueue(handler.prepare(record))
+    if writer is not None:
+        writer.stop()
+
+
 def get_log_path() -> Path:
     log_dir = Path(os.getenv("EGO_MCP_LOG_DIR", "/tmp")).expanduser()
     date_stamp = timezone_utils.now().strftime("%Y-%m-%d")
@@ -99,14 +293,27 @@ def configure_logging() -> Path:
     root = logging.getLogger()
     root.setLevel(log_level)
 
+    shutdown_logging()
     for handler in list(root.handlers):
         root.removeHandler(handler)
 
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(JsonLineFormatter())
-    root.addHandler(file_handler)
+    # Records are only queued on the logging thread; a background writer formats and
+    # appends them, so tool-call latency does not include JSON encoding or disk I/O.
+    log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(
+        _parse_queue_size(os.getenv("EGO_MCP_LOG_QUEUE_SIZE"))
+    )
+    writer = JsonlLogWriter(log_queue, log_path, JsonLineFormatter())
+    queue_handler = BoundedQueueHandler(
+        log_queue,
+        _parse_overflow_policy(os.getenv("EGO_MCP_LOG_OVERFLOW")),
+        writer_alive=writer.is_alive,
+    )
+    queue_handler.setLevel(log_level)
+    writer.start()
+    root.addHandler(queue_handler)
 
+    global _active_writer, _active_handler
+    _active_writer, _active_handler = writer, queue_handler
     logging.captureWarnings(True)
     return log_path
 
@@ -138,3 +345,6 @@ def install_global_exception_hooks() -> None:
 
     sys.excepthook = _sys_hook
     threading.excepthook = _thread_hook
+
+
+atexit.register(shutdown_logging)
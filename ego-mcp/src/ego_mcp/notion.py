@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 from ego_mcp import timezone_utils
+from ego_mcp.spans import timed
 from ego_mcp.types import Emotion, Memory, MetaField, Notion
 
 _PLACEHOLDER_NOTION_LABEL = re.compile(r"^untitled\s*\([^)]+\)$", re.IGNORECASE)
@@ -132,8 +133,15 @@ class NotionStore:
     def __init__(self, path: Path) -> None:
         self._path = path
         self._data: dict[str, dict[str, Any]] = {}
+        self._revision = 0
         self._load()
 
+    @property
+    def revision(self) -> int:
+        """Incremented on every save, so readers can tell their copy is stale."""
+        return self._revision
+
+    @timed("notion_io")
     def _load(self) -> None:
         if not self._path.exists():
             self._data = {}
@@ -145,7 +153,9 @@ class NotionStore:
             return
         self._data = parsed if isinstance(parsed, dict) else {}
 
+    @timed("notion_io")
     def _save(self) -> None:
+        self._revision += 1
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._path.write_text(
             json.dumps(self._data, ensure_ascii=False, indent=2),
@@ -183,13 +193,18 @@ class NotionStore:
         )
 
     def save(self, notion: Notion) -> None:
-        if not notion.id:
-            notion.id = f"notion_{uuid.uuid4().hex[:12]}"
-        if not notion.created:
-            notion.created = _now_iso()
-        if not notion.last_reinforced:
-            notion.last_reinforced = notion.created
-        self._data[notion.id] = self._to_payload(notion)
+        self.save_many([notion])
+
+    def save_many(self, notions: list[Notion]) -> None:
+        """Save several notions with a single write of the JSON file."""
+        for notion in notions:
+            if not notion.id:
+                notion.id = f"notion_{uuid.uuid4().hex[:12]}"
+            if not notion.created:
+                notion.created = _now_iso()
+            if not notion.last_reinforced:
+                notion.last_reinforced = notion.created
+            self._data[notion.id] = self._to_payload(notion)
         self._save()
 
     def get_by_id(self, notion_id: str) -> Notion | None:
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Any
 
 from ego_mcp import timezone_utils
+from ego_mcp._file_version import FileVersion, file_unchanged
+from ego_mcp.spans import timed
 from ego_mcp.types import RelationshipModel
 
 INTERACTION_LOG_MAX = 200
@@ -44,10 +46,13 @@ class RelationshipStore:
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        self._version: FileVersion | None = None
         self._data: dict[str, dict[str, Any]] = {}
         self._load()
 
+    @timed("relationship_io")
     def _load(self) -> None:
+        self._version = FileVersion.of(self._path)
         if not self._path.exists():
             self._data = {}
             return
@@ -57,12 +62,22 @@ class RelationshipStore:
         except (json.JSONDecodeError, OSError):
             self._data = {}
 
+    @timed("relationship_io")
     def _save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._path.write_text(
             json.dumps(self._data, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
+        self._version = FileVersion.of(self._path)
+
+    @timed("relationship_io")
+    def reload_if_changed(self) -> bool:
+        """Re-read the file if something else rewrote it since the last load or save."""
+        if file_unchanged(self._path, self._version):
+            return False
+        self._load()
+        return True
 
     @staticmethod
     def _default_model(person_id: str) -> dict[str, Any]:
@@ -217,6 +232,9 @@ class RelationshipStore:
         self._save()
         return self.get(person_id)
 
+    def person_ids(self) -> list[str]:
+        return list(self._data)
+
     def resolve_person(self, query: str) -> str | None:
         """Exact-match alias or canonical person_id resolution.
 
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from ego_mcp import timezone_utils
+from ego_mcp._file_version import FileVersion, file_unchanged
 from ego_mcp.types import SelfModel
 
 _UPDATABLE_FIELDS = frozenset(
@@ -85,6 +86,7 @@ class SelfModelStore:
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        self._version: FileVersion | None = None
         self._data: dict[str, Any] = {}
         self._load()
 
@@ -97,6 +99,7 @@ class SelfModelStore:
         return data
 
     def _load(self) -> None:
+        self._version = FileVersion.of(self._path)
         if not self._path.exists():
             self._data = self._default_data()
             return
@@ -172,6 +175,14 @@ class SelfModelStore:
             json.dumps(self._data, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
+        self._version = FileVersion.of(self._path)
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the file if something else rewrote it since the last load or save."""
+        if file_unchanged(self._path, self._version):
+            return False
+        self._load()
+        return True
 
     def get(self) -> SelfModel:
         unresolved = self._data.get("unresolved_questions", [])
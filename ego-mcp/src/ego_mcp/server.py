@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from typing import Any, cast
 
 from mcp.server import Server
@@ -14,11 +15,17 @@ import ego_mcp._server_handlers as _handlers
 from ego_mcp._server_backend_handlers import (
     pop_tool_context as pop_backend_tool_context,
 )
+from ego_mcp._server_context import _recent_memories
 from ego_mcp._server_param_validation import (
     ToolParameterFormatError,
     validate_tool_arguments,
 )
-from ego_mcp._server_runtime import get_tool_metadata, reset_tool_metadata
+from ego_mcp._server_runtime import (
+    begin_request_context,
+    end_request_context,
+    get_tool_metadata,
+    reset_tool_metadata,
+)
 from ego_mcp._server_surface_memory import pop_tool_context as pop_memory_tool_context
 from ego_mcp._server_tools import BACKEND_TOOLS, SURFACE_TOOLS
 from ego_mcp.config import EgoConfig
@@ -26,13 +33,18 @@ from ego_mcp.consolidation import ConsolidationEngine
 from ego_mcp.desire import DesireEngine
 from ego_mcp.desire_catalog import DesireConfigurationError
 from ego_mcp.desire_satisfaction import SignalEmbeddingCache
-from ego_mcp.embedding import EgoEmbeddingFunction, create_embedding_provider
+from ego_mcp.embedding import (
+    EgoEmbeddingFunction,
+    EmbeddingProvider,
+    create_embedding_provider,
+)
 from ego_mcp.episode import EpisodeStore
 from ego_mcp.impulse import ImpulseManager
 from ego_mcp.interoception import get_body_state
 from ego_mcp.memory import MemoryStore, calculate_time_decay
 from ego_mcp.migrations import run_migrations
 from ego_mcp.notion import NotionStore
+from ego_mcp.spans import begin_stage_timings, end_stage_timings, stage_timings
 from ego_mcp.types import Memory
 from ego_mcp.workspace_sync import WorkspaceMemorySync
 
@@ -315,7 +327,7 @@ async def _completion_log_context(
                 extra[key] = float(value)
 
     try:
-        recent = await memory.list_recent(n=1)
+        recent = await _recent_memories(memory, 1)
     except Exception:
         logger.debug("Skipped completion telemetry snapshot", exc_info=True)
         return extra
@@ -355,6 +367,26 @@ async def _completion_log_context(
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Dispatch tool calls."""
     reset_tool_metadata()
+    token = begin_request_context()
+    timings_token = begin_stage_timings()
+    try:
+        return await _call_tool(name, arguments, time.perf_counter())
+    finally:
+        end_stage_timings(timings_token)
+        end_request_context(token)
+
+
+def _latency_log_context(started: float) -> dict[str, object]:
+    """Wall-clock duration of the call so far and its per-stage breakdown."""
+    return {
+        "duration_ms": round((time.perf_counter() - started) * 1000),
+        "stage_ms": stage_timings(),
+    }
+
+
+async def _call_tool(
+    name: str, arguments: dict[str, Any], started: float
+) -> list[TextContent]:
     safe_args = _sanitize_tool_args_for_logging(name, arguments)
     log_context = _tool_log_context()
     logger.info(
@@ -375,7 +407,12 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     except Exception:
         logger.exception(
             "Tool execution failed",
-            extra={"tool_name": name, "tool_args": safe_args, **log_context},
+            extra={
+                "tool_name": name,
+                "tool_args": safe_args,
+                **log_context,
+                **_latency_log_context(started),
+            },
         )
         raise
 
@@ -398,6 +435,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             "tool_output_truncated": output_truncated,
             **log_context,
             **completion_context,
+            **_latency_log_context(started),
         },
     )
     return [TextContent(type="text", text=text)]
@@ -514,8 +552,14 @@ async def _dispatch(
         return f"Unknown tool: {name}"
 
 
-def init_server(config: EgoConfig | None = None) -> None:
-    """Initialize all dependencies. Called from main() or tests."""
+def init_server(
+    config: EgoConfig | None = None,
+    embedding_provider: EmbeddingProvider | None = None,
+) -> None:
+    """Initialize all dependencies. Called from main(), tests and benchmarks.
+
+    ``embedding_provider`` replaces the provider named in ``config``.
+    """
     global _config, _memory, _desire, _episodes, _consolidation, _workspace_sync, _notions, _impulse, _signal_cache
 
     if config is None:
@@ -529,7 +573,7 @@ def init_server(config: EgoConfig | None = None) -> None:
     config.data_dir.mkdir(parents=True, exist_ok=True)
     run_migrations(config.data_dir)
 
-    provider = create_embedding_provider(config)
+    provider = embedding_provider or create_embedding_provider(config)
     embedding_fn = EgoEmbeddingFunction(provider)
 
     _memory = MemoryStore(config, embedding_fn)
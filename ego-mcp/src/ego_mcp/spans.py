@@ -0,0 +1,75 @@
+"""Per-stage wall-clock timings for the tool call in progress."""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+
+class _OpenSpan:
+    __slots__ = ("child_ms",)
+
+    def __init__(self) -> None:
+        self.child_ms = 0.0
+
+
+_stage_ms: ContextVar[dict[str, float] | None] = ContextVar("stage_ms", default=None)
+_open_span: ContextVar[_OpenSpan | None] = ContextVar("open_span", default=None)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Add the time spent inside the block to ``stage`` of the current tool call.
+
+    Time spent in a nested span counts only toward the inner stage, so the stages of
+    one call never overlap. Outside ``begin_stage_timings`` this does nothing.
+    """
+    stages = _stage_ms.get()
+    if stages is None:
+        yield
+        return
+    parent = _open_span.get()
+    current = _OpenSpan()
+    token = _open_span.set(current)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        _open_span.reset(token)
+        if parent is not None:
+            parent.child_ms += elapsed_ms
+        stages[stage] = stages.get(stage, 0.0) + elapsed_ms - current.child_ms
+
+
+def timed[**P, R](stage: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator form of ``span`` for synchronous functions."""
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(stage):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def begin_stage_timings() -> Token[dict[str, float] | None]:
+    return _stage_ms.set({})
+
+
+def end_stage_timings(token: Token[dict[str, float] | None]) -> None:
+    _stage_ms.reset(token)
+
+
+def stage_timings() -> dict[str, float]:
+    """Milliseconds per stage recorded so far, rounded to microseconds."""
+    stages = _stage_ms.get()
+    if not stages:
+        return {}
+    return {stage: round(ms, 3) for stage, ms in stages.items()}
@@ -0,0 +1,107 @@
+"""Tests for the offline benchmark suite."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import CorpusSpec, build_memories, build_notions
+from benchmarks.hashing import HashingEmbeddingProvider
+from benchmarks.runner import SCENARIOS, compare_reports, run_benchmarks
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+class TestHashingEmbeddingProvider:
+    async def test_vectors_are_deterministic_unit_length(self) -> None:
+        provider = HashingEmbeddingProvider(dim=64)
+        first, empty = await provider.embed(["rain on the tomatoes", ""])
+        again = (await provider.embed(["rain on the tomatoes"]))[0]
+
+        assert first == again
+        assert len(first) == 64
+        assert math.isclose(math.fsum(x * x for x in first), 1.0)
+        assert math.isclose(math.fsum(x * x for x in empty), 1.0)
+
+    async def test_shared_words_are_closer_than_unrelated_text(self) -> None:
+        provider = HashingEmbeddingProvider()
+        query, related, unrelated = await provider.embed(
+            [
+                "piano chords and melody",
+                "a new melody on the piano",
+                "garlic soup in the oven",
+            ]
+        )
+
+        assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+class TestCorpus:
+    def test_same_spec_builds_the_same_linked_corpus(self) -> None:
+        spec = CorpusSpec(size=300, seed=7)
+        memories = build_memories(spec)
+        again = build_memories(spec)
+
+        assert [m.id for m in memories] == [m.id for m in again]
+        assert [m.content for m in memories] == [m.content for m in again]
+        ids = {m.id for m in memories}
+        assert len(ids) == 300
+        assert [m.timestamp for m in memories] == sorted(m.timestamp for m in memories)
+        links = [link for m in memories for link in m.linked_ids]
+        assert len(links) > 300
+        assert all(link.target_id in ids for link in links)
+
+    def test_notions_come_from_same_topic_clusters(self) -> None:
+        spec = CorpusSpec(size=500, seed=1)
+        memories = build_memories(spec)
+        by_id = {m.id: m for m in memories}
+
+        notions = build_notions(spec, memories)
+
+        assert len(notions) == 10
+        for notion in notions:
+            sources = [by_id[memory_id] for memory_id in notion.source_memory_ids]
+            assert len({tuple(m.tags) for m in sources}) == 1
+            assert set(notion.related_notion_ids) <= {n.id for n in notions}
+
+
+class TestRunner:
+    async def test_report_times_every_scenario(self, tmp_path: Path) -> None:
+        report = await run_benchmarks(
+            [120], iterations=1, warmup=0, dim=32, data_dir=tmp_path
+        )
+
+        corpus = report["corpora"]["120"]
+        assert corpus["memories"] == 120
+        assert set(corpus["tools"]) == {scenario.tool for scenario in SCENARIOS}
+        for tool, summary in corpus["tools"].items():
+            assert summary["errors"] == 0, tool
+            assert summary["calls"] == 1
+            assert summary["p50_ms"] > 0
+        assert "embedding" in corpus["tools"]["recall"]["stage_ms"]
+        assert report["settings"]["dim"] == 32
+
+    def test_compare_flags_tools_slower_than_threshold(self) -> None:
+        def report(recall_ms: float, remember_ms: float) -> dict[str, object]:
+            return {
+                "corpora": {
+                    "1000": {
+                        "tools": {
+                            "recall": {"p50_ms": recall_ms},
+                            "remember": {"p50_ms": remember_ms},
+                        }
+                    }
+                }
+            }
+
+        rows = compare_reports(report(10.0, 4.0), report(15.0, 4.2), threshold=1.25)
+
+        assert [(row["tool"], row["regressed"]) for row in rows] == [
+            ("recall", True),
+            ("remember", False),
+        ]
+        assert rows[0]["ratio"] == pytest.approx(1.5)
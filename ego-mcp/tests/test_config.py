@@ -23,6 +23,7 @@ def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
         "EGO_MCP_WORKSPACE_DIR",
         "EGO_MCP_TIMEZONE",
         "EGO_MCP_LEXICAL_SEARCH",
+        "EGO_MCP_MODEL_CACHE_DIR",
     ]:
         monkeypatch.delenv(key, raising=False)
 
@@ -76,6 +77,16 @@ class TestValidation:
         with pytest.raises(ValueError, match="OPENAI_API_KEY is not set"):
             EgoConfig.from_env()
 
+    def test_local_provider_needs_no_api_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("EGO_MCP_EMBEDDING_PROVIDER", "local")
+        monkeypatch.setenv("EGO_MCP_MODEL_CACHE_DIR", "/tmp/ego-models")
+        config = EgoConfig.from_env()
+        assert config.embedding_model == "all-MiniLM-L6-v2"
+        assert config.api_key == ""
+        assert config.model_cache_dir == Path("/tmp/ego-models")
+
     def test_invalid_provider_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("EGO_MCP_EMBEDDING_PROVIDER", "invalid")
         with pytest.raises(ValueError, match="Invalid embedding provider"):
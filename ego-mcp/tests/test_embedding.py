@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, cast
+import hashlib
+import io
+import tarfile
+from pathlib import Path
+from typing import Any, ClassVar, cast
 
 import httpx
+import numpy as np
 import pytest
 import respx
 
+from ego_mcp import embedding as embedding_mod
 from ego_mcp.config import EgoConfig
 from ego_mcp.embedding import (
     _MAX_RETRY_DELAY,
     GeminiEmbeddingProvider,
+    LocalEmbeddingProvider,
     OpenAIEmbeddingProvider,
     _parse_retry_after,
     create_embedding_provider,
@@ -236,6 +243,137 @@ class TestOpenAIEmbeddingProvider:
         assert second == [[0.7, 0.8]]
 
 
+# --- LocalEmbeddingProvider ---
+
+_VOCAB = ["[PAD]", "[UNK]", "alpha", "beta", "gamma", "delta"]
+
+
+def _write_tokenizer(model_dir: Path) -> None:
+    tokenizers = pytest.importorskip("tokenizers")
+    tokenizer = tokenizers.Tokenizer(
+        tokenizers.models.WordLevel(
+            {word: i for i, word in enumerate(_VOCAB)}, unk_token="[UNK]"
+        )
+    )
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    model_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer.save(str(model_dir / "tokenizer.json"))
+
+
+class _OneHotSession:
+    """Stands in for an ONNX model whose hidden state is the one-hot token id."""
+
+    runs: ClassVar[list[dict[str, Any]]] = []
+
+    def __init__(self, path: str, sess_options: Any, providers: list[str]) -> None:
+        assert path.endswith("model.onnx")
+        assert providers == ["CPUExecutionProvider"]
+
+    def get_inputs(self) -> list[Any]:
+        return [
+            type("Input", (), {"name": name})()
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+        ]
+
+    def run(self, outputs: Any, feeds: dict[str, Any]) -> list[Any]:
+        self.runs.append(feeds)
+        return [np.eye(len(_VOCAB), dtype=np.float32)[feeds["input_ids"]]]
+
+
+@pytest.fixture
+def local_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    onnxruntime = pytest.importorskip("onnxruntime")
+    model_dir = tmp_path / "models" / "tiny"
+    _write_tokenizer(model_dir)
+    (model_dir / "model.onnx").write_bytes(b"onnx")
+    _OneHotSession.runs = []
+    monkeypatch.setattr(onnxruntime, "InferenceSession", _OneHotSession)
+    return tmp_path / "models"
+
+
+class TestLocalEmbeddingProvider:
+    """Tests for LocalEmbeddingProvider."""
+
+    async def test_mean_pools_unpadded_tokens_into_unit_vectors(
+        self, local_model: Path
+    ) -> None:
+        provider = LocalEmbeddingProvider("tiny", local_model)
+
+        alpha, alpha_beta = await provider.embed(["alpha", "alpha beta"])
+
+        assert alpha == pytest.approx([0, 0, 1, 0, 0, 0])
+        norm = 2**-0.5
+        assert alpha_beta == pytest.approx([0, 0, norm, norm, 0, 0])
+        feeds = _OneHotSession.runs[0]
+        assert feeds["input_ids"].shape == (2, 2)
+        assert not feeds["token_type_ids"].any()
+
+    async def test_batches_keep_input_order(self, local_model: Path) -> None:
+        provider = LocalEmbeddingProvider("tiny", local_model, batch_size=2)
+        texts = ["delta gamma beta", "beta", "gamma delta", "alpha", ""]
+
+        vectors = await provider.embed(texts)
+
+        assert len(_OneHotSession.runs) == 3
+        assert vectors[1] == pytest.approx([0, 0, 0, 1, 0, 0])
+        assert vectors[3] == pytest.approx([0, 0, 1, 0, 0, 0])
+        assert vectors[4] == [0.0] * len(_VOCAB)
+        assert vectors[2][4] == pytest.approx(vectors[2][5])
+        assert await provider.embed([]) == []
+
+    async def test_unknown_missing_model_names_expected_files(
+        self, tmp_path: Path
+    ) -> None:
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("tokenizers")
+        provider = LocalEmbeddingProvider("nope", tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="model.onnx and tokenizer.json"):
+            await provider.embed(["alpha"])
+
+    @respx.mock
+    def test_downloads_known_model_once(
+        self, local_model: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            tar.add(local_model / "tiny", arcname="onnx")
+        archive = buffer.getvalue()
+        url = "https://models.example/tiny.tar.gz"
+        route = respx.get(url).respond(content=archive)
+        monkeypatch.setitem(
+            embedding_mod._LOCAL_MODEL_ARCHIVES,
+            "tiny",
+            (url, hashlib.sha256(archive).hexdigest()),
+        )
+        cache_dir = tmp_path / "cache"
+
+        first = asyncio.run(LocalEmbeddingProvider("tiny", cache_dir).embed(["beta"]))
+        second = asyncio.run(LocalEmbeddingProvider("tiny", cache_dir).embed(["beta"]))
+
+        assert route.call_count == 1
+        assert sorted(p.name for p in (cache_dir / "tiny").iterdir()) == [
+            "model.onnx",
+            "tokenizer.json",
+        ]
+        assert first == second
+
+    @respx.mock
+    def test_download_rejects_checksum_mismatch(
+        self, local_model: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        url = "https://models.example/tiny.tar.gz"
+        respx.get(url).respond(content=b"tampered")
+        monkeypatch.setitem(
+            embedding_mod._LOCAL_MODEL_ARCHIVES, "tiny", (url, "0" * 64)
+        )
+        provider = LocalEmbeddingProvider("tiny", tmp_path / "cache")
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            asyncio.run(provider.embed(["beta"]))
+        assert not (tmp_path / "cache" / "tiny").exists()
+
+
 # --- Factory ---
 
 
@@ -254,3 +392,10 @@ class TestFactory:
         config = EgoConfig.from_env()
         provider = create_embedding_provider(config)
         assert isinstance(provider, OpenAIEmbeddingProvider)
+
+    def test_local(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("EGO_MCP_EMBEDDING_PROVIDER", "local")
+        monkeypatch.setenv("EGO_MCP_MODEL_CACHE_DIR", str(tmp_path))
+        config = EgoConfig.from_env()
+        provider = create_embedding_provider(config)
+        assert isinstance(provider, LocalEmbeddingProvider)
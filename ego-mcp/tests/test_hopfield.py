@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from ego_mcp.hopfield import HopfieldRecallResult, ModernHopfieldNetwork
 
 
@@ -14,6 +16,12 @@ class TestHopfieldStore:
         assert net.n_memories == 2
         assert net.dim == 3
 
+    def test_store_accepts_numpy_array(self) -> None:
+        # Chroma returns stored embeddings as an ndarray.
+        net = ModernHopfieldNetwork()
+        net.store(np.eye(3, dtype=np.float32), ["a", "b", "c"], ["x", "y", "z"])
+        assert net.n_memories == 3
+
     def test_store_empty(self) -> None:
         net = ModernHopfieldNetwork()
         net.store([], [], [])
@@ -257,6 +257,50 @@ class TestMcpBoundary:
         assert isinstance(getattr(completion, "time_phase", None), str)
         assert getattr(completion, "time_phase")
 
+    @pytest.mark.asyncio
+    async def test_call_tool_logs_stage_timings(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        config: EgoConfig,
+        memory: MemoryStore,
+        desire: DesireEngine,
+        episodes: EpisodeStore,
+        consolidation: ConsolidationEngine,
+    ) -> None:
+        caplog.set_level(logging.INFO, logger=server_mod.logger.name)
+        await _call(
+            "remember",
+            {"content": "Sunset was beautiful"},
+            config,
+            memory,
+            desire,
+            episodes,
+            consolidation,
+        )
+        await _call(
+            "recall",
+            {"context": "sunset"},
+            config,
+            memory,
+            desire,
+            episodes,
+            consolidation,
+        )
+
+        completion = [
+            record
+            for record in caplog.records
+            if record.getMessage() == "Tool execution completed"
+        ][-1]
+        duration_ms = getattr(completion, "duration_ms", None)
+        stage_ms = getattr(completion, "stage_ms", None)
+
+        assert getattr(completion, "tool_name", None) == "recall"
+        assert isinstance(duration_ms, int) and duration_ms >= 0
+        assert isinstance(stage_ms, dict)
+        assert {"chroma", "embedding", "scoring"} <= stage_ms.keys()
+        assert sum(stage_ms.values()) <= duration_ms + 1
+
 
 # === Surface Tools ===
 
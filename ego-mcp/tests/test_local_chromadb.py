@@ -0,0 +1,298 @@
+"""Tests for the local ChromaDB fallback collection."""
+
+from __future__ import annotations
+
+import math
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ego_mcp import local_chromadb
+from ego_mcp.local_chromadb import Collection, PersistentClient
+
+
+def _unused_embedding(docs: list[str]) -> list[list[float]]:
+    raise AssertionError("embeddings are passed explicitly")
+
+
+def _cosine_distance(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a))
+    nb = math.sqrt(sum(y * y for y in b))
+    return 1.0 - dot / (na * nb)
+
+
+def _collection(
+    vectors: dict[str, list[float]], **metas: dict[str, object]
+) -> Collection:
+    collection = Collection(_unused_embedding)
+    collection.add(
+        ids=list(vectors),
+        documents=[f"doc {rec_id}" for rec_id in vectors],
+        metadatas=[metas.get(rec_id, {}) for rec_id in vectors],
+        embeddings=list(vectors.values()),
+    )
+    return collection
+
+
+class TestQuery:
+    def test_matches_brute_force_cosine_ranking(self) -> None:
+        rng = random.Random(3)
+        vectors = {f"m{i}": [rng.uniform(-1, 1) for _ in range(16)] for i in range(300)}
+        collection = _collection(vectors)
+        q = [rng.uniform(-1, 1) for _ in range(16)]
+
+        result = collection.query(query_embeddings=[q], n_results=7)
+
+        expected = sorted(vectors, key=lambda i: _cosine_distance(q, vectors[i]))[:7]
+        assert result["ids"] == [expected]
+        assert result["distances"][0] == pytest.approx(
+            [_cosine_distance(q, vectors[i]) for i in expected], abs=1e-5
+        )
+        assert result["documents"][0] == [f"doc {i}" for i in expected]
+
+    def test_embeds_query_text_and_filters_by_where(self) -> None:
+        collection = Collection(lambda docs: [[1.0, 0.0] for _ in docs])
+        collection.add(
+            ids=["a", "b", "c"],
+            documents=["a", "b", "c"],
+            metadatas=[{"category": "daily"}, {"category": "dream"}, {}],
+            embeddings=[[1.0, 0.0], [1.0, 0.1], [0.0, 1.0]],
+        )
+
+        result = collection.query(
+            query_texts=["x"], n_results=5, where={"category": {"$ne": "daily"}}
+        )
+
+        assert result["ids"] == [["b", "c"]]
+        assert result["metadatas"] == [[{"category": "dream"}, {}]]
+
+    def test_zero_vectors_are_maximally_distant(self) -> None:
+        collection = _collection({"zero": [0.0, 0.0], "one": [0.0, 2.0]})
+
+        result = collection.query(query_embeddings=[[0.0, 1.0]], n_results=2)
+
+        assert result["ids"] == [["one", "zero"]]
+        assert result["distances"][0] == pytest.approx([0.0, 1.0])
+
+
+class TestGetAndDelete:
+    def test_get_keeps_requested_order_and_returns_embedding_matrix(self) -> None:
+        collection = _collection({"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [1.0, 1.0]})
+
+        result = collection.get(
+            ids=["c", "missing", "a"], include=["metadatas", "embeddings"]
+        )
+
+        assert result["ids"] == ["c", "a"]
+        assert isinstance(result["embeddings"], np.ndarray)
+        assert result["embeddings"].tolist() == [[1.0, 1.0], [1.0, 0.0]]
+        assert "documents" not in result
+        assert collection.get(limit=2)["ids"] == ["a", "b"]
+
+    def test_add_existing_id_replaces_in_place(self) -> None:
+        collection = _collection({"a": [1.0, 0.0], "b": [0.0, 1.0]})
+
+        collection.add(ids=["a"], documents=["new"], embeddings=[[0.0, 1.0]])
+
+        assert collection.count() == 2
+        assert collection.get()["documents"] == ["new", "doc b"]
+        assert collection.query(query_embeddings=[[0.0, 1.0]], n_results=2)[
+            "distances"
+        ][0] == pytest.approx([0.0, 0.0])
+
+    def test_rejects_mismatched_dimensions(self) -> None:
+        collection = _collection({"a": [1.0, 0.0]})
+
+        with pytest.raises(ValueError, match="dimension"):
+            collection.add(ids=["b"], documents=["b"], embeddings=[[1.0, 0.0, 0.0]])
+
+    def test_deleted_records_disappear_and_are_compacted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(local_chromadb, "_MIN_GARBAGE_TO_COMPACT", 2)
+        collection = _collection(
+            {f"m{i}": [1.0, float(i)] for i in range(5)},
+            m1={"category": "dream"},
+        )
+
+        collection.delete(ids=["m0", "missing"])
+        collection.delete(where={"category": "dream"})
+
+        assert collection.count() == 3
+        assert collection.get()["ids"] == ["m2", "m3", "m4"]
+        result = collection.query(query_embeddings=[[1.0, 0.0]], n_results=5)
+        assert result["ids"] == [["m2", "m3", "m4"]]
+
+        collection.delete(ids=["m3", "m4"])
+
+        assert collection._ids == ["m2"]
+        assert collection.get(include=["embeddings"])["embeddings"].tolist() == [
+            [1.0, 2.0]
+        ]
+        collection.add(ids=["m5"], documents=["m5"], embeddings=[[0.0, 1.0]])
+        assert collection.get()["ids"] == ["m2", "m5"]
+
+
+class TestMetadataIndexes:
+    def test_filtered_reads_match_a_full_scan(self) -> None:
+        rng = random.Random(11)
+        categories = ["daily", "dream", "technical", None]
+        collection = Collection(_unused_embedding)
+        for i in range(200):
+            meta: dict[str, object] = {"importance": rng.randint(1, 5)}
+            if (category := rng.choice(categories)) is not None:
+                meta["category"] = category
+            meta["emotion"] = rng.choice(["happy", "sad", "curious"])
+            meta["anticipated_at"] = rng.choice(["", "", "", "2026-07-10"])
+            collection.add(
+                ids=[f"m{i}"], documents=[f"m{i}"], metadatas=[meta], embeddings=[[1.0]]
+            )
+        for i in range(0, 200, 7):
+            collection.update(ids=[f"m{i}"], metadatas=[{"category": "dream"}])
+        collection.delete(ids=[f"m{i}" for i in range(0, 200, 11)])
+        collection.add(
+            ids=["m1"],
+            documents=["m1"],
+            metadatas=[{"emotion": "sad"}],
+            embeddings=[[1.0]],
+        )
+
+        wheres: list[dict[str, object]] = [
+            {"anticipated_at": {"$ne": ""}},
+            {"category": "dream"},
+            {"category": {"$eq": "daily"}, "importance": 3},
+            {"$and": [{"emotion": "sad"}, {"category": {"$ne": "dream"}}]},
+            {"$and": [{"emotion": "happy"}, {"importance": {"$ne": 2}}]},
+            {"category": {"$ne": "dream", "$eq": "daily"}},
+            {"category": {"$gt": "a"}},
+            {"$and": "invalid"},
+        ]
+        everything = collection.get()
+        for where in wheres:
+            expected = [
+                rec_id
+                for rec_id, meta in zip(everything["ids"], everything["metadatas"])
+                if local_chromadb._match_where(meta, where)
+            ]
+            assert collection.get(where=where)["ids"] == expected, where
+            queried = collection.query(
+                query_embeddings=[[1.0]], n_results=500, where=where
+            )
+            assert queried["ids"] == [expected], where
+
+    def test_anticipation_filter_follows_updates(self) -> None:
+        collection = _collection(
+            {"a": [1.0], "b": [1.0], "c": [1.0]},
+            a={"anticipated_at": ""},
+            b={"anticipated_at": "2026-07-10"},
+        )
+        where = {"anticipated_at": {"$ne": ""}}
+        assert collection.get(where=where)["ids"] == ["b", "c"]
+
+        collection.update(ids=["b", "c"], metadatas=[{"anticipated_at": ""}] * 2)
+        collection.update(ids=["a"], metadatas=[{"anticipated_at": "2026-08-01"}])
+
+        assert collection.get(where=where)["ids"] == ["a"]
+        assert collection.get(ids=["c", "a"], where=where)["ids"] == ["a"]
+
+    def test_unhashable_values_fall_back_to_scanning(self) -> None:
+        collection = _collection(
+            {"a": [1.0], "b": [1.0]},
+            a={"category": "daily"},
+            b={"category": ["daily"]},
+        )
+
+        assert "category" not in collection._indexes
+        assert collection.get(where={"category": "daily"})["ids"] == ["a"]
+
+
+def _reopen(path: Path, name: str = "memories") -> Collection:
+    """Open ``name`` the way a freshly started process would."""
+    local_chromadb._STORE_BY_PATH.pop(str(path), None)
+    return PersistentClient(str(path)).get_or_create_collection(
+        name, embedding_function=_unused_embedding
+    )
+
+
+class TestPersistence:
+    def test_records_survive_a_restart(self, tmp_path: Path) -> None:
+        collection = _reopen(tmp_path)
+        collection.add(
+            ids=["a", "b", "c"],
+            documents=["doc a", "doc b", "doc c"],
+            metadatas=[{"category": "daily"}, {}, {}],
+            embeddings=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+        )
+        collection.update(ids=["a"], metadatas=[{"access_count": 2}])
+        collection.delete(ids=["b"])
+
+        reopened = _reopen(tmp_path)
+
+        assert reopened is not collection
+        assert reopened.count() == 2
+        result = reopened.get(include=["documents", "metadatas", "embeddings"])
+        assert result["ids"] == ["a", "c"]
+        assert result["metadatas"] == [{"category": "daily", "access_count": 2}, {}]
+        assert result["embeddings"].tolist() == [[1.0, 0.0], [1.0, 1.0]]
+        top = reopened.query(query_embeddings=[[1.0, 0.1]], n_results=1)
+        assert top["ids"] == [["a"]]
+
+    def test_opening_reads_nothing_until_first_use(self, tmp_path: Path) -> None:
+        _reopen(tmp_path).add(ids=["a"], documents=["a"], embeddings=[[1.0]])
+
+        reopened = _reopen(tmp_path)
+
+        assert reopened._loaded is False
+        assert reopened.count() == 1
+        assert isinstance(reopened._matrix, np.memmap)
+
+    def test_torn_final_log_line_is_dropped(self, tmp_path: Path) -> None:
+        _reopen(tmp_path).add(ids=["a"], documents=["a"], embeddings=[[1.0]])
+        log = tmp_path / "local_chromadb" / "memories" / "records.0.jsonl"
+        with log.open("a", encoding="utf-8") as fh:
+            fh.write('{"op": "add", "id": "b"')
+
+        reopened = _reopen(tmp_path)
+        reopened.add(ids=["c"], documents=["c"], embeddings=[[1.0]])
+
+        assert _reopen(tmp_path).get()["ids"] == ["a", "c"]
+
+    def test_compaction_switches_generation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(local_chromadb, "_MIN_GARBAGE_TO_COMPACT", 4)
+        collection = _reopen(tmp_path)
+        collection.add(
+            ids=["a", "b", "c"],
+            documents=["a", "b", "c"],
+            embeddings=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+        )
+        collection.delete(ids=["a"])
+        for count in range(4):
+            collection.update(ids=["c"], metadatas=[{"access_count": count}])
+
+        directory = tmp_path / "local_chromadb" / "memories"
+        assert sorted(p.name for p in directory.iterdir()) == [
+            "collection.json",
+            "embeddings.1.f32",
+            "norms.1.f32",
+            "records.1.jsonl",
+        ]
+        reopened = _reopen(tmp_path)
+        result = reopened.get(include=["metadatas", "embeddings"])
+        assert result["ids"] == ["b", "c"]
+        assert result["metadatas"] == [{}, {"access_count": 3}]
+        assert result["embeddings"].tolist() == [[0.0, 1.0], [1.0, 1.0]]
+
+    def test_get_collection_requires_existing_data(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="does not exist"):
+            PersistentClient(str(tmp_path)).get_collection("memories")
+
+        _reopen(tmp_path).add(ids=["a"], documents=["a"], embeddings=[[1.0]])
+        local_chromadb._STORE_BY_PATH.pop(str(tmp_path))
+
+        collection = PersistentClient(str(tmp_path)).get_collection("memories")
+        assert collection.get()["ids"] == ["a"]
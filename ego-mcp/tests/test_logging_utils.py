@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -246,3 +248,127 @@ class TestInstallGlobalExceptionHooks:
         assert logged_exc_info
         assert logged_exc_info[0] == (None, None, None)
         assert original_calls
+
+
+def _record(level: int, msg: str = "line") -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, (), None)
+
+
+class TestQueuedLogging:
+    @pytest.fixture
+    def log_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[Path]:
+        path = tmp_path / "ego-mcp.log"
+        monkeypatch.setattr(logging_utils, "get_log_path", lambda: path)
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        yield path
+        logging_utils.shutdown_logging()
+
+    def test_shutdown_flushes_queued_records(self, log_path: Path) -> None:
+        logging_utils.configure_logging()
+        logger = logging.getLogger("ego_mcp.server")
+        for index in range(500):
+            logger.info("Tool invocation %d", index, extra={"tool_name": "recall"})
+        logging_utils.shutdown_logging()
+
+        lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [line["message"] for line in lines] == [
+            f"Tool invocation {index}" for index in range(500)
+        ]
+        assert all(line["tool_name"] == "recall" for line in lines)
+
+    def test_exception_text_survives_the_queue(self, log_path: Path) -> None:
+        logging_utils.configure_logging()
+        try:
+            raise RuntimeError("queued failure")
+        except RuntimeError:
+            logging.getLogger("ego_mcp.server").exception("Tool execution failed")
+        logging_utils.shutdown_logging()
+
+        payload = json.loads(log_path.read_text().splitlines()[-1])
+        assert "RuntimeError: queued failure" in payload["exception"]
+
+    def test_reconfigure_replaces_previous_writer(self, log_path: Path) -> None:
+        logging_utils.configure_logging()
+        logging_utils.configure_logging()
+        logging.getLogger("ego_mcp.server").info("once")
+        logging_utils.shutdown_logging()
+
+        assert log_path.read_text().count('"once"') == 1
+
+
+    def test_unformattable_record_does_not_stop_the_writer(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        class _Unprintable:
+            def __str__(self) -> str:
+                raise AttributeError("no str")
+
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue()
+        path = tmp_path / "ego-mcp.log"
+        writer = logging_utils.JsonlLogWriter(
+            log_queue, path, logging_utils.JsonLineFormatter()
+        )
+        writer.start()
+        broken = _record(logging.INFO, "broken")
+        broken.payload = _Unprintable()
+        log_queue.put(broken)
+        log_queue.put(_record(logging.INFO, "after"))
+        writer.stop()
+
+        assert [json.loads(line)["message"] for line in path.read_text().splitlines()] == [
+            "after"
+        ]
+        assert "could not format log record 'broken'" in capsys.readouterr().err
+
+
+class TestBoundedQueueHandler:
+    def _full_handler(
+        self, overflow: logging_utils.OverflowPolicy
+    ) -> logging_utils.BoundedQueueHandler:
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(1)
+        log_queue.put_nowait(_record(logging.INFO))
+        return logging_utils.BoundedQueueHandler(log_queue, overflow)
+
+    def test_drop_debug_drops_only_debug_when_full(self) -> None:
+        handler = self._full_handler("drop_debug")
+        handler.handle(_record(logging.DEBUG))
+        assert handler.dropped == 1
+        assert handler._should_drop(logging.INFO) is False
+        assert handler._should_drop(logging.WARNING) is False
+
+    def test_sample_keeps_one_in_ten_info_records(self) -> None:
+        handler = self._full_handler("sample")
+        kept = [not handler._should_drop(logging.INFO) for _ in range(20)]
+        assert kept.count(True) == 2
+        assert handler._should_drop(logging.ERROR) is False
+
+    def test_block_never_drops(self) -> None:
+        handler = self._full_handler("block")
+        assert handler._should_drop(logging.DEBUG) is False
+
+    def test_full_queue_without_a_writer_drops_instead_of_blocking(self) -> None:
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(1)
+        log_queue.put_nowait(_record(logging.INFO))
+        handler = logging_utils.BoundedQueueHandler(
+            log_queue, "block", writer_alive=lambda: False
+        )
+
+        handler.handle(_record(logging.ERROR))
+
+        assert handler.dropped == 1
+
+    def test_prepare_resolves_args(self) -> None:
+        handler = self._full_handler("block")
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "n=%d", (3,), None)
+        prepared = handler.prepare(record)
+        assert prepared.getMessage() == "n=3"
+        assert record.args == (3,)
+
+    def test_overflow_policy_parsing(self) -> None:
+        assert logging_utils._parse_overflow_policy("BLOCK") == "block"
+        assert logging_utils._parse_overflow_policy("sample") == "sample"
+        assert logging_utils._parse_overflow_policy("nonsense") == "drop_debug"
+        assert logging_utils._parse_queue_size("0") == 10_000
+        assert logging_utils._parse_queue_size("50") == 50
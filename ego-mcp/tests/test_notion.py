@@ -190,6 +190,20 @@ def test_notion_store_reinforces_and_weakens_by_tag_overlap(tmp_path: Path) -> N
     assert {item for item in updates} == {("notion_1", "reinforced"), ("notion_2", "dormant")}
 
 
+def test_notion_store_save_many_writes_once_and_fills_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "notions.json"
+    store = NotionStore(path)
+    first = Notion(id="notion_a", label="signal (curious)")
+    second = Notion(label="tension (sad)")
+
+    store.save_many([first, second])
+
+    assert store.revision == 1
+    assert second.id.startswith("notion_")
+    assert second.last_reinforced == second.created != ""
+    assert set(json.loads(path.read_text(encoding="utf-8"))) == {"notion_a", second.id}
+
+
 def test_notion_store_search_by_tags_ranks_overlap_and_confidence(
     tmp_path: Path,
 ) -> None:
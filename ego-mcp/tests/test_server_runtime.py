@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import cast
+
 import pytest
 
+from ego_mcp import relationship as relationship_mod
 from ego_mcp._server_runtime import (
+    RequestContext,
+    begin_request_context,
+    clear_json_stores,
     clear_tool_completion_metadata,
+    end_request_context,
     get_episodes,
+    get_relationship_store,
+    get_request_context,
+    get_self_model_store,
     get_tool_metadata,
     reset_tool_metadata,
     take_tool_completion_metadata,
     update_tool_completion_metadata,
     update_tool_metadata,
 )
+from ego_mcp.memory import MemoryStore
+from ego_mcp.notion import NotionStore
+from ego_mcp.types import Category, Memory, Notion
 
 
 class TestToolCompletionMetadata:
@@ -52,6 +66,7 @@ class TestToolMetadata:
 class TestGetEpisodes:
     def test_raises_when_not_configured(self) -> None:
         import ego_mcp._server_runtime as rt
+
         original = rt._episodes_getter
         try:
             rt._episodes_getter = None
@@ -59,3 +74,164 @@ class TestGetEpisodes:
                 get_episodes()
         finally:
             rt._episodes_getter = original
+
+
+class TestJsonStoreRegistry:
+    def test_returns_one_instance_per_path(self, tmp_path: Path) -> None:
+        clear_json_stores()
+        path = tmp_path / "relationships" / "models.json"
+        store = get_relationship_store(path)
+        assert get_relationship_store(path) is store
+        assert get_relationship_store(tmp_path / "other.json") is not store
+
+    def test_unchanged_file_is_parsed_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clear_json_stores()
+        path = tmp_path / "models.json"
+        get_relationship_store(path).update("Alice", {"trust_level": 0.7})
+        clear_json_stores()
+        loads: list[Path] = []
+        real_load = relationship_mod.RelationshipStore._load
+
+        def counting_load(store: relationship_mod.RelationshipStore) -> None:
+            loads.append(store._path)
+            real_load(store)
+
+        monkeypatch.setattr(relationship_mod.RelationshipStore, "_load", counting_load)
+        for _ in range(4):
+            assert get_relationship_store(path).get("Alice").trust_level == 0.7
+        get_relationship_store(path).update("Alice", {"trust_level": 0.8})
+        assert get_relationship_store(path).get("Alice").trust_level == 0.8
+        assert len(loads) == 1
+
+    def test_reloads_after_external_write(self, tmp_path: Path) -> None:
+        clear_json_stores()
+        path = tmp_path / "models.json"
+        shared = get_relationship_store(path)
+        shared.update("Alice", {"trust_level": 0.7})
+
+        # Same size, written within the same timestamp tick: detected by content.
+        relationship_mod.RelationshipStore(path).update("Alice", {"trust_level": 0.2})
+
+        assert get_relationship_store(path) is shared
+        assert shared.get("Alice").trust_level == 0.2
+
+    def test_reloads_after_delete(self, tmp_path: Path) -> None:
+        clear_json_stores()
+        path = tmp_path / "self_model.json"
+        get_self_model_store(path).update({"current_goals": ["write"]})
+        path.unlink()
+        assert get_self_model_store(path).get().current_goals == []
+
+
+class _FakeMemory:
+    def __init__(self, memories: list[Memory]) -> None:
+        self.memories = memories
+        self.calls: list[tuple[int, str | None]] = []
+
+    def collection_count(self) -> int:
+        return len(self.memories)
+
+    async def list_recent(
+        self, n: int = 10, category_filter: str | None = None
+    ) -> list[Memory]:
+        self.calls.append((n, category_filter))
+        matching = [
+            m
+            for m in self.memories
+            if category_filter is None or m.category.value == category_filter
+        ]
+        return matching[:n]
+
+
+def _memories(count: int, category: Category = Category.DAILY) -> list[Memory]:
+    return [
+        Memory(id=f"mem_{i}", content=f"memory {i}", category=category)
+        for i in range(count)
+    ]
+
+
+class TestRequestContext:
+    async def test_shorter_reads_reuse_one_fetch(self) -> None:
+        fake = _FakeMemory(_memories(40))
+        memory = cast(MemoryStore, fake)
+        context = RequestContext()
+
+        first = await context.list_recent(memory, 30)
+        second = await context.list_recent(memory, 1)
+
+        assert [m.id for m in second] == [first[0].id]
+        assert fake.calls == [(30, None)]
+
+    async def test_longer_read_fetches_again(self) -> None:
+        fake = _FakeMemory(_memories(40))
+        memory = cast(MemoryStore, fake)
+        context = RequestContext()
+
+        await context.list_recent(memory, 1)
+        assert len(await context.list_recent(memory, 30)) == 30
+        assert fake.calls == [(1, None), (30, None)]
+
+    async def test_short_collection_serves_any_length(self) -> None:
+        fake = _FakeMemory(_memories(3))
+        memory = cast(MemoryStore, fake)
+        context = RequestContext()
+
+        await context.list_recent(memory, 30)
+        assert len(await context.list_recent(memory, 200)) == 3
+        assert fake.calls == [(30, None)]
+
+    async def test_new_memory_invalidates(self) -> None:
+        fake = _FakeMemory(_memories(5))
+        memory = cast(MemoryStore, fake)
+        context = RequestContext()
+
+        await context.list_recent(memory, 1)
+        fake.memories.insert(0, Memory(id="mem_new", content="new"))
+        latest = await context.list_recent(memory, 1)
+
+        assert latest[0].id == "mem_new"
+        assert fake.calls == [(1, None), (1, None)]
+
+    async def test_category_filters_are_cached_separately(self) -> None:
+        fake = _FakeMemory(_memories(2) + _memories(2, Category.CONVERSATION))
+        memory = cast(MemoryStore, fake)
+        context = RequestContext()
+
+        await context.list_recent(memory, 30)
+        conversations = await context.list_recent(memory, 30, "conversation")
+        await context.list_recent(memory, 1, "conversation")
+
+        assert all(m.category == Category.CONVERSATION for m in conversations)
+        assert fake.calls == [(30, None), (30, "conversation")]
+
+    def test_notions_relisted_after_save(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = NotionStore(tmp_path / "notions.json")
+        calls = 0
+        list_all = store.list_all
+
+        def counting_list_all() -> list[Notion]:
+            nonlocal calls
+            calls += 1
+            return list_all()
+
+        monkeypatch.setattr(store, "list_all", counting_list_all)
+        context = RequestContext()
+
+        assert context.list_notions(store) == []
+        assert context.list_notions(store) == []
+        store.save(Notion(id="notion_a", label="a"))
+        assert [n.id for n in context.list_notions(store)] == ["notion_a"]
+        assert calls == 2
+
+    def test_scoped_to_begin_and_end(self) -> None:
+        assert get_request_context() is None
+        token = begin_request_context()
+        try:
+            assert isinstance(get_request_context(), RequestContext)
+        finally:
+            end_request_context(token)
+        assert get_request_context() is None
@@ -0,0 +1,68 @@
+"""Tests for per-stage span timings."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from ego_mcp.spans import (
+    begin_stage_timings,
+    end_stage_timings,
+    span,
+    stage_timings,
+    timed,
+)
+
+
+@pytest.fixture
+def timings() -> Iterator[None]:
+    token = begin_stage_timings()
+    yield
+    end_stage_timings(token)
+
+
+class TestSpan:
+    def test_noop_outside_timed_call(self) -> None:
+        with span("chroma"):
+            pass
+        assert stage_timings() == {}
+
+    @pytest.mark.usefixtures("timings")
+    def test_repeated_stages_accumulate(self) -> None:
+        for _ in range(2):
+            with span("chroma"):
+                time.sleep(0.002)
+        assert stage_timings()["chroma"] >= 4.0
+
+    @pytest.mark.usefixtures("timings")
+    def test_nested_time_counts_only_toward_inner_stage(self) -> None:
+        with span("hopfield"), span("embedding"):
+            time.sleep(0.01)
+        stages = stage_timings()
+        assert stages["embedding"] >= 10.0
+        assert stages["hopfield"] < 5.0
+
+    @pytest.mark.usefixtures("timings")
+    async def test_spans_across_awaits(self) -> None:
+        with span("spreading_activation"):
+            await asyncio.sleep(0.002)
+        assert stage_timings()["spreading_activation"] >= 2.0
+
+    @pytest.mark.usefixtures("timings")
+    def test_timed_decorator(self) -> None:
+        @timed("scoring")
+        def score(value: int) -> int:
+            return value * 2
+
+        assert score(3) == 6
+        assert "scoring" in stage_timings()
+
+    def test_end_discards_timings(self) -> None:
+        token = begin_stage_timings()
+        with span("chroma"):
+            pass
+        end_stage_timings(token)
+        assert stage_timings() == {}